@@ -7,10 +7,13 @@ import warnings
 import weakref
 
 from .actions import Action
+from .actions import BinaryRecorder
 from .actions import CallPrinter
+from .actions import ChromeTraceRecorder
 from .actions import CodePrinter
 from .actions import Debugger
 from .actions import ErrorSnooper
+from .actions import FlightRecorder
 from .actions import Manhole
 from .actions import StackPrinter
 from .actions import VarsPrinter
@@ -28,6 +31,7 @@ try:
     from ._predicates import Or as _Or
     from ._predicates import Query
     from ._predicates import When
+    from ._tracer import Budget
     from ._tracer import Tracer
 except ImportError:
     from .event import Event  # noqa
@@ -38,6 +42,7 @@ except ImportError:
     from .predicates import Or as _Or
     from .predicates import Query
     from .predicates import When
+    from .tracer import Budget
     from .tracer import Tracer
 
 try:
@@ -48,10 +53,13 @@ except ImportError:
 __all__ = (
     'And',
     'Backlog',
+    'BinaryRecorder',
     'CallPrinter',
+    'ChromeTraceRecorder',
     'CodePrinter',
     'Debugger',
     'ErrorSnooper',
+    'FlightRecorder',
     'From',
     'Manhole',
     'Not',
@@ -62,6 +70,7 @@ __all__ = (
     'VarsPrinter',
     'VarsSnooper',
     'When',
+    'stats',
     'stop',
     'trace',
 )
@@ -76,7 +85,18 @@ THREADING_SUPPORT_ALIASES = (
     'threads',
     'thread',
 )
-TRACER_OPTION_NAMES = (*THREADING_SUPPORT_ALIASES, 'clear_env_var', 'profile')
+BUDGET_OPTION_NAMES = ('max_events', 'max_events_per_second', 'max_cpu_fraction', 'over_budget')
+TRACER_OPTION_NAMES = (
+    *THREADING_SUPPORT_ALIASES,
+    'clear_env_var',
+    'profile',
+    'monitoring',
+    'sample',
+    'sample_rate',
+    'sharding',
+    'instrument',
+    *BUDGET_OPTION_NAMES,
+)
 _last_tracer = None
 _default_trace_args = None
 _default_config = {}
@@ -91,10 +111,13 @@ def _embed_via_environment():
                 {
                     'And': And,
                     'Backlog': Backlog,
+                    'BinaryRecorder': BinaryRecorder,
                     'CallPrinter': CallPrinter,
+                    'ChromeTraceRecorder': ChromeTraceRecorder,
                     'CodePrinter': CodePrinter,
                     'Debugger': Debugger,
                     'ErrorSnooper': ErrorSnooper,
+                    'FlightRecorder': FlightRecorder,
                     'From': From,
                     'Manhole': Manhole,
                     'Not': Not,
@@ -133,6 +156,11 @@ def _prepare_config(*args, **kwargs):
             'pid_alignment',
             'repr_limit',
             'repr_func',
+            'buffer_size',
+            'flush_interval',
+            'background',
+            'queue_size',
+            'overflow',
         ):
             continue
 
@@ -367,6 +395,27 @@ def stop():
         _last_tracer = None
 
 
+def stats(tracer=None):
+    """
+    Returns the counters of an instrumented tracer (see the ``instrument`` option of :func:`hunter.trace`) as a tree with a
+    line for every part of the predicate. Uses the last tracer started via :func:`hunter.trace` if ``tracer`` is not given.
+
+    Example output (for ``trace(Q(module='foo') | Q(function_regex='^test_'), instrument='time')``)::
+
+        When -> CallPrinter: evaluations=1200 hits=30 (2.5%) time=1.734ms
+            Or: evaluations=1200 hits=30 (2.5%) time=1.234ms
+                Query(module='foo'): evaluations=1200 hits=10 (0.8%) time=0.321ms
+                Query(function_regex=re.compile('^test_')): evaluations=1190 hits=20 (1.7%) time=0.654ms
+    """
+    from .predicates import format_stats
+
+    if tracer is None:
+        tracer = _last_tracer
+    if tracer is None or tracer.instrumented is None:
+        raise ValueError('The tracer is not instrumented. Use hunter.trace(..., instrument=True).')
+    return format_stats(tracer.instrumented)
+
+
 class Stop(Action):
     def __call__(self, event):
         stop()
@@ -407,6 +456,27 @@ def trace(*predicates, **options):
             You can also use:
             ``threads_support``, ``thread_support``, ``threadingsupport``, ``threadssupport``, ``threadsupport``,
             ``threading``, ``threads`` or ``thread``.
+        profile: Use ``sys.setprofile`` instead of ``sys.settrace``: only call and return events (including builtin
+            calls) are produced. Default: ``None`` - ``sys.setprofile`` is used (without the builtin calls) if the
+            predicates can't match any line or exception events (eg: ``kind='call'``), otherwise ``sys.settrace`` is used.
+            See the ``hook`` in the tracer's ``repr``.
+        monitoring: Use a :class:`hunter.monitoring.Tracer` (based on ``sys.monitoring``, Python 3.12+) that only subscribes to
+            the events the predicates could match. Default: ``False``.
+        sample: Only trace one in every ``sample`` top-level calls (calls made at depth 0, eg: the ``run`` method of a
+            thread). Everything inside the calls that were not sampled is skipped. Default: ``None`` (trace everything).
+        sample_rate: Like ``sample`` but the top-level calls are sampled with the given probability (between 0 and 1).
+            Default: ``None``.
+        max_events: Stop the tracer after this many events were delivered. Default: ``None`` (no limit).
+        max_events_per_second: Stop the tracer if more than this many events are delivered in a second. Default: ``None``.
+        max_cpu_fraction: Stop the tracer if the handler takes more than this fraction of the time (between 0 and 1).
+            Default: ``None``.
+        over_budget: What to do when one of the limits above is exceeded: ``'stop'`` the tracer or only trace ``'calls'``
+            from then on (and stop if the limits are exceeded again). Default: ``'stop'``.
+        sharding: Give each thread its own copy of the predicates and actions that keep state between events (like
+            :class:`~hunter.predicates.From`, :class:`~hunter.predicates.Backlog` or :class:`~hunter.actions.ErrorSnooper`),
+            so that threads don't share (or race on) that state. Default: ``None`` - enabled on free-threaded Python builds.
+        instrument: Count how many times each part of the predicates is evaluated and how many times it matched (use
+            ``'time'`` to also measure the time spent in each part). See :func:`hunter.stats`. Default: ``False``.
         action: Action to run if all the predicates return ``True``. Default: ``CodePrinter``.
         actions: Actions to run (in case you want more than 1).
         **kwargs: for convenience you can also pass anything that you'd pass to :obj:`hunter.Q`
@@ -419,7 +489,15 @@ def trace(*predicates, **options):
     predicates, options = _apply_config(predicates, options)
 
     clear_env_var = options.pop('clear_env_var', False)
-    profiling_mode = options.pop('profile', False)
+    profiling_mode = options.pop('profile', None)
+    monitoring_mode = options.pop('monitoring', False)
+    sample = options.pop('sample', None)
+    sample_rate = options.pop('sample_rate', None)
+    sharding = options.pop('sharding', None)
+    if sharding is None:
+        sharding = not getattr(sys, '_is_gil_enabled', lambda: True)()
+    instrument = options.pop('instrument', False)
+    budget_options = {name: options.pop(name) for name in BUDGET_OPTION_NAMES if name in options}
     threading_support = None
     for alias in THREADING_SUPPORT_ALIASES:
         if alias in options:
@@ -429,7 +507,21 @@ def trace(*predicates, **options):
     if clear_env_var:
         os.environ.pop('PYTHONHUNTER', None)
 
-    _last_tracer = Tracer(threading_support, profiling_mode)
+    budget = Budget(**budget_options) if budget_options else None
+    if monitoring_mode:
+        from .monitoring import Tracer as MonitoringTracer
+
+        _last_tracer = MonitoringTracer(threading_support, bool(profiling_mode), sample, sample_rate, budget, sharding, instrument)
+    elif profiling_mode is None:
+        from .predicates import _needs_trace_hook
+
+        # the profile hook doesn't produce line events, thus is a lot cheaper
+        profiling_mode = not _needs_trace_hook(predicate)
+        _last_tracer = Tracer(
+            threading_support, profiling_mode, sample, sample_rate, budget, builtin_events=False, sharding=sharding, instrument=instrument
+        )
+    else:
+        _last_tracer = Tracer(threading_support, profiling_mode, sample, sample_rate, budget, sharding=sharding, instrument=instrument)
 
     @atexit.register
     def atexit_cleanup(ref=weakref.ref(_last_tracer)):  # noqa: B008
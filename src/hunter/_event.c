@@ -1368,7 +1368,7 @@ static const char *__pyx_filename;
 static const char* const __pyx_f[] = {
   "src/hunter/_event.pyx",
   "src/hunter/_event.pxd",
-  ".tox/cythonize/lib64/python3.13/site-packages/Cython/Includes/cpython/type.pxd",
+  "cpython/type.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* Atomics.proto */
@@ -1592,7 +1592,6 @@ static const char* const __pyx_f[] = {
 
 /*--- Type declarations ---*/
 struct __pyx_obj_6hunter_6_event_Event;
-struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines;
 
 /* "hunter/_event.pxd":4
  * 
@@ -1639,36 +1638,13 @@ struct __pyx_obj_6hunter_6_event_Event {
 };
 
 
-/* "hunter/_event.pyx":347
- * 
- * 
- * def yield_lines(filename, module_globals, start, list collector,             # <<<<<<<<<<<<<<
- *                 limit=10):
- *     dedent = None
-*/
-struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines {
-  PyObject_HEAD
-  Py_ssize_t __pyx_v_amount;
-  PyObject *__pyx_v_collector;
-  PyObject *__pyx_v_dedent;
-  PyObject *__pyx_v_filename;
-  PyObject *__pyx_v_limit;
-  PyObject *__pyx_v_line;
-  PyObject *__pyx_v_module_globals;
-  PyObject *__pyx_v_start;
-  PyObject *__pyx_t_0;
-  Py_ssize_t __pyx_t_1;
-  PyObject *(*__pyx_t_2)(PyObject *);
-};
-
 
-
-/* "hunter/_event.pyx":46
- * 
- * 
+/* "hunter/_event.pyx":43
+ * # Events that the handler doesn't keep around are released right after the handler returns; the freelist makes the
+ * # next allocation reuse their memory instead of going through the allocator every time.
  * @cython.auto_pickle(False)             # <<<<<<<<<<<<<<
+ * @cython.freelist(64)
  * cdef class Event:
- *     """
 */
 
 struct __pyx_vtabstruct_6hunter_6_event_Event {
@@ -2552,39 +2528,9 @@ static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict,
 static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
                                               PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
 
-/* SliceObject.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
-        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
-        int has_cstart, int has_cstop, int wraparound);
-
 /* ExtTypeTest.proto */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
-/* PySequenceContains.proto */
-static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
-    int result = PySequence_Contains(seq, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
-
-/* IterNextPlain.proto */
-static CYTHON_INLINE PyObject *__Pyx_PyIter_Next_Plain(PyObject *iterator);
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-static PyObject *__Pyx_GetBuiltinNext_LimitedAPI(void);
-#endif
-
-/* IterNext.proto */
-#define __Pyx_PyIter_Next(obj) __Pyx_PyIter_Next2(obj, NULL)
-static CYTHON_INLINE PyObject *__Pyx_PyIter_Next2(PyObject *, PyObject *);
-
-/* PyLongBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static CYTHON_INLINE PyObject* __Pyx_PyLong_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyLong_SubtractObjC(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
-#endif
-
 /* GetTopmostException.proto */
 #if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
 static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
@@ -2601,30 +2547,6 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
 #endif
 
-/* FastTypeChecks.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
-#else
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
-#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
-    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
-}
-#endif
-#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
-#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
-#ifdef PyExceptionInstance_Check
-  #define __Pyx_PyBaseException_Check(obj) PyExceptionInstance_Check(obj)
-#else
-  #define __Pyx_PyBaseException_Check(obj) __Pyx_TypeCheck(obj, PyExc_BaseException)
-#endif
-
 /* GetException.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
@@ -2661,36 +2583,17 @@ static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value,
 /* GetAttr.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
 /* ArgTypeTest.proto */
 #define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
     ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
         __Pyx__ArgTypeTest(obj, type, name, exact))
 static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-        L->ob_item[len] = x;
-        #else
-        PyList_SET_ITEM(list, len, x);
-        #endif
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
-
-/* pep479.proto */
-static void __Pyx_Generator_Replace_StopIteration(int in_async_gen);
-
 /* CallTypeTraverse.proto */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
@@ -2957,102 +2860,29 @@ typedef const char *__Pyx_TypeName;
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
-/* PyObjectCall2Args.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
-
-/* PyObjectCallMethod1.proto */
-static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
-
-/* ReturnWithStopIteration.proto */
-static CYTHON_INLINE void __Pyx_ReturnWithStopIteration(PyObject* value, int async, int iternext);
-
-/* CoroutineBase.proto */
-struct __pyx_CoroutineObject;
-typedef PyObject *(*__pyx_coroutine_body_t)(struct __pyx_CoroutineObject *, PyThreadState *, PyObject *);
-#if CYTHON_USE_EXC_INFO_STACK
-#define __Pyx_ExcInfoStruct  _PyErr_StackItem
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
 #else
-typedef struct {
-    PyObject *exc_type;
-    PyObject *exc_value;
-    PyObject *exc_traceback;
-} __Pyx_ExcInfoStruct;
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
 #endif
-typedef struct __pyx_CoroutineObject {
-    PyObject_HEAD
-    __pyx_coroutine_body_t body;
-    PyObject *closure;
-    __Pyx_ExcInfoStruct gi_exc_state;
-    PyObject *gi_weakreflist;
-    PyObject *classobj;
-    PyObject *yieldfrom;
-    __Pyx_pyiter_sendfunc yieldfrom_am_send;
-    PyObject *gi_name;
-    PyObject *gi_qualname;
-    PyObject *gi_modulename;
-    PyObject *gi_code;
-    PyObject *gi_frame;
-#if CYTHON_USE_SYS_MONITORING && (CYTHON_PROFILE || CYTHON_TRACE)
-    PyMonitoringState __pyx_pymonitoring_state[__Pyx_MonitoringEventTypes_CyGen_count];
-    uint64_t __pyx_pymonitoring_version;
-#endif
-    int resume_label;
-    char is_running;
-} __pyx_CoroutineObject;
-static __pyx_CoroutineObject *__Pyx__Coroutine_New(
-    PyTypeObject *type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
-    PyObject *name, PyObject *qualname, PyObject *module_name);
-static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
-            __pyx_CoroutineObject *gen, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
-            PyObject *name, PyObject *qualname, PyObject *module_name);
-static CYTHON_INLINE void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *self);
-static int __Pyx_Coroutine_clear(PyObject *self);
-static __Pyx_PySendResult __Pyx_Coroutine_AmSend(PyObject *self, PyObject *value, PyObject **retval);
-static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value);
-static __Pyx_PySendResult __Pyx_Coroutine_Close(PyObject *self, PyObject **retval);
-static PyObject *__Pyx_Coroutine_Throw(PyObject *gen, PyObject *args);
-#if CYTHON_USE_EXC_INFO_STACK
-#define __Pyx_Coroutine_SwapException(self)
-#define __Pyx_Coroutine_ResetAndClearException(self)  __Pyx_Coroutine_ExceptionClear(&(self)->gi_exc_state)
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+#ifdef PyExceptionInstance_Check
+  #define __Pyx_PyBaseException_Check(obj) PyExceptionInstance_Check(obj)
 #else
-#define __Pyx_Coroutine_SwapException(self) {\
-    __Pyx_ExceptionSwap(&(self)->gi_exc_state.exc_type, &(self)->gi_exc_state.exc_value, &(self)->gi_exc_state.exc_traceback);\
-    __Pyx_Coroutine_ResetFrameBackpointer(&(self)->gi_exc_state);\
-    }
-#define __Pyx_Coroutine_ResetAndClearException(self) {\
-    __Pyx_ExceptionReset((self)->gi_exc_state.exc_type, (self)->gi_exc_state.exc_value, (self)->gi_exc_state.exc_traceback);\
-    (self)->gi_exc_state.exc_type = (self)->gi_exc_state.exc_value = (self)->gi_exc_state.exc_traceback = NULL;\
-    }
+  #define __Pyx_PyBaseException_Check(obj) __Pyx_TypeCheck(obj, PyExc_BaseException)
 #endif
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyGen_FetchStopIterationValue(pvalue)\
-    __Pyx_PyGen__FetchStopIterationValue(__pyx_tstate, pvalue)
-#else
-#define __Pyx_PyGen_FetchStopIterationValue(pvalue)\
-    __Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, pvalue)
-#endif
-static int __Pyx_PyGen__FetchStopIterationValue(PyThreadState *tstate, PyObject **pvalue);
-static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state);
-static char __Pyx_Coroutine_test_and_set_is_running(__pyx_CoroutineObject *gen);
-static void __Pyx_Coroutine_unset_is_running(__pyx_CoroutineObject *gen);
-static char __Pyx_Coroutine_get_is_running(__pyx_CoroutineObject *gen);
-static PyObject *__Pyx_Coroutine_get_is_running_getter(PyObject *gen, void *closure);
-#if __PYX_HAS_PY_AM_SEND == 2
-static void __Pyx_SetBackportTypeAmSend(PyTypeObject *type, __Pyx_PyAsyncMethodsStruct *static_amsend_methods, __Pyx_pyiter_sendfunc am_send);
-#endif
-static PyObject *__Pyx_Coroutine_fail_reduce_ex(PyObject *self, PyObject *arg);
-
-/* Generator.proto */
-#define __Pyx_Generator_USED
-#define __Pyx_Generator_CheckExact(obj) __Pyx_IS_TYPE(obj, __pyx_mstate_global->__pyx_GeneratorType)
-#define __Pyx_Generator_New(body, code, closure, name, qualname, module_name)\
-    __Pyx__Coroutine_New(__pyx_mstate_global->__pyx_GeneratorType, body, code, closure, name, qualname, module_name)
-static PyObject *__Pyx_Generator_Next(PyObject *self);
-static int __pyx_Generator_init(PyObject *module);
-static CYTHON_INLINE PyObject *__Pyx_Generator_GetInlinedResult(PyObject *self);
 
 /* GetRuntimeVersion.proto */
 static unsigned long __Pyx_get_runtime_version(void);
@@ -3153,6 +2983,7 @@ static PyObject *__pyx_v_6hunter_6_event_RETURN = 0;
 static PyObject const **__pyx_v_6hunter_6_event_KIND_NAMES;
 static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_event_fast_clone(struct __pyx_obj_6hunter_6_event_Event *); /*proto*/
 static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_event_fast_detach(struct __pyx_obj_6hunter_6_event_Event *, PyObject *); /*proto*/
+static CYTHON_INLINE void __pyx_f_6hunter_6_event_init_event(struct __pyx_obj_6hunter_6_event_Event *, FrameType, int, PyObject *, int, int, int); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "hunter._event"
@@ -3173,28 +3004,21 @@ static const char __pyx_k__2[] = "";
 static const char __pyx_k__3[] = "?";
 static const char __pyx_k__4[] = ".";
 static const char __pyx_k__5[] = "\230\001";
-static const char __pyx_k__6[] = "\200\001\330\020\021";
 static const char __pyx_k_eq[] = "__eq__";
 static const char __pyx_k_gc[] = "gc";
-static const char __pyx_k_py[] = ".py";
 static const char __pyx_k_so[] = ".so";
 static const char __pyx_k_A_t[] = "\200A\340\010\017\210t\220>\240\021";
 static const char __pyx_k_A_z[] = "\200A\330\010\017\210z\230\021\230!";
 static const char __pyx_k_all[] = "__all__";
 static const char __pyx_k_arg[] = "arg";
-static const char __pyx_k_def[] = "def";
 static const char __pyx_k_get[] = "get";
 static const char __pyx_k_pop[] = "pop";
-static const char __pyx_k_pyc[] = ".pyc";
 static const char __pyx_k_pyd[] = ".pyd";
-static const char __pyx_k_pyo[] = ".pyo";
-static const char __pyx_k_pyx[] = ".pyx";
-static const char __pyx_k_sub[] = "sub";
 static const char __pyx_k_CALL[] = "CALL";
 static const char __pyx_k_LINE[] = "LINE";
 static const char __pyx_k_call[] = "call";
 static const char __pyx_k_code[] = "_code";
-static const char __pyx_k_file[] = "__file__";
+static const char __pyx_k_file[] = " file";
 static const char __pyx_k_func[] = "__func__";
 static const char __pyx_k_init[] = "__init__";
 static const char __pyx_k_item[] = "item";
@@ -3202,11 +3026,8 @@ static const char __pyx_k_kind[] = "kind";
 static const char __pyx_k_line[] = "line";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "name";
-static const char __pyx_k_next[] = "next";
 static const char __pyx_k_repr[] = "__repr__";
 static const char __pyx_k_self[] = "self";
-static const char __pyx_k_send[] = "send";
-static const char __pyx_k_site[] = "site";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_util[] = "util";
 static const char __pyx_k_A_t_1[] = "\200A\340\010\017\210t\320\023#\2401";
@@ -3218,32 +3039,24 @@ static const char __pyx_k_A_uCq[] = "\200A\330\010\017\210u\220C\220q";
 static const char __pyx_k_Event[] = "Event";
 static const char __pyx_k_UNSET[] = "UNSET";
 static const char __pyx_k_calls[] = "calls";
-static const char __pyx_k_class[] = "class";
 static const char __pyx_k_clone[] = "clone";
-static const char __pyx_k_close[] = "close";
-static const char __pyx_k_const[] = "const";
 static const char __pyx_k_depth[] = "depth";
+static const char __pyx_k_event[] = "event";
 static const char __pyx_k_frame[] = "frame";
 static const char __pyx_k_get_2[] = "__get__";
 static const char __pyx_k_ident[] = "ident";
 static const char __pyx_k_items[] = "items";
 static const char __pyx_k_limit[] = "limit";
 static const char __pyx_k_other[] = "other";
-static const char __pyx_k_split[] = "split";
 static const char __pyx_k_start[] = "start";
-static const char __pyx_k_throw[] = "throw";
-static const char __pyx_k_value[] = "value";
+static const char __pyx_k_A_6_e7[] = "\200A\330\010\022\220!\2206\230\027\240\006\240e\2507\260'\270\021";
 static const char __pyx_k_A_wavQ[] = "\200A\330\010\017\210w\220a\220v\230Q";
 static const char __pyx_k_RETURN[] = "RETURN";
-static const char __pyx_k_amount[] = "amount";
+static const char __pyx_k_append[] = "append";
 static const char __pyx_k_code_2[] = "code";
-static const char __pyx_k_dedent[] = "dedent";
 static const char __pyx_k_detach[] = "detach";
 static const char __pyx_k_enable[] = "enable";
-static const char __pyx_k_exists[] = "exists";
-static const char __pyx_k_file_2[] = " file";
 static const char __pyx_k_func_2[] = "func";
-static const char __pyx_k_lambda[] = "lambda";
 static const char __pyx_k_lineno[] = " lineno=";
 static const char __pyx_k_locals[] = "locals";
 static const char __pyx_k_module[] = " module=";
@@ -3252,17 +3065,14 @@ static const char __pyx_k_object[] = "object";
 static const char __pyx_k_return[] = "return";
 static const char __pyx_k_source[] = "_source";
 static const char __pyx_k_stdlib[] = "_stdlib";
-static const char __pyx_k_string[] = "<string>";
 static const char __pyx_k_thread[] = "_thread";
 static const char __pyx_k_values[] = "values";
 static const char __pyx_k_builtin[] = "builtin";
 static const char __pyx_k_disable[] = "disable";
-static const char __pyx_k_findall[] = "findall";
 static const char __pyx_k_getitem[] = "__getitem__";
 static const char __pyx_k_getline[] = "getline";
 static const char __pyx_k_globals[] = "globals";
 static const char __pyx_k_os_path[] = "os.path";
-static const char __pyx_k_partial[] = "partial";
 static const char __pyx_k_add_note[] = "add_note";
 static const char __pyx_k_basename[] = "basename";
 static const char __pyx_k_detached[] = "detached";
@@ -3280,33 +3090,30 @@ static const char __pyx_k_module_5[] = "_module";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_set_name[] = "__set_name__";
 static const char __pyx_k_splitext[] = "splitext";
-static const char __pyx_k_tokenize[] = "tokenize";
 static const char __pyx_k_EXCEPTION[] = "EXCEPTION";
 static const char __pyx_k_NO_SOURCE[] = "\077\077? NO SOURCE: ";
 static const char __pyx_k_candidate[] = "candidate";
 static const char __pyx_k_collector[] = "collector";
 static const char __pyx_k_exception[] = "exception";
-static const char __pyx_k_f_globals[] = "f_globals";
 static const char __pyx_k_first_arg[] = "first_arg";
-static const char __pyx_k_functools[] = "functools";
 static const char __pyx_k_globals_2[] = "_globals";
 static const char __pyx_k_isenabled[] = "isenabled";
 static const char __pyx_k_linecache[] = "linecache";
 static const char __pyx_k_threadidn[] = "_threadidn";
 static const char __pyx_k_threading[] = "threading";
 static const char __pyx_k_A_4wc_a_4q[] = "\200A\330\010\013\2104\210w\220c\230\021\330\014\023\320\023)\250\021\250$\250a\340\014\023\2204\220q";
+static const char __pyx_k_A_Qhaz1B_R[] = "\320\000A\300\021\340\004\013\320\013\035\230Q\230h\240a\240z\3201B\300'\310\031\320R[\320[\\";
 static const char __pyx_k_Event_kind[] = "<Event kind=";
 static const char __pyx_k_KIND_NAMES[] = "KIND_NAMES";
-static const char __pyx_k_TokenError[] = "TokenError";
 static const char __pyx_k_fast_clone[] = "fast_clone";
+static const char __pyx_k_fast_event[] = "fast_event";
 static const char __pyx_k_filename_2[] = "filename";
 static const char __pyx_k_filename_3[] = "_filename";
 static const char __pyx_k_fullsource[] = "_fullsource";
 static const char __pyx_k_function_2[] = "function";
 static const char __pyx_k_function_3[] = "_function";
-static const char __pyx_k_namedtuple[] = "namedtuple_";
+static const char __pyx_k_init_event[] = "init_event";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
-static const char __pyx_k_startswith[] = "startswith";
 static const char __pyx_k_threadname[] = "_threadname";
 static const char __pyx_k_A_q_t_d_4_a[] = "\200A\330\010\017\210q\330\014\020\220\007\220t\230;\240d\250)\2604\260{\300$\300a";
 static const char __pyx_k_Event_clone[] = "Event.clone";
@@ -3318,52 +3125,50 @@ static const char __pyx_k_Event_detach[] = "Event.detach";
 static const char __pyx_k_if_same_code[] = "if_same_code";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
 static const char __pyx_k_value_filter[] = "value_filter";
+static const char __pyx_k_HE_awgV5_wa_1[] = "\200\001\330\004\014\210H\220E\230\030\240\021\240!\330\004\016\210a\210w\220g\230V\2405\250\007\250w\260a\330\004\013\2101";
 static const char __pyx_k_hunter__event[] = "hunter._event";
 static const char __pyx_k_lineno_getter[] = "lineno_getter";
 static const char __pyx_k_locals_getter[] = "locals_getter";
 static const char __pyx_k_module_getter[] = "module_getter";
-static const char __pyx_k_pkg_resources[] = "pkg_resources";
 static const char __pyx_k_source_getter[] = "source_getter";
 static const char __pyx_k_stdlib_getter[] = "stdlib_getter";
 static const char __pyx_k_A_4y_1_7q_A_t1[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\020\220\013\320\0337\260q\270\004\270A\330\010\017\210t\2201";
 static const char __pyx_k_current_thread[] = "current_thread";
+static const char __pyx_k_get_fullsource[] = "get_fullsource";
 static const char __pyx_k_globals_getter[] = "globals_getter";
 static const char __pyx_k_module_globals[] = "module_globals";
 static const char __pyx_k_filename_getter[] = "filename_getter";
 static const char __pyx_k_function_getter[] = "function_getter";
 static const char __pyx_k_function_object[] = "_function_object";
-static const char __pyx_k_generate_tokens[] = "generate_tokens";
+static const char __pyx_k_get_code_fields[] = "get_code_fields";
 static const char __pyx_k_get_func_in_mro[] = "get_func_in_mro";
 static const char __pyx_k_get_main_thread[] = "get_main_thread";
 static const char __pyx_k_threadid_getter[] = "threadid_getter";
-static const char __pyx_k_CYTHON_SUFFIX_RE[] = "CYTHON_SUFFIX_RE";
-static const char __pyx_k_SYS_PREFIX_PATHS[] = "SYS_PREFIX_PATHS";
 static const char __pyx_k_fullsource_getter[] = "fullsource_getter";
 static const char __pyx_k_threading_support[] = "threading_support";
 static const char __pyx_k_threadname_getter[] = "threadname_getter";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_instruction_getter[] = "instruction_getter";
+static const char __pyx_k_yield_source_lines[] = "yield_source_lines";
 static const char __pyx_k_A_4_Q_t1_M_T_M_1_t1[] = "\200A\330\010\013\2104\210{\230#\230Q\330\014\017\210t\2201\330\020\024\220M\240\024\240T\250\021\340\020\024\220M\240\024\240\\\260\022\2601\330\010\017\210t\2201";
-static const char __pyx_k_SITE_PACKAGES_PATHS[] = "SITE_PACKAGES_PATHS";
 static const char __pyx_k_A_4z_A_t1_Kq_L_9_a_t1[] = "\200A\330\010\013\2104\210z\230\023\230A\330\014\017\210t\2201\330\020\024\220K\230q\340\020\024\220L\320 9\270\021\270$\270a\330\010\017\210t\2201";
-static const char __pyx_k_LEADING_WHITESPACE_RE[] = "LEADING_WHITESPACE_RE";
 static const char __pyx_k_src_hunter__event_pxd[] = "src/hunter/_event.pxd";
 static const char __pyx_k_src_hunter__event_pyx[] = "src/hunter/_event.pyx";
 static const char __pyx_k_A_4_Cq_t9Cq_K_Q_t81_t1[] = "\200A\330\010\013\2104\210}\230C\230q\330\014\017\210t\2209\230C\230q\330\020\024\220K\230~\250Q\330\014\020\220\017\230t\2408\2501\330\010\017\210t\2201";
 static const char __pyx_k_A_4y_1_t1_Kq_K_7q_A_t1[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\017\210t\2201\330\020\024\220K\230q\340\020\024\220K\320\0377\260q\270\004\270A\330\010\017\210t\2201";
 static const char __pyx_k_A_4_3a_q_uG5_HCt1_N_N_t1[] = "\200A\360\006\000\t\014\2104\210|\2303\230a\330\014\026\320\026/\250q\330\014\023\220?\240!\330\014\017\210u\220G\2305\240\004\240H\250C\250t\2601\330\020\024\220N\240!\340\020\024\220N\240!\330\010\017\210t\2201";
 static const char __pyx_k_A_4y_1_t1_T_XT_a_wc_1_t1[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\017\210t\2201\330\020\031\230\024\230T\240\021\340\020\031\230\024\230X\240T\250\021\250,\260a\330\014\017\210w\220c\230\021\330\020\031\230\021\330\014\020\220\013\2301\330\010\017\210t\2201";
+static const char __pyx_k_A_4_Q_D_4_4tSaaeeiixxy_t1[] = "\200A\330\010\013\2104\210{\230#\230Q\330\014\020\220\014\230D\240\013\250?\270!\2704\270|\3104\310t\320Sa\320ae\320ei\320ix\320xy\330\010\017\210t\2201";
+static const char __pyx_k_A_4y_1_D_4_4tSaaeeiixxy_t1[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\020\220\014\230D\240\013\250?\270!\2704\270|\3104\310t\320Sa\320ae\320ei\320ix\320xy\330\010\017\210t\2201";
 static const char __pyx_k_NO_SOURCE_not_reading_binary[] = "\077\077? NO SOURCE: not reading binary ";
 static const char __pyx_k_HE_A_D_a_a_Q_a_Q_d_a_d_A_T_d_T[] = "\200\001\330\004\014\210H\220E\230\030\240\021\240!\330\004\t\210\027\220\004\220A\330\004\t\210\033\220D\230\001\330\004\t\210\031\220$\220a\330\004\t\210\031\220$\220a\330\004\t\210\034\220Q\330\004\t\210\031\220$\220a\330\004\t\210\030\220\024\220Q\330\004\t\320\t\036\230d\240!\330\004\t\210\031\220$\220a\330\004\t\210\035\220d\230!\330\004\t\210\037\230\004\230A\330\004\t\320\t\035\230T\240\021\330\004\t\210\035\220d\230!\330\004\t\210\034\220T\230\021\330\004\t\210\033\220D\230\001\330\004\t\210\033\220D\230\001\330\004\t\210\033\220D\230\001\330\004\t\210\033\220D\230\001\330\004\t\210\033\220D\230\001\330\004\t\210\036\220t\2301\330\004\t\210\037\230\004\230A\330\004\t\210\033\220D\230\001\330\004\t\320\t\031\230\024\230Q\330\004\013\2101";
 static const char __pyx_k_HE_l_d_a_T_d_D_a_D_a_D_a_D_a_t[] = "\200\001\330\004\014\210H\220E\230\030\240\021\240!\340\004\t\210\031\220$\220l\240!\330\004\t\210\035\220d\320\032*\250!\330\004\t\210\037\230\004\320\034.\250a\330\004\t\320\t\035\230T\240\021\330\004\t\210\035\220d\320\032*\250!\330\004\t\210\033\220D\230\016\240a\330\004\t\210\033\220D\230\016\240a\330\004\t\210\033\220D\230\016\240a\330\004\t\210\033\220D\230\016\240a\330\004\t\210\036\220t\320\033+\2501\330\004\t\210\037\230\004\320\034.\250a\330\004\t\320\t\031\230\024\320\0350\260\001\340\004\007\200q\330\010\r\210\\\230\021\230%\230|\2501\250G\2604\260u\270I\300T\310\030\320QW\320WX\330\010\r\210[\230\001\230\025\230l\250!\2507\260$\260e\2709\300D\310\007\310v\320UV\330\010\r\210W\220L\240\001\240\024\240Q\340\010\r\210\\\230\021\330\010\r\210[\230\001\330\010\r\210W\220A\340\004\t\210\033\220D\230\001\330\004\t\210\031\220$\220a\330\004\t\210\031\220$\220a\330\004\t\210\034\220Q\330\004\t\210\030\220\024\220Q\330\004\t\320\t\036\230d\240!\340\004\013\2101";
-static const char __pyx_k_A_4_Cq_O1_t_q_4vS_t4y_1_A_Cwc_E[] = "\200A\360\010\000\t\014\2104\210}\230C\230q\330\014\r\330\020\024\220O\2401\330\020\027\220t\230<\240q\330\020\023\2204\220v\230S\240\007\240t\2504\250y\270\003\2701\330\024\034\230A\330\024\025\330\030\034\230C\230w\240c\250\023\250E\260\037\300\001\330\034#\2401\330 !\330 +\2501\330$(\250\001\330$(\250\006\250a\330$(\250\010\260\002\260!\330$%\360\010\000\035 \230v\240T\250\027\260\t\270\021\330 $\240O\2602\260U\270!\2701\330 !\330\033\034\330\030\031\330\020\023\2204\220}\240C\240q\330\024\030\230\017\240w\250a\250t\260;\270d\300)\3104\310q\330\014\023\220=\240\001\330\020\024\220O\2402\320%8\270\001\330\010\017\210t\2201";
 static const char __pyx_k_A_4q_4q_3a_4_1_t9Cq_q_HD_Zq_q_1[] = "\200A\360\006\000\t\014\2104\210q\330\014\023\2204\220q\330\r\021\320\021#\2403\240a\330\014\023\2204\220|\2401\330\014\017\210t\2209\230C\230q\330\020\027\220q\340\014\030\230\004\230H\240D\250\001\250\024\250Z\260q\330\014\023\220<\230q\240\013\2501\360\n\000\r\020\210u\220C\220u\230D\240\004\240M\260\023\260A\330\020\034\230D\240\007\240t\2501\320,>\270a\270u\300A\300Q\330\020\027\220\177\240a\240{\260!\360\006\000\r\020\210u\220C\220q\330\020\024\220E\230\024\230X\240W\250A\330\024\027\220t\230:\240Q\240c\250\021\330\030\031\330\024\033\230?\250!\2503\250a\330\024\027\220u\230G\2401\330\030\031\330\014\020\320\020$\240A\330\010\017\210t\2201";
 static const char __pyx_k_A_4y_1_t9IRwa_Kr_GxqPXXYY_hhiij[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\017\210t\2209\230I\240R\240w\250a\330\020\024\220K\230r\320!G\300x\310q\320PX\320XY\320Y]\320]h\320hi\320ij\330\014\r\330\020\024\220K\230w\240a\240t\250;\260d\270)\3004\300q\330\014\023\220=\240\001\330\020\024\220K\230r\320!4\260A\340\010\017\210t\2201";
-static const char __pyx_k_A_G1_IQ_HF_AQ_IQ_IQ_L_KuBa_IQ_M[] = "\200A\330\010\014\210G\2201\330\010\014\210I\220Q\330\010\014\210H\220F\230*\240A\240Q\330\010\014\210I\220Q\330\010\014\210I\220Q\330\010\014\320\014!\240\021\330\010\014\210L\230\001\330\010\014\210K\220u\230B\230a\340\010\014\210I\220Q\330\010\014\210M\230\021\330\010\014\210O\2301\330\010\014\320\014 \240\001\330\010\014\210M\230\021\330\010\014\210L\230\001\330\010\014\210K\220q\330\010\014\210K\220q\330\010\014\210K\220q\330\010\014\210K\220q\330\010\014\210K\220q\330\010\014\210N\230!\330\010\014\210O\2301\330\010\014\210K\220q\330\010\014\320\014\034\230A";
-static const char __pyx_k_A_4_Q_4_1_t1_t1_4xt1A_t1_1_HA_83[] = "\200A\340\010\013\2104\210{\230#\230Q\330\014\023\2204\220|\2401\330\014\027\220t\2301\330\014\017\210t\2201\330\020\033\2304\230x\240t\2501\250A\330\014\017\210t\2201\330\020\033\2301\330\021\031\230\031\240\"\240H\250A\330\020\033\2308\2403\240a\330\021\031\230\031\240\"\240G\2501\330\020\035\320\035-\250T\260\021\260$\260a\330\020\024\220G\2301\230H\240A\330\024!\240\033\250B\250a\330\024\027\220v\230Q\230a\330\030#\2401\330\030\031\340\014\020\220\r\230Q\330\010\017\210t\2201";
+static const char __pyx_k_z_a_Q_E_1_a_Q_a_Q_A_A_A_A_A_q_A[] = "\200\001\340\004\t\210\027\220\001\330\004\t\210\031\220!\330\004\t\210\030\220\026\220z\240\021\240!\330\004\t\210\031\220!\330\004\t\210\031\220!\330\004\t\320\t\036\230a\330\004\t\210\034\220Q\330\004\t\210\033\220E\230\022\2301\340\004\t\210\031\220!\330\004\t\210\035\220a\330\004\t\210\037\230\001\330\004\t\320\t\035\230Q\330\004\t\210\035\220a\330\004\t\210\034\220Q\330\004\t\210\033\220A\330\004\t\210\033\220A\330\004\t\210\033\220A\330\004\t\210\033\220A\330\004\t\210\033\220A\330\004\t\210\036\220q\330\004\t\210\037\230\001\330\004\t\210\033\220A\330\004\t\320\t\031\230\021";
+static const char __pyx_k_A_4_Cq_t_q_4vS_t4y_1_Qd_J_dR_ddh[] = "\200A\360\006\000\t\014\2104\210}\230C\230q\330\014\r\330\020\027\220t\230<\240q\330\020\023\2204\220v\230S\240\007\240t\2504\250y\270\003\2701\330\024\030\230\017\240~\260Q\260d\320:J\310$\310d\320R`\320`d\320dh\320hw\320wx\340\024\030\230\017\240w\250a\250t\3203C\3004\300t\310>\320Y]\320]a\320ap\320pq\330\014\023\220=\240\001\330\020\024\220O\2402\320%8\270\001\330\010\017\210t\2201";
 static const char __pyx_k_A_4_S_at1_nAT_Q_xt3ay_a_G1A_A_t1[] = "\200A\360\006\000\t\014\2104\210~\230S\240\001\330\014\027\320\027.\250a\250t\2601\330\014\026\220n\240A\240T\250\034\260Q\330\014\017\210x\220t\2303\230a\230y\250\002\250,\260a\330\020\024\320\024$\240G\2501\250A\340\020\024\320\024$\240A\330\010\017\210t\2201";
-static const char __pyx_k_A_4y_1_4wfAQ_s_Kq_Zs_U_g_X___ggj[] = "\200A\330\010\013\2104\210y\230\003\2301\330\014\033\2304\230w\240f\250A\250Q\330\014\017\320\017\037\230s\240!\340\020\024\220K\230q\330\021\025\220Z\230s\240+\250U\260$\260g\270[\310\001\310\037\320X[\320[_\320_g\320gj\320jk\340\020\024\220K\230q\330\021\025\220Y\230k\250\021\250!\340\020\024\220K\230q\330\021\025\220Y\230k\250\021\250!\330\020\024\220K\230q\340\020\024\220K\230q\330\010\017\210t\2201";
 static const char __pyx_k_Note_that_Cython_is_deliberately[] = "Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.";
 /* #### Code section: decls ### */
 static int __pyx_pf_6hunter_6_event_5Event___init__(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self, FrameType __pyx_v_frame, int __pyx_v_kind, PyObject *__pyx_v_arg, int __pyx_v_depth, int __pyx_v_calls, int __pyx_v_threading_support); /* proto */
@@ -3396,7 +3201,6 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8detached___get__(struct __pyx_
 static PyObject *__pyx_pf_6hunter_6_event_5Event_7builtin___get__(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_6hunter_6_event_yield_lines(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_filename, PyObject *__pyx_v_module_globals, PyObject *__pyx_v_start, PyObject *__pyx_v_collector, PyObject *__pyx_v_limit); /* proto */
 static PyObject *__pyx_tp_new_6hunter_6_event_Event(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_6hunter_6_event___pyx_scope_struct__yield_lines(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 /* SmallCodeConfig */
@@ -3437,28 +3241,18 @@ typedef struct {
   #endif
   PyTypeObject *__pyx_ptype_7cpython_4type_type;
   PyObject *__pyx_type_6hunter_6_event_Event;
-  PyObject *__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines;
   PyTypeObject *__pyx_ptype_6hunter_6_event_CodeType;
   PyTypeObject *__pyx_ptype_6hunter_6_event_Event;
-  PyTypeObject *__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
-  PyObject *__pyx_slice[1];
-  PyObject *__pyx_tuple[7];
-  PyObject *__pyx_codeobj_tab[44];
-  PyObject *__pyx_string_tab[169];
-  PyObject *__pyx_int_1;
+  PyObject *__pyx_tuple[5];
+  PyObject *__pyx_codeobj_tab[46];
+  PyObject *__pyx_string_tab[141];
   PyObject *__pyx_int_10;
-  PyObject *__pyx_int_neg_1;
 /* #### Code section: module_state_contents ### */
-/* IterNextPlain.module_state_decls */
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-PyObject *__Pyx_GetBuiltinNext_LimitedAPI_cache;
-#endif
-
 
 #if CYTHON_USE_FREELISTS
-struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *__pyx_freelist_6hunter_6_event___pyx_scope_struct__yield_lines[8];
-int __pyx_freecount_6hunter_6_event___pyx_scope_struct__yield_lines;
+struct __pyx_obj_6hunter_6_event_Event *__pyx_freelist_6hunter_6_event_Event[64];
+int __pyx_freecount_6hunter_6_event_Event;
 #endif
 /* CommonTypesMetaclass.module_state_decls */
 PyTypeObject *__pyx_CommonTypesMetaclassType;
@@ -3498,173 +3292,145 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 /* #### Code section: constant_name_defines ### */
 #define __pyx_kp_u_ __pyx_string_tab[0]
 #define __pyx_n_u_CALL __pyx_string_tab[1]
-#define __pyx_n_u_CYTHON_SUFFIX_RE __pyx_string_tab[2]
-#define __pyx_n_u_EXCEPTION __pyx_string_tab[3]
-#define __pyx_n_u_Event __pyx_string_tab[4]
-#define __pyx_n_u_Event_clone __pyx_string_tab[5]
-#define __pyx_n_u_Event_detach __pyx_string_tab[6]
-#define __pyx_kp_u_Event_kind __pyx_string_tab[7]
-#define __pyx_n_u_KIND_NAMES __pyx_string_tab[8]
-#define __pyx_n_u_LEADING_WHITESPACE_RE __pyx_string_tab[9]
-#define __pyx_n_u_LINE __pyx_string_tab[10]
-#define __pyx_kp_u_NO_SOURCE __pyx_string_tab[11]
-#define __pyx_kp_u_NO_SOURCE_not_reading_binary __pyx_string_tab[12]
-#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[13]
-#define __pyx_n_u_RETURN __pyx_string_tab[14]
-#define __pyx_n_u_SITE_PACKAGES_PATHS __pyx_string_tab[15]
-#define __pyx_n_u_SYS_PREFIX_PATHS __pyx_string_tab[16]
-#define __pyx_n_u_TokenError __pyx_string_tab[17]
-#define __pyx_n_u_UNSET __pyx_string_tab[18]
-#define __pyx_kp_u__2 __pyx_string_tab[19]
-#define __pyx_kp_u__3 __pyx_string_tab[20]
-#define __pyx_kp_u__4 __pyx_string_tab[21]
-#define __pyx_kp_u_add_note __pyx_string_tab[22]
-#define __pyx_n_u_all __pyx_string_tab[23]
-#define __pyx_n_u_amount __pyx_string_tab[24]
-#define __pyx_n_u_arg __pyx_string_tab[25]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[26]
-#define __pyx_n_u_basename __pyx_string_tab[27]
-#define __pyx_n_u_builtin __pyx_string_tab[28]
-#define __pyx_n_u_call __pyx_string_tab[29]
-#define __pyx_n_u_calls __pyx_string_tab[30]
-#define __pyx_n_u_candidate __pyx_string_tab[31]
-#define __pyx_n_u_class __pyx_string_tab[32]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[33]
-#define __pyx_n_u_clone __pyx_string_tab[34]
-#define __pyx_n_u_close __pyx_string_tab[35]
-#define __pyx_n_u_code __pyx_string_tab[36]
-#define __pyx_n_u_code_2 __pyx_string_tab[37]
-#define __pyx_n_u_code_getter __pyx_string_tab[38]
-#define __pyx_n_u_collector __pyx_string_tab[39]
-#define __pyx_n_u_const __pyx_string_tab[40]
-#define __pyx_n_u_current_thread __pyx_string_tab[41]
-#define __pyx_n_u_dedent __pyx_string_tab[42]
-#define __pyx_n_u_def __pyx_string_tab[43]
-#define __pyx_n_u_depth __pyx_string_tab[44]
-#define __pyx_n_u_detach __pyx_string_tab[45]
-#define __pyx_n_u_detached __pyx_string_tab[46]
-#define __pyx_kp_u_disable __pyx_string_tab[47]
-#define __pyx_kp_u_enable __pyx_string_tab[48]
-#define __pyx_n_u_endswith __pyx_string_tab[49]
-#define __pyx_n_u_eq __pyx_string_tab[50]
-#define __pyx_n_u_exception __pyx_string_tab[51]
-#define __pyx_n_u_exists __pyx_string_tab[52]
-#define __pyx_n_u_f_globals __pyx_string_tab[53]
-#define __pyx_n_u_fast_clone __pyx_string_tab[54]
-#define __pyx_n_u_fast_detach __pyx_string_tab[55]
-#define __pyx_n_u_file __pyx_string_tab[56]
-#define __pyx_kp_u_file_2 __pyx_string_tab[57]
-#define __pyx_kp_u_filename __pyx_string_tab[58]
-#define __pyx_n_u_filename_2 __pyx_string_tab[59]
-#define __pyx_n_u_filename_3 __pyx_string_tab[60]
-#define __pyx_n_u_filename_getter __pyx_string_tab[61]
-#define __pyx_n_u_findall __pyx_string_tab[62]
-#define __pyx_n_u_first_arg __pyx_string_tab[63]
-#define __pyx_n_u_frame __pyx_string_tab[64]
-#define __pyx_n_u_fullsource __pyx_string_tab[65]
-#define __pyx_n_u_fullsource_getter __pyx_string_tab[66]
-#define __pyx_n_u_func __pyx_string_tab[67]
-#define __pyx_n_u_func_2 __pyx_string_tab[68]
-#define __pyx_kp_u_function __pyx_string_tab[69]
-#define __pyx_n_u_function_2 __pyx_string_tab[70]
-#define __pyx_n_u_function_3 __pyx_string_tab[71]
-#define __pyx_n_u_function_getter __pyx_string_tab[72]
-#define __pyx_n_u_function_object __pyx_string_tab[73]
-#define __pyx_n_u_functools __pyx_string_tab[74]
-#define __pyx_kp_u_gc __pyx_string_tab[75]
-#define __pyx_n_u_generate_tokens __pyx_string_tab[76]
-#define __pyx_n_u_get __pyx_string_tab[77]
-#define __pyx_n_u_get_2 __pyx_string_tab[78]
-#define __pyx_n_u_get_func_in_mro __pyx_string_tab[79]
-#define __pyx_n_u_get_main_thread __pyx_string_tab[80]
-#define __pyx_n_u_getitem __pyx_string_tab[81]
-#define __pyx_n_u_getline __pyx_string_tab[82]
-#define __pyx_n_u_getlines __pyx_string_tab[83]
-#define __pyx_n_u_globals __pyx_string_tab[84]
-#define __pyx_n_u_globals_2 __pyx_string_tab[85]
-#define __pyx_n_u_globals_getter __pyx_string_tab[86]
-#define __pyx_n_u_hunter__event __pyx_string_tab[87]
-#define __pyx_n_u_ident __pyx_string_tab[88]
-#define __pyx_n_u_if_same_code __pyx_string_tab[89]
-#define __pyx_n_u_init __pyx_string_tab[90]
-#define __pyx_n_u_instruction __pyx_string_tab[91]
-#define __pyx_n_u_instruction_getter __pyx_string_tab[92]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[93]
-#define __pyx_kp_u_isenabled __pyx_string_tab[94]
-#define __pyx_n_u_item __pyx_string_tab[95]
-#define __pyx_n_u_items __pyx_string_tab[96]
-#define __pyx_n_u_kind __pyx_string_tab[97]
-#define __pyx_n_u_lambda __pyx_string_tab[98]
-#define __pyx_n_u_limit __pyx_string_tab[99]
-#define __pyx_n_u_line __pyx_string_tab[100]
-#define __pyx_n_u_linecache __pyx_string_tab[101]
-#define __pyx_kp_u_lineno __pyx_string_tab[102]
-#define __pyx_n_u_lineno_2 __pyx_string_tab[103]
-#define __pyx_n_u_lineno_3 __pyx_string_tab[104]
-#define __pyx_n_u_lineno_getter __pyx_string_tab[105]
-#define __pyx_n_u_locals __pyx_string_tab[106]
-#define __pyx_n_u_locals_2 __pyx_string_tab[107]
-#define __pyx_n_u_locals_getter __pyx_string_tab[108]
-#define __pyx_n_u_main __pyx_string_tab[109]
-#define __pyx_kp_u_module __pyx_string_tab[110]
-#define __pyx_n_u_module_2 __pyx_string_tab[111]
-#define __pyx_n_u_module_3 __pyx_string_tab[112]
-#define __pyx_kp_u_module_4 __pyx_string_tab[113]
-#define __pyx_n_u_module_5 __pyx_string_tab[114]
-#define __pyx_n_u_module_getter __pyx_string_tab[115]
-#define __pyx_n_u_module_globals __pyx_string_tab[116]
-#define __pyx_n_u_name __pyx_string_tab[117]
-#define __pyx_n_u_name_2 __pyx_string_tab[118]
-#define __pyx_n_u_namedtuple __pyx_string_tab[119]
-#define __pyx_n_u_next __pyx_string_tab[120]
-#define __pyx_n_u_object __pyx_string_tab[121]
-#define __pyx_n_u_os_path __pyx_string_tab[122]
-#define __pyx_n_u_other __pyx_string_tab[123]
-#define __pyx_n_u_partial __pyx_string_tab[124]
-#define __pyx_n_u_pkg_resources __pyx_string_tab[125]
-#define __pyx_n_u_pop __pyx_string_tab[126]
-#define __pyx_kp_u_py __pyx_string_tab[127]
-#define __pyx_kp_u_pyc __pyx_string_tab[128]
-#define __pyx_kp_u_pyd __pyx_string_tab[129]
-#define __pyx_kp_u_pyo __pyx_string_tab[130]
-#define __pyx_kp_u_pyx __pyx_string_tab[131]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[132]
-#define __pyx_n_u_qualname __pyx_string_tab[133]
-#define __pyx_n_u_repr __pyx_string_tab[134]
-#define __pyx_n_u_return __pyx_string_tab[135]
-#define __pyx_n_u_self __pyx_string_tab[136]
-#define __pyx_n_u_send __pyx_string_tab[137]
-#define __pyx_n_u_set_name __pyx_string_tab[138]
-#define __pyx_n_u_site __pyx_string_tab[139]
-#define __pyx_kp_u_so __pyx_string_tab[140]
-#define __pyx_n_u_source __pyx_string_tab[141]
-#define __pyx_n_u_source_getter __pyx_string_tab[142]
-#define __pyx_n_u_split __pyx_string_tab[143]
-#define __pyx_n_u_splitext __pyx_string_tab[144]
-#define __pyx_kp_u_src_hunter__event_pxd __pyx_string_tab[145]
-#define __pyx_kp_u_src_hunter__event_pyx __pyx_string_tab[146]
-#define __pyx_n_u_start __pyx_string_tab[147]
-#define __pyx_n_u_startswith __pyx_string_tab[148]
-#define __pyx_n_u_stdlib __pyx_string_tab[149]
-#define __pyx_n_u_stdlib_getter __pyx_string_tab[150]
-#define __pyx_kp_u_string __pyx_string_tab[151]
-#define __pyx_n_u_sub __pyx_string_tab[152]
-#define __pyx_n_u_test __pyx_string_tab[153]
-#define __pyx_n_u_thread __pyx_string_tab[154]
-#define __pyx_n_u_threadid_getter __pyx_string_tab[155]
-#define __pyx_n_u_threadidn __pyx_string_tab[156]
-#define __pyx_n_u_threading __pyx_string_tab[157]
-#define __pyx_n_u_threading_support __pyx_string_tab[158]
-#define __pyx_n_u_threadname __pyx_string_tab[159]
-#define __pyx_n_u_threadname_getter __pyx_string_tab[160]
-#define __pyx_n_u_throw __pyx_string_tab[161]
-#define __pyx_n_u_tokenize __pyx_string_tab[162]
-#define __pyx_n_u_util __pyx_string_tab[163]
-#define __pyx_n_u_v __pyx_string_tab[164]
-#define __pyx_n_u_value __pyx_string_tab[165]
-#define __pyx_n_u_value_filter __pyx_string_tab[166]
-#define __pyx_n_u_values __pyx_string_tab[167]
-#define __pyx_n_u_yield_lines __pyx_string_tab[168]
+#define __pyx_n_u_EXCEPTION __pyx_string_tab[2]
+#define __pyx_n_u_Event __pyx_string_tab[3]
+#define __pyx_n_u_Event_clone __pyx_string_tab[4]
+#define __pyx_n_u_Event_detach __pyx_string_tab[5]
+#define __pyx_kp_u_Event_kind __pyx_string_tab[6]
+#define __pyx_n_u_KIND_NAMES __pyx_string_tab[7]
+#define __pyx_n_u_LINE __pyx_string_tab[8]
+#define __pyx_kp_u_NO_SOURCE __pyx_string_tab[9]
+#define __pyx_kp_u_NO_SOURCE_not_reading_binary __pyx_string_tab[10]
+#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[11]
+#define __pyx_n_u_RETURN __pyx_string_tab[12]
+#define __pyx_n_u_UNSET __pyx_string_tab[13]
+#define __pyx_kp_u__2 __pyx_string_tab[14]
+#define __pyx_kp_u__3 __pyx_string_tab[15]
+#define __pyx_kp_u__4 __pyx_string_tab[16]
+#define __pyx_kp_u_add_note __pyx_string_tab[17]
+#define __pyx_n_u_all __pyx_string_tab[18]
+#define __pyx_n_u_append __pyx_string_tab[19]
+#define __pyx_n_u_arg __pyx_string_tab[20]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[21]
+#define __pyx_n_u_basename __pyx_string_tab[22]
+#define __pyx_n_u_builtin __pyx_string_tab[23]
+#define __pyx_n_u_call __pyx_string_tab[24]
+#define __pyx_n_u_calls __pyx_string_tab[25]
+#define __pyx_n_u_candidate __pyx_string_tab[26]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[27]
+#define __pyx_n_u_clone __pyx_string_tab[28]
+#define __pyx_n_u_code __pyx_string_tab[29]
+#define __pyx_n_u_code_2 __pyx_string_tab[30]
+#define __pyx_n_u_code_getter __pyx_string_tab[31]
+#define __pyx_n_u_collector __pyx_string_tab[32]
+#define __pyx_n_u_current_thread __pyx_string_tab[33]
+#define __pyx_n_u_depth __pyx_string_tab[34]
+#define __pyx_n_u_detach __pyx_string_tab[35]
+#define __pyx_n_u_detached __pyx_string_tab[36]
+#define __pyx_kp_u_disable __pyx_string_tab[37]
+#define __pyx_kp_u_enable __pyx_string_tab[38]
+#define __pyx_n_u_endswith __pyx_string_tab[39]
+#define __pyx_n_u_eq __pyx_string_tab[40]
+#define __pyx_n_u_event __pyx_string_tab[41]
+#define __pyx_n_u_exception __pyx_string_tab[42]
+#define __pyx_n_u_fast_clone __pyx_string_tab[43]
+#define __pyx_n_u_fast_detach __pyx_string_tab[44]
+#define __pyx_n_u_fast_event __pyx_string_tab[45]
+#define __pyx_kp_u_file __pyx_string_tab[46]
+#define __pyx_kp_u_filename __pyx_string_tab[47]
+#define __pyx_n_u_filename_2 __pyx_string_tab[48]
+#define __pyx_n_u_filename_3 __pyx_string_tab[49]
+#define __pyx_n_u_filename_getter __pyx_string_tab[50]
+#define __pyx_n_u_first_arg __pyx_string_tab[51]
+#define __pyx_n_u_frame __pyx_string_tab[52]
+#define __pyx_n_u_fullsource __pyx_string_tab[53]
+#define __pyx_n_u_fullsource_getter __pyx_string_tab[54]
+#define __pyx_n_u_func __pyx_string_tab[55]
+#define __pyx_n_u_func_2 __pyx_string_tab[56]
+#define __pyx_kp_u_function __pyx_string_tab[57]
+#define __pyx_n_u_function_2 __pyx_string_tab[58]
+#define __pyx_n_u_function_3 __pyx_string_tab[59]
+#define __pyx_n_u_function_getter __pyx_string_tab[60]
+#define __pyx_n_u_function_object __pyx_string_tab[61]
+#define __pyx_kp_u_gc __pyx_string_tab[62]
+#define __pyx_n_u_get __pyx_string_tab[63]
+#define __pyx_n_u_get_2 __pyx_string_tab[64]
+#define __pyx_n_u_get_code_fields __pyx_string_tab[65]
+#define __pyx_n_u_get_fullsource __pyx_string_tab[66]
+#define __pyx_n_u_get_func_in_mro __pyx_string_tab[67]
+#define __pyx_n_u_get_main_thread __pyx_string_tab[68]
+#define __pyx_n_u_getitem __pyx_string_tab[69]
+#define __pyx_n_u_getline __pyx_string_tab[70]
+#define __pyx_n_u_getlines __pyx_string_tab[71]
+#define __pyx_n_u_globals __pyx_string_tab[72]
+#define __pyx_n_u_globals_2 __pyx_string_tab[73]
+#define __pyx_n_u_globals_getter __pyx_string_tab[74]
+#define __pyx_n_u_hunter__event __pyx_string_tab[75]
+#define __pyx_n_u_ident __pyx_string_tab[76]
+#define __pyx_n_u_if_same_code __pyx_string_tab[77]
+#define __pyx_n_u_init __pyx_string_tab[78]
+#define __pyx_n_u_init_event __pyx_string_tab[79]
+#define __pyx_n_u_instruction __pyx_string_tab[80]
+#define __pyx_n_u_instruction_getter __pyx_string_tab[81]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[82]
+#define __pyx_kp_u_isenabled __pyx_string_tab[83]
+#define __pyx_n_u_item __pyx_string_tab[84]
+#define __pyx_n_u_items __pyx_string_tab[85]
+#define __pyx_n_u_kind __pyx_string_tab[86]
+#define __pyx_n_u_limit __pyx_string_tab[87]
+#define __pyx_n_u_line __pyx_string_tab[88]
+#define __pyx_n_u_linecache __pyx_string_tab[89]
+#define __pyx_kp_u_lineno __pyx_string_tab[90]
+#define __pyx_n_u_lineno_2 __pyx_string_tab[91]
+#define __pyx_n_u_lineno_3 __pyx_string_tab[92]
+#define __pyx_n_u_lineno_getter __pyx_string_tab[93]
+#define __pyx_n_u_locals __pyx_string_tab[94]
+#define __pyx_n_u_locals_2 __pyx_string_tab[95]
+#define __pyx_n_u_locals_getter __pyx_string_tab[96]
+#define __pyx_n_u_main __pyx_string_tab[97]
+#define __pyx_kp_u_module __pyx_string_tab[98]
+#define __pyx_n_u_module_2 __pyx_string_tab[99]
+#define __pyx_n_u_module_3 __pyx_string_tab[100]
+#define __pyx_kp_u_module_4 __pyx_string_tab[101]
+#define __pyx_n_u_module_5 __pyx_string_tab[102]
+#define __pyx_n_u_module_getter __pyx_string_tab[103]
+#define __pyx_n_u_module_globals __pyx_string_tab[104]
+#define __pyx_n_u_name __pyx_string_tab[105]
+#define __pyx_n_u_name_2 __pyx_string_tab[106]
+#define __pyx_n_u_object __pyx_string_tab[107]
+#define __pyx_n_u_os_path __pyx_string_tab[108]
+#define __pyx_n_u_other __pyx_string_tab[109]
+#define __pyx_n_u_pop __pyx_string_tab[110]
+#define __pyx_kp_u_pyd __pyx_string_tab[111]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[112]
+#define __pyx_n_u_qualname __pyx_string_tab[113]
+#define __pyx_n_u_repr __pyx_string_tab[114]
+#define __pyx_n_u_return __pyx_string_tab[115]
+#define __pyx_n_u_self __pyx_string_tab[116]
+#define __pyx_n_u_set_name __pyx_string_tab[117]
+#define __pyx_kp_u_so __pyx_string_tab[118]
+#define __pyx_n_u_source __pyx_string_tab[119]
+#define __pyx_n_u_source_getter __pyx_string_tab[120]
+#define __pyx_n_u_splitext __pyx_string_tab[121]
+#define __pyx_kp_u_src_hunter__event_pxd __pyx_string_tab[122]
+#define __pyx_kp_u_src_hunter__event_pyx __pyx_string_tab[123]
+#define __pyx_n_u_start __pyx_string_tab[124]
+#define __pyx_n_u_stdlib __pyx_string_tab[125]
+#define __pyx_n_u_stdlib_getter __pyx_string_tab[126]
+#define __pyx_n_u_test __pyx_string_tab[127]
+#define __pyx_n_u_thread __pyx_string_tab[128]
+#define __pyx_n_u_threadid_getter __pyx_string_tab[129]
+#define __pyx_n_u_threadidn __pyx_string_tab[130]
+#define __pyx_n_u_threading __pyx_string_tab[131]
+#define __pyx_n_u_threading_support __pyx_string_tab[132]
+#define __pyx_n_u_threadname __pyx_string_tab[133]
+#define __pyx_n_u_threadname_getter __pyx_string_tab[134]
+#define __pyx_n_u_util __pyx_string_tab[135]
+#define __pyx_n_u_v __pyx_string_tab[136]
+#define __pyx_n_u_value_filter __pyx_string_tab[137]
+#define __pyx_n_u_values __pyx_string_tab[138]
+#define __pyx_n_u_yield_lines __pyx_string_tab[139]
+#define __pyx_n_u_yield_source_lines __pyx_string_tab[140]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -3689,15 +3455,10 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_ptype_6hunter_6_event_CodeType);
   Py_CLEAR(clear_module_state->__pyx_ptype_6hunter_6_event_Event);
   Py_CLEAR(clear_module_state->__pyx_type_6hunter_6_event_Event);
-  Py_CLEAR(clear_module_state->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines);
-  Py_CLEAR(clear_module_state->__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines);
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_slice[i]); }
-  for (int i=0; i<7; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<44; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<169; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
-  Py_CLEAR(clear_module_state->__pyx_int_1);
+  for (int i=0; i<5; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<46; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<141; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   Py_CLEAR(clear_module_state->__pyx_int_10);
-  Py_CLEAR(clear_module_state->__pyx_int_neg_1);
   return 0;
 }
 #endif
@@ -3722,26 +3483,21 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_ptype_6hunter_6_event_CodeType);
   Py_VISIT(traverse_module_state->__pyx_ptype_6hunter_6_event_Event);
   Py_VISIT(traverse_module_state->__pyx_type_6hunter_6_event_Event);
-  Py_VISIT(traverse_module_state->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines);
-  Py_VISIT(traverse_module_state->__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines);
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_slice[i]); }
-  for (int i=0; i<7; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<44; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<169; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
-  __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_1);
+  for (int i=0; i<5; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<46; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<141; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_10);
-  __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_neg_1);
   return 0;
 }
 #endif
 /* #### Code section: module_code ### */
 
-/* "hunter/_event.pyx":59
+/* "hunter/_event.pyx":57
  *             may be expected.
  *     """
  *     def __init__(self, FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):             # <<<<<<<<<<<<<<
- *         self.arg = arg
- *         self.frame = frame
+ *         init_event(self, frame, kind, arg, depth, calls, threading_support)
+ * 
 */
 
 /* Python wrapper */
@@ -3771,67 +3527,67 @@ static int __pyx_pw_6hunter_6_event_5Event_1__init__(PyObject *__pyx_v_self, PyO
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_frame,&__pyx_mstate_global->__pyx_n_u_kind,&__pyx_mstate_global->__pyx_n_u_arg,&__pyx_mstate_global->__pyx_n_u_depth,&__pyx_mstate_global->__pyx_n_u_calls,&__pyx_mstate_global->__pyx_n_u_threading_support,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 59, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 57, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  6:
         values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  5:
         values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < 0) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < 0) __PYX_ERR(0, 57, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 6; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 6, 6, i); __PYX_ERR(0, 59, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 6, 6, i); __PYX_ERR(0, 57, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 6)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 57, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 57, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 57, __pyx_L3_error)
       values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 57, __pyx_L3_error)
       values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 59, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 57, __pyx_L3_error)
     }
     __pyx_v_frame = ((FrameType)values[0]);
-    __pyx_v_kind = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_kind == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
+    __pyx_v_kind = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_kind == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
     __pyx_v_arg = values[2];
-    __pyx_v_depth = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
-    __pyx_v_calls = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_calls == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
-    __pyx_v_threading_support = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_threading_support == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
+    __pyx_v_depth = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+    __pyx_v_calls = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_calls == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+    __pyx_v_threading_support = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_threading_support == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 6, 6, __pyx_nargs); __PYX_ERR(0, 59, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 6, 6, __pyx_nargs); __PYX_ERR(0, 57, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3855,355 +3611,50 @@ static int __pyx_pw_6hunter_6_event_5Event_1__init__(PyObject *__pyx_v_self, PyO
 static int __pyx_pf_6hunter_6_event_5Event___init__(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self, FrameType __pyx_v_frame, int __pyx_v_kind, PyObject *__pyx_v_arg, int __pyx_v_depth, int __pyx_v_calls, int __pyx_v_threading_support) {
   int __pyx_r;
   __Pyx_TraceDeclarationsFunc
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0]))
-  __Pyx_RefNannySetupContext("__init__", 0);
-  __Pyx_TraceStartFunc("__init__", __pyx_f[0], 59, 0, 0, 0, __PYX_ERR(0, 59, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__init__", __pyx_f[0], 57, 0, 0, 0, __PYX_ERR(0, 57, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":60
+  /* "hunter/_event.pyx":58
  *     """
  *     def __init__(self, FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
- *         self.arg = arg             # <<<<<<<<<<<<<<
- *         self.frame = frame
- *         self.kind = <str> KIND_NAMES[kind]
-*/
-  __Pyx_TraceLine(60,1,0,__PYX_ERR(0, 60, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_arg);
-  __Pyx_GIVEREF(__pyx_v_arg);
-  __Pyx_GOTREF(__pyx_v_self->arg);
-  __Pyx_DECREF(__pyx_v_self->arg);
-  __pyx_v_self->arg = __pyx_v_arg;
-
-  /* "hunter/_event.pyx":61
- *     def __init__(self, FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
- *         self.arg = arg
- *         self.frame = frame             # <<<<<<<<<<<<<<
- *         self.kind = <str> KIND_NAMES[kind]
- *         self.depth = depth
-*/
-  __Pyx_TraceLine(61,4,0,__PYX_ERR(0, 61, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_frame);
-  __Pyx_GIVEREF(__pyx_v_frame);
-  __Pyx_GOTREF(__pyx_v_self->frame);
-  __Pyx_DECREF(__pyx_v_self->frame);
-  __pyx_v_self->frame = __pyx_v_frame;
-
-  /* "hunter/_event.pyx":62
- *         self.arg = arg
- *         self.frame = frame
- *         self.kind = <str> KIND_NAMES[kind]             # <<<<<<<<<<<<<<
- *         self.depth = depth
- *         self.calls = calls
-*/
-  __Pyx_TraceLine(62,9,0,__PYX_ERR(0, 62, __pyx_L1_error))
-  __pyx_t_1 = ((PyObject *)(__pyx_v_6hunter_6_event_KIND_NAMES[__pyx_v_kind]));
-  __Pyx_INCREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_self->kind);
-  __Pyx_DECREF(__pyx_v_self->kind);
-  __pyx_v_self->kind = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "hunter/_event.pyx":63
- *         self.frame = frame
- *         self.kind = <str> KIND_NAMES[kind]
- *         self.depth = depth             # <<<<<<<<<<<<<<
- *         self.calls = calls
- *         self.threading_support = threading_support
-*/
-  __Pyx_TraceLine(63,13,0,__PYX_ERR(0, 63, __pyx_L1_error))
-  __pyx_v_self->depth = __pyx_v_depth;
-
-  /* "hunter/_event.pyx":64
- *         self.kind = <str> KIND_NAMES[kind]
- *         self.depth = depth
- *         self.calls = calls             # <<<<<<<<<<<<<<
- *         self.threading_support = threading_support
- *         self.detached = False
-*/
-  __Pyx_TraceLine(64,16,0,__PYX_ERR(0, 64, __pyx_L1_error))
-  __pyx_v_self->calls = __pyx_v_calls;
-
-  /* "hunter/_event.pyx":65
- *         self.depth = depth
- *         self.calls = calls
- *         self.threading_support = threading_support             # <<<<<<<<<<<<<<
- *         self.detached = False
- *         self.builtin = kind > 3
-*/
-  __Pyx_TraceLine(65,19,0,__PYX_ERR(0, 65, __pyx_L1_error))
-  __pyx_v_self->threading_support = __pyx_v_threading_support;
-
-  /* "hunter/_event.pyx":66
- *         self.calls = calls
- *         self.threading_support = threading_support
- *         self.detached = False             # <<<<<<<<<<<<<<
- *         self.builtin = kind > 3
- * 
-*/
-  __Pyx_TraceLine(66,22,0,__PYX_ERR(0, 66, __pyx_L1_error))
-  __pyx_v_self->detached = 0;
-
-  /* "hunter/_event.pyx":67
- *         self.threading_support = threading_support
- *         self.detached = False
- *         self.builtin = kind > 3             # <<<<<<<<<<<<<<
- * 
- *         self._code = UNSET
-*/
-  __Pyx_TraceLine(67,28,0,__PYX_ERR(0, 67, __pyx_L1_error))
-  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_kind > 3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_self->builtin);
-  __Pyx_DECREF(__pyx_v_self->builtin);
-  __pyx_v_self->builtin = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "hunter/_event.pyx":69
- *         self.builtin = kind > 3
- * 
- *         self._code = UNSET             # <<<<<<<<<<<<<<
- *         self._filename = UNSET
- *         self._fullsource = UNSET
-*/
-  __Pyx_TraceLine(69,30,0,__PYX_ERR(0, 69, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_code);
-  __Pyx_DECREF(__pyx_v_self->_code);
-  __pyx_v_self->_code = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":70
- * 
- *         self._code = UNSET
- *         self._filename = UNSET             # <<<<<<<<<<<<<<
- *         self._fullsource = UNSET
- *         self._function_object = UNSET
-*/
-  __Pyx_TraceLine(70,33,0,__PYX_ERR(0, 70, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_filename);
-  __Pyx_DECREF(__pyx_v_self->_filename);
-  __pyx_v_self->_filename = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":71
- *         self._code = UNSET
- *         self._filename = UNSET
- *         self._fullsource = UNSET             # <<<<<<<<<<<<<<
- *         self._function_object = UNSET
- *         self._function = UNSET
-*/
-  __Pyx_TraceLine(71,36,0,__PYX_ERR(0, 71, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_fullsource);
-  __Pyx_DECREF(__pyx_v_self->_fullsource);
-  __pyx_v_self->_fullsource = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":72
- *         self._filename = UNSET
- *         self._fullsource = UNSET
- *         self._function_object = UNSET             # <<<<<<<<<<<<<<
- *         self._function = UNSET
- *         self._globals = UNSET
-*/
-  __Pyx_TraceLine(72,39,0,__PYX_ERR(0, 72, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_function_object);
-  __Pyx_DECREF(__pyx_v_self->_function_object);
-  __pyx_v_self->_function_object = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":73
- *         self._fullsource = UNSET
- *         self._function_object = UNSET
- *         self._function = UNSET             # <<<<<<<<<<<<<<
- *         self._globals = UNSET
- *         self._lineno = UNSET
-*/
-  __Pyx_TraceLine(73,42,0,__PYX_ERR(0, 73, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_function);
-  __Pyx_DECREF(__pyx_v_self->_function);
-  __pyx_v_self->_function = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":74
- *         self._function_object = UNSET
- *         self._function = UNSET
- *         self._globals = UNSET             # <<<<<<<<<<<<<<
- *         self._lineno = UNSET
- *         self._locals = UNSET
-*/
-  __Pyx_TraceLine(74,45,0,__PYX_ERR(0, 74, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_globals);
-  __Pyx_DECREF(__pyx_v_self->_globals);
-  __pyx_v_self->_globals = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":75
- *         self._function = UNSET
- *         self._globals = UNSET
- *         self._lineno = UNSET             # <<<<<<<<<<<<<<
- *         self._locals = UNSET
- *         self._module = UNSET
-*/
-  __Pyx_TraceLine(75,48,0,__PYX_ERR(0, 75, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_lineno);
-  __Pyx_DECREF(__pyx_v_self->_lineno);
-  __pyx_v_self->_lineno = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":76
- *         self._globals = UNSET
- *         self._lineno = UNSET
- *         self._locals = UNSET             # <<<<<<<<<<<<<<
- *         self._module = UNSET
- *         self._source = UNSET
-*/
-  __Pyx_TraceLine(76,51,0,__PYX_ERR(0, 76, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_locals);
-  __Pyx_DECREF(__pyx_v_self->_locals);
-  __pyx_v_self->_locals = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":77
- *         self._lineno = UNSET
- *         self._locals = UNSET
- *         self._module = UNSET             # <<<<<<<<<<<<<<
- *         self._source = UNSET
- *         self._stdlib = UNSET
-*/
-  __Pyx_TraceLine(77,54,0,__PYX_ERR(0, 77, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_module);
-  __Pyx_DECREF(__pyx_v_self->_module);
-  __pyx_v_self->_module = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":78
- *         self._locals = UNSET
- *         self._module = UNSET
- *         self._source = UNSET             # <<<<<<<<<<<<<<
- *         self._stdlib = UNSET
- *         self._threadidn = UNSET
-*/
-  __Pyx_TraceLine(78,57,0,__PYX_ERR(0, 78, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_source);
-  __Pyx_DECREF(__pyx_v_self->_source);
-  __pyx_v_self->_source = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":79
- *         self._module = UNSET
- *         self._source = UNSET
- *         self._stdlib = UNSET             # <<<<<<<<<<<<<<
- *         self._threadidn = UNSET
- *         self._threadname = UNSET
-*/
-  __Pyx_TraceLine(79,60,0,__PYX_ERR(0, 79, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_stdlib);
-  __Pyx_DECREF(__pyx_v_self->_stdlib);
-  __pyx_v_self->_stdlib = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":80
- *         self._source = UNSET
- *         self._stdlib = UNSET
- *         self._threadidn = UNSET             # <<<<<<<<<<<<<<
- *         self._threadname = UNSET
- *         self._thread = UNSET
-*/
-  __Pyx_TraceLine(80,63,0,__PYX_ERR(0, 80, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_threadidn);
-  __Pyx_DECREF(__pyx_v_self->_threadidn);
-  __pyx_v_self->_threadidn = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":81
- *         self._stdlib = UNSET
- *         self._threadidn = UNSET
- *         self._threadname = UNSET             # <<<<<<<<<<<<<<
- *         self._thread = UNSET
- *         self._instruction = UNSET
-*/
-  __Pyx_TraceLine(81,66,0,__PYX_ERR(0, 81, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_threadname);
-  __Pyx_DECREF(__pyx_v_self->_threadname);
-  __pyx_v_self->_threadname = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":82
- *         self._threadidn = UNSET
- *         self._threadname = UNSET
- *         self._thread = UNSET             # <<<<<<<<<<<<<<
- *         self._instruction = UNSET
- * 
-*/
-  __Pyx_TraceLine(82,69,0,__PYX_ERR(0, 82, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_thread);
-  __Pyx_DECREF(__pyx_v_self->_thread);
-  __pyx_v_self->_thread = __pyx_v_6hunter_6_event_UNSET;
-
-  /* "hunter/_event.pyx":83
- *         self._threadname = UNSET
- *         self._thread = UNSET
- *         self._instruction = UNSET             # <<<<<<<<<<<<<<
+ *         init_event(self, frame, kind, arg, depth, calls, threading_support)             # <<<<<<<<<<<<<<
  * 
  *     def __repr__(self):
 */
-  __Pyx_TraceLine(83,72,0,__PYX_ERR(0, 83, __pyx_L1_error))
-  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_GOTREF(__pyx_v_self->_instruction);
-  __Pyx_DECREF(__pyx_v_self->_instruction);
-  __pyx_v_self->_instruction = __pyx_v_6hunter_6_event_UNSET;
+  __Pyx_TraceLine(58,2,0,__PYX_ERR(0, 58, __pyx_L1_error))
+  __pyx_f_6hunter_6_event_init_event(__pyx_v_self, __pyx_v_frame, __pyx_v_kind, __pyx_v_arg, __pyx_v_depth, __pyx_v_calls, __pyx_v_threading_support);
 
-  /* "hunter/_event.pyx":59
+  /* "hunter/_event.pyx":57
  *             may be expected.
  *     """
  *     def __init__(self, FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):             # <<<<<<<<<<<<<<
- *         self.arg = arg
- *         self.frame = frame
+ *         init_event(self, frame, kind, arg, depth, calls, threading_support)
+ * 
 */
 
   /* function exit code */
   __pyx_r = 0;
-  __Pyx_TraceReturnCValue(__pyx_r, __Pyx_Owned_Py_None, 0, 0, __PYX_ERR(0, 59, __pyx_L1_error));
+  __Pyx_TraceReturnCValue(__pyx_r, __Pyx_Owned_Py_None, 0, 0, __PYX_ERR(0, 57, __pyx_L1_error));
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_TraceException(__pyx_lineno, 0, 0);
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 59, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 57, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_PyMonitoring_ExitScope(0);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":85
- *         self._instruction = UNSET
+/* "hunter/_event.pyx":60
+ *         init_event(self, frame, kind, arg, depth, calls, threading_support)
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (
@@ -4241,46 +3692,46 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_2__repr__(struct __pyx_obj_6hun
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1]))
   __Pyx_RefNannySetupContext("__repr__", 0);
-  __Pyx_TraceStartFunc("__repr__", __pyx_f[0], 85, 0, 0, 0, __PYX_ERR(0, 85, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__repr__", __pyx_f[0], 60, 0, 0, 0, __PYX_ERR(0, 60, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":86
+  /* "hunter/_event.pyx":61
  * 
  *     def __repr__(self):
  *         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (             # <<<<<<<<<<<<<<
  *             self.kind, self.function, self.module, self.filename, self.lineno
  *         )
 */
-  __Pyx_TraceLine(86,1,0,__PYX_ERR(0, 86, __pyx_L1_error))
+  __Pyx_TraceLine(61,1,0,__PYX_ERR(0, 61, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
 
-  /* "hunter/_event.pyx":87
+  /* "hunter/_event.pyx":62
  *     def __repr__(self):
  *         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (
  *             self.kind, self.function, self.module, self.filename, self.lineno             # <<<<<<<<<<<<<<
  *         )
  * 
 */
-  __Pyx_TraceLine(87,4,0,__PYX_ERR(0, 87, __pyx_L1_error))
-  __pyx_t_1 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_self->kind), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_TraceLine(62,4,0,__PYX_ERR(0, 62, __pyx_L1_error))
+  __pyx_t_1 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_self->kind), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_function_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_function_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_module_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_module_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Str(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Str(__pyx_t_2), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_7[0] = __pyx_mstate_global->__pyx_kp_u_Event_kind;
@@ -4295,16 +3746,16 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_2__repr__(struct __pyx_obj_6hun
   __pyx_t_7[9] = __pyx_t_6;
   __pyx_t_7[10] = __pyx_mstate_global->__pyx_kp_u_;
 
-  /* "hunter/_event.pyx":86
+  /* "hunter/_event.pyx":61
  * 
  *     def __repr__(self):
  *         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (             # <<<<<<<<<<<<<<
  *             self.kind, self.function, self.module, self.filename, self.lineno
  *         )
 */
-  __Pyx_TraceLine(86,2,0,__PYX_ERR(0, 86, __pyx_L1_error))
+  __Pyx_TraceLine(61,2,0,__PYX_ERR(0, 61, __pyx_L1_error))
   __pyx_t_2 = __Pyx_PyUnicode_Join(__pyx_t_7, 11, 12 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_1) + 10 * 2 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3) + 8 * 2 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4) + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5) + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6) + 1, 127 | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_1) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6));
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -4313,11 +3764,11 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_2__repr__(struct __pyx_obj_6hun
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 86, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 61, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":85
- *         self._instruction = UNSET
+  /* "hunter/_event.pyx":60
+ *         init_event(self, frame, kind, arg, depth, calls, threading_support)
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
  *         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (
@@ -4336,7 +3787,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_2__repr__(struct __pyx_obj_6hun
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 85, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 60, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -4347,7 +3798,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_2__repr__(struct __pyx_obj_6hun
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":90
+/* "hunter/_event.pyx":65
  *         )
  * 
  *     def __eq__(self, other):             # <<<<<<<<<<<<<<
@@ -4381,26 +3832,26 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4__eq__(struct __pyx_obj_6hunte
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2]))
   __Pyx_RefNannySetupContext("__eq__", 0);
-  __Pyx_TraceStartFunc("__eq__", __pyx_f[0], 90, 0, 0, 0, __PYX_ERR(0, 90, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__eq__", __pyx_f[0], 65, 0, 0, 0, __PYX_ERR(0, 65, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":91
+  /* "hunter/_event.pyx":66
  * 
  *     def __eq__(self, other):
  *         return self is other             # <<<<<<<<<<<<<<
  * 
  *     def detach(self, value_filter=None):
 */
-  __Pyx_TraceLine(91,1,0,__PYX_ERR(0, 91, __pyx_L1_error))
+  __Pyx_TraceLine(66,1,0,__PYX_ERR(0, 66, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_1 = (((PyObject *)__pyx_v_self) == __pyx_v_other);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 91, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 66, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":90
+  /* "hunter/_event.pyx":65
  *         )
  * 
  *     def __eq__(self, other):             # <<<<<<<<<<<<<<
@@ -4415,7 +3866,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4__eq__(struct __pyx_obj_6hunte
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 90, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 65, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.__eq__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -4426,7 +3877,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4__eq__(struct __pyx_obj_6hunte
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":93
+/* "hunter/_event.pyx":68
  *         return self is other
  * 
  *     def detach(self, value_filter=None):             # <<<<<<<<<<<<<<
@@ -4473,24 +3924,24 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_value_filter,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 93, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 68, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 93, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 68, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "detach", 0) < 0) __PYX_ERR(0, 93, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "detach", 0) < 0) __PYX_ERR(0, 68, __pyx_L3_error)
       if (!values[0]) values[0] = __Pyx_NewRef(((PyObject *)Py_None));
     } else {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 93, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 68, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
@@ -4501,7 +3952,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("detach", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 93, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("detach", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 68, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4532,25 +3983,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6detach(struct __pyx_obj_6hunte
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3]))
   __Pyx_RefNannySetupContext("detach", 0);
-  __Pyx_TraceStartFunc("detach", __pyx_f[0], 93, 0, 0, 0, __PYX_ERR(0, 93, __pyx_L1_error));
+  __Pyx_TraceStartFunc("detach", __pyx_f[0], 68, 0, 0, 0, __PYX_ERR(0, 68, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":94
+  /* "hunter/_event.pyx":69
  * 
  *     def detach(self, value_filter=None):
  *         return fast_detach(self, value_filter)             # <<<<<<<<<<<<<<
  * 
  *     def clone(self):
 */
-  __Pyx_TraceLine(94,2,0,__PYX_ERR(0, 94, __pyx_L1_error))
+  __Pyx_TraceLine(69,2,0,__PYX_ERR(0, 69, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_fast_detach(__pyx_v_self, __pyx_v_value_filter)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_fast_detach(__pyx_v_self, __pyx_v_value_filter)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 2, 0, __PYX_ERR(0, 94, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 2, 0, __PYX_ERR(0, 69, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":93
+  /* "hunter/_event.pyx":68
  *         return self is other
  * 
  *     def detach(self, value_filter=None):             # <<<<<<<<<<<<<<
@@ -4565,7 +4016,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6detach(struct __pyx_obj_6hunte
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 93, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 68, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.detach", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -4576,7 +4027,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6detach(struct __pyx_obj_6hunte
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":96
+/* "hunter/_event.pyx":71
  *         return fast_detach(self, value_filter)
  * 
  *     def clone(self):             # <<<<<<<<<<<<<<
@@ -4636,25 +4087,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8clone(struct __pyx_obj_6hunter
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4]))
   __Pyx_RefNannySetupContext("clone", 0);
-  __Pyx_TraceStartFunc("clone", __pyx_f[0], 96, 0, 0, 0, __PYX_ERR(0, 96, __pyx_L1_error));
+  __Pyx_TraceStartFunc("clone", __pyx_f[0], 71, 0, 0, 0, __PYX_ERR(0, 71, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":97
+  /* "hunter/_event.pyx":72
  * 
  *     def clone(self):
  *         return fast_clone(self)             # <<<<<<<<<<<<<<
  * 
  *     cdef inline instruction_getter(self):
 */
-  __Pyx_TraceLine(97,1,0,__PYX_ERR(0, 97, __pyx_L1_error))
+  __Pyx_TraceLine(72,1,0,__PYX_ERR(0, 72, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_fast_clone(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_fast_clone(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 97, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 72, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":96
+  /* "hunter/_event.pyx":71
  *         return fast_detach(self, value_filter)
  * 
  *     def clone(self):             # <<<<<<<<<<<<<<
@@ -4669,7 +4120,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8clone(struct __pyx_obj_6hunter
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 96, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 71, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.clone", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -4680,7 +4131,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8clone(struct __pyx_obj_6hunter
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":99
+/* "hunter/_event.pyx":74
  *         return fast_clone(self)
  * 
  *     cdef inline instruction_getter(self):             # <<<<<<<<<<<<<<
@@ -4704,63 +4155,63 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5]))
   __Pyx_RefNannySetupContext("instruction_getter", 0);
-  __Pyx_TraceStartFunc("instruction_getter", __pyx_f[0], 99, 0, 0, 0, __PYX_ERR(0, 99, __pyx_L1_error));
+  __Pyx_TraceStartFunc("instruction_getter", __pyx_f[0], 74, 0, 0, 0, __PYX_ERR(0, 74, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":102
+  /* "hunter/_event.pyx":77
  *         cdef int position
  * 
  *         if self._instruction is UNSET:             # <<<<<<<<<<<<<<
  *             position = Hunter_PyFrame_GetLasti(self.frame)
  *             co_code = PyCode_GetCode(self.code_getter())
 */
-  __Pyx_TraceLine(102,5,0,__PYX_ERR(0, 102, __pyx_L1_error))
+  __Pyx_TraceLine(77,5,0,__PYX_ERR(0, 77, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_instruction == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":103
+    /* "hunter/_event.pyx":78
  * 
  *         if self._instruction is UNSET:
  *             position = Hunter_PyFrame_GetLasti(self.frame)             # <<<<<<<<<<<<<<
  *             co_code = PyCode_GetCode(self.code_getter())
  *             if co_code and len(co_code) > position >= 0:
 */
-    __Pyx_TraceLine(103,10,0,__PYX_ERR(0, 103, __pyx_L1_error))
+    __Pyx_TraceLine(78,10,0,__PYX_ERR(0, 78, __pyx_L1_error))
     __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
     __Pyx_INCREF(__pyx_t_2);
     __pyx_v_position = Hunter_PyFrame_GetLasti(((FrameType)__pyx_t_2));
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":104
+    /* "hunter/_event.pyx":79
  *         if self._instruction is UNSET:
  *             position = Hunter_PyFrame_GetLasti(self.frame)
  *             co_code = PyCode_GetCode(self.code_getter())             # <<<<<<<<<<<<<<
  *             if co_code and len(co_code) > position >= 0:
  *                 self._instruction = co_code[position]
 */
-    __Pyx_TraceLine(104,16,0,__PYX_ERR(0, 104, __pyx_L1_error))
-    __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+    __Pyx_TraceLine(79,16,0,__PYX_ERR(0, 79, __pyx_L1_error))
+    __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyCode_GetCode(((PyCodeObject *)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
+    __pyx_t_3 = PyCode_GetCode(((PyCodeObject *)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_v_co_code = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "hunter/_event.pyx":105
+    /* "hunter/_event.pyx":80
  *             position = Hunter_PyFrame_GetLasti(self.frame)
  *             co_code = PyCode_GetCode(self.code_getter())
  *             if co_code and len(co_code) > position >= 0:             # <<<<<<<<<<<<<<
  *                 self._instruction = co_code[position]
  *             else:
 */
-    __Pyx_TraceLine(105,18,0,__PYX_ERR(0, 105, __pyx_L1_error))
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_co_code); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_TraceLine(80,18,0,__PYX_ERR(0, 80, __pyx_L1_error))
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_co_code); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 80, __pyx_L1_error)
     if (__pyx_t_4) {
     } else {
       __pyx_t_1 = __pyx_t_4;
       goto __pyx_L5_bool_binop_done;
     }
-    __pyx_t_5 = PyObject_Length(__pyx_v_co_code); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 105, __pyx_L1_error)
+    __pyx_t_5 = PyObject_Length(__pyx_v_co_code); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 80, __pyx_L1_error)
     __pyx_t_4 = (__pyx_t_5 > __pyx_v_position);
     if (__pyx_t_4) {
       __pyx_t_4 = (__pyx_v_position >= 0);
@@ -4769,15 +4220,15 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
     __pyx_L5_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":106
+      /* "hunter/_event.pyx":81
  *             co_code = PyCode_GetCode(self.code_getter())
  *             if co_code and len(co_code) > position >= 0:
  *                 self._instruction = co_code[position]             # <<<<<<<<<<<<<<
  *             else:
  *                 self._instruction = None
 */
-      __Pyx_TraceLine(106,29,0,__PYX_ERR(0, 106, __pyx_L1_error))
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_co_code, __pyx_v_position, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_TraceLine(81,29,0,__PYX_ERR(0, 81, __pyx_L1_error))
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_co_code, __pyx_v_position, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_GIVEREF(__pyx_t_3);
       __Pyx_GOTREF(__pyx_v_self->_instruction);
@@ -4785,7 +4236,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
       __pyx_v_self->_instruction = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "hunter/_event.pyx":105
+      /* "hunter/_event.pyx":80
  *             position = Hunter_PyFrame_GetLasti(self.frame)
  *             co_code = PyCode_GetCode(self.code_getter())
  *             if co_code and len(co_code) > position >= 0:             # <<<<<<<<<<<<<<
@@ -4795,14 +4246,14 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":108
+    /* "hunter/_event.pyx":83
  *                 self._instruction = co_code[position]
  *             else:
  *                 self._instruction = None             # <<<<<<<<<<<<<<
  *         return self._instruction
  * 
 */
-    __Pyx_TraceLine(108,33,0,__PYX_ERR(0, 108, __pyx_L1_error))
+    __Pyx_TraceLine(83,33,0,__PYX_ERR(0, 83, __pyx_L1_error))
     /*else*/ {
       __Pyx_INCREF(Py_None);
       __Pyx_GIVEREF(Py_None);
@@ -4812,7 +4263,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":102
+    /* "hunter/_event.pyx":77
  *         cdef int position
  * 
  *         if self._instruction is UNSET:             # <<<<<<<<<<<<<<
@@ -4821,21 +4272,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
 */
   }
 
-  /* "hunter/_event.pyx":109
+  /* "hunter/_event.pyx":84
  *             else:
  *                 self._instruction = None
  *         return self._instruction             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(109,34,0,__PYX_ERR(0, 109, __pyx_L1_error))
+  __Pyx_TraceLine(84,34,0,__PYX_ERR(0, 84, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_instruction);
   __pyx_r = __pyx_v_self->_instruction;
-  __Pyx_TraceReturnValue(__pyx_r, 34, 0, __PYX_ERR(0, 109, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 34, 0, __PYX_ERR(0, 84, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":99
+  /* "hunter/_event.pyx":74
  *         return fast_clone(self)
  * 
  *     cdef inline instruction_getter(self):             # <<<<<<<<<<<<<<
@@ -4851,7 +4302,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 99, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 74, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.instruction_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -4863,7 +4314,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_instruction_getter(struct __pyx_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":111
+/* "hunter/_event.pyx":86
  *         return self._instruction
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -4896,25 +4347,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_11instruction___get__(struct __
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 111, 0, 0, 0, __PYX_ERR(0, 111, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 86, 0, 0, 0, __PYX_ERR(0, 86, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":113
+  /* "hunter/_event.pyx":88
  *     @property
  *     def instruction(self):
  *         return self.instruction_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline threadid_getter(self):
 */
-  __Pyx_TraceLine(113,1,0,__PYX_ERR(0, 113, __pyx_L1_error))
+  __Pyx_TraceLine(88,1,0,__PYX_ERR(0, 88, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_instruction_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_instruction_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 113, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 88, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":111
+  /* "hunter/_event.pyx":86
  *         return self._instruction
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -4929,7 +4380,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_11instruction___get__(struct __
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 111, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 86, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.instruction.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -4940,7 +4391,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_11instruction___get__(struct __
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":115
+/* "hunter/_event.pyx":90
  *         return self.instruction_getter()
  * 
  *     cdef inline threadid_getter(self):             # <<<<<<<<<<<<<<
@@ -4965,39 +4416,39 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7]))
   __Pyx_RefNannySetupContext("threadid_getter", 0);
-  __Pyx_TraceStartFunc("threadid_getter", __pyx_f[0], 115, 0, 0, 0, __PYX_ERR(0, 115, __pyx_L1_error));
+  __Pyx_TraceStartFunc("threadid_getter", __pyx_f[0], 90, 0, 0, 0, __PYX_ERR(0, 90, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":118
+  /* "hunter/_event.pyx":93
  *         cdef long current
  * 
  *         if self._threadidn is UNSET:             # <<<<<<<<<<<<<<
  *             current = PyThread_get_thread_ident()
  *             main = get_main_thread()
 */
-  __Pyx_TraceLine(118,5,0,__PYX_ERR(0, 118, __pyx_L1_error))
+  __Pyx_TraceLine(93,5,0,__PYX_ERR(0, 93, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_threadidn == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":119
+    /* "hunter/_event.pyx":94
  * 
  *         if self._threadidn is UNSET:
  *             current = PyThread_get_thread_ident()             # <<<<<<<<<<<<<<
  *             main = get_main_thread()
  *             if main is not None and current == main.ident:
 */
-    __Pyx_TraceLine(119,8,0,__PYX_ERR(0, 119, __pyx_L1_error))
+    __Pyx_TraceLine(94,8,0,__PYX_ERR(0, 94, __pyx_L1_error))
     __pyx_v_current = PyThread_get_thread_ident();
 
-    /* "hunter/_event.pyx":120
+    /* "hunter/_event.pyx":95
  *         if self._threadidn is UNSET:
  *             current = PyThread_get_thread_ident()
  *             main = get_main_thread()             # <<<<<<<<<<<<<<
  *             if main is not None and current == main.ident:
  *                 self._threadidn = None
 */
-    __Pyx_TraceLine(120,11,0,__PYX_ERR(0, 120, __pyx_L1_error))
+    __Pyx_TraceLine(95,11,0,__PYX_ERR(0, 95, __pyx_L1_error))
     __pyx_t_3 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 120, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = 1;
     #if CYTHON_UNPACK_METHODS
@@ -5016,54 +4467,54 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 120, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
     __pyx_v_main = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":121
+    /* "hunter/_event.pyx":96
  *             current = PyThread_get_thread_ident()
  *             main = get_main_thread()
  *             if main is not None and current == main.ident:             # <<<<<<<<<<<<<<
  *                 self._threadidn = None
  *             else:
 */
-    __Pyx_TraceLine(121,15,0,__PYX_ERR(0, 121, __pyx_L1_error))
+    __Pyx_TraceLine(96,15,0,__PYX_ERR(0, 96, __pyx_L1_error))
     __pyx_t_6 = (__pyx_v_main != Py_None);
     if (__pyx_t_6) {
     } else {
       __pyx_t_1 = __pyx_t_6;
       goto __pyx_L5_bool_binop_done;
     }
-    __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_v_current); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_v_current); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_main, __pyx_mstate_global->__pyx_n_u_ident); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_main, __pyx_mstate_global->__pyx_n_u_ident); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 121, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 96, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_1 = __pyx_t_6;
     __pyx_L5_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":122
+      /* "hunter/_event.pyx":97
  *             main = get_main_thread()
  *             if main is not None and current == main.ident:
  *                 self._threadidn = None             # <<<<<<<<<<<<<<
  *             else:
  *                 self._threadidn = current
 */
-      __Pyx_TraceLine(122,21,0,__PYX_ERR(0, 122, __pyx_L1_error))
+      __Pyx_TraceLine(97,21,0,__PYX_ERR(0, 97, __pyx_L1_error))
       __Pyx_INCREF(Py_None);
       __Pyx_GIVEREF(Py_None);
       __Pyx_GOTREF(__pyx_v_self->_threadidn);
       __Pyx_DECREF(__pyx_v_self->_threadidn);
       __pyx_v_self->_threadidn = Py_None;
 
-      /* "hunter/_event.pyx":121
+      /* "hunter/_event.pyx":96
  *             current = PyThread_get_thread_ident()
  *             main = get_main_thread()
  *             if main is not None and current == main.ident:             # <<<<<<<<<<<<<<
@@ -5073,16 +4524,16 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":124
+    /* "hunter/_event.pyx":99
  *                 self._threadidn = None
  *             else:
  *                 self._threadidn = current             # <<<<<<<<<<<<<<
  *         return self._threadidn
  * 
 */
-    __Pyx_TraceLine(124,26,0,__PYX_ERR(0, 124, __pyx_L1_error))
+    __Pyx_TraceLine(99,26,0,__PYX_ERR(0, 99, __pyx_L1_error))
     /*else*/ {
-      __pyx_t_3 = __Pyx_PyLong_From_long(__pyx_v_current); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyLong_From_long(__pyx_v_current); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_GIVEREF(__pyx_t_3);
       __Pyx_GOTREF(__pyx_v_self->_threadidn);
@@ -5092,7 +4543,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":118
+    /* "hunter/_event.pyx":93
  *         cdef long current
  * 
  *         if self._threadidn is UNSET:             # <<<<<<<<<<<<<<
@@ -5101,21 +4552,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
 */
   }
 
-  /* "hunter/_event.pyx":125
+  /* "hunter/_event.pyx":100
  *             else:
  *                 self._threadidn = current
  *         return self._threadidn             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(125,27,0,__PYX_ERR(0, 125, __pyx_L1_error))
+  __Pyx_TraceLine(100,27,0,__PYX_ERR(0, 100, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_threadidn);
   __pyx_r = __pyx_v_self->_threadidn;
-  __Pyx_TraceReturnValue(__pyx_r, 27, 0, __PYX_ERR(0, 125, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 27, 0, __PYX_ERR(0, 100, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":115
+  /* "hunter/_event.pyx":90
  *         return self.instruction_getter()
  * 
  *     cdef inline threadid_getter(self):             # <<<<<<<<<<<<<<
@@ -5132,7 +4583,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 115, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 90, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.threadid_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -5144,7 +4595,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadid_getter(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":127
+/* "hunter/_event.pyx":102
  *         return self._threadidn
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5177,25 +4628,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8threadid___get__(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 127, 0, 0, 0, __PYX_ERR(0, 127, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 102, 0, 0, 0, __PYX_ERR(0, 102, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":129
+  /* "hunter/_event.pyx":104
  *     @property
  *     def threadid(self):
  *         return self.threadid_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline threadname_getter(self):
 */
-  __Pyx_TraceLine(129,1,0,__PYX_ERR(0, 129, __pyx_L1_error))
+  __Pyx_TraceLine(104,1,0,__PYX_ERR(0, 104, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_threadid_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_threadid_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 129, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 104, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":127
+  /* "hunter/_event.pyx":102
  *         return self._threadidn
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5210,7 +4661,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8threadid___get__(struct __pyx_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 127, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 102, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.threadid.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -5221,7 +4672,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8threadid___get__(struct __pyx_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":131
+/* "hunter/_event.pyx":106
  *         return self.threadid_getter()
  * 
  *     cdef inline threadname_getter(self):             # <<<<<<<<<<<<<<
@@ -5243,40 +4694,40 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9]))
   __Pyx_RefNannySetupContext("threadname_getter", 0);
-  __Pyx_TraceStartFunc("threadname_getter", __pyx_f[0], 131, 0, 0, 0, __PYX_ERR(0, 131, __pyx_L1_error));
+  __Pyx_TraceStartFunc("threadname_getter", __pyx_f[0], 106, 0, 0, 0, __PYX_ERR(0, 106, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":132
+  /* "hunter/_event.pyx":107
  * 
  *     cdef inline threadname_getter(self):
  *         if self._threadname is UNSET:             # <<<<<<<<<<<<<<
  *             if self._thread is UNSET:
  *                 self._thread = current_thread()
 */
-  __Pyx_TraceLine(132,5,0,__PYX_ERR(0, 132, __pyx_L1_error))
+  __Pyx_TraceLine(107,5,0,__PYX_ERR(0, 107, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_threadname == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":133
+    /* "hunter/_event.pyx":108
  *     cdef inline threadname_getter(self):
  *         if self._threadname is UNSET:
  *             if self._thread is UNSET:             # <<<<<<<<<<<<<<
  *                 self._thread = current_thread()
  *             self._threadname = self._thread.name
 */
-    __Pyx_TraceLine(133,10,0,__PYX_ERR(0, 133, __pyx_L1_error))
+    __Pyx_TraceLine(108,10,0,__PYX_ERR(0, 108, __pyx_L1_error))
     __pyx_t_1 = (__pyx_v_self->_thread == __pyx_v_6hunter_6_event_UNSET);
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":134
+      /* "hunter/_event.pyx":109
  *         if self._threadname is UNSET:
  *             if self._thread is UNSET:
  *                 self._thread = current_thread()             # <<<<<<<<<<<<<<
  *             self._threadname = self._thread.name
  *         return self._threadname
 */
-      __Pyx_TraceLine(134,14,0,__PYX_ERR(0, 134, __pyx_L1_error))
+      __Pyx_TraceLine(109,14,0,__PYX_ERR(0, 109, __pyx_L1_error))
       __pyx_t_3 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 134, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 109, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_t_5 = 1;
       #if CYTHON_UNPACK_METHODS
@@ -5295,7 +4746,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
         __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 109, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
       }
       __Pyx_GIVEREF(__pyx_t_2);
@@ -5304,7 +4755,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
       __pyx_v_self->_thread = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":133
+      /* "hunter/_event.pyx":108
  *     cdef inline threadname_getter(self):
  *         if self._threadname is UNSET:
  *             if self._thread is UNSET:             # <<<<<<<<<<<<<<
@@ -5313,15 +4764,15 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
 */
     }
 
-    /* "hunter/_event.pyx":135
+    /* "hunter/_event.pyx":110
  *             if self._thread is UNSET:
  *                 self._thread = current_thread()
  *             self._threadname = self._thread.name             # <<<<<<<<<<<<<<
  *         return self._threadname
  * 
 */
-    __Pyx_TraceLine(135,19,0,__PYX_ERR(0, 135, __pyx_L1_error))
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->_thread, __pyx_mstate_global->__pyx_n_u_name); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 135, __pyx_L1_error)
+    __Pyx_TraceLine(110,19,0,__PYX_ERR(0, 110, __pyx_L1_error))
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->_thread, __pyx_mstate_global->__pyx_n_u_name); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
     __Pyx_GOTREF(__pyx_v_self->_threadname);
@@ -5329,7 +4780,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
     __pyx_v_self->_threadname = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":132
+    /* "hunter/_event.pyx":107
  * 
  *     cdef inline threadname_getter(self):
  *         if self._threadname is UNSET:             # <<<<<<<<<<<<<<
@@ -5338,21 +4789,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
 */
   }
 
-  /* "hunter/_event.pyx":136
+  /* "hunter/_event.pyx":111
  *                 self._thread = current_thread()
  *             self._threadname = self._thread.name
  *         return self._threadname             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(136,20,0,__PYX_ERR(0, 136, __pyx_L1_error))
+  __Pyx_TraceLine(111,20,0,__PYX_ERR(0, 111, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_threadname);
   __pyx_r = __pyx_v_self->_threadname;
-  __Pyx_TraceReturnValue(__pyx_r, 20, 0, __PYX_ERR(0, 136, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 20, 0, __PYX_ERR(0, 111, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":131
+  /* "hunter/_event.pyx":106
  *         return self.threadid_getter()
  * 
  *     cdef inline threadname_getter(self):             # <<<<<<<<<<<<<<
@@ -5369,7 +4820,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 131, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 106, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.threadname_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -5380,7 +4831,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_threadname_getter(struct __pyx_o
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":138
+/* "hunter/_event.pyx":113
  *         return self._threadname
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5413,25 +4864,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10threadname___get__(struct __p
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 138, 0, 0, 0, __PYX_ERR(0, 138, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 113, 0, 0, 0, __PYX_ERR(0, 113, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":140
+  /* "hunter/_event.pyx":115
  *     @property
  *     def threadname(self):
  *         return self.threadname_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline locals_getter(self):
 */
-  __Pyx_TraceLine(140,1,0,__PYX_ERR(0, 140, __pyx_L1_error))
+  __Pyx_TraceLine(115,1,0,__PYX_ERR(0, 115, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_threadname_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_threadname_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 140, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 115, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":138
+  /* "hunter/_event.pyx":113
  *         return self._threadname
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5446,7 +4897,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10threadname___get__(struct __p
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 138, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 113, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.threadname.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -5457,7 +4908,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10threadname___get__(struct __p
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":142
+/* "hunter/_event.pyx":117
  *         return self.threadname_getter()
  * 
  *     cdef inline locals_getter(self):             # <<<<<<<<<<<<<<
@@ -5477,39 +4928,39 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11]))
   __Pyx_RefNannySetupContext("locals_getter", 0);
-  __Pyx_TraceStartFunc("locals_getter", __pyx_f[0], 142, 0, 0, 0, __PYX_ERR(0, 142, __pyx_L1_error));
+  __Pyx_TraceStartFunc("locals_getter", __pyx_f[0], 117, 0, 0, 0, __PYX_ERR(0, 117, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":143
+  /* "hunter/_event.pyx":118
  * 
  *     cdef inline locals_getter(self):
  *         if self._locals is UNSET:             # <<<<<<<<<<<<<<
  *             if self.builtin:
  *                 self._locals = {}
 */
-  __Pyx_TraceLine(143,5,0,__PYX_ERR(0, 143, __pyx_L1_error))
+  __Pyx_TraceLine(118,5,0,__PYX_ERR(0, 118, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_locals == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":144
+    /* "hunter/_event.pyx":119
  *     cdef inline locals_getter(self):
  *         if self._locals is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
  *                 self._locals = {}
  *             else:
 */
-    __Pyx_TraceLine(144,8,0,__PYX_ERR(0, 144, __pyx_L1_error))
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_TraceLine(119,8,0,__PYX_ERR(0, 119, __pyx_L1_error))
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 119, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":145
+      /* "hunter/_event.pyx":120
  *         if self._locals is UNSET:
  *             if self.builtin:
  *                 self._locals = {}             # <<<<<<<<<<<<<<
  *             else:
  *                 self._locals = Hunter_PyFrame_GetLocals(self.frame)
 */
-      __Pyx_TraceLine(145,11,0,__PYX_ERR(0, 145, __pyx_L1_error))
-      __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+      __Pyx_TraceLine(120,11,0,__PYX_ERR(0, 120, __pyx_L1_error))
+      __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 120, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_v_self->_locals);
@@ -5517,7 +4968,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
       __pyx_v_self->_locals = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":144
+      /* "hunter/_event.pyx":119
  *     cdef inline locals_getter(self):
  *         if self._locals is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
@@ -5527,18 +4978,18 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":147
+    /* "hunter/_event.pyx":122
  *                 self._locals = {}
  *             else:
  *                 self._locals = Hunter_PyFrame_GetLocals(self.frame)             # <<<<<<<<<<<<<<
  *         return self._locals
  * 
 */
-    __Pyx_TraceLine(147,15,0,__PYX_ERR(0, 147, __pyx_L1_error))
+    __Pyx_TraceLine(122,15,0,__PYX_ERR(0, 122, __pyx_L1_error))
     /*else*/ {
       __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
       __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_3 = Hunter_PyFrame_GetLocals(((FrameType)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
+      __pyx_t_3 = Hunter_PyFrame_GetLocals(((FrameType)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GIVEREF(__pyx_t_3);
@@ -5549,7 +5000,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":143
+    /* "hunter/_event.pyx":118
  * 
  *     cdef inline locals_getter(self):
  *         if self._locals is UNSET:             # <<<<<<<<<<<<<<
@@ -5558,21 +5009,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
 */
   }
 
-  /* "hunter/_event.pyx":148
+  /* "hunter/_event.pyx":123
  *             else:
  *                 self._locals = Hunter_PyFrame_GetLocals(self.frame)
  *         return self._locals             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(148,18,0,__PYX_ERR(0, 148, __pyx_L1_error))
+  __Pyx_TraceLine(123,18,0,__PYX_ERR(0, 123, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_locals);
   __pyx_r = __pyx_v_self->_locals;
-  __Pyx_TraceReturnValue(__pyx_r, 18, 0, __PYX_ERR(0, 148, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 18, 0, __PYX_ERR(0, 123, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":142
+  /* "hunter/_event.pyx":117
  *         return self.threadname_getter()
  * 
  *     cdef inline locals_getter(self):             # <<<<<<<<<<<<<<
@@ -5588,7 +5039,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 142, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 117, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.locals_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -5599,7 +5050,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_locals_getter(struct __pyx_obj_6
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":150
+/* "hunter/_event.pyx":125
  *         return self._locals
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5632,25 +5083,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6locals___get__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 150, 0, 0, 0, __PYX_ERR(0, 150, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 125, 0, 0, 0, __PYX_ERR(0, 125, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":152
+  /* "hunter/_event.pyx":127
  *     @property
  *     def locals(self):
  *         return self.locals_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline globals_getter(self):
 */
-  __Pyx_TraceLine(152,1,0,__PYX_ERR(0, 152, __pyx_L1_error))
+  __Pyx_TraceLine(127,1,0,__PYX_ERR(0, 127, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_locals_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_locals_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 152, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 127, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":150
+  /* "hunter/_event.pyx":125
  *         return self._locals
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5665,7 +5116,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6locals___get__(struct __pyx_ob
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 150, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 125, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.locals.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -5676,7 +5127,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6locals___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":154
+/* "hunter/_event.pyx":129
  *         return self.locals_getter()
  * 
  *     cdef inline globals_getter(self):             # <<<<<<<<<<<<<<
@@ -5696,39 +5147,39 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13]))
   __Pyx_RefNannySetupContext("globals_getter", 0);
-  __Pyx_TraceStartFunc("globals_getter", __pyx_f[0], 154, 0, 0, 0, __PYX_ERR(0, 154, __pyx_L1_error));
+  __Pyx_TraceStartFunc("globals_getter", __pyx_f[0], 129, 0, 0, 0, __PYX_ERR(0, 129, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":155
+  /* "hunter/_event.pyx":130
  * 
  *     cdef inline globals_getter(self):
  *         if self._globals is UNSET:             # <<<<<<<<<<<<<<
  *             if self.builtin:
  *                 self._locals = {}
 */
-  __Pyx_TraceLine(155,5,0,__PYX_ERR(0, 155, __pyx_L1_error))
+  __Pyx_TraceLine(130,5,0,__PYX_ERR(0, 130, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_globals == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":156
+    /* "hunter/_event.pyx":131
  *     cdef inline globals_getter(self):
  *         if self._globals is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
  *                 self._locals = {}
  *             else:
 */
-    __Pyx_TraceLine(156,8,0,__PYX_ERR(0, 156, __pyx_L1_error))
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_TraceLine(131,8,0,__PYX_ERR(0, 131, __pyx_L1_error))
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 131, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":157
+      /* "hunter/_event.pyx":132
  *         if self._globals is UNSET:
  *             if self.builtin:
  *                 self._locals = {}             # <<<<<<<<<<<<<<
  *             else:
  *                 self._globals = Hunter_PyFrame_GetGlobals(self.frame)
 */
-      __Pyx_TraceLine(157,11,0,__PYX_ERR(0, 157, __pyx_L1_error))
-      __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
+      __Pyx_TraceLine(132,11,0,__PYX_ERR(0, 132, __pyx_L1_error))
+      __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 132, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_v_self->_locals);
@@ -5736,7 +5187,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
       __pyx_v_self->_locals = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":156
+      /* "hunter/_event.pyx":131
  *     cdef inline globals_getter(self):
  *         if self._globals is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
@@ -5746,18 +5197,18 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":159
+    /* "hunter/_event.pyx":134
  *                 self._locals = {}
  *             else:
  *                 self._globals = Hunter_PyFrame_GetGlobals(self.frame)             # <<<<<<<<<<<<<<
  *         return self._globals
  * 
 */
-    __Pyx_TraceLine(159,15,0,__PYX_ERR(0, 159, __pyx_L1_error))
+    __Pyx_TraceLine(134,15,0,__PYX_ERR(0, 134, __pyx_L1_error))
     /*else*/ {
       __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
       __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_3 = Hunter_PyFrame_GetGlobals(((FrameType)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 159, __pyx_L1_error)
+      __pyx_t_3 = Hunter_PyFrame_GetGlobals(((FrameType)__pyx_t_2)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_GIVEREF(__pyx_t_3);
@@ -5768,7 +5219,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":155
+    /* "hunter/_event.pyx":130
  * 
  *     cdef inline globals_getter(self):
  *         if self._globals is UNSET:             # <<<<<<<<<<<<<<
@@ -5777,21 +5228,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
 */
   }
 
-  /* "hunter/_event.pyx":160
+  /* "hunter/_event.pyx":135
  *             else:
  *                 self._globals = Hunter_PyFrame_GetGlobals(self.frame)
  *         return self._globals             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(160,18,0,__PYX_ERR(0, 160, __pyx_L1_error))
+  __Pyx_TraceLine(135,18,0,__PYX_ERR(0, 135, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_globals);
   __pyx_r = __pyx_v_self->_globals;
-  __Pyx_TraceReturnValue(__pyx_r, 18, 0, __PYX_ERR(0, 160, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 18, 0, __PYX_ERR(0, 135, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":154
+  /* "hunter/_event.pyx":129
  *         return self.locals_getter()
  * 
  *     cdef inline globals_getter(self):             # <<<<<<<<<<<<<<
@@ -5807,7 +5258,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 154, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 129, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.globals_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -5818,7 +5269,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_globals_getter(struct __pyx_obj_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":162
+/* "hunter/_event.pyx":137
  *         return self._globals
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5851,25 +5302,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_7globals___get__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 162, 0, 0, 0, __PYX_ERR(0, 162, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 137, 0, 0, 0, __PYX_ERR(0, 137, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":164
+  /* "hunter/_event.pyx":139
  *     @property
  *     def globals(self):
  *         return self.globals_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline function_getter(self):
 */
-  __Pyx_TraceLine(164,1,0,__PYX_ERR(0, 164, __pyx_L1_error))
+  __Pyx_TraceLine(139,1,0,__PYX_ERR(0, 139, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 164, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 139, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":162
+  /* "hunter/_event.pyx":137
  *         return self._globals
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -5884,7 +5335,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_7globals___get__(struct __pyx_o
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 162, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 137, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.globals.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -5895,7 +5346,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_7globals___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":166
+/* "hunter/_event.pyx":141
  *         return self.globals_getter()
  * 
  *     cdef inline function_getter(self):             # <<<<<<<<<<<<<<
@@ -5915,39 +5366,39 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[15]))
   __Pyx_RefNannySetupContext("function_getter", 0);
-  __Pyx_TraceStartFunc("function_getter", __pyx_f[0], 166, 0, 0, 0, __PYX_ERR(0, 166, __pyx_L1_error));
+  __Pyx_TraceStartFunc("function_getter", __pyx_f[0], 141, 0, 0, 0, __PYX_ERR(0, 141, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":167
+  /* "hunter/_event.pyx":142
  * 
  *     cdef inline function_getter(self):
  *         if self._function is UNSET:             # <<<<<<<<<<<<<<
  *             if self.builtin:
  *                 self._function = self.arg.__name__
 */
-  __Pyx_TraceLine(167,5,0,__PYX_ERR(0, 167, __pyx_L1_error))
+  __Pyx_TraceLine(142,5,0,__PYX_ERR(0, 142, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_function == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":168
+    /* "hunter/_event.pyx":143
  *     cdef inline function_getter(self):
  *         if self._function is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
  *                 self._function = self.arg.__name__
  *             else:
 */
-    __Pyx_TraceLine(168,8,0,__PYX_ERR(0, 168, __pyx_L1_error))
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_TraceLine(143,8,0,__PYX_ERR(0, 143, __pyx_L1_error))
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 143, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":169
+      /* "hunter/_event.pyx":144
  *         if self._function is UNSET:
  *             if self.builtin:
  *                 self._function = self.arg.__name__             # <<<<<<<<<<<<<<
  *             else:
  *                 self._function = self.code_getter().co_name
 */
-      __Pyx_TraceLine(169,13,0,__PYX_ERR(0, 169, __pyx_L1_error))
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->arg, __pyx_mstate_global->__pyx_n_u_name_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 169, __pyx_L1_error)
+      __Pyx_TraceLine(144,13,0,__PYX_ERR(0, 144, __pyx_L1_error))
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->arg, __pyx_mstate_global->__pyx_n_u_name_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_v_self->_function);
@@ -5955,7 +5406,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
       __pyx_v_self->_function = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":168
+      /* "hunter/_event.pyx":143
  *     cdef inline function_getter(self):
  *         if self._function is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
@@ -5965,16 +5416,16 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":171
+    /* "hunter/_event.pyx":146
  *                 self._function = self.arg.__name__
  *             else:
  *                 self._function = self.code_getter().co_name             # <<<<<<<<<<<<<<
  *         return self._function
  * 
 */
-    __Pyx_TraceLine(171,19,0,__PYX_ERR(0, 171, __pyx_L1_error))
+    __Pyx_TraceLine(146,19,0,__PYX_ERR(0, 146, __pyx_L1_error))
     /*else*/ {
-      __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+      __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_t_3 = ((PyCodeObject *)__pyx_t_2)->co_name;
       __Pyx_INCREF(__pyx_t_3);
@@ -5987,7 +5438,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":167
+    /* "hunter/_event.pyx":142
  * 
  *     cdef inline function_getter(self):
  *         if self._function is UNSET:             # <<<<<<<<<<<<<<
@@ -5996,21 +5447,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
 */
   }
 
-  /* "hunter/_event.pyx":172
+  /* "hunter/_event.pyx":147
  *             else:
  *                 self._function = self.code_getter().co_name
  *         return self._function             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(172,20,0,__PYX_ERR(0, 172, __pyx_L1_error))
+  __Pyx_TraceLine(147,20,0,__PYX_ERR(0, 147, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_function);
   __pyx_r = __pyx_v_self->_function;
-  __Pyx_TraceReturnValue(__pyx_r, 20, 0, __PYX_ERR(0, 172, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 20, 0, __PYX_ERR(0, 147, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":166
+  /* "hunter/_event.pyx":141
  *         return self.globals_getter()
  * 
  *     cdef inline function_getter(self):             # <<<<<<<<<<<<<<
@@ -6026,7 +5477,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 166, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 141, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.function_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -6037,7 +5488,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_function_getter(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":174
+/* "hunter/_event.pyx":149
  *         return self._function
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6070,25 +5521,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8function___get__(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 174, 0, 0, 0, __PYX_ERR(0, 174, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 149, 0, 0, 0, __PYX_ERR(0, 149, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":176
+  /* "hunter/_event.pyx":151
  *     @property
  *     def function(self):
  *         return self.function_getter()             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(176,1,0,__PYX_ERR(0, 176, __pyx_L1_error))
+  __Pyx_TraceLine(151,1,0,__PYX_ERR(0, 151, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_function_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_function_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 176, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 151, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":174
+  /* "hunter/_event.pyx":149
  *         return self._function
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6103,7 +5554,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8function___get__(struct __pyx_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 174, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 149, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.function.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -6114,7 +5565,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8function___get__(struct __pyx_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":178
+/* "hunter/_event.pyx":153
  *         return self.function_getter()
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6163,34 +5614,34 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 178, 0, 0, 0, __PYX_ERR(0, 178, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 153, 0, 0, 0, __PYX_ERR(0, 153, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":181
+  /* "hunter/_event.pyx":156
  *     def function_object(self):
  *         cdef CodeType code
  *         if self.builtin:             # <<<<<<<<<<<<<<
  *             return self.builtin
  *         elif self._function_object is UNSET:
 */
-  __Pyx_TraceLine(181,3,0,__PYX_ERR(0, 181, __pyx_L1_error))
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_TraceLine(156,3,0,__PYX_ERR(0, 156, __pyx_L1_error))
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 156, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":182
+    /* "hunter/_event.pyx":157
  *         cdef CodeType code
  *         if self.builtin:
  *             return self.builtin             # <<<<<<<<<<<<<<
  *         elif self._function_object is UNSET:
  *             code = self.code_getter()
 */
-    __Pyx_TraceLine(182,4,0,__PYX_ERR(0, 182, __pyx_L1_error))
+    __Pyx_TraceLine(157,4,0,__PYX_ERR(0, 157, __pyx_L1_error))
     __Pyx_XDECREF(__pyx_r);
     __Pyx_INCREF(__pyx_v_self->builtin);
     __pyx_r = __pyx_v_self->builtin;
-    __Pyx_TraceReturnValue(__pyx_r, 4, 0, __PYX_ERR(0, 182, __pyx_L1_error));
+    __Pyx_TraceReturnValue(__pyx_r, 4, 0, __PYX_ERR(0, 157, __pyx_L1_error));
     goto __pyx_L0;
 
-    /* "hunter/_event.pyx":181
+    /* "hunter/_event.pyx":156
  *     def function_object(self):
  *         cdef CodeType code
  *         if self.builtin:             # <<<<<<<<<<<<<<
@@ -6199,54 +5650,54 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
   }
 
-  /* "hunter/_event.pyx":183
+  /* "hunter/_event.pyx":158
  *         if self.builtin:
  *             return self.builtin
  *         elif self._function_object is UNSET:             # <<<<<<<<<<<<<<
  *             code = self.code_getter()
  *             if code.co_name is None:
 */
-  __Pyx_TraceLine(183,10,0,__PYX_ERR(0, 183, __pyx_L1_error))
+  __Pyx_TraceLine(158,10,0,__PYX_ERR(0, 158, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_function_object == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":184
+    /* "hunter/_event.pyx":159
  *             return self.builtin
  *         elif self._function_object is UNSET:
  *             code = self.code_getter()             # <<<<<<<<<<<<<<
  *             if code.co_name is None:
  *                 return None
 */
-    __Pyx_TraceLine(184,14,0,__PYX_ERR(0, 184, __pyx_L1_error))
-    __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
+    __Pyx_TraceLine(159,14,0,__PYX_ERR(0, 159, __pyx_L1_error))
+    __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_code = ((PyCodeObject *)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":185
+    /* "hunter/_event.pyx":160
  *         elif self._function_object is UNSET:
  *             code = self.code_getter()
  *             if code.co_name is None:             # <<<<<<<<<<<<<<
  *                 return None
  *             # First, try to find the function in globals
 */
-    __Pyx_TraceLine(185,19,0,__PYX_ERR(0, 185, __pyx_L1_error))
+    __Pyx_TraceLine(160,19,0,__PYX_ERR(0, 160, __pyx_L1_error))
     __pyx_t_1 = (__pyx_v_code->co_name == Py_None);
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":186
+      /* "hunter/_event.pyx":161
  *             code = self.code_getter()
  *             if code.co_name is None:
  *                 return None             # <<<<<<<<<<<<<<
  *             # First, try to find the function in globals
  *             candidate = self.globals.get(code.co_name, None)
 */
-      __Pyx_TraceLine(186,20,0,__PYX_ERR(0, 186, __pyx_L1_error))
+      __Pyx_TraceLine(161,20,0,__PYX_ERR(0, 161, __pyx_L1_error))
       __Pyx_XDECREF(__pyx_r);
       __pyx_r = Py_None; __Pyx_INCREF(Py_None);
       goto __pyx_L0;
 
-      /* "hunter/_event.pyx":185
+      /* "hunter/_event.pyx":160
  *         elif self._function_object is UNSET:
  *             code = self.code_getter()
  *             if code.co_name is None:             # <<<<<<<<<<<<<<
@@ -6255,15 +5706,15 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
     }
 
-    /* "hunter/_event.pyx":188
+    /* "hunter/_event.pyx":163
  *                 return None
  *             # First, try to find the function in globals
  *             candidate = self.globals.get(code.co_name, None)             # <<<<<<<<<<<<<<
  *             func = if_same_code(candidate, code)
  *             # If that failed, as will be the case with class and instance methods, try
 */
-    __Pyx_TraceLine(188,24,0,__PYX_ERR(0, 188, __pyx_L1_error))
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 188, __pyx_L1_error)
+    __Pyx_TraceLine(163,24,0,__PYX_ERR(0, 163, __pyx_L1_error))
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = __pyx_t_4;
     __Pyx_INCREF(__pyx_t_3);
@@ -6273,22 +5724,22 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
       __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_5, (3-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 188, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
     __pyx_v_candidate = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":189
+    /* "hunter/_event.pyx":164
  *             # First, try to find the function in globals
  *             candidate = self.globals.get(code.co_name, None)
  *             func = if_same_code(candidate, code)             # <<<<<<<<<<<<<<
  *             # If that failed, as will be the case with class and instance methods, try
  *             # to look up the function from the first argument. In the case of class/instance
 */
-    __Pyx_TraceLine(189,32,0,__PYX_ERR(0, 189, __pyx_L1_error))
+    __Pyx_TraceLine(164,32,0,__PYX_ERR(0, 164, __pyx_L1_error))
     __pyx_t_4 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_5 = 1;
     #if CYTHON_UNPACK_METHODS
@@ -6307,20 +5758,20 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_5, (3-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
     __pyx_v_func = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":194
+    /* "hunter/_event.pyx":169
  *             # methods, this should be the class (or an instance of the class) on which our
  *             # method is defined.
  *             if func is None and code.co_argcount >= 1:             # <<<<<<<<<<<<<<
  *                 first_arg = self.locals.get(PyCode_GetVarnames(code)[0])
  *                 func = get_func_in_mro(first_arg, code)
 */
-    __Pyx_TraceLine(194,38,0,__PYX_ERR(0, 194, __pyx_L1_error))
+    __Pyx_TraceLine(169,38,0,__PYX_ERR(0, 169, __pyx_L1_error))
     __pyx_t_6 = (__pyx_v_func == Py_None);
     if (__pyx_t_6) {
     } else {
@@ -6332,21 +5783,21 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":195
+      /* "hunter/_event.pyx":170
  *             # method is defined.
  *             if func is None and code.co_argcount >= 1:
  *                 first_arg = self.locals.get(PyCode_GetVarnames(code)[0])             # <<<<<<<<<<<<<<
  *                 func = get_func_in_mro(first_arg, code)
  *             # If we still can't find the function, as will be the case with static methods,
 */
-      __Pyx_TraceLine(195,46,0,__PYX_ERR(0, 195, __pyx_L1_error))
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_locals); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __Pyx_TraceLine(170,46,0,__PYX_ERR(0, 170, __pyx_L1_error))
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_locals); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 170, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_t_3 = __pyx_t_4;
       __Pyx_INCREF(__pyx_t_3);
-      __pyx_t_7 = PyCode_GetVarnames(__pyx_v_code); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_7 = PyCode_GetVarnames(__pyx_v_code); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 170, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_7, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_7, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 170, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __pyx_t_5 = 0;
@@ -6356,22 +5807,22 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
       }
       __pyx_v_first_arg = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":196
+      /* "hunter/_event.pyx":171
  *             if func is None and code.co_argcount >= 1:
  *                 first_arg = self.locals.get(PyCode_GetVarnames(code)[0])
  *                 func = get_func_in_mro(first_arg, code)             # <<<<<<<<<<<<<<
  *             # If we still can't find the function, as will be the case with static methods,
  *             # try looking at classes in global scope.
 */
-      __Pyx_TraceLine(196,56,0,__PYX_ERR(0, 196, __pyx_L1_error))
+      __Pyx_TraceLine(171,56,0,__PYX_ERR(0, 171, __pyx_L1_error))
       __pyx_t_4 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 171, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __pyx_t_5 = 1;
       #if CYTHON_UNPACK_METHODS
@@ -6390,13 +5841,13 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
         __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+__pyx_t_5, (3-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
       }
       __Pyx_DECREF_SET(__pyx_v_func, __pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":194
+      /* "hunter/_event.pyx":169
  *             # methods, this should be the class (or an instance of the class) on which our
  *             # method is defined.
  *             if func is None and code.co_argcount >= 1:             # <<<<<<<<<<<<<<
@@ -6405,33 +5856,33 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
     }
 
-    /* "hunter/_event.pyx":199
+    /* "hunter/_event.pyx":174
  *             # If we still can't find the function, as will be the case with static methods,
  *             # try looking at classes in global scope.
  *             if func is None:             # <<<<<<<<<<<<<<
  *                 for v in self.globals.values():
  *                     if not isinstance(v, type):
 */
-    __Pyx_TraceLine(199,62,0,__PYX_ERR(0, 199, __pyx_L1_error))
+    __Pyx_TraceLine(174,62,0,__PYX_ERR(0, 174, __pyx_L1_error))
     __pyx_t_1 = (__pyx_v_func == Py_None);
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":200
+      /* "hunter/_event.pyx":175
  *             # try looking at classes in global scope.
  *             if func is None:
  *                 for v in self.globals.values():             # <<<<<<<<<<<<<<
  *                     if not isinstance(v, type):
  *                         continue
 */
-      __Pyx_TraceLine(200,63,0,__PYX_ERR(0, 200, __pyx_L1_error))
+      __Pyx_TraceLine(175,63,0,__PYX_ERR(0, 175, __pyx_L1_error))
       __pyx_t_9 = 0;
-      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 175, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (unlikely(__pyx_t_8 == Py_None)) {
         PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "values");
-        __PYX_ERR(0, 200, __pyx_L1_error)
+        __PYX_ERR(0, 175, __pyx_L1_error)
       }
-      __pyx_t_4 = __Pyx_dict_iterator(__pyx_t_8, 0, __pyx_mstate_global->__pyx_n_u_values, (&__pyx_t_10), (&__pyx_t_11)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_dict_iterator(__pyx_t_8, 0, __pyx_mstate_global->__pyx_n_u_values, (&__pyx_t_10), (&__pyx_t_11)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_XDECREF(__pyx_t_2);
@@ -6440,34 +5891,34 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
       while (1) {
         __pyx_t_12 = __Pyx_dict_iter_next(__pyx_t_2, __pyx_t_10, &__pyx_t_9, NULL, &__pyx_t_4, NULL, __pyx_t_11);
         if (unlikely(__pyx_t_12 == 0)) break;
-        if (unlikely(__pyx_t_12 == -1)) __PYX_ERR(0, 200, __pyx_L1_error)
+        if (unlikely(__pyx_t_12 == -1)) __PYX_ERR(0, 175, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_4);
         __pyx_t_4 = 0;
 
-        /* "hunter/_event.pyx":201
+        /* "hunter/_event.pyx":176
  *             if func is None:
  *                 for v in self.globals.values():
  *                     if not isinstance(v, type):             # <<<<<<<<<<<<<<
  *                         continue
  *                     func = get_func_in_mro(v, code)
 */
-        __Pyx_TraceLine(201,74,0,__PYX_ERR(0, 201, __pyx_L1_error))
+        __Pyx_TraceLine(176,74,0,__PYX_ERR(0, 176, __pyx_L1_error))
         __pyx_t_1 = PyType_Check(__pyx_v_v); 
         __pyx_t_6 = (!__pyx_t_1);
         if (__pyx_t_6) {
 
-          /* "hunter/_event.pyx":202
+          /* "hunter/_event.pyx":177
  *                 for v in self.globals.values():
  *                     if not isinstance(v, type):
  *                         continue             # <<<<<<<<<<<<<<
  *                     func = get_func_in_mro(v, code)
  *                     if func is not None:
 */
-          __Pyx_TraceLine(202,75,0,__PYX_ERR(0, 202, __pyx_L1_error))
+          __Pyx_TraceLine(177,75,0,__PYX_ERR(0, 177, __pyx_L1_error))
           goto __pyx_L9_continue;
 
-          /* "hunter/_event.pyx":201
+          /* "hunter/_event.pyx":176
  *             if func is None:
  *                 for v in self.globals.values():
  *                     if not isinstance(v, type):             # <<<<<<<<<<<<<<
@@ -6476,16 +5927,16 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
         }
 
-        /* "hunter/_event.pyx":203
+        /* "hunter/_event.pyx":178
  *                     if not isinstance(v, type):
  *                         continue
  *                     func = get_func_in_mro(v, code)             # <<<<<<<<<<<<<<
  *                     if func is not None:
  *                         break
 */
-        __Pyx_TraceLine(203,78,0,__PYX_ERR(0, 203, __pyx_L1_error))
+        __Pyx_TraceLine(178,78,0,__PYX_ERR(0, 178, __pyx_L1_error))
         __pyx_t_8 = NULL;
-        __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_5 = 1;
         #if CYTHON_UNPACK_METHODS
@@ -6504,34 +5955,34 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
           __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_5, (3-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 203, __pyx_L1_error)
+          if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 178, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
         }
         __Pyx_DECREF_SET(__pyx_v_func, __pyx_t_4);
         __pyx_t_4 = 0;
 
-        /* "hunter/_event.pyx":204
+        /* "hunter/_event.pyx":179
  *                         continue
  *                     func = get_func_in_mro(v, code)
  *                     if func is not None:             # <<<<<<<<<<<<<<
  *                         break
  *             self._function_object = func
 */
-        __Pyx_TraceLine(204,84,0,__PYX_ERR(0, 204, __pyx_L1_error))
+        __Pyx_TraceLine(179,84,0,__PYX_ERR(0, 179, __pyx_L1_error))
         __pyx_t_6 = (__pyx_v_func != Py_None);
         if (__pyx_t_6) {
 
-          /* "hunter/_event.pyx":205
+          /* "hunter/_event.pyx":180
  *                     func = get_func_in_mro(v, code)
  *                     if func is not None:
  *                         break             # <<<<<<<<<<<<<<
  *             self._function_object = func
  *         return self._function_object
 */
-          __Pyx_TraceLine(205,85,0,__PYX_ERR(0, 205, __pyx_L1_error))
+          __Pyx_TraceLine(180,85,0,__PYX_ERR(0, 180, __pyx_L1_error))
           goto __pyx_L10_break;
 
-          /* "hunter/_event.pyx":204
+          /* "hunter/_event.pyx":179
  *                         continue
  *                     func = get_func_in_mro(v, code)
  *                     if func is not None:             # <<<<<<<<<<<<<<
@@ -6544,7 +5995,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
       __pyx_L10_break:;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":199
+      /* "hunter/_event.pyx":174
  *             # If we still can't find the function, as will be the case with static methods,
  *             # try looking at classes in global scope.
  *             if func is None:             # <<<<<<<<<<<<<<
@@ -6553,21 +6004,21 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
     }
 
-    /* "hunter/_event.pyx":206
+    /* "hunter/_event.pyx":181
  *                     if func is not None:
  *                         break
  *             self._function_object = func             # <<<<<<<<<<<<<<
  *         return self._function_object
  * 
 */
-    __Pyx_TraceLine(206,86,0,__PYX_ERR(0, 206, __pyx_L1_error))
+    __Pyx_TraceLine(181,86,0,__PYX_ERR(0, 181, __pyx_L1_error))
     __Pyx_INCREF(__pyx_v_func);
     __Pyx_GIVEREF(__pyx_v_func);
     __Pyx_GOTREF(__pyx_v_self->_function_object);
     __Pyx_DECREF(__pyx_v_self->_function_object);
     __pyx_v_self->_function_object = __pyx_v_func;
 
-    /* "hunter/_event.pyx":183
+    /* "hunter/_event.pyx":158
  *         if self.builtin:
  *             return self.builtin
  *         elif self._function_object is UNSET:             # <<<<<<<<<<<<<<
@@ -6576,21 +6027,21 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
 */
   }
 
-  /* "hunter/_event.pyx":207
+  /* "hunter/_event.pyx":182
  *                         break
  *             self._function_object = func
  *         return self._function_object             # <<<<<<<<<<<<<<
  * 
  *     cdef inline module_getter(self):
 */
-  __Pyx_TraceLine(207,89,0,__PYX_ERR(0, 207, __pyx_L1_error))
+  __Pyx_TraceLine(182,89,0,__PYX_ERR(0, 182, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_function_object);
   __pyx_r = __pyx_v_self->_function_object;
-  __Pyx_TraceReturnValue(__pyx_r, 89, 0, __PYX_ERR(0, 207, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 89, 0, __PYX_ERR(0, 182, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":178
+  /* "hunter/_event.pyx":153
  *         return self.function_getter()
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6609,7 +6060,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 178, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 153, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.function_object.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -6625,7 +6076,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_15function_object___get__(struc
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":209
+/* "hunter/_event.pyx":184
  *         return self._function_object
  * 
  *     cdef inline module_getter(self):             # <<<<<<<<<<<<<<
@@ -6646,44 +6097,44 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18]))
   __Pyx_RefNannySetupContext("module_getter", 0);
-  __Pyx_TraceStartFunc("module_getter", __pyx_f[0], 209, 0, 0, 0, __PYX_ERR(0, 209, __pyx_L1_error));
+  __Pyx_TraceStartFunc("module_getter", __pyx_f[0], 184, 0, 0, 0, __PYX_ERR(0, 184, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":210
+  /* "hunter/_event.pyx":185
  * 
  *     cdef inline module_getter(self):
  *         if self._module is UNSET:             # <<<<<<<<<<<<<<
  *             if self.builtin:
  *                 module = self.arg.__module__
 */
-  __Pyx_TraceLine(210,5,0,__PYX_ERR(0, 210, __pyx_L1_error))
+  __Pyx_TraceLine(185,5,0,__PYX_ERR(0, 185, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_module == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":211
+    /* "hunter/_event.pyx":186
  *     cdef inline module_getter(self):
  *         if self._module is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
  *                 module = self.arg.__module__
  *             else:
 */
-    __Pyx_TraceLine(211,8,0,__PYX_ERR(0, 211, __pyx_L1_error))
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_TraceLine(186,8,0,__PYX_ERR(0, 186, __pyx_L1_error))
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_self->builtin); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 186, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":212
+      /* "hunter/_event.pyx":187
  *         if self._module is UNSET:
  *             if self.builtin:
  *                 module = self.arg.__module__             # <<<<<<<<<<<<<<
  *             else:
  *                 module = self.globals.get('__name__', '')
 */
-      __Pyx_TraceLine(212,12,0,__PYX_ERR(0, 212, __pyx_L1_error))
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->arg, __pyx_mstate_global->__pyx_n_u_module_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 212, __pyx_L1_error)
+      __Pyx_TraceLine(187,12,0,__PYX_ERR(0, 187, __pyx_L1_error))
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->arg, __pyx_mstate_global->__pyx_n_u_module_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_v_module = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "hunter/_event.pyx":211
+      /* "hunter/_event.pyx":186
  *     cdef inline module_getter(self):
  *         if self._module is UNSET:
  *             if self.builtin:             # <<<<<<<<<<<<<<
@@ -6693,21 +6144,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
       goto __pyx_L4;
     }
 
-    /* "hunter/_event.pyx":214
+    /* "hunter/_event.pyx":189
  *                 module = self.arg.__module__
  *             else:
  *                 module = self.globals.get('__name__', '')             # <<<<<<<<<<<<<<
  *             if module is None:
  *                 module = '?'
 */
-    __Pyx_TraceLine(214,17,0,__PYX_ERR(0, 214, __pyx_L1_error))
+    __Pyx_TraceLine(189,17,0,__PYX_ERR(0, 189, __pyx_L1_error))
     /*else*/ {
-      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_mstate_global->__pyx_tuple[0], NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_mstate_global->__pyx_tuple[0], NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_module = __pyx_t_2;
@@ -6715,29 +6166,29 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
     }
     __pyx_L4:;
 
-    /* "hunter/_event.pyx":215
+    /* "hunter/_event.pyx":190
  *             else:
  *                 module = self.globals.get('__name__', '')
  *             if module is None:             # <<<<<<<<<<<<<<
  *                 module = '?'
  *             self._module = module
 */
-    __Pyx_TraceLine(215,23,0,__PYX_ERR(0, 215, __pyx_L1_error))
+    __Pyx_TraceLine(190,23,0,__PYX_ERR(0, 190, __pyx_L1_error))
     __pyx_t_1 = (__pyx_v_module == Py_None);
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":216
+      /* "hunter/_event.pyx":191
  *                 module = self.globals.get('__name__', '')
  *             if module is None:
  *                 module = '?'             # <<<<<<<<<<<<<<
  *             self._module = module
  *         return self._module
 */
-      __Pyx_TraceLine(216,25,0,__PYX_ERR(0, 216, __pyx_L1_error))
+      __Pyx_TraceLine(191,25,0,__PYX_ERR(0, 191, __pyx_L1_error))
       __Pyx_INCREF(__pyx_mstate_global->__pyx_kp_u__3);
       __Pyx_DECREF_SET(__pyx_v_module, __pyx_mstate_global->__pyx_kp_u__3);
 
-      /* "hunter/_event.pyx":215
+      /* "hunter/_event.pyx":190
  *             else:
  *                 module = self.globals.get('__name__', '')
  *             if module is None:             # <<<<<<<<<<<<<<
@@ -6746,21 +6197,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
 */
     }
 
-    /* "hunter/_event.pyx":217
+    /* "hunter/_event.pyx":192
  *             if module is None:
  *                 module = '?'
  *             self._module = module             # <<<<<<<<<<<<<<
  *         return self._module
  * 
 */
-    __Pyx_TraceLine(217,26,0,__PYX_ERR(0, 217, __pyx_L1_error))
+    __Pyx_TraceLine(192,26,0,__PYX_ERR(0, 192, __pyx_L1_error))
     __Pyx_INCREF(__pyx_v_module);
     __Pyx_GIVEREF(__pyx_v_module);
     __Pyx_GOTREF(__pyx_v_self->_module);
     __Pyx_DECREF(__pyx_v_self->_module);
     __pyx_v_self->_module = __pyx_v_module;
 
-    /* "hunter/_event.pyx":210
+    /* "hunter/_event.pyx":185
  * 
  *     cdef inline module_getter(self):
  *         if self._module is UNSET:             # <<<<<<<<<<<<<<
@@ -6769,21 +6220,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
 */
   }
 
-  /* "hunter/_event.pyx":218
+  /* "hunter/_event.pyx":193
  *                 module = '?'
  *             self._module = module
  *         return self._module             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(218,29,0,__PYX_ERR(0, 218, __pyx_L1_error))
+  __Pyx_TraceLine(193,29,0,__PYX_ERR(0, 193, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_module);
   __pyx_r = __pyx_v_self->_module;
-  __Pyx_TraceReturnValue(__pyx_r, 29, 0, __PYX_ERR(0, 218, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 29, 0, __PYX_ERR(0, 193, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":209
+  /* "hunter/_event.pyx":184
  *         return self._function_object
  * 
  *     cdef inline module_getter(self):             # <<<<<<<<<<<<<<
@@ -6799,7 +6250,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 209, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 184, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.module_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -6811,7 +6262,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_module_getter(struct __pyx_obj_6
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":220
+/* "hunter/_event.pyx":195
  *         return self._module
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6844,25 +6295,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6module___get__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 220, 0, 0, 0, __PYX_ERR(0, 220, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 195, 0, 0, 0, __PYX_ERR(0, 195, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":222
+  /* "hunter/_event.pyx":197
  *     @property
  *     def module(self):
  *         return self.module_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline filename_getter(self):
 */
-  __Pyx_TraceLine(222,1,0,__PYX_ERR(0, 222, __pyx_L1_error))
+  __Pyx_TraceLine(197,1,0,__PYX_ERR(0, 197, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 222, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 197, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":220
+  /* "hunter/_event.pyx":195
  *         return self._module
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -6877,7 +6328,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6module___get__(struct __pyx_ob
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 220, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 195, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.module.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -6888,457 +6339,201 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6module___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":224
+/* "hunter/_event.pyx":199
  *         return self.module_getter()
  * 
  *     cdef inline filename_getter(self):             # <<<<<<<<<<<<<<
- *         cdef CodeType code
  *         if self._filename is UNSET:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
 
 static PyObject *__pyx_f_6hunter_6_event_5Event_filename_getter(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self) {
-  PyCodeObject *__pyx_v_code = 0;
-  PyObject *__pyx_v_filename = NULL;
-  PyObject *__pyx_v_cybasename = NULL;
-  PyObject *__pyx_v_ext = NULL;
-  PyObject *__pyx_v_cyfilename = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_TraceDeclarationsFunc
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
+  size_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20]))
   __Pyx_RefNannySetupContext("filename_getter", 0);
-  __Pyx_TraceStartFunc("filename_getter", __pyx_f[0], 224, 0, 0, 0, __PYX_ERR(0, 224, __pyx_L1_error));
+  __Pyx_TraceStartFunc("filename_getter", __pyx_f[0], 199, 0, 0, 0, __PYX_ERR(0, 199, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":226
+  /* "hunter/_event.pyx":200
+ * 
  *     cdef inline filename_getter(self):
- *         cdef CodeType code
  *         if self._filename is UNSET:             # <<<<<<<<<<<<<<
- *             code = self.code_getter()
- *             filename = code.co_filename
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
+ *         return self._filename
 */
-  __Pyx_TraceLine(226,5,0,__PYX_ERR(0, 226, __pyx_L1_error))
+  __Pyx_TraceLine(200,5,0,__PYX_ERR(0, 200, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_filename == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":227
- *         cdef CodeType code
- *         if self._filename is UNSET:
- *             code = self.code_getter()             # <<<<<<<<<<<<<<
- *             filename = code.co_filename
- *             if not filename:
-*/
-    __Pyx_TraceLine(227,9,0,__PYX_ERR(0, 227, __pyx_L1_error))
-    __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 227, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_v_code = ((PyCodeObject *)__pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "hunter/_event.pyx":228
+    /* "hunter/_event.pyx":201
+ *     cdef inline filename_getter(self):
  *         if self._filename is UNSET:
- *             code = self.code_getter()
- *             filename = code.co_filename             # <<<<<<<<<<<<<<
- *             if not filename:
- *                 filename = self.globals.get('__file__')
-*/
-    __Pyx_TraceLine(228,12,0,__PYX_ERR(0, 228, __pyx_L1_error))
-    __pyx_t_2 = __pyx_v_code->co_filename;
-    __Pyx_INCREF(__pyx_t_2);
-    __pyx_v_filename = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "hunter/_event.pyx":229
- *             code = self.code_getter()
- *             filename = code.co_filename
- *             if not filename:             # <<<<<<<<<<<<<<
- *                 filename = self.globals.get('__file__')
- *             if not filename:
-*/
-    __Pyx_TraceLine(229,15,0,__PYX_ERR(0, 229, __pyx_L1_error))
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_filename); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 229, __pyx_L1_error)
-    __pyx_t_3 = (!__pyx_t_1);
-    if (__pyx_t_3) {
-
-      /* "hunter/_event.pyx":230
- *             filename = code.co_filename
- *             if not filename:
- *                 filename = self.globals.get('__file__')             # <<<<<<<<<<<<<<
- *             if not filename:
- *                 filename = '?'
-*/
-      __Pyx_TraceLine(230,18,0,__PYX_ERR(0, 230, __pyx_L1_error))
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = __pyx_t_5;
-      __Pyx_INCREF(__pyx_t_4);
-      __pyx_t_6 = 0;
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_n_u_file};
-        __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-      }
-      __Pyx_DECREF_SET(__pyx_v_filename, __pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "hunter/_event.pyx":229
- *             code = self.code_getter()
- *             filename = code.co_filename
- *             if not filename:             # <<<<<<<<<<<<<<
- *                 filename = self.globals.get('__file__')
- *             if not filename:
-*/
-    }
-
-    /* "hunter/_event.pyx":231
- *             if not filename:
- *                 filename = self.globals.get('__file__')
- *             if not filename:             # <<<<<<<<<<<<<<
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):
-*/
-    __Pyx_TraceLine(231,24,0,__PYX_ERR(0, 231, __pyx_L1_error))
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_filename); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 231, __pyx_L1_error)
-    __pyx_t_1 = (!__pyx_t_3);
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":232
- *                 filename = self.globals.get('__file__')
- *             if not filename:
- *                 filename = '?'             # <<<<<<<<<<<<<<
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]
-*/
-      __Pyx_TraceLine(232,26,0,__PYX_ERR(0, 232, __pyx_L1_error))
-      __Pyx_INCREF(__pyx_mstate_global->__pyx_kp_u__3);
-      __Pyx_DECREF_SET(__pyx_v_filename, __pyx_mstate_global->__pyx_kp_u__3);
-
-      /* "hunter/_event.pyx":231
- *             if not filename:
- *                 filename = self.globals.get('__file__')
- *             if not filename:             # <<<<<<<<<<<<<<
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):
-*/
-      goto __pyx_L5;
-    }
-
-    /* "hunter/_event.pyx":233
- *             if not filename:
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):             # <<<<<<<<<<<<<<
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):
-*/
-    __Pyx_TraceLine(233,27,0,__PYX_ERR(0, 233, __pyx_L1_error))
-    __pyx_t_5 = __pyx_v_filename;
-    __Pyx_INCREF(__pyx_t_5);
-    __pyx_t_6 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_tuple[1]};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_endswith, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 233, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":234
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]             # <<<<<<<<<<<<<<
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
-*/
-      __Pyx_TraceLine(234,34,0,__PYX_ERR(0, 234, __pyx_L1_error))
-      __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_filename, 0, -1L, NULL, NULL, &__pyx_mstate_global->__pyx_slice[0], 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF_SET(__pyx_v_filename, __pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "hunter/_event.pyx":233
- *             if not filename:
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):             # <<<<<<<<<<<<<<
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())             # <<<<<<<<<<<<<<
+ *         return self._filename
+ * 
 */
-      goto __pyx_L5;
+    __Pyx_TraceLine(201,11,0,__PYX_ERR(0, 201, __pyx_L1_error))
+    __pyx_t_3 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_get_code_fields); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      assert(__pyx_t_3);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+      __pyx_t_8 = 0;
     }
-
-    /* "hunter/_event.pyx":235
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):
-*/
-    __Pyx_TraceLine(235,36,0,__PYX_ERR(0, 235, __pyx_L1_error))
-    __pyx_t_5 = __pyx_v_filename;
-    __Pyx_INCREF(__pyx_t_5);
-    __pyx_t_6 = 0;
+    #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_tuple[2]};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_endswith, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+      PyObject *__pyx_callargs[4] = {__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_8, (4-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 201, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 235, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":236
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)             # <<<<<<<<<<<<<<
- *                 for ext in ('.pyx', '.py'):
- *                     cyfilename = cybasename + ext
-*/
-      __Pyx_TraceLine(236,44,0,__PYX_ERR(0, 236, __pyx_L1_error))
-      __pyx_t_5 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_CYTHON_SUFFIX_RE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+    if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
+      PyObject* sequence = __pyx_t_2;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 201, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0);
+        __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1);
+        __Pyx_INCREF(__pyx_t_7);
+      } else {
+        __pyx_t_4 = __Pyx_PyList_GetItemRef(sequence, 0);
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 201, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_4);
+        __pyx_t_7 = __Pyx_PyList_GetItemRef(sequence, 1);
+        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 201, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_7);
+      }
+      #else
+      __pyx_t_4 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 201, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_sub); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 201, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = 1;
-      #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_7))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
-        assert(__pyx_t_5);
-        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(__pyx__function);
-        __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
-        __pyx_t_6 = 0;
-      }
       #endif
-      {
-        PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u__2, __pyx_v_filename};
-        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+__pyx_t_6, (3-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-      }
-      __pyx_v_cybasename = __pyx_t_2;
-      __pyx_t_2 = 0;
-
-      /* "hunter/_event.pyx":237
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):             # <<<<<<<<<<<<<<
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):
-*/
-      __Pyx_TraceLine(237,49,0,__PYX_ERR(0, 237, __pyx_L1_error))
-      __pyx_t_2 = __pyx_mstate_global->__pyx_tuple[3]; __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_8 = 0;
-      for (;;) {
-        if (__pyx_t_8 >= 2) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_8));
-        #else
-        __pyx_t_7 = __Pyx_PySequence_ITEM(__pyx_t_2, __pyx_t_8);
-        #endif
-        ++__pyx_t_8;
-        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 237, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_XDECREF_SET(__pyx_v_ext, ((PyObject*)__pyx_t_7));
-        __pyx_t_7 = 0;
-        __Pyx_TraceLine(237,47,0,__PYX_ERR(0, 237, __pyx_L1_error))
-
-        /* "hunter/_event.pyx":238
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):
- *                     cyfilename = cybasename + ext             # <<<<<<<<<<<<<<
- *                     if exists(cyfilename):
- *                         filename = cyfilename
-*/
-        __Pyx_TraceLine(238,54,0,__PYX_ERR(0, 238, __pyx_L1_error))
-        __pyx_t_7 = PyNumber_Add(__pyx_v_cybasename, __pyx_v_ext); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 238, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_XDECREF_SET(__pyx_v_cyfilename, __pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "hunter/_event.pyx":239
- *                 for ext in ('.pyx', '.py'):
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):             # <<<<<<<<<<<<<<
- *                         filename = cyfilename
- *                         break
-*/
-        __Pyx_TraceLine(239,58,0,__PYX_ERR(0, 239, __pyx_L1_error))
-        __pyx_t_5 = NULL;
-        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_exists); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 239, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_6 = 1;
-        #if CYTHON_UNPACK_METHODS
-        if (unlikely(PyMethod_Check(__pyx_t_4))) {
-          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-          assert(__pyx_t_5);
-          PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(__pyx__function);
-          __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-          __pyx_t_6 = 0;
-        }
-        #endif
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_v_cyfilename};
-          __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 239, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_7);
-        }
-        __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 239, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (__pyx_t_1) {
-
-          /* "hunter/_event.pyx":240
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):
- *                         filename = cyfilename             # <<<<<<<<<<<<<<
- *                         break
- * 
-*/
-          __Pyx_TraceLine(240,61,0,__PYX_ERR(0, 240, __pyx_L1_error))
-          __Pyx_INCREF(__pyx_v_cyfilename);
-          __Pyx_DECREF_SET(__pyx_v_filename, __pyx_v_cyfilename);
-
-          /* "hunter/_event.pyx":241
- *                     if exists(cyfilename):
- *                         filename = cyfilename
- *                         break             # <<<<<<<<<<<<<<
- * 
- *             self._filename = filename
-*/
-          __Pyx_TraceLine(241,62,0,__PYX_ERR(0, 241, __pyx_L1_error))
-          goto __pyx_L7_break;
-
-          /* "hunter/_event.pyx":239
- *                 for ext in ('.pyx', '.py'):
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):             # <<<<<<<<<<<<<<
- *                         filename = cyfilename
- *                         break
-*/
-        }
-
-        /* "hunter/_event.pyx":237
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):             # <<<<<<<<<<<<<<
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):
-*/
-        __Pyx_TraceLine(237,47,0,__PYX_ERR(0, 237, __pyx_L1_error))
-      }
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      goto __pyx_L9_for_end;
-      __pyx_L7_break:;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_6 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 201, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      goto __pyx_L9_for_end;
-      __pyx_L9_for_end:;
-
-      /* "hunter/_event.pyx":235
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):
-*/
+      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_6);
+      index = 0; __pyx_t_4 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      index = 1; __pyx_t_7 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_7)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_6), 2) < 0) __PYX_ERR(0, 201, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L5_unpacking_done;
+      __pyx_L4_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 201, __pyx_L1_error)
+      __pyx_L5_unpacking_done:;
     }
-    __pyx_L5:;
-
-    /* "hunter/_event.pyx":243
- *                         break
- * 
- *             self._filename = filename             # <<<<<<<<<<<<<<
- *         return self._filename
- * 
-*/
-    __Pyx_TraceLine(243,63,0,__PYX_ERR(0, 243, __pyx_L1_error))
-    __Pyx_INCREF(__pyx_v_filename);
-    __Pyx_GIVEREF(__pyx_v_filename);
+    __Pyx_GIVEREF(__pyx_t_4);
     __Pyx_GOTREF(__pyx_v_self->_filename);
     __Pyx_DECREF(__pyx_v_self->_filename);
-    __pyx_v_self->_filename = __pyx_v_filename;
+    __pyx_v_self->_filename = __pyx_t_4;
+    __pyx_t_4 = 0;
+    __Pyx_GIVEREF(__pyx_t_7);
+    __Pyx_GOTREF(__pyx_v_self->_stdlib);
+    __Pyx_DECREF(__pyx_v_self->_stdlib);
+    __pyx_v_self->_stdlib = __pyx_t_7;
+    __pyx_t_7 = 0;
 
-    /* "hunter/_event.pyx":226
+    /* "hunter/_event.pyx":200
+ * 
  *     cdef inline filename_getter(self):
- *         cdef CodeType code
  *         if self._filename is UNSET:             # <<<<<<<<<<<<<<
- *             code = self.code_getter()
- *             filename = code.co_filename
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
+ *         return self._filename
 */
   }
 
-  /* "hunter/_event.pyx":244
- * 
- *             self._filename = filename
+  /* "hunter/_event.pyx":202
+ *         if self._filename is UNSET:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
  *         return self._filename             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(244,66,0,__PYX_ERR(0, 244, __pyx_L1_error))
+  __Pyx_TraceLine(202,21,0,__PYX_ERR(0, 202, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_filename);
   __pyx_r = __pyx_v_self->_filename;
-  __Pyx_TraceReturnValue(__pyx_r, 66, 0, __PYX_ERR(0, 244, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 21, 0, __PYX_ERR(0, 202, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":224
+  /* "hunter/_event.pyx":199
  *         return self.module_getter()
  * 
  *     cdef inline filename_getter(self):             # <<<<<<<<<<<<<<
- *         cdef CodeType code
  *         if self._filename is UNSET:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_TraceException(__pyx_lineno, 0, 0);
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 224, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 199, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.filename_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_code);
-  __Pyx_XDECREF(__pyx_v_filename);
-  __Pyx_XDECREF(__pyx_v_cybasename);
-  __Pyx_XDECREF(__pyx_v_ext);
-  __Pyx_XDECREF(__pyx_v_cyfilename);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_PyMonitoring_ExitScope(0);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":246
+/* "hunter/_event.pyx":204
  *         return self._filename
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7371,25 +6566,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8filename___get__(struct __pyx_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[21]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 246, 0, 0, 0, __PYX_ERR(0, 246, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 204, 0, 0, 0, __PYX_ERR(0, 204, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":248
+  /* "hunter/_event.pyx":206
  *     @property
  *     def filename(self):
  *         return self.filename_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline lineno_getter(self):
 */
-  __Pyx_TraceLine(248,1,0,__PYX_ERR(0, 248, __pyx_L1_error))
+  __Pyx_TraceLine(206,1,0,__PYX_ERR(0, 206, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 248, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 206, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":246
+  /* "hunter/_event.pyx":204
  *         return self._filename
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7404,7 +6599,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8filename___get__(struct __pyx_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 246, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 204, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.filename.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -7415,7 +6610,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_8filename___get__(struct __pyx_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":250
+/* "hunter/_event.pyx":208
  *         return self.filename_getter()
  * 
  *     cdef inline lineno_getter(self):             # <<<<<<<<<<<<<<
@@ -7435,30 +6630,30 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_lineno_getter(struct __pyx_obj_6
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[22]))
   __Pyx_RefNannySetupContext("lineno_getter", 0);
-  __Pyx_TraceStartFunc("lineno_getter", __pyx_f[0], 250, 0, 0, 0, __PYX_ERR(0, 250, __pyx_L1_error));
+  __Pyx_TraceStartFunc("lineno_getter", __pyx_f[0], 208, 0, 0, 0, __PYX_ERR(0, 208, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":251
+  /* "hunter/_event.pyx":209
  * 
  *     cdef inline lineno_getter(self):
  *         if self._lineno is UNSET:             # <<<<<<<<<<<<<<
  *             self._lineno = Hunter_PyFrame_GetLineNumber(self.frame)
  *         return self._lineno
 */
-  __Pyx_TraceLine(251,5,0,__PYX_ERR(0, 251, __pyx_L1_error))
+  __Pyx_TraceLine(209,5,0,__PYX_ERR(0, 209, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_lineno == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":252
+    /* "hunter/_event.pyx":210
  *     cdef inline lineno_getter(self):
  *         if self._lineno is UNSET:
  *             self._lineno = Hunter_PyFrame_GetLineNumber(self.frame)             # <<<<<<<<<<<<<<
  *         return self._lineno
  * 
 */
-    __Pyx_TraceLine(252,11,0,__PYX_ERR(0, 252, __pyx_L1_error))
+    __Pyx_TraceLine(210,11,0,__PYX_ERR(0, 210, __pyx_L1_error))
     __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
     __Pyx_INCREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyLong_From_int(Hunter_PyFrame_GetLineNumber(((FrameType)__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyLong_From_int(Hunter_PyFrame_GetLineNumber(((FrameType)__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_GIVEREF(__pyx_t_3);
@@ -7467,7 +6662,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_lineno_getter(struct __pyx_obj_6
     __pyx_v_self->_lineno = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "hunter/_event.pyx":251
+    /* "hunter/_event.pyx":209
  * 
  *     cdef inline lineno_getter(self):
  *         if self._lineno is UNSET:             # <<<<<<<<<<<<<<
@@ -7476,21 +6671,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_lineno_getter(struct __pyx_obj_6
 */
   }
 
-  /* "hunter/_event.pyx":253
+  /* "hunter/_event.pyx":211
  *         if self._lineno is UNSET:
  *             self._lineno = Hunter_PyFrame_GetLineNumber(self.frame)
  *         return self._lineno             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(253,12,0,__PYX_ERR(0, 253, __pyx_L1_error))
+  __Pyx_TraceLine(211,12,0,__PYX_ERR(0, 211, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_lineno);
   __pyx_r = __pyx_v_self->_lineno;
-  __Pyx_TraceReturnValue(__pyx_r, 12, 0, __PYX_ERR(0, 253, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 12, 0, __PYX_ERR(0, 211, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":250
+  /* "hunter/_event.pyx":208
  *         return self.filename_getter()
  * 
  *     cdef inline lineno_getter(self):             # <<<<<<<<<<<<<<
@@ -7506,7 +6701,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_lineno_getter(struct __pyx_obj_6
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 250, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 208, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.lineno_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -7517,7 +6712,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_lineno_getter(struct __pyx_obj_6
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":255
+/* "hunter/_event.pyx":213
  *         return self._lineno
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7550,25 +6745,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6lineno___get__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[23]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 255, 0, 0, 0, __PYX_ERR(0, 255, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 213, 0, 0, 0, __PYX_ERR(0, 213, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":257
+  /* "hunter/_event.pyx":215
  *     @property
  *     def lineno(self):
  *         return self.lineno_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline CodeType code_getter(self):
 */
-  __Pyx_TraceLine(257,1,0,__PYX_ERR(0, 257, __pyx_L1_error))
+  __Pyx_TraceLine(215,1,0,__PYX_ERR(0, 215, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 257, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 215, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":255
+  /* "hunter/_event.pyx":213
  *         return self._lineno
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7583,7 +6778,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6lineno___get__(struct __pyx_ob
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 255, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 213, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.lineno.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -7594,7 +6789,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6lineno___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":259
+/* "hunter/_event.pyx":217
  *         return self.lineno_getter()
  * 
  *     cdef inline CodeType code_getter(self):             # <<<<<<<<<<<<<<
@@ -7614,39 +6809,39 @@ static PyCodeObject *__pyx_f_6hunter_6_event_5Event_code_getter(struct __pyx_obj
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[24]))
   __Pyx_RefNannySetupContext("code_getter", 0);
-  __Pyx_TraceStartFunc("code_getter", __pyx_f[0], 259, 0, 0, 0, __PYX_ERR(0, 259, __pyx_L1_error));
+  __Pyx_TraceStartFunc("code_getter", __pyx_f[0], 217, 0, 0, 0, __PYX_ERR(0, 217, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":260
+  /* "hunter/_event.pyx":218
  * 
  *     cdef inline CodeType code_getter(self):
  *         if self._code is UNSET:             # <<<<<<<<<<<<<<
  *             return Hunter_PyFrame_GetCode(self.frame)
  *         else:
 */
-  __Pyx_TraceLine(260,5,0,__PYX_ERR(0, 260, __pyx_L1_error))
+  __Pyx_TraceLine(218,5,0,__PYX_ERR(0, 218, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_code == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":261
+    /* "hunter/_event.pyx":219
  *     cdef inline CodeType code_getter(self):
  *         if self._code is UNSET:
  *             return Hunter_PyFrame_GetCode(self.frame)             # <<<<<<<<<<<<<<
  *         else:
  *             return self._code
 */
-    __Pyx_TraceLine(261,6,0,__PYX_ERR(0, 261, __pyx_L1_error))
+    __Pyx_TraceLine(219,6,0,__PYX_ERR(0, 219, __pyx_L1_error))
     __Pyx_XDECREF((PyObject *)__pyx_r);
     __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
     __Pyx_INCREF(__pyx_t_2);
-    __pyx_t_3 = ((PyObject *)Hunter_PyFrame_GetCode(((FrameType)__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+    __pyx_t_3 = ((PyObject *)Hunter_PyFrame_GetCode(((FrameType)__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 219, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = ((PyCodeObject *)__pyx_t_3);
     __pyx_t_3 = 0;
-    __Pyx_TraceReturnValue((PyObject *)__pyx_r, 6, 0, __PYX_ERR(0, 261, __pyx_L1_error));
+    __Pyx_TraceReturnValue((PyObject *)__pyx_r, 6, 0, __PYX_ERR(0, 219, __pyx_L1_error));
     goto __pyx_L0;
 
-    /* "hunter/_event.pyx":260
+    /* "hunter/_event.pyx":218
  * 
  *     cdef inline CodeType code_getter(self):
  *         if self._code is UNSET:             # <<<<<<<<<<<<<<
@@ -7655,24 +6850,24 @@ static PyCodeObject *__pyx_f_6hunter_6_event_5Event_code_getter(struct __pyx_obj
 */
   }
 
-  /* "hunter/_event.pyx":263
+  /* "hunter/_event.pyx":221
  *             return Hunter_PyFrame_GetCode(self.frame)
  *         else:
  *             return self._code             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(263,11,0,__PYX_ERR(0, 263, __pyx_L1_error))
+  __Pyx_TraceLine(221,11,0,__PYX_ERR(0, 221, __pyx_L1_error))
   /*else*/ {
     __Pyx_XDECREF((PyObject *)__pyx_r);
-    if (!(likely(((__pyx_v_self->_code) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_self->_code, __pyx_mstate_global->__pyx_ptype_6hunter_6_event_CodeType))))) __PYX_ERR(0, 263, __pyx_L1_error)
+    if (!(likely(((__pyx_v_self->_code) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_self->_code, __pyx_mstate_global->__pyx_ptype_6hunter_6_event_CodeType))))) __PYX_ERR(0, 221, __pyx_L1_error)
     __Pyx_INCREF(__pyx_v_self->_code);
     __pyx_r = ((PyCodeObject *)__pyx_v_self->_code);
-    __Pyx_TraceReturnValue((PyObject *)__pyx_r, 11, 0, __PYX_ERR(0, 263, __pyx_L1_error));
+    __Pyx_TraceReturnValue((PyObject *)__pyx_r, 11, 0, __PYX_ERR(0, 221, __pyx_L1_error));
     goto __pyx_L0;
   }
 
-  /* "hunter/_event.pyx":259
+  /* "hunter/_event.pyx":217
  *         return self.lineno_getter()
  * 
  *     cdef inline CodeType code_getter(self):             # <<<<<<<<<<<<<<
@@ -7688,7 +6883,7 @@ static PyCodeObject *__pyx_f_6hunter_6_event_5Event_code_getter(struct __pyx_obj
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 259, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 217, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.code_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -7699,7 +6894,7 @@ static PyCodeObject *__pyx_f_6hunter_6_event_5Event_code_getter(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":265
+/* "hunter/_event.pyx":223
  *             return self._code
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7732,25 +6927,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4code___get__(struct __pyx_obj_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[25]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 265, 0, 0, 0, __PYX_ERR(0, 265, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 223, 0, 0, 0, __PYX_ERR(0, 223, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":267
+  /* "hunter/_event.pyx":225
  *     @property
  *     def code(self):
  *         return self.code_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline stdlib_getter(self):
 */
-  __Pyx_TraceLine(267,1,0,__PYX_ERR(0, 267, __pyx_L1_error))
+  __Pyx_TraceLine(225,1,0,__PYX_ERR(0, 225, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 267, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 225, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":265
+  /* "hunter/_event.pyx":223
  *             return self._code
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -7765,7 +6960,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4code___get__(struct __pyx_obj_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 265, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 223, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.code.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -7776,16 +6971,15 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_4code___get__(struct __pyx_obj_
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":269
+/* "hunter/_event.pyx":227
  *         return self.code_getter()
  * 
  *     cdef inline stdlib_getter(self):             # <<<<<<<<<<<<<<
  *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
 
 static PyObject *__pyx_f_6hunter_6_event_5Event_stdlib_getter(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self) {
-  PyObject *__pyx_v_module_parts = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_TraceDeclarationsFunc
   __Pyx_RefNannyDeclarations
@@ -7793,305 +6987,159 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_stdlib_getter(struct __pyx_obj_6
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  int __pyx_t_6;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
+  size_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[26]))
   __Pyx_RefNannySetupContext("stdlib_getter", 0);
-  __Pyx_TraceStartFunc("stdlib_getter", __pyx_f[0], 269, 0, 0, 0, __PYX_ERR(0, 269, __pyx_L1_error));
+  __Pyx_TraceStartFunc("stdlib_getter", __pyx_f[0], 227, 0, 0, 0, __PYX_ERR(0, 227, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":270
+  /* "hunter/_event.pyx":228
  * 
  *     cdef inline stdlib_getter(self):
  *         if self._stdlib is UNSET:             # <<<<<<<<<<<<<<
- *             module_parts = self.module.split('.')
- *             if 'pkg_resources' in module_parts:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
+ *         return self._stdlib
 */
-  __Pyx_TraceLine(270,5,0,__PYX_ERR(0, 270, __pyx_L1_error))
+  __Pyx_TraceLine(228,5,0,__PYX_ERR(0, 228, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_stdlib == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":271
+    /* "hunter/_event.pyx":229
  *     cdef inline stdlib_getter(self):
  *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')             # <<<<<<<<<<<<<<
- *             if 'pkg_resources' in module_parts:
- *                 # skip this over-vendored module
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())             # <<<<<<<<<<<<<<
+ *         return self._stdlib
+ * 
 */
-    __Pyx_TraceLine(271,8,0,__PYX_ERR(0, 271, __pyx_L1_error))
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_module_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
+    __Pyx_TraceLine(229,11,0,__PYX_ERR(0, 229, __pyx_L1_error))
+    __pyx_t_3 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_get_code_fields); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 229, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = __pyx_t_4;
-    __Pyx_INCREF(__pyx_t_3);
-    __pyx_t_5 = 0;
+    __pyx_t_5 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      assert(__pyx_t_3);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+      __pyx_t_8 = 0;
+    }
+    #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u__4};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_split, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      PyObject *__pyx_callargs[4] = {__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_8, (4-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 271, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 229, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
-    __pyx_v_module_parts = __pyx_t_2;
-    __pyx_t_2 = 0;
+    if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
+      PyObject* sequence = __pyx_t_2;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 229, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0);
+        __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1);
+        __Pyx_INCREF(__pyx_t_7);
+      } else {
+        __pyx_t_4 = __Pyx_PyList_GetItemRef(sequence, 0);
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 229, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_4);
+        __pyx_t_7 = __Pyx_PyList_GetItemRef(sequence, 1);
+        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 229, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_7);
+      }
+      #else
+      __pyx_t_4 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 229, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 229, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_6 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 229, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_6);
+      index = 0; __pyx_t_4 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      index = 1; __pyx_t_7 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_7)) goto __pyx_L4_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_6), 2) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L5_unpacking_done;
+      __pyx_L4_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 229, __pyx_L1_error)
+      __pyx_L5_unpacking_done:;
+    }
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_GOTREF(__pyx_v_self->_filename);
+    __Pyx_DECREF(__pyx_v_self->_filename);
+    __pyx_v_self->_filename = __pyx_t_4;
+    __pyx_t_4 = 0;
+    __Pyx_GIVEREF(__pyx_t_7);
+    __Pyx_GOTREF(__pyx_v_self->_stdlib);
+    __Pyx_DECREF(__pyx_v_self->_stdlib);
+    __pyx_v_self->_stdlib = __pyx_t_7;
+    __pyx_t_7 = 0;
 
-    /* "hunter/_event.pyx":272
- *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')
- *             if 'pkg_resources' in module_parts:             # <<<<<<<<<<<<<<
- *                 # skip this over-vendored module
- *                 self._stdlib = True
+    /* "hunter/_event.pyx":228
+ * 
+ *     cdef inline stdlib_getter(self):
+ *         if self._stdlib is UNSET:             # <<<<<<<<<<<<<<
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
+ *         return self._stdlib
 */
-    __Pyx_TraceLine(272,15,0,__PYX_ERR(0, 272, __pyx_L1_error))
-    __pyx_t_1 = (__Pyx_PySequence_ContainsTF(__pyx_mstate_global->__pyx_n_u_pkg_resources, __pyx_v_module_parts, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 272, __pyx_L1_error)
-    if (__pyx_t_1) {
+  }
 
-      /* "hunter/_event.pyx":274
- *             if 'pkg_resources' in module_parts:
- *                 # skip this over-vendored module
- *                 self._stdlib = True             # <<<<<<<<<<<<<<
- *             elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):
- *                 # skip namedtuple exec garbage
-*/
-      __Pyx_TraceLine(274,16,0,__PYX_ERR(0, 274, __pyx_L1_error))
-      __Pyx_INCREF(Py_True);
-      __Pyx_GIVEREF(Py_True);
-      __Pyx_GOTREF(__pyx_v_self->_stdlib);
-      __Pyx_DECREF(__pyx_v_self->_stdlib);
-      __pyx_v_self->_stdlib = Py_True;
-
-      /* "hunter/_event.pyx":272
+  /* "hunter/_event.pyx":230
  *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')
- *             if 'pkg_resources' in module_parts:             # <<<<<<<<<<<<<<
- *                 # skip this over-vendored module
- *                 self._stdlib = True
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
+ *         return self._stdlib             # <<<<<<<<<<<<<<
+ * 
+ *     @property
 */
-      goto __pyx_L4;
-    }
+  __Pyx_TraceLine(230,21,0,__PYX_ERR(0, 230, __pyx_L1_error))
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->_stdlib);
+  __pyx_r = __pyx_v_self->_stdlib;
+  __Pyx_TraceReturnValue(__pyx_r, 21, 0, __PYX_ERR(0, 230, __pyx_L1_error));
+  goto __pyx_L0;
 
-    /* "hunter/_event.pyx":275
- *                 # skip this over-vendored module
- *                 self._stdlib = True
- *             elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):             # <<<<<<<<<<<<<<
- *                 # skip namedtuple exec garbage
- *                 self._stdlib = True
-*/
-    __Pyx_TraceLine(275,20,0,__PYX_ERR(0, 275, __pyx_L1_error))
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_t_2, __pyx_mstate_global->__pyx_kp_u_string, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_6) {
-    } else {
-      __pyx_t_1 = __pyx_t_6;
-      goto __pyx_L5_bool_binop_done;
-    }
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_module_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __pyx_t_3;
-    __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_5 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_n_u_namedtuple};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_startswith, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (!__pyx_t_6) {
-    } else {
-      __pyx_t_1 = __pyx_t_6;
-      goto __pyx_L5_bool_binop_done;
-    }
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_module_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_site, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_1 = __pyx_t_6;
-    __pyx_L5_bool_binop_done:;
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":277
- *             elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):
- *                 # skip namedtuple exec garbage
- *                 self._stdlib = True             # <<<<<<<<<<<<<<
- *             elif self.filename.startswith(SITE_PACKAGES_PATHS):
- *                 # if in site-packages then definitely not stdlib
-*/
-      __Pyx_TraceLine(277,34,0,__PYX_ERR(0, 277, __pyx_L1_error))
-      __Pyx_INCREF(Py_True);
-      __Pyx_GIVEREF(Py_True);
-      __Pyx_GOTREF(__pyx_v_self->_stdlib);
-      __Pyx_DECREF(__pyx_v_self->_stdlib);
-      __pyx_v_self->_stdlib = Py_True;
-
-      /* "hunter/_event.pyx":275
- *                 # skip this over-vendored module
- *                 self._stdlib = True
- *             elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):             # <<<<<<<<<<<<<<
- *                 # skip namedtuple exec garbage
- *                 self._stdlib = True
-*/
-      goto __pyx_L4;
-    }
-
-    /* "hunter/_event.pyx":278
- *                 # skip namedtuple exec garbage
- *                 self._stdlib = True
- *             elif self.filename.startswith(SITE_PACKAGES_PATHS):             # <<<<<<<<<<<<<<
- *                 # if in site-packages then definitely not stdlib
- *                 self._stdlib = False
-*/
-    __Pyx_TraceLine(278,38,0,__PYX_ERR(0, 278, __pyx_L1_error))
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = __pyx_t_4;
-    __Pyx_INCREF(__pyx_t_3);
-    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_SITE_PACKAGES_PATHS); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_5 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_7};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_startswith, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":280
- *             elif self.filename.startswith(SITE_PACKAGES_PATHS):
- *                 # if in site-packages then definitely not stdlib
- *                 self._stdlib = False             # <<<<<<<<<<<<<<
- *             elif self.filename.startswith(SYS_PREFIX_PATHS):
- *                 self._stdlib = True
-*/
-      __Pyx_TraceLine(280,42,0,__PYX_ERR(0, 280, __pyx_L1_error))
-      __Pyx_INCREF(Py_False);
-      __Pyx_GIVEREF(Py_False);
-      __Pyx_GOTREF(__pyx_v_self->_stdlib);
-      __Pyx_DECREF(__pyx_v_self->_stdlib);
-      __pyx_v_self->_stdlib = Py_False;
-
-      /* "hunter/_event.pyx":278
- *                 # skip namedtuple exec garbage
- *                 self._stdlib = True
- *             elif self.filename.startswith(SITE_PACKAGES_PATHS):             # <<<<<<<<<<<<<<
- *                 # if in site-packages then definitely not stdlib
- *                 self._stdlib = False
-*/
-      goto __pyx_L4;
-    }
-
-    /* "hunter/_event.pyx":281
- *                 # if in site-packages then definitely not stdlib
- *                 self._stdlib = False
- *             elif self.filename.startswith(SYS_PREFIX_PATHS):             # <<<<<<<<<<<<<<
- *                 self._stdlib = True
- *             else:
-*/
-    __Pyx_TraceLine(281,46,0,__PYX_ERR(0, 281, __pyx_L1_error))
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 281, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_4 = __pyx_t_7;
-    __Pyx_INCREF(__pyx_t_4);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_SYS_PREFIX_PATHS); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 281, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_startswith, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_1) {
-
-      /* "hunter/_event.pyx":282
- *                 self._stdlib = False
- *             elif self.filename.startswith(SYS_PREFIX_PATHS):
- *                 self._stdlib = True             # <<<<<<<<<<<<<<
- *             else:
- *                 self._stdlib = False
-*/
-      __Pyx_TraceLine(282,50,0,__PYX_ERR(0, 282, __pyx_L1_error))
-      __Pyx_INCREF(Py_True);
-      __Pyx_GIVEREF(Py_True);
-      __Pyx_GOTREF(__pyx_v_self->_stdlib);
-      __Pyx_DECREF(__pyx_v_self->_stdlib);
-      __pyx_v_self->_stdlib = Py_True;
-
-      /* "hunter/_event.pyx":281
- *                 # if in site-packages then definitely not stdlib
- *                 self._stdlib = False
- *             elif self.filename.startswith(SYS_PREFIX_PATHS):             # <<<<<<<<<<<<<<
- *                 self._stdlib = True
- *             else:
-*/
-      goto __pyx_L4;
-    }
-
-    /* "hunter/_event.pyx":284
- *                 self._stdlib = True
- *             else:
- *                 self._stdlib = False             # <<<<<<<<<<<<<<
- *         return self._stdlib
- * 
-*/
-    __Pyx_TraceLine(284,55,0,__PYX_ERR(0, 284, __pyx_L1_error))
-    /*else*/ {
-      __Pyx_INCREF(Py_False);
-      __Pyx_GIVEREF(Py_False);
-      __Pyx_GOTREF(__pyx_v_self->_stdlib);
-      __Pyx_DECREF(__pyx_v_self->_stdlib);
-      __pyx_v_self->_stdlib = Py_False;
-    }
-    __pyx_L4:;
-
-    /* "hunter/_event.pyx":270
- * 
- *     cdef inline stdlib_getter(self):
- *         if self._stdlib is UNSET:             # <<<<<<<<<<<<<<
- *             module_parts = self.module.split('.')
- *             if 'pkg_resources' in module_parts:
-*/
-  }
-
-  /* "hunter/_event.pyx":285
- *             else:
- *                 self._stdlib = False
- *         return self._stdlib             # <<<<<<<<<<<<<<
- * 
- *     @property
-*/
-  __Pyx_TraceLine(285,56,0,__PYX_ERR(0, 285, __pyx_L1_error))
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_self->_stdlib);
-  __pyx_r = __pyx_v_self->_stdlib;
-  __Pyx_TraceReturnValue(__pyx_r, 56, 0, __PYX_ERR(0, 285, __pyx_L1_error));
-  goto __pyx_L0;
-
-  /* "hunter/_event.pyx":269
- *         return self.code_getter()
- * 
- *     cdef inline stdlib_getter(self):             # <<<<<<<<<<<<<<
- *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')
+  /* "hunter/_event.pyx":227
+ *         return self.code_getter()
+ * 
+ *     cdef inline stdlib_getter(self):             # <<<<<<<<<<<<<<
+ *         if self._stdlib is UNSET:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
 
   /* function exit code */
@@ -8099,24 +7147,25 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_stdlib_getter(struct __pyx_obj_6
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_TraceException(__pyx_lineno, 0, 0);
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 269, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 227, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.stdlib_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_module_parts);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_PyMonitoring_ExitScope(0);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":287
+/* "hunter/_event.pyx":232
  *         return self._stdlib
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -8149,25 +7198,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6stdlib___get__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[27]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 287, 0, 0, 0, __PYX_ERR(0, 287, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 232, 0, 0, 0, __PYX_ERR(0, 232, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":289
+  /* "hunter/_event.pyx":234
  *     @property
  *     def stdlib(self):
  *         return self.stdlib_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline fullsource_getter(self):
 */
-  __Pyx_TraceLine(289,1,0,__PYX_ERR(0, 289, __pyx_L1_error))
+  __Pyx_TraceLine(234,1,0,__PYX_ERR(0, 234, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_stdlib_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_stdlib_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 289, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 234, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":287
+  /* "hunter/_event.pyx":232
  *         return self._stdlib
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -8182,7 +7231,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6stdlib___get__(struct __pyx_ob
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 287, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 232, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.stdlib.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -8193,19 +7242,16 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6stdlib___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":291
+/* "hunter/_event.pyx":236
  *         return self.stdlib_getter()
  * 
  *     cdef inline fullsource_getter(self):             # <<<<<<<<<<<<<<
- *         cdef list lines
  *         cdef CodeType code
+ * 
 */
 
 static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_self) {
-  PyObject *__pyx_v_lines = 0;
   PyCodeObject *__pyx_v_code = 0;
-  CYTHON_UNUSED PyObject *__pyx_v__ = NULL;
-  PyObject *__pyx_v_token = NULL;
   PyObject *__pyx_v_exc = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_TraceDeclarationsFunc
@@ -8221,53 +7267,42 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_o
   PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  PyObject *__pyx_t_15 = NULL;
+  size_t __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  char const *__pyx_t_15;
   PyObject *__pyx_t_16 = NULL;
   PyObject *__pyx_t_17 = NULL;
   PyObject *__pyx_t_18 = NULL;
   PyObject *__pyx_t_19 = NULL;
   PyObject *__pyx_t_20 = NULL;
   PyObject *__pyx_t_21 = NULL;
-  PyObject *__pyx_t_22 = NULL;
-  size_t __pyx_t_23;
-  Py_ssize_t __pyx_t_24;
-  PyObject *(*__pyx_t_25)(PyObject *);
-  PyObject *(*__pyx_t_26)(PyObject *);
-  int __pyx_t_27;
-  int __pyx_t_28;
-  char const *__pyx_t_29;
-  PyObject *__pyx_t_30 = NULL;
-  PyObject *__pyx_t_31 = NULL;
-  PyObject *__pyx_t_32 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[28]))
   __Pyx_RefNannySetupContext("fullsource_getter", 0);
-  __Pyx_TraceStartFunc("fullsource_getter", __pyx_f[0], 291, 0, 0, 0, __PYX_ERR(0, 291, __pyx_L1_error));
+  __Pyx_TraceStartFunc("fullsource_getter", __pyx_f[0], 236, 0, 0, 0, __PYX_ERR(0, 236, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":295
+  /* "hunter/_event.pyx":239
  *         cdef CodeType code
  * 
  *         if self._fullsource is UNSET:             # <<<<<<<<<<<<<<
  *             try:
- *                 self._fullsource = None
+ *                 code = self.code_getter()
 */
-  __Pyx_TraceLine(295,5,0,__PYX_ERR(0, 295, __pyx_L1_error))
+  __Pyx_TraceLine(239,5,0,__PYX_ERR(0, 239, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_fullsource == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":296
+    /* "hunter/_event.pyx":240
  * 
  *         if self._fullsource is UNSET:
  *             try:             # <<<<<<<<<<<<<<
- *                 self._fullsource = None
  *                 code = self.code_getter()
+ *                 if self.kind == 'call' and code.co_name != '<module>':
 */
-    __Pyx_TraceLine(296,6,0,__PYX_ERR(0, 296, __pyx_L1_error))
+    __Pyx_TraceLine(240,6,0,__PYX_ERR(0, 240, __pyx_L1_error))
     {
       __Pyx_PyThreadState_declare
       __Pyx_PyThreadState_assign
@@ -8277,626 +7312,149 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_o
       __Pyx_XGOTREF(__pyx_t_4);
       /*try:*/ {
 
-        /* "hunter/_event.pyx":297
+        /* "hunter/_event.pyx":241
  *         if self._fullsource is UNSET:
  *             try:
- *                 self._fullsource = None             # <<<<<<<<<<<<<<
- *                 code = self.code_getter()
- *                 if self.kind == 'call' and code.co_name != '<module>':
-*/
-        __Pyx_TraceLine(297,7,0,__PYX_ERR(0, 297, __pyx_L4_error))
-        __Pyx_INCREF(Py_None);
-        __Pyx_GIVEREF(Py_None);
-        __Pyx_GOTREF(__pyx_v_self->_fullsource);
-        __Pyx_DECREF(__pyx_v_self->_fullsource);
-        __pyx_v_self->_fullsource = Py_None;
-
-        /* "hunter/_event.pyx":298
- *             try:
- *                 self._fullsource = None
  *                 code = self.code_getter()             # <<<<<<<<<<<<<<
  *                 if self.kind == 'call' and code.co_name != '<module>':
- *                     lines = []
+ *                     self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())
 */
-        __Pyx_TraceLine(298,13,0,__PYX_ERR(0, 298, __pyx_L4_error))
-        __pyx_t_5 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 298, __pyx_L4_error)
+        __Pyx_TraceLine(241,10,0,__PYX_ERR(0, 241, __pyx_L4_error))
+        __pyx_t_5 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L4_error)
         __Pyx_GOTREF(__pyx_t_5);
         __pyx_v_code = ((PyCodeObject *)__pyx_t_5);
         __pyx_t_5 = 0;
 
-        /* "hunter/_event.pyx":299
- *                 self._fullsource = None
+        /* "hunter/_event.pyx":242
+ *             try:
  *                 code = self.code_getter()
  *                 if self.kind == 'call' and code.co_name != '<module>':             # <<<<<<<<<<<<<<
- *                     lines = []
- *                     try:
+ *                     self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())
+ *                 else:
 */
-        __Pyx_TraceLine(299,16,0,__PYX_ERR(0, 299, __pyx_L4_error))
-        __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_self->kind, __pyx_mstate_global->__pyx_n_u_call, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 299, __pyx_L4_error)
+        __Pyx_TraceLine(242,13,0,__PYX_ERR(0, 242, __pyx_L4_error))
+        __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_self->kind, __pyx_mstate_global->__pyx_n_u_call, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 242, __pyx_L4_error)
         if (__pyx_t_6) {
         } else {
           __pyx_t_1 = __pyx_t_6;
           goto __pyx_L11_bool_binop_done;
         }
-        __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_code->co_name, __pyx_mstate_global->__pyx_kp_u_module_4, Py_NE)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 299, __pyx_L4_error)
+        __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_code->co_name, __pyx_mstate_global->__pyx_kp_u_module_4, Py_NE)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 242, __pyx_L4_error)
         __pyx_t_1 = __pyx_t_6;
         __pyx_L11_bool_binop_done:;
         if (__pyx_t_1) {
 
-          /* "hunter/_event.pyx":300
+          /* "hunter/_event.pyx":243
  *                 code = self.code_getter()
  *                 if self.kind == 'call' and code.co_name != '<module>':
- *                     lines = []             # <<<<<<<<<<<<<<
- *                     try:
- *                         for _, token, _, _, _ in generate_tokens(
-*/
-          __Pyx_TraceLine(300,25,0,__PYX_ERR(0, 300, __pyx_L4_error))
-          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 300, __pyx_L4_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_v_lines = ((PyObject*)__pyx_t_5);
-          __pyx_t_5 = 0;
-
-          /* "hunter/_event.pyx":301
- *                 if self.kind == 'call' and code.co_name != '<module>':
- *                     lines = []
- *                     try:             # <<<<<<<<<<<<<<
- *                         for _, token, _, _, _ in generate_tokens(
- *                             partial(
-*/
-          __Pyx_TraceLine(301,26,0,__PYX_ERR(0, 301, __pyx_L4_error))
+ *                     self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())
+*/
+          __Pyx_TraceLine(243,24,0,__PYX_ERR(0, 243, __pyx_L4_error))
+          __pyx_t_7 = NULL;
+          __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_get_fullsource); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 243, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __pyx_t_9 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 243, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 243, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_11 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 243, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __pyx_t_12 = 1;
+          #if CYTHON_UNPACK_METHODS
+          if (unlikely(PyMethod_Check(__pyx_t_8))) {
+            __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_8);
+            assert(__pyx_t_7);
+            PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(__pyx__function);
+            __Pyx_DECREF_SET(__pyx_t_8, __pyx__function);
+            __pyx_t_12 = 0;
+          }
+          #endif
           {
-            __Pyx_PyThreadState_declare
-            __Pyx_PyThreadState_assign
-            __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
-            __Pyx_XGOTREF(__pyx_t_7);
-            __Pyx_XGOTREF(__pyx_t_8);
-            __Pyx_XGOTREF(__pyx_t_9);
-            /*try:*/ {
-
-              /* "hunter/_event.pyx":302
- *                     lines = []
- *                     try:
- *                         for _, token, _, _, _ in generate_tokens(             # <<<<<<<<<<<<<<
- *                             partial(
- *                                 next,
-*/
-              __Pyx_TraceLine(302,34,0,__PYX_ERR(0, 302, __pyx_L13_error))
-              __pyx_t_10 = NULL;
-              __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_generate_tokens); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 302, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_11);
-
-              /* "hunter/_event.pyx":303
- *                     try:
- *                         for _, token, _, _, _ in generate_tokens(
- *                             partial(             # <<<<<<<<<<<<<<
- *                                 next,
- *                                 yield_lines(
-*/
-              __Pyx_TraceLine(303,36,0,__PYX_ERR(0, 303, __pyx_L13_error))
-              __pyx_t_13 = NULL;
-              __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_partial); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 303, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_14);
-
-              /* "hunter/_event.pyx":304
- *                         for _, token, _, _, _ in generate_tokens(
- *                             partial(
- *                                 next,             # <<<<<<<<<<<<<<
- *                                 yield_lines(
- *                                     self.filename,
-*/
-              __Pyx_TraceLine(304,37,0,__PYX_ERR(0, 304, __pyx_L13_error))
-              __pyx_t_15 = __Pyx_GetBuiltinName(__pyx_mstate_global->__pyx_n_u_next); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 304, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_15);
-
-              /* "hunter/_event.pyx":305
- *                             partial(
- *                                 next,
- *                                 yield_lines(             # <<<<<<<<<<<<<<
- *                                     self.filename,
- *                                     self.frame.f_globals,
-*/
-              __Pyx_TraceLine(305,39,0,__PYX_ERR(0, 305, __pyx_L13_error))
-              __pyx_t_17 = NULL;
-              __Pyx_GetModuleGlobalName(__pyx_t_18, __pyx_mstate_global->__pyx_n_u_yield_lines); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 305, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_18);
-
-              /* "hunter/_event.pyx":306
- *                                 next,
- *                                 yield_lines(
- *                                     self.filename,             # <<<<<<<<<<<<<<
- *                                     self.frame.f_globals,
- *                                     self.lineno - 1,
-*/
-              __Pyx_TraceLine(306,41,0,__PYX_ERR(0, 306, __pyx_L13_error))
-              __pyx_t_19 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 306, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_19);
-
-              /* "hunter/_event.pyx":307
- *                                 yield_lines(
- *                                     self.filename,
- *                                     self.frame.f_globals,             # <<<<<<<<<<<<<<
- *                                     self.lineno - 1,
- *                                     lines,
-*/
-              __Pyx_TraceLine(307,44,0,__PYX_ERR(0, 307, __pyx_L13_error))
-              __pyx_t_20 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->frame), __pyx_mstate_global->__pyx_n_u_f_globals); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 307, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_20);
-
-              /* "hunter/_event.pyx":308
- *                                     self.filename,
- *                                     self.frame.f_globals,
- *                                     self.lineno - 1,             # <<<<<<<<<<<<<<
- *                                     lines,
- *                                 ),
-*/
-              __Pyx_TraceLine(308,46,0,__PYX_ERR(0, 308, __pyx_L13_error))
-              __pyx_t_21 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 308, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_21);
-              __pyx_t_22 = __Pyx_PyLong_SubtractObjC(__pyx_t_21, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 308, __pyx_L13_error)
-              __Pyx_GOTREF(__pyx_t_22);
-              __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-
-              /* "hunter/_event.pyx":309
- *                                     self.frame.f_globals,
- *                                     self.lineno - 1,
- *                                     lines,             # <<<<<<<<<<<<<<
- *                                 ),
- *                             )
-*/
-              __Pyx_TraceLine(309,49,0,__PYX_ERR(0, 309, __pyx_L13_error))
-              __pyx_t_23 = 1;
-              #if CYTHON_UNPACK_METHODS
-              if (unlikely(PyMethod_Check(__pyx_t_18))) {
-                __pyx_t_17 = PyMethod_GET_SELF(__pyx_t_18);
-                assert(__pyx_t_17);
-                PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_18);
-                __Pyx_INCREF(__pyx_t_17);
-                __Pyx_INCREF(__pyx__function);
-                __Pyx_DECREF_SET(__pyx_t_18, __pyx__function);
-                __pyx_t_23 = 0;
-              }
-              #endif
-              {
-                PyObject *__pyx_callargs[5] = {__pyx_t_17, __pyx_t_19, __pyx_t_20, __pyx_t_22, __pyx_v_lines};
-                __pyx_t_16 = __Pyx_PyObject_FastCall(__pyx_t_18, __pyx_callargs+__pyx_t_23, (5-__pyx_t_23) | (__pyx_t_23*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-                __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
-                __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-                __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
-                __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-                __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-                if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 305, __pyx_L13_error)
-                __Pyx_GOTREF(__pyx_t_16);
-              }
-              __pyx_t_23 = 1;
-              #if CYTHON_UNPACK_METHODS
-              if (unlikely(PyMethod_Check(__pyx_t_14))) {
-                __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_14);
-                assert(__pyx_t_13);
-                PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_14);
-                __Pyx_INCREF(__pyx_t_13);
-                __Pyx_INCREF(__pyx__function);
-                __Pyx_DECREF_SET(__pyx_t_14, __pyx__function);
-                __pyx_t_23 = 0;
-              }
-              #endif
-              {
-                PyObject *__pyx_callargs[3] = {__pyx_t_13, __pyx_t_15, __pyx_t_16};
-                __pyx_t_12 = __Pyx_PyObject_FastCall(__pyx_t_14, __pyx_callargs+__pyx_t_23, (3-__pyx_t_23) | (__pyx_t_23*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-                __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-                __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-                __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-                if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 303, __pyx_L13_error)
-                __Pyx_GOTREF(__pyx_t_12);
-              }
-              __pyx_t_23 = 1;
-              #if CYTHON_UNPACK_METHODS
-              if (unlikely(PyMethod_Check(__pyx_t_11))) {
-                __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_11);
-                assert(__pyx_t_10);
-                PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
-                __Pyx_INCREF(__pyx_t_10);
-                __Pyx_INCREF(__pyx__function);
-                __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
-                __pyx_t_23 = 0;
-              }
-              #endif
-              {
-                PyObject *__pyx_callargs[2] = {__pyx_t_10, __pyx_t_12};
-                __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+__pyx_t_23, (2-__pyx_t_23) | (__pyx_t_23*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-                __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-                __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-                __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-                if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 302, __pyx_L13_error)
-                __Pyx_GOTREF(__pyx_t_5);
-              }
-
-              /* "hunter/_event.pyx":302
- *                     lines = []
- *                     try:
- *                         for _, token, _, _, _ in generate_tokens(             # <<<<<<<<<<<<<<
- *                             partial(
- *                                 next,
-*/
-              __Pyx_TraceLine(302,33,0,__PYX_ERR(0, 302, __pyx_L13_error))
-              if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
-                __pyx_t_11 = __pyx_t_5; __Pyx_INCREF(__pyx_t_11);
-                __pyx_t_24 = 0;
-                __pyx_t_25 = NULL;
-              } else {
-                __pyx_t_24 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 302, __pyx_L13_error)
-                __Pyx_GOTREF(__pyx_t_11);
-                __pyx_t_25 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_25)) __PYX_ERR(0, 302, __pyx_L13_error)
-              }
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              for (;;) {
-                if (likely(!__pyx_t_25)) {
-                  if (likely(PyList_CheckExact(__pyx_t_11))) {
-                    {
-                      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
-                      #if !CYTHON_ASSUME_SAFE_SIZE
-                      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 302, __pyx_L13_error)
-                      #endif
-                      if (__pyx_t_24 >= __pyx_temp) break;
-                    }
-                    __pyx_t_5 = __Pyx_PyList_GetItemRef(__pyx_t_11, __pyx_t_24);
-                    ++__pyx_t_24;
-                  } else {
-                    {
-                      Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
-                      #if !CYTHON_ASSUME_SAFE_SIZE
-                      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 302, __pyx_L13_error)
-                      #endif
-                      if (__pyx_t_24 >= __pyx_temp) break;
-                    }
-                    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                    __pyx_t_5 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_24));
-                    #else
-                    __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_24);
-                    #endif
-                    ++__pyx_t_24;
-                  }
-                  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 302, __pyx_L13_error)
-                } else {
-                  __pyx_t_5 = __pyx_t_25(__pyx_t_11);
-                  if (unlikely(!__pyx_t_5)) {
-                    PyObject* exc_type = PyErr_Occurred();
-                    if (exc_type) {
-                      if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 302, __pyx_L13_error)
-                      PyErr_Clear();
-                    }
-                    break;
-                  }
-                }
-                __Pyx_GOTREF(__pyx_t_5);
-                if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-                  PyObject* sequence = __pyx_t_5;
-                  Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-                  if (unlikely(size != 5)) {
-                    if (size > 5) __Pyx_RaiseTooManyValuesError(5);
-                    else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-                    __PYX_ERR(0, 302, __pyx_L13_error)
-                  }
-                  #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                  if (likely(PyTuple_CheckExact(sequence))) {
-                    __pyx_t_12 = PyTuple_GET_ITEM(sequence, 0);
-                    __Pyx_INCREF(__pyx_t_12);
-                    __pyx_t_10 = PyTuple_GET_ITEM(sequence, 1);
-                    __Pyx_INCREF(__pyx_t_10);
-                    __pyx_t_14 = PyTuple_GET_ITEM(sequence, 2);
-                    __Pyx_INCREF(__pyx_t_14);
-                    __pyx_t_16 = PyTuple_GET_ITEM(sequence, 3);
-                    __Pyx_INCREF(__pyx_t_16);
-                    __pyx_t_15 = PyTuple_GET_ITEM(sequence, 4);
-                    __Pyx_INCREF(__pyx_t_15);
-                  } else {
-                    __pyx_t_12 = __Pyx_PyList_GetItemRef(sequence, 0);
-                    if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 302, __pyx_L13_error)
-                    __Pyx_XGOTREF(__pyx_t_12);
-                    __pyx_t_10 = __Pyx_PyList_GetItemRef(sequence, 1);
-                    if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 302, __pyx_L13_error)
-                    __Pyx_XGOTREF(__pyx_t_10);
-                    __pyx_t_14 = __Pyx_PyList_GetItemRef(sequence, 2);
-                    if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 302, __pyx_L13_error)
-                    __Pyx_XGOTREF(__pyx_t_14);
-                    __pyx_t_16 = __Pyx_PyList_GetItemRef(sequence, 3);
-                    if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 302, __pyx_L13_error)
-                    __Pyx_XGOTREF(__pyx_t_16);
-                    __pyx_t_15 = __Pyx_PyList_GetItemRef(sequence, 4);
-                    if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 302, __pyx_L13_error)
-                    __Pyx_XGOTREF(__pyx_t_15);
-                  }
-                  #else
-                  {
-                    Py_ssize_t i;
-                    PyObject** temps[5] = {&__pyx_t_12,&__pyx_t_10,&__pyx_t_14,&__pyx_t_16,&__pyx_t_15};
-                    for (i=0; i < 5; i++) {
-                      PyObject* item = __Pyx_PySequence_ITEM(sequence, i); if (unlikely(!item)) __PYX_ERR(0, 302, __pyx_L13_error)
-                      __Pyx_GOTREF(item);
-                      *(temps[i]) = item;
-                    }
-                  }
-                  #endif
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                } else {
-                  Py_ssize_t index = -1;
-                  PyObject** temps[5] = {&__pyx_t_12,&__pyx_t_10,&__pyx_t_14,&__pyx_t_16,&__pyx_t_15};
-                  __pyx_t_13 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 302, __pyx_L13_error)
-                  __Pyx_GOTREF(__pyx_t_13);
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                  __pyx_t_26 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_13);
-                  for (index=0; index < 5; index++) {
-                    PyObject* item = __pyx_t_26(__pyx_t_13); if (unlikely(!item)) goto __pyx_L21_unpacking_failed;
-                    __Pyx_GOTREF(item);
-                    *(temps[index]) = item;
-                  }
-                  if (__Pyx_IternextUnpackEndCheck(__pyx_t_26(__pyx_t_13), 5) < 0) __PYX_ERR(0, 302, __pyx_L13_error)
-                  __pyx_t_26 = NULL;
-                  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-                  goto __pyx_L22_unpacking_done;
-                  __pyx_L21_unpacking_failed:;
-                  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-                  __pyx_t_26 = NULL;
-                  if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-                  __PYX_ERR(0, 302, __pyx_L13_error)
-                  __pyx_L22_unpacking_done:;
-                }
-                __Pyx_XDECREF_SET(__pyx_v__, __pyx_t_12);
-                __pyx_t_12 = 0;
-                __Pyx_XDECREF_SET(__pyx_v_token, __pyx_t_10);
-                __pyx_t_10 = 0;
-                __Pyx_DECREF_SET(__pyx_v__, __pyx_t_14);
-                __pyx_t_14 = 0;
-                __Pyx_DECREF_SET(__pyx_v__, __pyx_t_16);
-                __pyx_t_16 = 0;
-                __Pyx_DECREF_SET(__pyx_v__, __pyx_t_15);
-                __pyx_t_15 = 0;
-                __Pyx_TraceLine(302,27,0,__PYX_ERR(0, 302, __pyx_L13_error))
-
-                /* "hunter/_event.pyx":313
- *                             )
- *                         ):
- *                             if token in ('def', 'class', 'lambda'):             # <<<<<<<<<<<<<<
- *                                 self._fullsource = ''.join(lines)
- *                                 break
-*/
-                __Pyx_TraceLine(313,51,0,__PYX_ERR(0, 313, __pyx_L13_error))
-                __Pyx_INCREF(__pyx_v_token);
-                __pyx_t_5 = __pyx_v_token;
-                __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_def, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 313, __pyx_L13_error)
-                if (!__pyx_t_6) {
-                } else {
-                  __pyx_t_1 = __pyx_t_6;
-                  goto __pyx_L24_bool_binop_done;
-                }
-                __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_class, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 313, __pyx_L13_error)
-                if (!__pyx_t_6) {
-                } else {
-                  __pyx_t_1 = __pyx_t_6;
-                  goto __pyx_L24_bool_binop_done;
-                }
-                __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_lambda, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 313, __pyx_L13_error)
-                __pyx_t_1 = __pyx_t_6;
-                __pyx_L24_bool_binop_done:;
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __pyx_t_6 = __pyx_t_1;
-                if (__pyx_t_6) {
-
-                  /* "hunter/_event.pyx":314
- *                         ):
- *                             if token in ('def', 'class', 'lambda'):
- *                                 self._fullsource = ''.join(lines)             # <<<<<<<<<<<<<<
- *                                 break
- *                     except TokenError:
-*/
-                  __Pyx_TraceLine(314,60,0,__PYX_ERR(0, 314, __pyx_L13_error))
-                  __pyx_t_5 = PyUnicode_Join(__pyx_mstate_global->__pyx_kp_u__2, __pyx_v_lines); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 314, __pyx_L13_error)
-                  __Pyx_GOTREF(__pyx_t_5);
-                  __Pyx_GIVEREF(__pyx_t_5);
-                  __Pyx_GOTREF(__pyx_v_self->_fullsource);
-                  __Pyx_DECREF(__pyx_v_self->_fullsource);
-                  __pyx_v_self->_fullsource = __pyx_t_5;
-                  __pyx_t_5 = 0;
-
-                  /* "hunter/_event.pyx":315
- *                             if token in ('def', 'class', 'lambda'):
- *                                 self._fullsource = ''.join(lines)
- *                                 break             # <<<<<<<<<<<<<<
- *                     except TokenError:
- *                         pass
-*/
-                  __Pyx_TraceLine(315,62,0,__PYX_ERR(0, 315, __pyx_L13_error))
-                  goto __pyx_L20_break;
-
-                  /* "hunter/_event.pyx":313
- *                             )
- *                         ):
- *                             if token in ('def', 'class', 'lambda'):             # <<<<<<<<<<<<<<
- *                                 self._fullsource = ''.join(lines)
- *                                 break
-*/
-                }
-
-                /* "hunter/_event.pyx":302
- *                     lines = []
- *                     try:
- *                         for _, token, _, _, _ in generate_tokens(             # <<<<<<<<<<<<<<
- *                             partial(
- *                                 next,
-*/
-                __Pyx_TraceLine(302,27,0,__PYX_ERR(0, 302, __pyx_L13_error))
-              }
-              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-              goto __pyx_L27_for_end;
-              __pyx_L20_break:;
-              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-              goto __pyx_L27_for_end;
-              __pyx_L27_for_end:;
-
-              /* "hunter/_event.pyx":301
- *                 if self.kind == 'call' and code.co_name != '<module>':
- *                     lines = []
- *                     try:             # <<<<<<<<<<<<<<
- *                         for _, token, _, _, _ in generate_tokens(
- *                             partial(
-*/
-            }
+            PyObject *__pyx_callargs[4] = {__pyx_t_7, __pyx_t_9, __pyx_t_10, __pyx_t_11};
+            __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+__pyx_t_12, (4-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
             __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-            __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-            goto __pyx_L18_try_end;
-            __pyx_L13_error:;
-            __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
-            __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-            __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-            __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-            __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-            __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
-            __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
-            __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-            __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_XDECREF(__pyx_t_20); __pyx_t_20 = 0;
-            __Pyx_XDECREF(__pyx_t_21); __pyx_t_21 = 0;
-            __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
-            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __Pyx_TraceException(__pyx_lineno, 0, 0);
-
-            /* "hunter/_event.pyx":316
- *                                 self._fullsource = ''.join(lines)
- *                                 break
- *                     except TokenError:             # <<<<<<<<<<<<<<
- *                         pass
- *                 if self._fullsource is None:
-*/
-            __Pyx_TraceLine(316,0,0,__PYX_ERR(0, 316, __pyx_L15_except_error))
-            __Pyx_ErrFetch(&__pyx_t_11, &__pyx_t_5, &__pyx_t_15);
-            __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_mstate_global->__pyx_n_u_TokenError); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 316, __pyx_L15_except_error)
-            __Pyx_GOTREF(__pyx_t_16);
-            __pyx_t_27 = __Pyx_PyErr_GivenExceptionMatches(__pyx_t_11, __pyx_t_16);
-            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-            __Pyx_ErrRestore(__pyx_t_11, __pyx_t_5, __pyx_t_15);
-            __pyx_t_11 = 0; __pyx_t_5 = 0; __pyx_t_15 = 0;
-            if (__pyx_t_27) {
-              __Pyx_AddTraceback("hunter._event.Event.fullsource_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
-              __Pyx_TraceExceptionHandled(0);
-              __Pyx_ErrRestore(0,0,0);
-              __Pyx_TraceExceptionDone();
-
-              /* "hunter/_event.pyx":317
- *                                 break
- *                     except TokenError:
- *                         pass             # <<<<<<<<<<<<<<
- *                 if self._fullsource is None:
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
-*/
-              __Pyx_TraceLine(317,64,0,__PYX_ERR(0, 317, __pyx_L15_except_error))
-              goto __pyx_L14_exception_handled;
-            }
-            goto __pyx_L15_except_error;
-
-            /* "hunter/_event.pyx":301
- *                 if self.kind == 'call' and code.co_name != '<module>':
- *                     lines = []
- *                     try:             # <<<<<<<<<<<<<<
- *                         for _, token, _, _, _ in generate_tokens(
- *                             partial(
-*/
-            __pyx_L15_except_error:;
-            __Pyx_XGIVEREF(__pyx_t_7);
-            __Pyx_XGIVEREF(__pyx_t_8);
-            __Pyx_XGIVEREF(__pyx_t_9);
-            __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-            goto __pyx_L4_error;
-            __pyx_L14_exception_handled:;
-            __Pyx_XGIVEREF(__pyx_t_7);
-            __Pyx_XGIVEREF(__pyx_t_8);
-            __Pyx_XGIVEREF(__pyx_t_9);
-            __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-            __pyx_L18_try_end:;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 243, __pyx_L4_error)
+            __Pyx_GOTREF(__pyx_t_5);
           }
+          __Pyx_GIVEREF(__pyx_t_5);
+          __Pyx_GOTREF(__pyx_v_self->_fullsource);
+          __Pyx_DECREF(__pyx_v_self->_fullsource);
+          __pyx_v_self->_fullsource = __pyx_t_5;
+          __pyx_t_5 = 0;
 
-          /* "hunter/_event.pyx":299
- *                 self._fullsource = None
+          /* "hunter/_event.pyx":242
+ *             try:
  *                 code = self.code_getter()
  *                 if self.kind == 'call' and code.co_name != '<module>':             # <<<<<<<<<<<<<<
- *                     lines = []
- *                     try:
+ *                     self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())
+ *                 else:
 */
+          goto __pyx_L10;
         }
 
-        /* "hunter/_event.pyx":318
- *                     except TokenError:
- *                         pass
- *                 if self._fullsource is None:             # <<<<<<<<<<<<<<
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
- *             except Exception as exc:
-*/
-        __Pyx_TraceLine(318,69,0,__PYX_ERR(0, 318, __pyx_L4_error))
-        __pyx_t_6 = (__pyx_v_self->_fullsource == Py_None);
-        if (__pyx_t_6) {
-
-          /* "hunter/_event.pyx":319
- *                         pass
- *                 if self._fullsource is None:
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)             # <<<<<<<<<<<<<<
+        /* "hunter/_event.pyx":245
+ *                     self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())
+ *                 else:
+ *                     self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())             # <<<<<<<<<<<<<<
  *             except Exception as exc:
  *                 self._fullsource = f'??? NO SOURCE: {exc!r}'
 */
-          __Pyx_TraceLine(319,73,0,__PYX_ERR(0, 319, __pyx_L4_error))
-          __pyx_t_5 = NULL;
-          __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 319, __pyx_L4_error)
+        __Pyx_TraceLine(245,37,0,__PYX_ERR(0, 245, __pyx_L4_error))
+        /*else*/ {
+          __pyx_t_8 = NULL;
+          __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 245, __pyx_L4_error)
           __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_16 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 319, __pyx_L4_error)
-          __Pyx_GOTREF(__pyx_t_16);
-          __pyx_t_14 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 319, __pyx_L4_error)
-          __Pyx_GOTREF(__pyx_t_14);
-          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 319, __pyx_L4_error)
+          __pyx_t_10 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 245, __pyx_L4_error)
           __Pyx_GOTREF(__pyx_t_10);
-          __pyx_t_23 = 1;
+          __pyx_t_9 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 245, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_7 = __pyx_f_6hunter_6_event_5Event_globals_getter(__pyx_v_self); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 245, __pyx_L4_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          __pyx_t_12 = 1;
           #if CYTHON_UNPACK_METHODS
           if (unlikely(PyMethod_Check(__pyx_t_11))) {
-            __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_11);
-            assert(__pyx_t_5);
+            __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_11);
+            assert(__pyx_t_8);
             PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
-            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_8);
             __Pyx_INCREF(__pyx__function);
             __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
-            __pyx_t_23 = 0;
+            __pyx_t_12 = 0;
           }
           #endif
           {
-            PyObject *__pyx_callargs[4] = {__pyx_t_5, __pyx_t_16, __pyx_t_14, __pyx_t_10};
-            __pyx_t_15 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+__pyx_t_23, (4-__pyx_t_23) | (__pyx_t_23*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-            __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+            PyObject *__pyx_callargs[4] = {__pyx_t_8, __pyx_t_10, __pyx_t_9, __pyx_t_7};
+            __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+__pyx_t_12, (4-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
             __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
             __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-            if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 319, __pyx_L4_error)
-            __Pyx_GOTREF(__pyx_t_15);
+            if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 245, __pyx_L4_error)
+            __Pyx_GOTREF(__pyx_t_5);
           }
-          __Pyx_GIVEREF(__pyx_t_15);
+          __Pyx_GIVEREF(__pyx_t_5);
           __Pyx_GOTREF(__pyx_v_self->_fullsource);
           __Pyx_DECREF(__pyx_v_self->_fullsource);
-          __pyx_v_self->_fullsource = __pyx_t_15;
-          __pyx_t_15 = 0;
-
-          /* "hunter/_event.pyx":318
- *                     except TokenError:
- *                         pass
- *                 if self._fullsource is None:             # <<<<<<<<<<<<<<
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
- *             except Exception as exc:
-*/
+          __pyx_v_self->_fullsource = __pyx_t_5;
+          __pyx_t_5 = 0;
         }
+        __pyx_L10:;
 
-        /* "hunter/_event.pyx":296
+        /* "hunter/_event.pyx":240
  * 
  *         if self._fullsource is UNSET:
  *             try:             # <<<<<<<<<<<<<<
- *                 self._fullsource = None
  *                 code = self.code_getter()
+ *                 if self.kind == 'call' and code.co_name != '<module>':
 */
       }
       __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -8906,132 +7464,116 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_o
       __pyx_L4_error:;
       __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
       __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
-      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
-      __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
-      __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-      __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
-      __Pyx_XDECREF(__pyx_t_20); __pyx_t_20 = 0;
-      __Pyx_XDECREF(__pyx_t_21); __pyx_t_21 = 0;
-      __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_TraceException(__pyx_lineno, 0, 0);
 
-      /* "hunter/_event.pyx":320
- *                 if self._fullsource is None:
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
+      /* "hunter/_event.pyx":246
+ *                 else:
+ *                     self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())
  *             except Exception as exc:             # <<<<<<<<<<<<<<
  *                 self._fullsource = f'??? NO SOURCE: {exc!r}'
  *         return self._fullsource
 */
-      __Pyx_TraceLine(320,81,0,__PYX_ERR(0, 320, __pyx_L6_except_error))
-      __pyx_t_27 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
-      if (__pyx_t_27) {
+      __Pyx_TraceLine(246,48,0,__PYX_ERR(0, 246, __pyx_L6_except_error))
+      __pyx_t_13 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
+      if (__pyx_t_13) {
         __Pyx_AddTraceback("hunter._event.Event.fullsource_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
-        __Pyx_TraceExceptionHandled(80);
-        if (__Pyx_GetException(&__pyx_t_15, &__pyx_t_11, &__pyx_t_10) < 0) __PYX_ERR(0, 320, __pyx_L6_except_error)
-        __Pyx_XGOTREF(__pyx_t_15);
+        __Pyx_TraceExceptionHandled(47);
+        if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_11, &__pyx_t_7) < 0) __PYX_ERR(0, 246, __pyx_L6_except_error)
+        __Pyx_XGOTREF(__pyx_t_5);
         __Pyx_XGOTREF(__pyx_t_11);
-        __Pyx_XGOTREF(__pyx_t_10);
+        __Pyx_XGOTREF(__pyx_t_7);
         __Pyx_TraceExceptionDone();
         __Pyx_INCREF(__pyx_t_11);
         __pyx_v_exc = __pyx_t_11;
         /*try:*/ {
 
-          /* "hunter/_event.pyx":321
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
+          /* "hunter/_event.pyx":247
+ *                     self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())
  *             except Exception as exc:
  *                 self._fullsource = f'??? NO SOURCE: {exc!r}'             # <<<<<<<<<<<<<<
  *         return self._fullsource
  * 
 */
-          __Pyx_TraceLine(321,86,0,__PYX_ERR(0, 321, __pyx_L36_error))
-          __pyx_t_14 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_exc), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 321, __pyx_L36_error)
-          __Pyx_GOTREF(__pyx_t_14);
-          __pyx_t_16 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_NO_SOURCE, __pyx_t_14); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 321, __pyx_L36_error)
-          __Pyx_GOTREF(__pyx_t_16);
-          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-          __Pyx_GIVEREF(__pyx_t_16);
+          __Pyx_TraceLine(247,53,0,__PYX_ERR(0, 247, __pyx_L18_error))
+          __pyx_t_9 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_exc), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 247, __pyx_L18_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_NO_SOURCE, __pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 247, __pyx_L18_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_GIVEREF(__pyx_t_10);
           __Pyx_GOTREF(__pyx_v_self->_fullsource);
           __Pyx_DECREF(__pyx_v_self->_fullsource);
-          __pyx_v_self->_fullsource = __pyx_t_16;
-          __pyx_t_16 = 0;
+          __pyx_v_self->_fullsource = __pyx_t_10;
+          __pyx_t_10 = 0;
         }
 
-        /* "hunter/_event.pyx":320
- *                 if self._fullsource is None:
- *                     self._fullsource = getline(self.filename, self.lineno, self.globals)
+        /* "hunter/_event.pyx":246
+ *                 else:
+ *                     self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())
  *             except Exception as exc:             # <<<<<<<<<<<<<<
  *                 self._fullsource = f'??? NO SOURCE: {exc!r}'
  *         return self._fullsource
 */
-        __Pyx_TraceLine(320,80,0,__PYX_ERR(0, 320, __pyx_L36_error))
+        __Pyx_TraceLine(246,47,0,__PYX_ERR(0, 246, __pyx_L18_error))
         /*finally:*/ {
           /*normal exit:*/{
             __Pyx_DECREF(__pyx_v_exc); __pyx_v_exc = 0;
-            goto __pyx_L37;
+            goto __pyx_L19;
           }
-          __pyx_L36_error:;
+          __pyx_L18_error:;
           /*exception exit:*/{
             __Pyx_PyThreadState_declare
             __Pyx_TraceException(__pyx_lineno, 0, 0);
-            __Pyx_TraceExceptionHandled(80);
+            __Pyx_TraceExceptionHandled(47);
             __Pyx_PyThreadState_assign
-            __pyx_t_9 = 0; __pyx_t_8 = 0; __pyx_t_7 = 0; __pyx_t_30 = 0; __pyx_t_31 = 0; __pyx_t_32 = 0;
-            __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-            __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-            __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-            __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
-            __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
-            __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-            __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_XDECREF(__pyx_t_20); __pyx_t_20 = 0;
-            __Pyx_XDECREF(__pyx_t_21); __pyx_t_21 = 0;
-            __Pyx_XDECREF(__pyx_t_22); __pyx_t_22 = 0;
-            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-             __Pyx_ExceptionSwap(&__pyx_t_30, &__pyx_t_31, &__pyx_t_32);
-            if ( unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_8, &__pyx_t_7) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_8, &__pyx_t_7);
-            __Pyx_XGOTREF(__pyx_t_9);
-            __Pyx_XGOTREF(__pyx_t_8);
-            __Pyx_XGOTREF(__pyx_t_7);
-            __Pyx_XGOTREF(__pyx_t_30);
-            __Pyx_XGOTREF(__pyx_t_31);
-            __Pyx_XGOTREF(__pyx_t_32);
-            __pyx_t_27 = __pyx_lineno; __pyx_t_28 = __pyx_clineno; __pyx_t_29 = __pyx_filename;
+            __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+            __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+            __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+             __Pyx_ExceptionSwap(&__pyx_t_19, &__pyx_t_20, &__pyx_t_21);
+            if ( unlikely(__Pyx_GetException(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18) < 0)) __Pyx_ErrFetch(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18);
+            __Pyx_XGOTREF(__pyx_t_16);
+            __Pyx_XGOTREF(__pyx_t_17);
+            __Pyx_XGOTREF(__pyx_t_18);
+            __Pyx_XGOTREF(__pyx_t_19);
+            __Pyx_XGOTREF(__pyx_t_20);
+            __Pyx_XGOTREF(__pyx_t_21);
+            __pyx_t_13 = __pyx_lineno; __pyx_t_14 = __pyx_clineno; __pyx_t_15 = __pyx_filename;
             {
               __Pyx_DECREF(__pyx_v_exc); __pyx_v_exc = 0;
             }
-            __Pyx_XGIVEREF(__pyx_t_30);
-            __Pyx_XGIVEREF(__pyx_t_31);
-            __Pyx_XGIVEREF(__pyx_t_32);
-            __Pyx_ExceptionReset(__pyx_t_30, __pyx_t_31, __pyx_t_32);
-            __Pyx_XGIVEREF(__pyx_t_9);
-            __Pyx_XGIVEREF(__pyx_t_8);
-            __Pyx_XGIVEREF(__pyx_t_7);
-            __Pyx_ErrRestore(__pyx_t_9, __pyx_t_8, __pyx_t_7);
-            __pyx_t_9 = 0; __pyx_t_8 = 0; __pyx_t_7 = 0; __pyx_t_30 = 0; __pyx_t_31 = 0; __pyx_t_32 = 0;
-            __pyx_lineno = __pyx_t_27; __pyx_clineno = __pyx_t_28; __pyx_filename = __pyx_t_29;
-            __Pyx_TraceException(80, 1, 0);
+            __Pyx_XGIVEREF(__pyx_t_19);
+            __Pyx_XGIVEREF(__pyx_t_20);
+            __Pyx_XGIVEREF(__pyx_t_21);
+            __Pyx_ExceptionReset(__pyx_t_19, __pyx_t_20, __pyx_t_21);
+            __Pyx_XGIVEREF(__pyx_t_16);
+            __Pyx_XGIVEREF(__pyx_t_17);
+            __Pyx_XGIVEREF(__pyx_t_18);
+            __Pyx_ErrRestore(__pyx_t_16, __pyx_t_17, __pyx_t_18);
+            __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+            __pyx_lineno = __pyx_t_13; __pyx_clineno = __pyx_t_14; __pyx_filename = __pyx_t_15;
+            __Pyx_TraceException(47, 1, 0);
             goto __pyx_L6_except_error;
           }
-          __pyx_L37:;
+          __pyx_L19:;
         }
-        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
-        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         goto __pyx_L5_exception_handled;
       }
       goto __pyx_L6_except_error;
 
-      /* "hunter/_event.pyx":296
+      /* "hunter/_event.pyx":240
  * 
  *         if self._fullsource is UNSET:
  *             try:             # <<<<<<<<<<<<<<
- *                 self._fullsource = None
  *                 code = self.code_getter()
+ *                 if self.kind == 'call' and code.co_name != '<module>':
 */
       __pyx_L6_except_error:;
       __Pyx_XGIVEREF(__pyx_t_2);
@@ -9047,66 +7589,55 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_o
       __pyx_L9_try_end:;
     }
 
-    /* "hunter/_event.pyx":295
+    /* "hunter/_event.pyx":239
  *         cdef CodeType code
  * 
  *         if self._fullsource is UNSET:             # <<<<<<<<<<<<<<
  *             try:
- *                 self._fullsource = None
+ *                 code = self.code_getter()
 */
   }
 
-  /* "hunter/_event.pyx":322
+  /* "hunter/_event.pyx":248
  *             except Exception as exc:
  *                 self._fullsource = f'??? NO SOURCE: {exc!r}'
  *         return self._fullsource             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(322,88,0,__PYX_ERR(0, 322, __pyx_L1_error))
+  __Pyx_TraceLine(248,55,0,__PYX_ERR(0, 248, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_fullsource);
   __pyx_r = __pyx_v_self->_fullsource;
-  __Pyx_TraceReturnValue(__pyx_r, 88, 0, __PYX_ERR(0, 322, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 55, 0, __PYX_ERR(0, 248, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":291
+  /* "hunter/_event.pyx":236
  *         return self.stdlib_getter()
  * 
  *     cdef inline fullsource_getter(self):             # <<<<<<<<<<<<<<
- *         cdef list lines
  *         cdef CodeType code
+ * 
 */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
   __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_14);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_17);
-  __Pyx_XDECREF(__pyx_t_18);
-  __Pyx_XDECREF(__pyx_t_19);
-  __Pyx_XDECREF(__pyx_t_20);
-  __Pyx_XDECREF(__pyx_t_21);
-  __Pyx_XDECREF(__pyx_t_22);
   __Pyx_TraceException(__pyx_lineno, 0, 0);
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 291, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 236, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.fullsource_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_lines);
   __Pyx_XDECREF((PyObject *)__pyx_v_code);
-  __Pyx_XDECREF(__pyx_v__);
-  __Pyx_XDECREF(__pyx_v_token);
   __Pyx_XDECREF(__pyx_v_exc);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_PyMonitoring_ExitScope(0);
@@ -9114,7 +7645,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_fullsource_getter(struct __pyx_o
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":324
+/* "hunter/_event.pyx":250
  *         return self._fullsource
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -9147,25 +7678,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10fullsource___get__(struct __p
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[29]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 324, 0, 0, 0, __PYX_ERR(0, 324, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 250, 0, 0, 0, __PYX_ERR(0, 250, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":326
+  /* "hunter/_event.pyx":252
  *     @property
  *     def fullsource(self):
  *         return self.fullsource_getter()             # <<<<<<<<<<<<<<
  * 
  *     cdef inline source_getter(self):
 */
-  __Pyx_TraceLine(326,1,0,__PYX_ERR(0, 326, __pyx_L1_error))
+  __Pyx_TraceLine(252,1,0,__PYX_ERR(0, 252, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_fullsource_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_fullsource_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 326, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 252, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":324
+  /* "hunter/_event.pyx":250
  *         return self._fullsource
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -9180,7 +7711,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10fullsource___get__(struct __p
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 324, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 250, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.fullsource.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -9191,7 +7722,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10fullsource___get__(struct __p
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":328
+/* "hunter/_event.pyx":254
  *         return self.fullsource_getter()
  * 
  *     cdef inline source_getter(self):             # <<<<<<<<<<<<<<
@@ -9230,77 +7761,77 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[30]))
   __Pyx_RefNannySetupContext("source_getter", 0);
-  __Pyx_TraceStartFunc("source_getter", __pyx_f[0], 328, 0, 0, 0, __PYX_ERR(0, 328, __pyx_L1_error));
+  __Pyx_TraceStartFunc("source_getter", __pyx_f[0], 254, 0, 0, 0, __PYX_ERR(0, 254, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":329
+  /* "hunter/_event.pyx":255
  * 
  *     cdef inline source_getter(self):
  *         if self._source is UNSET:             # <<<<<<<<<<<<<<
  *             if self.filename.endswith(('.so', '.pyd')):
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
 */
-  __Pyx_TraceLine(329,5,0,__PYX_ERR(0, 329, __pyx_L1_error))
+  __Pyx_TraceLine(255,5,0,__PYX_ERR(0, 255, __pyx_L1_error))
   __pyx_t_1 = (__pyx_v_self->_source == __pyx_v_6hunter_6_event_UNSET);
   if (__pyx_t_1) {
 
-    /* "hunter/_event.pyx":330
+    /* "hunter/_event.pyx":256
  *     cdef inline source_getter(self):
  *         if self._source is UNSET:
  *             if self.filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
  *             try:
 */
-    __Pyx_TraceLine(330,8,0,__PYX_ERR(0, 330, __pyx_L1_error))
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_TraceLine(256,8,0,__PYX_ERR(0, 256, __pyx_L1_error))
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 256, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = __pyx_t_4;
     __Pyx_INCREF(__pyx_t_3);
     __pyx_t_5 = 0;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_tuple[2]};
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_tuple[1]};
       __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_endswith, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 256, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 330, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 256, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     if (__pyx_t_1) {
 
-      /* "hunter/_event.pyx":331
+      /* "hunter/_event.pyx":257
  *         if self._source is UNSET:
  *             if self.filename.endswith(('.so', '.pyd')):
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'             # <<<<<<<<<<<<<<
  *             try:
  *                 self._source = getline(self.filename, self.lineno, self.globals)
 */
-      __Pyx_TraceLine(331,17,0,__PYX_ERR(0, 331, __pyx_L1_error))
-      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_TraceLine(257,17,0,__PYX_ERR(0, 257, __pyx_L1_error))
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, 1, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, 1, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __pyx_t_7[0] = __pyx_mstate_global->__pyx_kp_u_NO_SOURCE_not_reading_binary;
       __pyx_t_7[1] = __pyx_t_3;
-      __pyx_t_7[2] = __pyx_mstate_global->__pyx_kp_u_file_2;
+      __pyx_t_7[2] = __pyx_mstate_global->__pyx_kp_u_file;
       __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_7, 3, 34 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3) + 5, 127 | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3));
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 331, __pyx_L1_error)
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 257, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_GIVEREF(__pyx_t_6);
@@ -9309,7 +7840,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
       __pyx_v_self->_source = __pyx_t_6;
       __pyx_t_6 = 0;
 
-      /* "hunter/_event.pyx":330
+      /* "hunter/_event.pyx":256
  *     cdef inline source_getter(self):
  *         if self._source is UNSET:
  *             if self.filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
@@ -9318,14 +7849,14 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
 */
     }
 
-    /* "hunter/_event.pyx":332
+    /* "hunter/_event.pyx":258
  *             if self.filename.endswith(('.so', '.pyd')):
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
  *             try:             # <<<<<<<<<<<<<<
  *                 self._source = getline(self.filename, self.lineno, self.globals)
  *             except Exception as exc:
 */
-    __Pyx_TraceLine(332,25,0,__PYX_ERR(0, 332, __pyx_L1_error))
+    __Pyx_TraceLine(258,25,0,__PYX_ERR(0, 258, __pyx_L1_error))
     {
       __Pyx_PyThreadState_declare
       __Pyx_PyThreadState_assign
@@ -9335,22 +7866,22 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
       __Pyx_XGOTREF(__pyx_t_10);
       /*try:*/ {
 
-        /* "hunter/_event.pyx":333
+        /* "hunter/_event.pyx":259
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
  *             try:
  *                 self._source = getline(self.filename, self.lineno, self.globals)             # <<<<<<<<<<<<<<
  *             except Exception as exc:
  *                 self._source = f'??? NO SOURCE: {exc!r}'
 */
-        __Pyx_TraceLine(333,29,0,__PYX_ERR(0, 333, __pyx_L5_error))
+        __Pyx_TraceLine(259,29,0,__PYX_ERR(0, 259, __pyx_L5_error))
         __pyx_t_3 = NULL;
-        __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 333, __pyx_L5_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L5_error)
+        __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_filename_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 259, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_11 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 333, __pyx_L5_error)
+        __pyx_t_11 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_lineno_2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 259, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_11);
-        __pyx_t_12 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 333, __pyx_L5_error)
+        __pyx_t_12 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 259, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_12);
         __pyx_t_5 = 1;
         #if CYTHON_UNPACK_METHODS
@@ -9372,7 +7903,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
           __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 333, __pyx_L5_error)
+          if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 259, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_6);
         }
         __Pyx_GIVEREF(__pyx_t_6);
@@ -9381,7 +7912,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
         __pyx_v_self->_source = __pyx_t_6;
         __pyx_t_6 = 0;
 
-        /* "hunter/_event.pyx":332
+        /* "hunter/_event.pyx":258
  *             if self.filename.endswith(('.so', '.pyd')):
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
  *             try:             # <<<<<<<<<<<<<<
@@ -9402,19 +7933,19 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_TraceException(__pyx_lineno, 0, 0);
 
-      /* "hunter/_event.pyx":334
+      /* "hunter/_event.pyx":260
  *             try:
  *                 self._source = getline(self.filename, self.lineno, self.globals)
  *             except Exception as exc:             # <<<<<<<<<<<<<<
  *                 self._source = f'??? NO SOURCE: {exc!r}'
  * 
 */
-      __Pyx_TraceLine(334,37,0,__PYX_ERR(0, 334, __pyx_L7_except_error))
+      __Pyx_TraceLine(260,37,0,__PYX_ERR(0, 260, __pyx_L7_except_error))
       __pyx_t_13 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(((PyTypeObject*)PyExc_Exception))));
       if (__pyx_t_13) {
         __Pyx_AddTraceback("hunter._event.Event.source_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
         __Pyx_TraceExceptionHandled(36);
-        if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_2, &__pyx_t_12) < 0) __PYX_ERR(0, 334, __pyx_L7_except_error)
+        if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_2, &__pyx_t_12) < 0) __PYX_ERR(0, 260, __pyx_L7_except_error)
         __Pyx_XGOTREF(__pyx_t_6);
         __Pyx_XGOTREF(__pyx_t_2);
         __Pyx_XGOTREF(__pyx_t_12);
@@ -9423,17 +7954,17 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
         __pyx_v_exc = __pyx_t_2;
         /*try:*/ {
 
-          /* "hunter/_event.pyx":335
+          /* "hunter/_event.pyx":261
  *                 self._source = getline(self.filename, self.lineno, self.globals)
  *             except Exception as exc:
  *                 self._source = f'??? NO SOURCE: {exc!r}'             # <<<<<<<<<<<<<<
  * 
  *         return self._source
 */
-          __Pyx_TraceLine(335,42,0,__PYX_ERR(0, 335, __pyx_L16_error))
-          __pyx_t_11 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_exc), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 335, __pyx_L16_error)
+          __Pyx_TraceLine(261,42,0,__PYX_ERR(0, 261, __pyx_L16_error))
+          __pyx_t_11 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_exc), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 261, __pyx_L16_error)
           __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_4 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_NO_SOURCE, __pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 335, __pyx_L16_error)
+          __pyx_t_4 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_NO_SOURCE, __pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 261, __pyx_L16_error)
           __Pyx_GOTREF(__pyx_t_4);
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
           __Pyx_GIVEREF(__pyx_t_4);
@@ -9443,14 +7974,14 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
           __pyx_t_4 = 0;
         }
 
-        /* "hunter/_event.pyx":334
+        /* "hunter/_event.pyx":260
  *             try:
  *                 self._source = getline(self.filename, self.lineno, self.globals)
  *             except Exception as exc:             # <<<<<<<<<<<<<<
  *                 self._source = f'??? NO SOURCE: {exc!r}'
  * 
 */
-        __Pyx_TraceLine(334,36,0,__PYX_ERR(0, 334, __pyx_L16_error))
+        __Pyx_TraceLine(260,36,0,__PYX_ERR(0, 260, __pyx_L16_error))
         /*finally:*/ {
           /*normal exit:*/{
             __Pyx_DECREF(__pyx_v_exc); __pyx_v_exc = 0;
@@ -9500,7 +8031,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
       }
       goto __pyx_L7_except_error;
 
-      /* "hunter/_event.pyx":332
+      /* "hunter/_event.pyx":258
  *             if self.filename.endswith(('.so', '.pyd')):
  *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
  *             try:             # <<<<<<<<<<<<<<
@@ -9521,7 +8052,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
       __pyx_L10_try_end:;
     }
 
-    /* "hunter/_event.pyx":329
+    /* "hunter/_event.pyx":255
  * 
  *     cdef inline source_getter(self):
  *         if self._source is UNSET:             # <<<<<<<<<<<<<<
@@ -9530,21 +8061,21 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
 */
   }
 
-  /* "hunter/_event.pyx":337
+  /* "hunter/_event.pyx":263
  *                 self._source = f'??? NO SOURCE: {exc!r}'
  * 
  *         return self._source             # <<<<<<<<<<<<<<
  * 
  *     @property
 */
-  __Pyx_TraceLine(337,44,0,__PYX_ERR(0, 337, __pyx_L1_error))
+  __Pyx_TraceLine(263,44,0,__PYX_ERR(0, 263, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_self->_source);
   __pyx_r = __pyx_v_self->_source;
-  __Pyx_TraceReturnValue(__pyx_r, 44, 0, __PYX_ERR(0, 337, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 44, 0, __PYX_ERR(0, 263, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":328
+  /* "hunter/_event.pyx":254
  *         return self.fullsource_getter()
  * 
  *     cdef inline source_getter(self):             # <<<<<<<<<<<<<<
@@ -9564,7 +8095,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 328, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 254, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.source_getter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -9576,7 +8107,7 @@ static PyObject *__pyx_f_6hunter_6_event_5Event_source_getter(struct __pyx_obj_6
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":339
+/* "hunter/_event.pyx":265
  *         return self._source
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -9609,25 +8140,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6source___get__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[31]))
   __Pyx_RefNannySetupContext("__get__", 0);
-  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 339, 0, 0, 0, __PYX_ERR(0, 339, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__get__", __pyx_f[0], 265, 0, 0, 0, __PYX_ERR(0, 265, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":341
+  /* "hunter/_event.pyx":267
  *     @property
  *     def source(self):
  *         return self.source_getter()             # <<<<<<<<<<<<<<
  * 
  *     def __getitem__(self, item):
 */
-  __Pyx_TraceLine(341,1,0,__PYX_ERR(0, 341, __pyx_L1_error))
+  __Pyx_TraceLine(267,1,0,__PYX_ERR(0, 267, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_source_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6hunter_6_event_5Event_source_getter(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 341, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 267, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":339
+  /* "hunter/_event.pyx":265
  *         return self._source
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -9642,7 +8173,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6source___get__(struct __pyx_ob
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 339, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 265, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.source.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -9653,7 +8184,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_6source___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":343
+/* "hunter/_event.pyx":269
  *         return self.source_getter()
  * 
  *     def __getitem__(self, item):             # <<<<<<<<<<<<<<
@@ -9686,25 +8217,25 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10__getitem__(struct __pyx_obj_
   int __pyx_clineno = 0;
   __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[32]))
   __Pyx_RefNannySetupContext("__getitem__", 0);
-  __Pyx_TraceStartFunc("__getitem__", __pyx_f[0], 343, 0, 0, 0, __PYX_ERR(0, 343, __pyx_L1_error));
+  __Pyx_TraceStartFunc("__getitem__", __pyx_f[0], 269, 0, 0, 0, __PYX_ERR(0, 269, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":344
+  /* "hunter/_event.pyx":270
  * 
  *     def __getitem__(self, item):
  *         return getattr(self, item)             # <<<<<<<<<<<<<<
  * 
  * 
 */
-  __Pyx_TraceLine(344,1,0,__PYX_ERR(0, 344, __pyx_L1_error))
+  __Pyx_TraceLine(270,1,0,__PYX_ERR(0, 270, __pyx_L1_error))
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetAttr(((PyObject *)__pyx_v_self), __pyx_v_item); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetAttr(((PyObject *)__pyx_v_self), __pyx_v_item); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
-  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 344, __pyx_L1_error));
+  __Pyx_TraceReturnValue(__pyx_r, 1, 0, __PYX_ERR(0, 270, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":343
+  /* "hunter/_event.pyx":269
  *         return self.source_getter()
  * 
  *     def __getitem__(self, item):             # <<<<<<<<<<<<<<
@@ -9719,7 +8250,7 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_10__getitem__(struct __pyx_obj_
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 343, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 269, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.Event.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -10193,38 +8724,481 @@ static PyObject *__pyx_pf_6hunter_6_event_5Event_7builtin___get__(struct __pyx_o
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static PyObject *__pyx_gb_6hunter_6_event_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "hunter/_event.pyx":347
+/* "hunter/_event.pyx":273
  * 
  * 
- * def yield_lines(filename, module_globals, start, list collector,             # <<<<<<<<<<<<<<
- *                 limit=10):
- *     dedent = None
+ * cdef inline void init_event(Event event, FrameType frame, int kind, object arg, int depth, int calls,             # <<<<<<<<<<<<<<
+ *                             bint threading_support) noexcept:
+ *     event.arg = arg
 */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_6hunter_6_event_1yield_lines(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static PyMethodDef __pyx_mdef_6hunter_6_event_1yield_lines = {"yield_lines", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_6hunter_6_event_1yield_lines, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_6hunter_6_event_1yield_lines(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_filename = 0;
-  PyObject *__pyx_v_module_globals = 0;
-  PyObject *__pyx_v_start = 0;
-  PyObject *__pyx_v_collector = 0;
-  PyObject *__pyx_v_limit = 0;
-  #if !CYTHON_METH_FASTCALL
+static CYTHON_INLINE void __pyx_f_6hunter_6_event_init_event(struct __pyx_obj_6hunter_6_event_Event *__pyx_v_event, FrameType __pyx_v_frame, int __pyx_v_kind, PyObject *__pyx_v_arg, int __pyx_v_depth, int __pyx_v_calls, int __pyx_v_threading_support) {
+  __Pyx_TraceDeclarationsFunc
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[41]))
+  __Pyx_RefNannySetupContext("init_event", 0);
+  __Pyx_TraceStartFunc("init_event", __pyx_f[0], 273, 0, 0, 0, __PYX_ERR(0, 273, __pyx_L1_error));
+
+  /* "hunter/_event.pyx":275
+ * cdef inline void init_event(Event event, FrameType frame, int kind, object arg, int depth, int calls,
+ *                             bint threading_support) noexcept:
+ *     event.arg = arg             # <<<<<<<<<<<<<<
+ *     event.frame = frame
+ *     event.kind = <str> KIND_NAMES[kind]
+*/
+  __Pyx_TraceLine(275,1,0,__PYX_ERR(0, 275, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_arg);
+  __Pyx_GIVEREF(__pyx_v_arg);
+  __Pyx_GOTREF(__pyx_v_event->arg);
+  __Pyx_DECREF(__pyx_v_event->arg);
+  __pyx_v_event->arg = __pyx_v_arg;
+
+  /* "hunter/_event.pyx":276
+ *                             bint threading_support) noexcept:
+ *     event.arg = arg
+ *     event.frame = frame             # <<<<<<<<<<<<<<
+ *     event.kind = <str> KIND_NAMES[kind]
+ *     event.depth = depth
+*/
+  __Pyx_TraceLine(276,4,0,__PYX_ERR(0, 276, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_frame);
+  __Pyx_GIVEREF(__pyx_v_frame);
+  __Pyx_GOTREF(__pyx_v_event->frame);
+  __Pyx_DECREF(__pyx_v_event->frame);
+  __pyx_v_event->frame = __pyx_v_frame;
+
+  /* "hunter/_event.pyx":277
+ *     event.arg = arg
+ *     event.frame = frame
+ *     event.kind = <str> KIND_NAMES[kind]             # <<<<<<<<<<<<<<
+ *     event.depth = depth
+ *     event.calls = calls
+*/
+  __Pyx_TraceLine(277,9,0,__PYX_ERR(0, 277, __pyx_L1_error))
+  __pyx_t_1 = ((PyObject *)(__pyx_v_6hunter_6_event_KIND_NAMES[__pyx_v_kind]));
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_event->kind);
+  __Pyx_DECREF(__pyx_v_event->kind);
+  __pyx_v_event->kind = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hunter/_event.pyx":278
+ *     event.frame = frame
+ *     event.kind = <str> KIND_NAMES[kind]
+ *     event.depth = depth             # <<<<<<<<<<<<<<
+ *     event.calls = calls
+ *     event.threading_support = threading_support
+*/
+  __Pyx_TraceLine(278,13,0,__PYX_ERR(0, 278, __pyx_L1_error))
+  __pyx_v_event->depth = __pyx_v_depth;
+
+  /* "hunter/_event.pyx":279
+ *     event.kind = <str> KIND_NAMES[kind]
+ *     event.depth = depth
+ *     event.calls = calls             # <<<<<<<<<<<<<<
+ *     event.threading_support = threading_support
+ *     event.detached = False
+*/
+  __Pyx_TraceLine(279,16,0,__PYX_ERR(0, 279, __pyx_L1_error))
+  __pyx_v_event->calls = __pyx_v_calls;
+
+  /* "hunter/_event.pyx":280
+ *     event.depth = depth
+ *     event.calls = calls
+ *     event.threading_support = threading_support             # <<<<<<<<<<<<<<
+ *     event.detached = False
+ *     event.builtin = kind > 3
+*/
+  __Pyx_TraceLine(280,19,0,__PYX_ERR(0, 280, __pyx_L1_error))
+  __pyx_v_event->threading_support = __pyx_v_threading_support;
+
+  /* "hunter/_event.pyx":281
+ *     event.calls = calls
+ *     event.threading_support = threading_support
+ *     event.detached = False             # <<<<<<<<<<<<<<
+ *     event.builtin = kind > 3
+ * 
+*/
+  __Pyx_TraceLine(281,22,0,__PYX_ERR(0, 281, __pyx_L1_error))
+  __pyx_v_event->detached = 0;
+
+  /* "hunter/_event.pyx":282
+ *     event.threading_support = threading_support
+ *     event.detached = False
+ *     event.builtin = kind > 3             # <<<<<<<<<<<<<<
+ * 
+ *     event._code = UNSET
+*/
+  __Pyx_TraceLine(282,28,0,__PYX_ERR(0, 282, __pyx_L1_error))
+  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_kind > 3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_event->builtin);
+  __Pyx_DECREF(__pyx_v_event->builtin);
+  __pyx_v_event->builtin = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "hunter/_event.pyx":284
+ *     event.builtin = kind > 3
+ * 
+ *     event._code = UNSET             # <<<<<<<<<<<<<<
+ *     event._filename = UNSET
+ *     event._fullsource = UNSET
+*/
+  __Pyx_TraceLine(284,30,0,__PYX_ERR(0, 284, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_code);
+  __Pyx_DECREF(__pyx_v_event->_code);
+  __pyx_v_event->_code = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":285
+ * 
+ *     event._code = UNSET
+ *     event._filename = UNSET             # <<<<<<<<<<<<<<
+ *     event._fullsource = UNSET
+ *     event._function_object = UNSET
+*/
+  __Pyx_TraceLine(285,33,0,__PYX_ERR(0, 285, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_filename);
+  __Pyx_DECREF(__pyx_v_event->_filename);
+  __pyx_v_event->_filename = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":286
+ *     event._code = UNSET
+ *     event._filename = UNSET
+ *     event._fullsource = UNSET             # <<<<<<<<<<<<<<
+ *     event._function_object = UNSET
+ *     event._function = UNSET
+*/
+  __Pyx_TraceLine(286,36,0,__PYX_ERR(0, 286, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_fullsource);
+  __Pyx_DECREF(__pyx_v_event->_fullsource);
+  __pyx_v_event->_fullsource = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":287
+ *     event._filename = UNSET
+ *     event._fullsource = UNSET
+ *     event._function_object = UNSET             # <<<<<<<<<<<<<<
+ *     event._function = UNSET
+ *     event._globals = UNSET
+*/
+  __Pyx_TraceLine(287,39,0,__PYX_ERR(0, 287, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_function_object);
+  __Pyx_DECREF(__pyx_v_event->_function_object);
+  __pyx_v_event->_function_object = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":288
+ *     event._fullsource = UNSET
+ *     event._function_object = UNSET
+ *     event._function = UNSET             # <<<<<<<<<<<<<<
+ *     event._globals = UNSET
+ *     event._lineno = UNSET
+*/
+  __Pyx_TraceLine(288,42,0,__PYX_ERR(0, 288, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_function);
+  __Pyx_DECREF(__pyx_v_event->_function);
+  __pyx_v_event->_function = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":289
+ *     event._function_object = UNSET
+ *     event._function = UNSET
+ *     event._globals = UNSET             # <<<<<<<<<<<<<<
+ *     event._lineno = UNSET
+ *     event._locals = UNSET
+*/
+  __Pyx_TraceLine(289,45,0,__PYX_ERR(0, 289, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_globals);
+  __Pyx_DECREF(__pyx_v_event->_globals);
+  __pyx_v_event->_globals = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":290
+ *     event._function = UNSET
+ *     event._globals = UNSET
+ *     event._lineno = UNSET             # <<<<<<<<<<<<<<
+ *     event._locals = UNSET
+ *     event._module = UNSET
+*/
+  __Pyx_TraceLine(290,48,0,__PYX_ERR(0, 290, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_lineno);
+  __Pyx_DECREF(__pyx_v_event->_lineno);
+  __pyx_v_event->_lineno = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":291
+ *     event._globals = UNSET
+ *     event._lineno = UNSET
+ *     event._locals = UNSET             # <<<<<<<<<<<<<<
+ *     event._module = UNSET
+ *     event._source = UNSET
+*/
+  __Pyx_TraceLine(291,51,0,__PYX_ERR(0, 291, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_locals);
+  __Pyx_DECREF(__pyx_v_event->_locals);
+  __pyx_v_event->_locals = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":292
+ *     event._lineno = UNSET
+ *     event._locals = UNSET
+ *     event._module = UNSET             # <<<<<<<<<<<<<<
+ *     event._source = UNSET
+ *     event._stdlib = UNSET
+*/
+  __Pyx_TraceLine(292,54,0,__PYX_ERR(0, 292, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_module);
+  __Pyx_DECREF(__pyx_v_event->_module);
+  __pyx_v_event->_module = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":293
+ *     event._locals = UNSET
+ *     event._module = UNSET
+ *     event._source = UNSET             # <<<<<<<<<<<<<<
+ *     event._stdlib = UNSET
+ *     event._threadidn = UNSET
+*/
+  __Pyx_TraceLine(293,57,0,__PYX_ERR(0, 293, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_source);
+  __Pyx_DECREF(__pyx_v_event->_source);
+  __pyx_v_event->_source = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":294
+ *     event._module = UNSET
+ *     event._source = UNSET
+ *     event._stdlib = UNSET             # <<<<<<<<<<<<<<
+ *     event._threadidn = UNSET
+ *     event._threadname = UNSET
+*/
+  __Pyx_TraceLine(294,60,0,__PYX_ERR(0, 294, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_stdlib);
+  __Pyx_DECREF(__pyx_v_event->_stdlib);
+  __pyx_v_event->_stdlib = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":295
+ *     event._source = UNSET
+ *     event._stdlib = UNSET
+ *     event._threadidn = UNSET             # <<<<<<<<<<<<<<
+ *     event._threadname = UNSET
+ *     event._thread = UNSET
+*/
+  __Pyx_TraceLine(295,63,0,__PYX_ERR(0, 295, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_threadidn);
+  __Pyx_DECREF(__pyx_v_event->_threadidn);
+  __pyx_v_event->_threadidn = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":296
+ *     event._stdlib = UNSET
+ *     event._threadidn = UNSET
+ *     event._threadname = UNSET             # <<<<<<<<<<<<<<
+ *     event._thread = UNSET
+ *     event._instruction = UNSET
+*/
+  __Pyx_TraceLine(296,66,0,__PYX_ERR(0, 296, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_threadname);
+  __Pyx_DECREF(__pyx_v_event->_threadname);
+  __pyx_v_event->_threadname = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":297
+ *     event._threadidn = UNSET
+ *     event._threadname = UNSET
+ *     event._thread = UNSET             # <<<<<<<<<<<<<<
+ *     event._instruction = UNSET
+ * 
+*/
+  __Pyx_TraceLine(297,69,0,__PYX_ERR(0, 297, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_thread);
+  __Pyx_DECREF(__pyx_v_event->_thread);
+  __pyx_v_event->_thread = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":298
+ *     event._threadname = UNSET
+ *     event._thread = UNSET
+ *     event._instruction = UNSET             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_TraceLine(298,72,0,__PYX_ERR(0, 298, __pyx_L1_error))
+  __Pyx_INCREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GIVEREF(__pyx_v_6hunter_6_event_UNSET);
+  __Pyx_GOTREF(__pyx_v_event->_instruction);
+  __Pyx_DECREF(__pyx_v_event->_instruction);
+  __pyx_v_event->_instruction = __pyx_v_6hunter_6_event_UNSET;
+
+  /* "hunter/_event.pyx":273
+ * 
+ * 
+ * cdef inline void init_event(Event event, FrameType frame, int kind, object arg, int depth, int calls,             # <<<<<<<<<<<<<<
+ *                             bint threading_support) noexcept:
+ *     event.arg = arg
+*/
+
+  /* function exit code */
+  __Pyx_TraceReturnValue(Py_None, 0, 0, __PYX_ERR(0, 273, __pyx_L1_error));
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_TraceException(__pyx_lineno, 0, 0);
+  #if CYTHON_USE_SYS_MONITORING
+  __Pyx_TraceExceptionUnwind(0, 0);
+  #else
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 273, __pyx_L1_error));
+  #endif
+  __Pyx_WriteUnraisable("hunter._event.init_event", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_PyMonitoring_ExitScope(0);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "hunter/_event.pyx":301
+ * 
+ * 
+ * cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):             # <<<<<<<<<<<<<<
+ *     event = <Event> Event.__new__(Event)
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)
+*/
+
+static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_event_fast_event(FrameType __pyx_v_frame, int __pyx_v_kind, PyObject *__pyx_v_arg, int __pyx_v_depth, int __pyx_v_calls, int __pyx_v_threading_support) {
+  struct __pyx_obj_6hunter_6_event_Event *__pyx_v_event = NULL;
+  struct __pyx_obj_6hunter_6_event_Event *__pyx_r = NULL;
+  __Pyx_TraceDeclarationsFunc
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[42]))
+  __Pyx_RefNannySetupContext("fast_event", 0);
+  __Pyx_TraceStartFunc("fast_event", __pyx_f[0], 301, 0, 0, 0, __PYX_ERR(0, 301, __pyx_L1_error));
+
+  /* "hunter/_event.pyx":302
+ * 
+ * cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
+ *     event = <Event> Event.__new__(Event)             # <<<<<<<<<<<<<<
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)
+ *     return event
+*/
+  __Pyx_TraceLine(302,5,0,__PYX_ERR(0, 302, __pyx_L1_error))
+  __pyx_t_1 = ((PyObject *)__pyx_tp_new_6hunter_6_event_Event(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  __pyx_t_2 = ((PyObject *)__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_DECREF((PyObject *)__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_event = ((struct __pyx_obj_6hunter_6_event_Event *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "hunter/_event.pyx":303
+ * cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
+ *     event = <Event> Event.__new__(Event)
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)             # <<<<<<<<<<<<<<
+ *     return event
+ * 
+*/
+  __Pyx_TraceLine(303,8,0,__PYX_ERR(0, 303, __pyx_L1_error))
+  __pyx_f_6hunter_6_event_init_event(__pyx_v_event, __pyx_v_frame, __pyx_v_kind, __pyx_v_arg, __pyx_v_depth, __pyx_v_calls, __pyx_v_threading_support);
+
+  /* "hunter/_event.pyx":304
+ *     event = <Event> Event.__new__(Event)
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)
+ *     return event             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_TraceLine(304,16,0,__PYX_ERR(0, 304, __pyx_L1_error))
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __Pyx_INCREF((PyObject *)__pyx_v_event);
+  __pyx_r = __pyx_v_event;
+  __Pyx_TraceReturnValue((PyObject *)__pyx_r, 16, 0, __PYX_ERR(0, 304, __pyx_L1_error));
+  goto __pyx_L0;
+
+  /* "hunter/_event.pyx":301
+ * 
+ * 
+ * cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):             # <<<<<<<<<<<<<<
+ *     event = <Event> Event.__new__(Event)
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_TraceException(__pyx_lineno, 0, 0);
+  #if CYTHON_USE_SYS_MONITORING
+  __Pyx_TraceExceptionUnwind(0, 0);
+  #else
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 301, __pyx_L1_error));
+  #endif
+  __Pyx_AddTraceback("hunter._event.fast_event", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_event);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_PyMonitoring_ExitScope(0);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hunter/_event.pyx":307
+ * 
+ * 
+ * def yield_lines(filename, module_globals, start, list collector, limit=10):             # <<<<<<<<<<<<<<
+ *     # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+ *     return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6hunter_6_event_1yield_lines(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_6hunter_6_event_1yield_lines = {"yield_lines", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_6hunter_6_event_1yield_lines, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_6hunter_6_event_1yield_lines(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_filename = 0;
+  PyObject *__pyx_v_module_globals = 0;
+  PyObject *__pyx_v_start = 0;
+  PyObject *__pyx_v_collector = 0;
+  PyObject *__pyx_v_limit = 0;
+  #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
@@ -10246,53 +9220,53 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_filename_2,&__pyx_mstate_global->__pyx_n_u_module_globals,&__pyx_mstate_global->__pyx_n_u_start,&__pyx_mstate_global->__pyx_n_u_collector,&__pyx_mstate_global->__pyx_n_u_limit,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 347, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 307, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "yield_lines", 0) < 0) __PYX_ERR(0, 347, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "yield_lines", 0) < 0) __PYX_ERR(0, 307, __pyx_L3_error)
       if (!values[4]) values[4] = __Pyx_NewRef(((PyObject *)((PyObject*)__pyx_mstate_global->__pyx_int_10)));
       for (Py_ssize_t i = __pyx_nargs; i < 4; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("yield_lines", 0, 4, 5, i); __PYX_ERR(0, 347, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("yield_lines", 0, 4, 5, i); __PYX_ERR(0, 307, __pyx_L3_error) }
       }
     } else {
       switch (__pyx_nargs) {
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 307, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 307, __pyx_L3_error)
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 307, __pyx_L3_error)
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 307, __pyx_L3_error)
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 347, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 307, __pyx_L3_error)
         break;
         default: goto __pyx_L5_argtuple_error;
       }
@@ -10306,7 +9280,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("yield_lines", 0, 4, 5, __pyx_nargs); __PYX_ERR(0, 347, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("yield_lines", 0, 4, 5, __pyx_nargs); __PYX_ERR(0, 307, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -10317,7 +9291,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_collector), (&PyList_Type), 1, "collector", 1))) __PYX_ERR(0, 347, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_collector), (&PyList_Type), 1, "collector", 1))) __PYX_ERR(0, 307, __pyx_L1_error)
   __pyx_r = __pyx_pf_6hunter_6_event_yield_lines(__pyx_self, __pyx_v_filename, __pyx_v_module_globals, __pyx_v_start, __pyx_v_collector, __pyx_v_limit);
 
   /* function exit code */
@@ -10338,125 +9312,61 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 }
 
 static PyObject *__pyx_pf_6hunter_6_event_yield_lines(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_filename, PyObject *__pyx_v_module_globals, PyObject *__pyx_v_start, PyObject *__pyx_v_collector, PyObject *__pyx_v_limit) {
-  struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *__pyx_cur_scope;
   PyObject *__pyx_r = NULL;
+  __Pyx_TraceDeclarationsFunc
   __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("yield_lines", 0);
-  __pyx_cur_scope = (struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)__pyx_tp_new_6hunter_6_event___pyx_scope_struct__yield_lines(__pyx_mstate_global->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines, __pyx_mstate_global->__pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 347, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
-  }
-  __pyx_cur_scope->__pyx_v_filename = __pyx_v_filename;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_filename);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_filename);
-  __pyx_cur_scope->__pyx_v_module_globals = __pyx_v_module_globals;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_module_globals);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_module_globals);
-  __pyx_cur_scope->__pyx_v_start = __pyx_v_start;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_start);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_start);
-  __pyx_cur_scope->__pyx_v_collector = __pyx_v_collector;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_collector);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_collector);
-  __pyx_cur_scope->__pyx_v_limit = __pyx_v_limit;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_limit);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_limit);
-  {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_6hunter_6_event_2generator, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[41]), (PyObject *) __pyx_cur_scope, __pyx_mstate_global->__pyx_n_u_yield_lines, __pyx_mstate_global->__pyx_n_u_yield_lines, __pyx_mstate_global->__pyx_n_u_hunter__event); if (unlikely(!gen)) __PYX_ERR(0, 347, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_cur_scope);
-    __Pyx_RefNannyFinishContext();
-    return (PyObject *) gen;
-  }
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("hunter._event.yield_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_gb_6hunter_6_event_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
-{
-  struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *__pyx_cur_scope = ((struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)__pyx_generator->closure);
-  PyObject *__pyx_r = NULL;
-  __Pyx_TraceDeclarationsGen
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  Py_ssize_t __pyx_t_5;
-  PyObject *(*__pyx_t_6)(PyObject *);
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  Py_ssize_t __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
+  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[43]))
   __Pyx_RefNannySetupContext("yield_lines", 0);
-  switch (__pyx_generator->resume_label) {
-    case 0: goto __pyx_L3_first_run;
-    case 1: goto __pyx_L7_resume_from_yield;
-    default: /* CPython raises the right error here */
-    __Pyx_TraceStartGen("yield_lines", __pyx_f[0], 347, 0, 0, 0, __PYX_ERR(0, 347, __pyx_L1_error));
-    __Pyx_TraceReturnValue(Py_None, 0, 0, __PYX_ERR(0, 347, __pyx_L1_error));
-    __Pyx_RefNannyFinishContext();
-    return NULL;
-  }
-  __pyx_L3_first_run:;
-  __Pyx_TraceStartGen("yield_lines", __pyx_f[0], 347, 0, 0, 0, __PYX_ERR(0, 347, __pyx_L1_error));
-  if (unlikely(__pyx_sent_value != Py_None)) {
-    if (unlikely(__pyx_sent_value)) PyErr_SetString(PyExc_TypeError, "can't send non-None value to a just-started generator");
-    __PYX_ERR(0, 347, __pyx_L1_error)
-  }
-
-  /* "hunter/_event.pyx":349
- * def yield_lines(filename, module_globals, start, list collector,
- *                 limit=10):
- *     dedent = None             # <<<<<<<<<<<<<<
- *     amount = 0
- *     for line in getlines(filename, module_globals)[start:start + limit]:
-*/
-  __Pyx_TraceLine(349,0,0,__PYX_ERR(0, 349, __pyx_L1_error))
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __pyx_cur_scope->__pyx_v_dedent = Py_None;
-
-  /* "hunter/_event.pyx":350
- *                 limit=10):
- *     dedent = None
- *     amount = 0             # <<<<<<<<<<<<<<
- *     for line in getlines(filename, module_globals)[start:start + limit]:
- *         if dedent is None:
-*/
-  __Pyx_TraceLine(350,0,0,__PYX_ERR(0, 350, __pyx_L1_error))
-  __pyx_cur_scope->__pyx_v_amount = 0;
+  __Pyx_TraceStartFunc("yield_lines", __pyx_f[0], 307, 0, 0, 0, __PYX_ERR(0, 307, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":351
- *     dedent = None
- *     amount = 0
- *     for line in getlines(filename, module_globals)[start:start + limit]:             # <<<<<<<<<<<<<<
- *         if dedent is None:
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
+  /* "hunter/_event.pyx":309
+ * def yield_lines(filename, module_globals, start, list collector, limit=10):
+ *     # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+ *     return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)             # <<<<<<<<<<<<<<
+ * 
+ * 
 */
-  __Pyx_TraceLine(351,0,0,__PYX_ERR(0, 351, __pyx_L1_error))
+  __Pyx_TraceLine(309,2,0,__PYX_ERR(0, 309, __pyx_L1_error))
+  __Pyx_XDECREF(__pyx_r);
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_yield_source_lines); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = 1;
+  __pyx_t_5 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_5);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_filename, __pyx_v_module_globals};
+    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+__pyx_t_7, (3-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 309, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_collector, __pyx_mstate_global->__pyx_n_u_append); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = 1;
   #if CYTHON_UNPACK_METHODS
   if (unlikely(PyMethod_Check(__pyx_t_3))) {
     __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
@@ -10465,316 +9375,56 @@ static PyObject *__pyx_gb_6hunter_6_event_2generator(__pyx_CoroutineObject *__py
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx__function);
     __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
-    __pyx_t_4 = 0;
+    __pyx_t_7 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_2, __pyx_cur_scope->__pyx_v_filename, __pyx_cur_scope->__pyx_v_module_globals};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    PyObject *__pyx_callargs[5] = {__pyx_t_2, __pyx_t_4, __pyx_v_start, __pyx_t_6, __pyx_v_limit};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_7, (5-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 351, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
-  __pyx_t_3 = PyNumber_Add(__pyx_cur_scope->__pyx_v_start, __pyx_cur_scope->__pyx_v_limit); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 351, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_t_1, 0, 0, &__pyx_cur_scope->__pyx_v_start, &__pyx_t_3, NULL, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-    __pyx_t_5 = 0;
-    __pyx_t_6 = NULL;
-  } else {
-    __pyx_t_5 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 351, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 351, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_6)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
-          #endif
-          if (__pyx_t_5 >= __pyx_temp) break;
-        }
-        __pyx_t_2 = __Pyx_PyList_GetItemRef(__pyx_t_3, __pyx_t_5);
-        ++__pyx_t_5;
-      } else {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
-          #endif
-          if (__pyx_t_5 >= __pyx_temp) break;
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_5));
-        #else
-        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_5);
-        #endif
-        ++__pyx_t_5;
-      }
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
-    } else {
-      __pyx_t_2 = __pyx_t_6(__pyx_t_3);
-      if (unlikely(!__pyx_t_2)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 351, __pyx_L1_error)
-          PyErr_Clear();
-        }
-        break;
-      }
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_line);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_line, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __pyx_t_2 = 0;
-    __Pyx_TraceLine(351,0,0,__PYX_ERR(0, 351, __pyx_L1_error))
-
-    /* "hunter/_event.pyx":352
- *     amount = 0
- *     for line in getlines(filename, module_globals)[start:start + limit]:
- *         if dedent is None:             # <<<<<<<<<<<<<<
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
- *             dedent = dedent[0] if dedent else ''
-*/
-    __Pyx_TraceLine(352,0,0,__PYX_ERR(0, 352, __pyx_L1_error))
-    __pyx_t_7 = (__pyx_cur_scope->__pyx_v_dedent == Py_None);
-    if (__pyx_t_7) {
-
-      /* "hunter/_event.pyx":353
- *     for line in getlines(filename, module_globals)[start:start + limit]:
- *         if dedent is None:
- *             dedent = LEADING_WHITESPACE_RE.findall(line)             # <<<<<<<<<<<<<<
- *             dedent = dedent[0] if dedent else ''
- *             amount = len(dedent)
-*/
-      __Pyx_TraceLine(353,0,0,__PYX_ERR(0, 353, __pyx_L1_error))
-      __pyx_t_1 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_LEADING_WHITESPACE_RE); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 353, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_findall); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 353, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_4 = 1;
-      #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_9))) {
-        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
-        assert(__pyx_t_1);
-        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_9);
-        __Pyx_INCREF(__pyx_t_1);
-        __Pyx_INCREF(__pyx__function);
-        __Pyx_DECREF_SET(__pyx_t_9, __pyx__function);
-        __pyx_t_4 = 0;
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_cur_scope->__pyx_v_line};
-        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_9, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-      }
-      __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_dedent);
-      __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v_dedent, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "hunter/_event.pyx":354
- *         if dedent is None:
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
- *             dedent = dedent[0] if dedent else ''             # <<<<<<<<<<<<<<
- *             amount = len(dedent)
- *         elif not line.startswith(dedent):
-*/
-      __Pyx_TraceLine(354,0,0,__PYX_ERR(0, 354, __pyx_L1_error))
-      __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_cur_scope->__pyx_v_dedent); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 354, __pyx_L1_error)
-      if (__pyx_t_7) {
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_cur_scope->__pyx_v_dedent, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 354, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_2 = __pyx_t_9;
-        __pyx_t_9 = 0;
-      } else {
-        __Pyx_INCREF(__pyx_mstate_global->__pyx_kp_u__2);
-        __pyx_t_2 = __pyx_mstate_global->__pyx_kp_u__2;
-      }
-      __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_dedent);
-      __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v_dedent, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "hunter/_event.pyx":355
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
- *             dedent = dedent[0] if dedent else ''
- *             amount = len(dedent)             # <<<<<<<<<<<<<<
- *         elif not line.startswith(dedent):
- *             break
-*/
-      __Pyx_TraceLine(355,0,0,__PYX_ERR(0, 355, __pyx_L1_error))
-      __pyx_t_10 = PyObject_Length(__pyx_cur_scope->__pyx_v_dedent); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 355, __pyx_L1_error)
-      __pyx_cur_scope->__pyx_v_amount = __pyx_t_10;
-
-      /* "hunter/_event.pyx":352
- *     amount = 0
- *     for line in getlines(filename, module_globals)[start:start + limit]:
- *         if dedent is None:             # <<<<<<<<<<<<<<
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
- *             dedent = dedent[0] if dedent else ''
-*/
-      goto __pyx_L6;
-    }
-
-    /* "hunter/_event.pyx":356
- *             dedent = dedent[0] if dedent else ''
- *             amount = len(dedent)
- *         elif not line.startswith(dedent):             # <<<<<<<<<<<<<<
- *             break
- *         collector.append(line)
-*/
-    __Pyx_TraceLine(356,0,0,__PYX_ERR(0, 356, __pyx_L1_error))
-    __pyx_t_9 = __pyx_cur_scope->__pyx_v_line;
-    __Pyx_INCREF(__pyx_t_9);
-    __pyx_t_4 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_cur_scope->__pyx_v_dedent};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_startswith, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 356, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 356, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_11 = (!__pyx_t_7);
-    if (__pyx_t_11) {
-
-      /* "hunter/_event.pyx":357
- *             amount = len(dedent)
- *         elif not line.startswith(dedent):
- *             break             # <<<<<<<<<<<<<<
- *         collector.append(line)
- *         yield line[amount:]
-*/
-      __Pyx_TraceLine(357,0,0,__PYX_ERR(0, 357, __pyx_L1_error))
-      goto __pyx_L5_break;
-
-      /* "hunter/_event.pyx":356
- *             dedent = dedent[0] if dedent else ''
- *             amount = len(dedent)
- *         elif not line.startswith(dedent):             # <<<<<<<<<<<<<<
- *             break
- *         collector.append(line)
-*/
-    }
-    __pyx_L6:;
-
-    /* "hunter/_event.pyx":358
- *         elif not line.startswith(dedent):
- *             break
- *         collector.append(line)             # <<<<<<<<<<<<<<
- *         yield line[amount:]
- * 
-*/
-    __Pyx_TraceLine(358,0,0,__PYX_ERR(0, 358, __pyx_L1_error))
-    if (unlikely(__pyx_cur_scope->__pyx_v_collector == Py_None)) {
-      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
-      __PYX_ERR(0, 358, __pyx_L1_error)
-    }
-    __pyx_t_12 = __Pyx_PyList_Append(__pyx_cur_scope->__pyx_v_collector, __pyx_cur_scope->__pyx_v_line); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 358, __pyx_L1_error)
-
-    /* "hunter/_event.pyx":359
- *             break
- *         collector.append(line)
- *         yield line[amount:]             # <<<<<<<<<<<<<<
- * 
- * 
-*/
-    __Pyx_TraceLine(359,0,0,__PYX_ERR(0, 359, __pyx_L1_error))
-    __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_cur_scope->__pyx_v_line, __pyx_cur_scope->__pyx_v_amount, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 359, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __pyx_cur_scope->__pyx_t_0 = __pyx_t_3;
-    __pyx_cur_scope->__pyx_t_1 = __pyx_t_5;
-    __pyx_cur_scope->__pyx_t_2 = __pyx_t_6;
-    __Pyx_TraceYield(__pyx_r, 0, __PYX_ERR(0, 359, __pyx_L1_error));
-    __Pyx_XGIVEREF(__pyx_r);
-    __Pyx_RefNannyFinishContext();
-    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-    /* return from generator, yielding value */
-    __pyx_generator->resume_label = 1;
-    return __pyx_r;
-    __pyx_L7_resume_from_yield:;
-    __Pyx_TraceResumeGen("yield_lines", __pyx_f[0], 347, 0, __PYX_ERR(0, 359, __pyx_L1_error));
-    __pyx_t_3 = __pyx_cur_scope->__pyx_t_0;
-    __pyx_cur_scope->__pyx_t_0 = 0;
-    __Pyx_XGOTREF(__pyx_t_3);
-    __pyx_t_5 = __pyx_cur_scope->__pyx_t_1;
-    __pyx_t_6 = __pyx_cur_scope->__pyx_t_2;
-    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 359, __pyx_L1_error)
-
-    /* "hunter/_event.pyx":351
- *     dedent = None
- *     amount = 0
- *     for line in getlines(filename, module_globals)[start:start + limit]:             # <<<<<<<<<<<<<<
- *         if dedent is None:
- *             dedent = LEADING_WHITESPACE_RE.findall(line)
-*/
-    __Pyx_TraceLine(351,0,0,__PYX_ERR(0, 351, __pyx_L1_error))
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  goto __pyx_L8_for_end;
-  __pyx_L5_break:;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  goto __pyx_L8_for_end;
-  __pyx_L8_for_end:;
-  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
-  __Pyx_TraceReturnValue(Py_None, 0, 0, __PYX_ERR(0, 347, __pyx_L1_error));
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __Pyx_TraceReturnValue(__pyx_r, 2, 0, __PYX_ERR(0, 309, __pyx_L1_error));
+  goto __pyx_L0;
 
-  /* "hunter/_event.pyx":347
+  /* "hunter/_event.pyx":307
  * 
  * 
- * def yield_lines(filename, module_globals, start, list collector,             # <<<<<<<<<<<<<<
- *                 limit=10):
- *     dedent = None
+ * def yield_lines(filename, module_globals, start, list collector, limit=10):             # <<<<<<<<<<<<<<
+ *     # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+ *     return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  if (__Pyx_PyErr_Occurred()) {
-    __Pyx_TraceException(__pyx_lineno, 0, 0);
-    __Pyx_Generator_Replace_StopIteration(0);
-    __Pyx_AddTraceback("yield_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    __Pyx_TraceExceptionUnwind(0, 0);
-  }
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_TraceException(__pyx_lineno, 0, 0);
+  #if CYTHON_USE_SYS_MONITORING
+  __Pyx_TraceExceptionUnwind(0, 0);
+  #else
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 307, __pyx_L1_error));
+  #endif
+  __Pyx_AddTraceback("hunter._event.yield_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_PyMonitoring_ExitScope(0);
-  #if !CYTHON_USE_EXC_INFO_STACK
-  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-  #endif
-  __pyx_generator->resume_label = -1;
-  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":362
+/* "hunter/_event.pyx":312
  * 
  * 
  * cdef inline Event fast_detach(Event self, object value_filter):             # <<<<<<<<<<<<<<
@@ -10805,19 +9455,19 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[42]))
+  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[44]))
   __Pyx_RefNannySetupContext("fast_detach", 0);
-  __Pyx_TraceStartFunc("fast_detach", __pyx_f[0], 362, 0, 0, 0, __PYX_ERR(0, 362, __pyx_L1_error));
+  __Pyx_TraceStartFunc("fast_detach", __pyx_f[0], 312, 0, 0, 0, __PYX_ERR(0, 312, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":363
+  /* "hunter/_event.pyx":313
  * 
  * cdef inline Event fast_detach(Event self, object value_filter):
  *     event = <Event> Event.__new__(Event)             # <<<<<<<<<<<<<<
  * 
  *     event._code = self.code_getter()
 */
-  __Pyx_TraceLine(363,5,0,__PYX_ERR(0, 363, __pyx_L1_error))
-  __pyx_t_1 = ((PyObject *)__pyx_tp_new_6hunter_6_event_Event(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_TraceLine(313,5,0,__PYX_ERR(0, 313, __pyx_L1_error))
+  __pyx_t_1 = ((PyObject *)__pyx_tp_new_6hunter_6_event_Event(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 313, __pyx_L1_error)
   __Pyx_GOTREF((PyObject *)__pyx_t_1);
   __pyx_t_2 = ((PyObject *)__pyx_t_1);
   __Pyx_INCREF(__pyx_t_2);
@@ -10825,15 +9475,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event = ((struct __pyx_obj_6hunter_6_event_Event *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":365
+  /* "hunter/_event.pyx":315
  *     event = <Event> Event.__new__(Event)
  * 
  *     event._code = self.code_getter()             # <<<<<<<<<<<<<<
  *     event._filename = self.filename_getter()
  *     event._fullsource = self.fullsource_getter()
 */
-  __Pyx_TraceLine(365,11,0,__PYX_ERR(0, 365, __pyx_L1_error))
-  __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_TraceLine(315,11,0,__PYX_ERR(0, 315, __pyx_L1_error))
+  __pyx_t_2 = ((PyObject *)__pyx_f_6hunter_6_event_5Event_code_getter(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_code);
@@ -10841,15 +9491,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_code = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":366
+  /* "hunter/_event.pyx":316
  * 
  *     event._code = self.code_getter()
  *     event._filename = self.filename_getter()             # <<<<<<<<<<<<<<
  *     event._fullsource = self.fullsource_getter()
  *     event._function_object = self._function_object
 */
-  __Pyx_TraceLine(366,16,0,__PYX_ERR(0, 366, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_TraceLine(316,16,0,__PYX_ERR(0, 316, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_filename_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_filename);
@@ -10857,15 +9507,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_filename = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":367
+  /* "hunter/_event.pyx":317
  *     event._code = self.code_getter()
  *     event._filename = self.filename_getter()
  *     event._fullsource = self.fullsource_getter()             # <<<<<<<<<<<<<<
  *     event._function_object = self._function_object
  *     event._function = self.function_getter()
 */
-  __Pyx_TraceLine(367,21,0,__PYX_ERR(0, 367, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_fullsource_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_TraceLine(317,21,0,__PYX_ERR(0, 317, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_fullsource_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_fullsource);
@@ -10873,14 +9523,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_fullsource = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":368
+  /* "hunter/_event.pyx":318
  *     event._filename = self.filename_getter()
  *     event._fullsource = self.fullsource_getter()
  *     event._function_object = self._function_object             # <<<<<<<<<<<<<<
  *     event._function = self.function_getter()
  *     event._lineno = self.lineno_getter()
 */
-  __Pyx_TraceLine(368,25,0,__PYX_ERR(0, 368, __pyx_L1_error))
+  __Pyx_TraceLine(318,25,0,__PYX_ERR(0, 318, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_function_object;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -10889,15 +9539,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_function_object = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":369
+  /* "hunter/_event.pyx":319
  *     event._fullsource = self.fullsource_getter()
  *     event._function_object = self._function_object
  *     event._function = self.function_getter()             # <<<<<<<<<<<<<<
  *     event._lineno = self.lineno_getter()
  *     event._module = self.module_getter()
 */
-  __Pyx_TraceLine(369,30,0,__PYX_ERR(0, 369, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_function_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_TraceLine(319,30,0,__PYX_ERR(0, 319, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_function_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 319, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_function);
@@ -10905,15 +9555,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_function = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":370
+  /* "hunter/_event.pyx":320
  *     event._function_object = self._function_object
  *     event._function = self.function_getter()
  *     event._lineno = self.lineno_getter()             # <<<<<<<<<<<<<<
  *     event._module = self.module_getter()
  *     event._source = self.source_getter()
 */
-  __Pyx_TraceLine(370,35,0,__PYX_ERR(0, 370, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_TraceLine(320,35,0,__PYX_ERR(0, 320, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_lineno_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_lineno);
@@ -10921,15 +9571,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_lineno = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":371
+  /* "hunter/_event.pyx":321
  *     event._function = self.function_getter()
  *     event._lineno = self.lineno_getter()
  *     event._module = self.module_getter()             # <<<<<<<<<<<<<<
  *     event._source = self.source_getter()
  *     event._stdlib = self.stdlib_getter()
 */
-  __Pyx_TraceLine(371,40,0,__PYX_ERR(0, 371, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_TraceLine(321,40,0,__PYX_ERR(0, 321, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_module_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 321, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_module);
@@ -10937,15 +9587,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_module = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":372
+  /* "hunter/_event.pyx":322
  *     event._lineno = self.lineno_getter()
  *     event._module = self.module_getter()
  *     event._source = self.source_getter()             # <<<<<<<<<<<<<<
  *     event._stdlib = self.stdlib_getter()
  *     event._threadidn = self.threadid_getter()
 */
-  __Pyx_TraceLine(372,45,0,__PYX_ERR(0, 372, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_source_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 372, __pyx_L1_error)
+  __Pyx_TraceLine(322,45,0,__PYX_ERR(0, 322, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_source_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_source);
@@ -10953,15 +9603,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_source = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":373
+  /* "hunter/_event.pyx":323
  *     event._module = self.module_getter()
  *     event._source = self.source_getter()
  *     event._stdlib = self.stdlib_getter()             # <<<<<<<<<<<<<<
  *     event._threadidn = self.threadid_getter()
  *     event._threadname = self.threadname_getter()
 */
-  __Pyx_TraceLine(373,50,0,__PYX_ERR(0, 373, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_stdlib_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_TraceLine(323,50,0,__PYX_ERR(0, 323, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_stdlib_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 323, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_stdlib);
@@ -10969,15 +9619,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_stdlib = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":374
+  /* "hunter/_event.pyx":324
  *     event._source = self.source_getter()
  *     event._stdlib = self.stdlib_getter()
  *     event._threadidn = self.threadid_getter()             # <<<<<<<<<<<<<<
  *     event._threadname = self.threadname_getter()
  *     event._instruction = self.instruction_getter()
 */
-  __Pyx_TraceLine(374,55,0,__PYX_ERR(0, 374, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_threadid_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __Pyx_TraceLine(324,55,0,__PYX_ERR(0, 324, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_threadid_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_threadidn);
@@ -10985,15 +9635,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_threadidn = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":375
+  /* "hunter/_event.pyx":325
  *     event._stdlib = self.stdlib_getter()
  *     event._threadidn = self.threadid_getter()
  *     event._threadname = self.threadname_getter()             # <<<<<<<<<<<<<<
  *     event._instruction = self.instruction_getter()
  * 
 */
-  __Pyx_TraceLine(375,60,0,__PYX_ERR(0, 375, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_threadname_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_TraceLine(325,60,0,__PYX_ERR(0, 325, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_threadname_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 325, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_threadname);
@@ -11001,15 +9651,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_threadname = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":376
+  /* "hunter/_event.pyx":326
  *     event._threadidn = self.threadid_getter()
  *     event._threadname = self.threadname_getter()
  *     event._instruction = self.instruction_getter()             # <<<<<<<<<<<<<<
  * 
  *     if value_filter:
 */
-  __Pyx_TraceLine(376,65,0,__PYX_ERR(0, 376, __pyx_L1_error))
-  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_instruction_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_TraceLine(326,65,0,__PYX_ERR(0, 326, __pyx_L1_error))
+  __pyx_t_2 = __pyx_f_6hunter_6_event_5Event_instruction_getter(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 326, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
   __Pyx_GOTREF(__pyx_v_event->_instruction);
@@ -11017,36 +9667,36 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_instruction = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":378
+  /* "hunter/_event.pyx":328
  *     event._instruction = self.instruction_getter()
  * 
  *     if value_filter:             # <<<<<<<<<<<<<<
  *         event._globals = {key: value_filter(value) for key, value in self.globals.items()}
  *         event._locals = {key: value_filter(value) for key, value in self.locals.items()}
 */
-  __Pyx_TraceLine(378,67,0,__PYX_ERR(0, 378, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_value_filter); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_TraceLine(328,67,0,__PYX_ERR(0, 328, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_value_filter); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 328, __pyx_L1_error)
   if (__pyx_t_3) {
 
-    /* "hunter/_event.pyx":379
+    /* "hunter/_event.pyx":329
  * 
  *     if value_filter:
  *         event._globals = {key: value_filter(value) for key, value in self.globals.items()}             # <<<<<<<<<<<<<<
  *         event._locals = {key: value_filter(value) for key, value in self.locals.items()}
  *         event.arg = value_filter(self.arg)
 */
-    __Pyx_TraceLine(379,70,0,__PYX_ERR(0, 379, __pyx_L1_error))
+    __Pyx_TraceLine(329,70,0,__PYX_ERR(0, 329, __pyx_L1_error))
     { /* enter inner scope */
-      __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 379, __pyx_L6_error)
+      __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 329, __pyx_L6_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_t_4 = 0;
-      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 379, __pyx_L6_error)
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_globals); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 329, __pyx_L6_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (unlikely(__pyx_t_7 == Py_None)) {
         PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
-        __PYX_ERR(0, 379, __pyx_L6_error)
+        __PYX_ERR(0, 329, __pyx_L6_error)
       }
-      __pyx_t_8 = __Pyx_dict_iterator(__pyx_t_7, 0, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_5), (&__pyx_t_6)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 379, __pyx_L6_error)
+      __pyx_t_8 = __Pyx_dict_iterator(__pyx_t_7, 0, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_5), (&__pyx_t_6)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 329, __pyx_L6_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_XDECREF(__pyx_t_1);
@@ -11055,7 +9705,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
       while (1) {
         __pyx_t_9 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_5, &__pyx_t_4, &__pyx_t_8, &__pyx_t_7, NULL, __pyx_t_6);
         if (unlikely(__pyx_t_9 == 0)) break;
-        if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(0, 379, __pyx_L6_error)
+        if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(0, 329, __pyx_L6_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_key, __pyx_t_8);
@@ -11082,10 +9732,10 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
           __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_10, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
           __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 379, __pyx_L6_error)
+          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 329, __pyx_L6_error)
           __Pyx_GOTREF(__pyx_t_7);
         }
-        if (unlikely(PyDict_SetItem(__pyx_t_2, (PyObject*)__pyx_7genexpr__pyx_v_key, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 379, __pyx_L6_error)
+        if (unlikely(PyDict_SetItem(__pyx_t_2, (PyObject*)__pyx_7genexpr__pyx_v_key, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 329, __pyx_L6_error)
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -11104,25 +9754,25 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     __pyx_v_event->_globals = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":380
+    /* "hunter/_event.pyx":330
  *     if value_filter:
  *         event._globals = {key: value_filter(value) for key, value in self.globals.items()}
  *         event._locals = {key: value_filter(value) for key, value in self.locals.items()}             # <<<<<<<<<<<<<<
  *         event.arg = value_filter(self.arg)
  *     else:
 */
-    __Pyx_TraceLine(380,84,0,__PYX_ERR(0, 380, __pyx_L1_error))
+    __Pyx_TraceLine(330,84,0,__PYX_ERR(0, 330, __pyx_L1_error))
     { /* enter inner scope */
-      __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 380, __pyx_L12_error)
+      __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L12_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_t_5 = 0;
-      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_locals); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 380, __pyx_L12_error)
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_locals); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 330, __pyx_L12_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (unlikely(__pyx_t_7 == Py_None)) {
         PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
-        __PYX_ERR(0, 380, __pyx_L12_error)
+        __PYX_ERR(0, 330, __pyx_L12_error)
       }
-      __pyx_t_10 = __Pyx_dict_iterator(__pyx_t_7, 0, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_4), (&__pyx_t_6)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 380, __pyx_L12_error)
+      __pyx_t_10 = __Pyx_dict_iterator(__pyx_t_7, 0, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_4), (&__pyx_t_6)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 330, __pyx_L12_error)
       __Pyx_GOTREF(__pyx_t_10);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_XDECREF(__pyx_t_1);
@@ -11131,7 +9781,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
       while (1) {
         __pyx_t_9 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_4, &__pyx_t_5, &__pyx_t_10, &__pyx_t_7, NULL, __pyx_t_6);
         if (unlikely(__pyx_t_9 == 0)) break;
-        if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(0, 380, __pyx_L12_error)
+        if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(0, 330, __pyx_L12_error)
         __Pyx_GOTREF(__pyx_t_10);
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_key, __pyx_t_10);
@@ -11158,10 +9808,10 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
           __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 380, __pyx_L12_error)
+          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 330, __pyx_L12_error)
           __Pyx_GOTREF(__pyx_t_7);
         }
-        if (unlikely(PyDict_SetItem(__pyx_t_2, (PyObject*)__pyx_8genexpr1__pyx_v_key, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 380, __pyx_L12_error)
+        if (unlikely(PyDict_SetItem(__pyx_t_2, (PyObject*)__pyx_8genexpr1__pyx_v_key, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 330, __pyx_L12_error)
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -11180,14 +9830,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     __pyx_v_event->_locals = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":381
+    /* "hunter/_event.pyx":331
  *         event._globals = {key: value_filter(value) for key, value in self.globals.items()}
  *         event._locals = {key: value_filter(value) for key, value in self.locals.items()}
  *         event.arg = value_filter(self.arg)             # <<<<<<<<<<<<<<
  *     else:
  *         event._globals = {}
 */
-    __Pyx_TraceLine(381,99,0,__PYX_ERR(0, 381, __pyx_L1_error))
+    __Pyx_TraceLine(331,99,0,__PYX_ERR(0, 331, __pyx_L1_error))
     __pyx_t_1 = NULL;
     __Pyx_INCREF(__pyx_v_value_filter);
     __pyx_t_7 = __pyx_v_value_filter; 
@@ -11208,7 +9858,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 381, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
     __Pyx_GIVEREF(__pyx_t_2);
@@ -11217,7 +9867,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     __pyx_v_event->arg = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":378
+    /* "hunter/_event.pyx":328
  *     event._instruction = self.instruction_getter()
  * 
  *     if value_filter:             # <<<<<<<<<<<<<<
@@ -11227,16 +9877,16 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     goto __pyx_L3;
   }
 
-  /* "hunter/_event.pyx":383
+  /* "hunter/_event.pyx":333
  *         event.arg = value_filter(self.arg)
  *     else:
  *         event._globals = {}             # <<<<<<<<<<<<<<
  *         event._locals = {}
  *         event.arg = None
 */
-  __Pyx_TraceLine(383,102,0,__PYX_ERR(0, 383, __pyx_L1_error))
+  __Pyx_TraceLine(333,102,0,__PYX_ERR(0, 333, __pyx_L1_error))
   /*else*/ {
-    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 383, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 333, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
     __Pyx_GOTREF(__pyx_v_event->_globals);
@@ -11244,15 +9894,15 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     __pyx_v_event->_globals = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":384
+    /* "hunter/_event.pyx":334
  *     else:
  *         event._globals = {}
  *         event._locals = {}             # <<<<<<<<<<<<<<
  *         event.arg = None
  * 
 */
-    __Pyx_TraceLine(384,107,0,__PYX_ERR(0, 384, __pyx_L1_error))
-    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_TraceLine(334,107,0,__PYX_ERR(0, 334, __pyx_L1_error))
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 334, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
     __Pyx_GOTREF(__pyx_v_event->_locals);
@@ -11260,14 +9910,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
     __pyx_v_event->_locals = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "hunter/_event.pyx":385
+    /* "hunter/_event.pyx":335
  *         event._globals = {}
  *         event._locals = {}
  *         event.arg = None             # <<<<<<<<<<<<<<
  * 
  *     event.builtin = self.builtin
 */
-    __Pyx_TraceLine(385,108,0,__PYX_ERR(0, 385, __pyx_L1_error))
+    __Pyx_TraceLine(335,108,0,__PYX_ERR(0, 335, __pyx_L1_error))
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
     __Pyx_GOTREF(__pyx_v_event->arg);
@@ -11276,14 +9926,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   }
   __pyx_L3:;
 
-  /* "hunter/_event.pyx":387
+  /* "hunter/_event.pyx":337
  *         event.arg = None
  * 
  *     event.builtin = self.builtin             # <<<<<<<<<<<<<<
  *     event.calls = self.calls
  *     event.depth = self.depth
 */
-  __Pyx_TraceLine(387,114,0,__PYX_ERR(0, 387, __pyx_L1_error))
+  __Pyx_TraceLine(337,114,0,__PYX_ERR(0, 337, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->builtin;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11292,46 +9942,46 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->builtin = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":388
+  /* "hunter/_event.pyx":338
  * 
  *     event.builtin = self.builtin
  *     event.calls = self.calls             # <<<<<<<<<<<<<<
  *     event.depth = self.depth
  *     event.detached = True
 */
-  __Pyx_TraceLine(388,118,0,__PYX_ERR(0, 388, __pyx_L1_error))
+  __Pyx_TraceLine(338,118,0,__PYX_ERR(0, 338, __pyx_L1_error))
   __pyx_t_6 = __pyx_v_self->calls;
   __pyx_v_event->calls = __pyx_t_6;
 
-  /* "hunter/_event.pyx":389
+  /* "hunter/_event.pyx":339
  *     event.builtin = self.builtin
  *     event.calls = self.calls
  *     event.depth = self.depth             # <<<<<<<<<<<<<<
  *     event.detached = True
  *     event.kind = self.kind
 */
-  __Pyx_TraceLine(389,122,0,__PYX_ERR(0, 389, __pyx_L1_error))
+  __Pyx_TraceLine(339,122,0,__PYX_ERR(0, 339, __pyx_L1_error))
   __pyx_t_6 = __pyx_v_self->depth;
   __pyx_v_event->depth = __pyx_t_6;
 
-  /* "hunter/_event.pyx":390
+  /* "hunter/_event.pyx":340
  *     event.calls = self.calls
  *     event.depth = self.depth
  *     event.detached = True             # <<<<<<<<<<<<<<
  *     event.kind = self.kind
  *     event.threading_support = self.threading_support
 */
-  __Pyx_TraceLine(390,123,0,__PYX_ERR(0, 390, __pyx_L1_error))
+  __Pyx_TraceLine(340,123,0,__PYX_ERR(0, 340, __pyx_L1_error))
   __pyx_v_event->detached = 1;
 
-  /* "hunter/_event.pyx":391
+  /* "hunter/_event.pyx":341
  *     event.depth = self.depth
  *     event.detached = True
  *     event.kind = self.kind             # <<<<<<<<<<<<<<
  *     event.threading_support = self.threading_support
  * 
 */
-  __Pyx_TraceLine(391,129,0,__PYX_ERR(0, 391, __pyx_L1_error))
+  __Pyx_TraceLine(341,129,0,__PYX_ERR(0, 341, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->kind;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11340,32 +9990,32 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->kind = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":392
+  /* "hunter/_event.pyx":342
  *     event.detached = True
  *     event.kind = self.kind
  *     event.threading_support = self.threading_support             # <<<<<<<<<<<<<<
  * 
  *     return event
 */
-  __Pyx_TraceLine(392,133,0,__PYX_ERR(0, 392, __pyx_L1_error))
+  __Pyx_TraceLine(342,133,0,__PYX_ERR(0, 342, __pyx_L1_error))
   __pyx_t_3 = __pyx_v_self->threading_support;
   __pyx_v_event->threading_support = __pyx_t_3;
 
-  /* "hunter/_event.pyx":394
+  /* "hunter/_event.pyx":344
  *     event.threading_support = self.threading_support
  * 
  *     return event             # <<<<<<<<<<<<<<
  * 
  * cdef inline Event fast_clone(Event self):
 */
-  __Pyx_TraceLine(394,134,0,__PYX_ERR(0, 394, __pyx_L1_error))
+  __Pyx_TraceLine(344,134,0,__PYX_ERR(0, 344, __pyx_L1_error))
   __Pyx_XDECREF((PyObject *)__pyx_r);
   __Pyx_INCREF((PyObject *)__pyx_v_event);
   __pyx_r = __pyx_v_event;
-  __Pyx_TraceReturnValue((PyObject *)__pyx_r, 134, 0, __PYX_ERR(0, 394, __pyx_L1_error));
+  __Pyx_TraceReturnValue((PyObject *)__pyx_r, 134, 0, __PYX_ERR(0, 344, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":362
+  /* "hunter/_event.pyx":312
  * 
  * 
  * cdef inline Event fast_detach(Event self, object value_filter):             # <<<<<<<<<<<<<<
@@ -11384,7 +10034,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 362, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 312, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.fast_detach", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -11400,7 +10050,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   return __pyx_r;
 }
 
-/* "hunter/_event.pyx":396
+/* "hunter/_event.pyx":346
  *     return event
  * 
  * cdef inline Event fast_clone(Event self):             # <<<<<<<<<<<<<<
@@ -11420,19 +10070,19 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[43]))
+  __Pyx_TraceFrameInit(((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[45]))
   __Pyx_RefNannySetupContext("fast_clone", 0);
-  __Pyx_TraceStartFunc("fast_clone", __pyx_f[0], 396, 0, 0, 0, __PYX_ERR(0, 396, __pyx_L1_error));
+  __Pyx_TraceStartFunc("fast_clone", __pyx_f[0], 346, 0, 0, 0, __PYX_ERR(0, 346, __pyx_L1_error));
 
-  /* "hunter/_event.pyx":397
+  /* "hunter/_event.pyx":347
  * 
  * cdef inline Event fast_clone(Event self):
  *     event = <Event> Event.__new__(Event)             # <<<<<<<<<<<<<<
  *     event.arg = self.arg
  *     event.builtin = self.builtin
 */
-  __Pyx_TraceLine(397,5,0,__PYX_ERR(0, 397, __pyx_L1_error))
-  __pyx_t_1 = ((PyObject *)__pyx_tp_new_6hunter_6_event_Event(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_TraceLine(347,5,0,__PYX_ERR(0, 347, __pyx_L1_error))
+  __pyx_t_1 = ((PyObject *)__pyx_tp_new_6hunter_6_event_Event(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 347, __pyx_L1_error)
   __Pyx_GOTREF((PyObject *)__pyx_t_1);
   __pyx_t_2 = ((PyObject *)__pyx_t_1);
   __Pyx_INCREF(__pyx_t_2);
@@ -11440,14 +10090,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event = ((struct __pyx_obj_6hunter_6_event_Event *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":398
+  /* "hunter/_event.pyx":348
  * cdef inline Event fast_clone(Event self):
  *     event = <Event> Event.__new__(Event)
  *     event.arg = self.arg             # <<<<<<<<<<<<<<
  *     event.builtin = self.builtin
  *     event.calls = self.calls
 */
-  __Pyx_TraceLine(398,10,0,__PYX_ERR(0, 398, __pyx_L1_error))
+  __Pyx_TraceLine(348,10,0,__PYX_ERR(0, 348, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->arg;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11456,14 +10106,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->arg = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":399
+  /* "hunter/_event.pyx":349
  *     event = <Event> Event.__new__(Event)
  *     event.arg = self.arg
  *     event.builtin = self.builtin             # <<<<<<<<<<<<<<
  *     event.calls = self.calls
  *     event.depth = self.depth
 */
-  __Pyx_TraceLine(399,14,0,__PYX_ERR(0, 399, __pyx_L1_error))
+  __Pyx_TraceLine(349,14,0,__PYX_ERR(0, 349, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->builtin;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11472,46 +10122,46 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->builtin = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":400
+  /* "hunter/_event.pyx":350
  *     event.arg = self.arg
  *     event.builtin = self.builtin
  *     event.calls = self.calls             # <<<<<<<<<<<<<<
  *     event.depth = self.depth
  *     event.detached = False
 */
-  __Pyx_TraceLine(400,18,0,__PYX_ERR(0, 400, __pyx_L1_error))
+  __Pyx_TraceLine(350,18,0,__PYX_ERR(0, 350, __pyx_L1_error))
   __pyx_t_3 = __pyx_v_self->calls;
   __pyx_v_event->calls = __pyx_t_3;
 
-  /* "hunter/_event.pyx":401
+  /* "hunter/_event.pyx":351
  *     event.builtin = self.builtin
  *     event.calls = self.calls
  *     event.depth = self.depth             # <<<<<<<<<<<<<<
  *     event.detached = False
  *     event.frame = self.frame
 */
-  __Pyx_TraceLine(401,22,0,__PYX_ERR(0, 401, __pyx_L1_error))
+  __Pyx_TraceLine(351,22,0,__PYX_ERR(0, 351, __pyx_L1_error))
   __pyx_t_3 = __pyx_v_self->depth;
   __pyx_v_event->depth = __pyx_t_3;
 
-  /* "hunter/_event.pyx":402
+  /* "hunter/_event.pyx":352
  *     event.calls = self.calls
  *     event.depth = self.depth
  *     event.detached = False             # <<<<<<<<<<<<<<
  *     event.frame = self.frame
  *     event.kind = self.kind
 */
-  __Pyx_TraceLine(402,23,0,__PYX_ERR(0, 402, __pyx_L1_error))
+  __Pyx_TraceLine(352,23,0,__PYX_ERR(0, 352, __pyx_L1_error))
   __pyx_v_event->detached = 0;
 
-  /* "hunter/_event.pyx":403
+  /* "hunter/_event.pyx":353
  *     event.depth = self.depth
  *     event.detached = False
  *     event.frame = self.frame             # <<<<<<<<<<<<<<
  *     event.kind = self.kind
  *     event.threading_support = self.threading_support
 */
-  __Pyx_TraceLine(403,29,0,__PYX_ERR(0, 403, __pyx_L1_error))
+  __Pyx_TraceLine(353,29,0,__PYX_ERR(0, 353, __pyx_L1_error))
   __pyx_t_2 = ((PyObject *)__pyx_v_self->frame);
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11520,14 +10170,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->frame = ((FrameType)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":404
+  /* "hunter/_event.pyx":354
  *     event.detached = False
  *     event.frame = self.frame
  *     event.kind = self.kind             # <<<<<<<<<<<<<<
  *     event.threading_support = self.threading_support
  *     event._code = self._code
 */
-  __Pyx_TraceLine(404,33,0,__PYX_ERR(0, 404, __pyx_L1_error))
+  __Pyx_TraceLine(354,33,0,__PYX_ERR(0, 354, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->kind;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11536,25 +10186,25 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->kind = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":405
+  /* "hunter/_event.pyx":355
  *     event.frame = self.frame
  *     event.kind = self.kind
  *     event.threading_support = self.threading_support             # <<<<<<<<<<<<<<
  *     event._code = self._code
  *     event._filename = self._filename
 */
-  __Pyx_TraceLine(405,37,0,__PYX_ERR(0, 405, __pyx_L1_error))
+  __Pyx_TraceLine(355,37,0,__PYX_ERR(0, 355, __pyx_L1_error))
   __pyx_t_4 = __pyx_v_self->threading_support;
   __pyx_v_event->threading_support = __pyx_t_4;
 
-  /* "hunter/_event.pyx":406
+  /* "hunter/_event.pyx":356
  *     event.kind = self.kind
  *     event.threading_support = self.threading_support
  *     event._code = self._code             # <<<<<<<<<<<<<<
  *     event._filename = self._filename
  *     event._fullsource = self._fullsource
 */
-  __Pyx_TraceLine(406,41,0,__PYX_ERR(0, 406, __pyx_L1_error))
+  __Pyx_TraceLine(356,41,0,__PYX_ERR(0, 356, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_code;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11563,14 +10213,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_code = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":407
+  /* "hunter/_event.pyx":357
  *     event.threading_support = self.threading_support
  *     event._code = self._code
  *     event._filename = self._filename             # <<<<<<<<<<<<<<
  *     event._fullsource = self._fullsource
  *     event._function_object = self._function_object
 */
-  __Pyx_TraceLine(407,45,0,__PYX_ERR(0, 407, __pyx_L1_error))
+  __Pyx_TraceLine(357,45,0,__PYX_ERR(0, 357, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_filename;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11579,14 +10229,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_filename = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":408
+  /* "hunter/_event.pyx":358
  *     event._code = self._code
  *     event._filename = self._filename
  *     event._fullsource = self._fullsource             # <<<<<<<<<<<<<<
  *     event._function_object = self._function_object
  *     event._function = self._function
 */
-  __Pyx_TraceLine(408,49,0,__PYX_ERR(0, 408, __pyx_L1_error))
+  __Pyx_TraceLine(358,49,0,__PYX_ERR(0, 358, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_fullsource;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11595,14 +10245,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_fullsource = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":409
+  /* "hunter/_event.pyx":359
  *     event._filename = self._filename
  *     event._fullsource = self._fullsource
  *     event._function_object = self._function_object             # <<<<<<<<<<<<<<
  *     event._function = self._function
  *     event._globals = self._globals
 */
-  __Pyx_TraceLine(409,53,0,__PYX_ERR(0, 409, __pyx_L1_error))
+  __Pyx_TraceLine(359,53,0,__PYX_ERR(0, 359, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_function_object;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11611,14 +10261,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_function_object = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":410
+  /* "hunter/_event.pyx":360
  *     event._fullsource = self._fullsource
  *     event._function_object = self._function_object
  *     event._function = self._function             # <<<<<<<<<<<<<<
  *     event._globals = self._globals
  *     event._lineno = self._lineno
 */
-  __Pyx_TraceLine(410,57,0,__PYX_ERR(0, 410, __pyx_L1_error))
+  __Pyx_TraceLine(360,57,0,__PYX_ERR(0, 360, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_function;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11627,14 +10277,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_function = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":411
+  /* "hunter/_event.pyx":361
  *     event._function_object = self._function_object
  *     event._function = self._function
  *     event._globals = self._globals             # <<<<<<<<<<<<<<
  *     event._lineno = self._lineno
  *     event._locals = self._locals
 */
-  __Pyx_TraceLine(411,61,0,__PYX_ERR(0, 411, __pyx_L1_error))
+  __Pyx_TraceLine(361,61,0,__PYX_ERR(0, 361, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_globals;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11643,14 +10293,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_globals = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":412
+  /* "hunter/_event.pyx":362
  *     event._function = self._function
  *     event._globals = self._globals
  *     event._lineno = self._lineno             # <<<<<<<<<<<<<<
  *     event._locals = self._locals
  *     event._module = self._module
 */
-  __Pyx_TraceLine(412,65,0,__PYX_ERR(0, 412, __pyx_L1_error))
+  __Pyx_TraceLine(362,65,0,__PYX_ERR(0, 362, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_lineno;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11659,14 +10309,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_lineno = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":413
+  /* "hunter/_event.pyx":363
  *     event._globals = self._globals
  *     event._lineno = self._lineno
  *     event._locals = self._locals             # <<<<<<<<<<<<<<
  *     event._module = self._module
  *     event._source = self._source
 */
-  __Pyx_TraceLine(413,69,0,__PYX_ERR(0, 413, __pyx_L1_error))
+  __Pyx_TraceLine(363,69,0,__PYX_ERR(0, 363, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_locals;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11675,14 +10325,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_locals = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":414
+  /* "hunter/_event.pyx":364
  *     event._lineno = self._lineno
  *     event._locals = self._locals
  *     event._module = self._module             # <<<<<<<<<<<<<<
  *     event._source = self._source
  *     event._stdlib = self._stdlib
 */
-  __Pyx_TraceLine(414,73,0,__PYX_ERR(0, 414, __pyx_L1_error))
+  __Pyx_TraceLine(364,73,0,__PYX_ERR(0, 364, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_module;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11691,14 +10341,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_module = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":415
+  /* "hunter/_event.pyx":365
  *     event._locals = self._locals
  *     event._module = self._module
  *     event._source = self._source             # <<<<<<<<<<<<<<
  *     event._stdlib = self._stdlib
  *     event._threadidn = self._threadidn
 */
-  __Pyx_TraceLine(415,77,0,__PYX_ERR(0, 415, __pyx_L1_error))
+  __Pyx_TraceLine(365,77,0,__PYX_ERR(0, 365, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_source;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11707,14 +10357,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_source = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":416
+  /* "hunter/_event.pyx":366
  *     event._module = self._module
  *     event._source = self._source
  *     event._stdlib = self._stdlib             # <<<<<<<<<<<<<<
  *     event._threadidn = self._threadidn
  *     event._threadname = self._threadname
 */
-  __Pyx_TraceLine(416,81,0,__PYX_ERR(0, 416, __pyx_L1_error))
+  __Pyx_TraceLine(366,81,0,__PYX_ERR(0, 366, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_stdlib;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11723,14 +10373,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_stdlib = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":417
+  /* "hunter/_event.pyx":367
  *     event._source = self._source
  *     event._stdlib = self._stdlib
  *     event._threadidn = self._threadidn             # <<<<<<<<<<<<<<
  *     event._threadname = self._threadname
  *     event._thread = self._thread
 */
-  __Pyx_TraceLine(417,85,0,__PYX_ERR(0, 417, __pyx_L1_error))
+  __Pyx_TraceLine(367,85,0,__PYX_ERR(0, 367, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_threadidn;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11739,14 +10389,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_threadidn = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":418
+  /* "hunter/_event.pyx":368
  *     event._stdlib = self._stdlib
  *     event._threadidn = self._threadidn
  *     event._threadname = self._threadname             # <<<<<<<<<<<<<<
  *     event._thread = self._thread
  *     event._instruction = self._instruction
 */
-  __Pyx_TraceLine(418,89,0,__PYX_ERR(0, 418, __pyx_L1_error))
+  __Pyx_TraceLine(368,89,0,__PYX_ERR(0, 368, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_threadname;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11755,14 +10405,14 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_threadname = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":419
+  /* "hunter/_event.pyx":369
  *     event._threadidn = self._threadidn
  *     event._threadname = self._threadname
  *     event._thread = self._thread             # <<<<<<<<<<<<<<
  *     event._instruction = self._instruction
  *     return event
 */
-  __Pyx_TraceLine(419,93,0,__PYX_ERR(0, 419, __pyx_L1_error))
+  __Pyx_TraceLine(369,93,0,__PYX_ERR(0, 369, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_thread;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11771,13 +10421,13 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_thread = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":420
+  /* "hunter/_event.pyx":370
  *     event._threadname = self._threadname
  *     event._thread = self._thread
  *     event._instruction = self._instruction             # <<<<<<<<<<<<<<
  *     return event
 */
-  __Pyx_TraceLine(420,97,0,__PYX_ERR(0, 420, __pyx_L1_error))
+  __Pyx_TraceLine(370,97,0,__PYX_ERR(0, 370, __pyx_L1_error))
   __pyx_t_2 = __pyx_v_self->_instruction;
   __Pyx_INCREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -11786,19 +10436,19 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   __pyx_v_event->_instruction = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":421
+  /* "hunter/_event.pyx":371
  *     event._thread = self._thread
  *     event._instruction = self._instruction
  *     return event             # <<<<<<<<<<<<<<
 */
-  __Pyx_TraceLine(421,98,0,__PYX_ERR(0, 421, __pyx_L1_error))
+  __Pyx_TraceLine(371,98,0,__PYX_ERR(0, 371, __pyx_L1_error))
   __Pyx_XDECREF((PyObject *)__pyx_r);
   __Pyx_INCREF((PyObject *)__pyx_v_event);
   __pyx_r = __pyx_v_event;
-  __Pyx_TraceReturnValue((PyObject *)__pyx_r, 98, 0, __PYX_ERR(0, 421, __pyx_L1_error));
+  __Pyx_TraceReturnValue((PyObject *)__pyx_r, 98, 0, __PYX_ERR(0, 371, __pyx_L1_error));
   goto __pyx_L0;
 
-  /* "hunter/_event.pyx":396
+  /* "hunter/_event.pyx":346
  *     return event
  * 
  * cdef inline Event fast_clone(Event self):             # <<<<<<<<<<<<<<
@@ -11814,7 +10464,7 @@ static CYTHON_INLINE struct __pyx_obj_6hunter_6_event_Event *__pyx_f_6hunter_6_e
   #if CYTHON_USE_SYS_MONITORING
   __Pyx_TraceExceptionUnwind(0, 0);
   #else
-  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 396, __pyx_L1_error));
+  __Pyx_TraceReturnValue(NULL, 0, 0, __PYX_ERR(0, 346, __pyx_L1_error));
   #endif
   __Pyx_AddTraceback("hunter._event.fast_clone", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
@@ -11835,8 +10485,18 @@ static PyObject *__pyx_tp_new_6hunter_6_event_Event(PyTypeObject *t, CYTHON_UNUS
   allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
   o = alloc_func(t, 0);
   #else
-  o = (*t->tp_alloc)(t, 0);
-  if (unlikely(!o)) return 0;
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_mstate_global->__pyx_freecount_6hunter_6_event_Event > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_6hunter_6_event_Event)))) {
+    o = (PyObject*)__pyx_mstate_global->__pyx_freelist_6hunter_6_event_Event[--__pyx_mstate_global->__pyx_freecount_6hunter_6_event_Event];
+    memset(o, 0, sizeof(struct __pyx_obj_6hunter_6_event_Event));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else
+  #endif
+  {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
   #endif
   p = ((struct __pyx_obj_6hunter_6_event_Event *)o);
   p->__pyx_vtab = __pyx_vtabptr_6hunter_6_event_Event;
@@ -11884,14 +10544,21 @@ static void __pyx_tp_dealloc_6hunter_6_event_Event(PyObject *o) {
   Py_CLEAR(p->_threadidn);
   Py_CLEAR(p->_threadname);
   Py_CLEAR(p->_instruction);
-  #if CYTHON_USE_TYPE_SLOTS
-  (*Py_TYPE(o)->tp_free)(o);
-  #else
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_mstate_global->__pyx_freecount_6hunter_6_event_Event < 64) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_6hunter_6_event_Event)))) {
+    __pyx_mstate_global->__pyx_freelist_6hunter_6_event_Event[__pyx_mstate_global->__pyx_freecount_6hunter_6_event_Event++] = ((struct __pyx_obj_6hunter_6_event_Event *)o);
+  } else
+  #endif
   {
-    freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
-    if (tp_free) tp_free(o);
+    #if CYTHON_USE_TYPE_SLOTS
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
   }
-  #endif
 }
 
 static int __pyx_tp_traverse_6hunter_6_event_Event(PyObject *o, visitproc v, void *a) {
@@ -12294,220 +10961,36 @@ static PyTypeObject __pyx_type_6hunter_6_event_Event = {
 };
 #endif
 
-static PyObject *__pyx_tp_new_6hunter_6_event___pyx_scope_struct__yield_lines(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  PyObject *o;
-  #if CYTHON_COMPILING_IN_LIMITED_API
-  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
-  o = alloc_func(t, 0);
-  #else
-  #if CYTHON_USE_FREELISTS
-  if (likely((int)(__pyx_mstate_global->__pyx_freecount_6hunter_6_event___pyx_scope_struct__yield_lines > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines)))) {
-    o = (PyObject*)__pyx_mstate_global->__pyx_freelist_6hunter_6_event___pyx_scope_struct__yield_lines[--__pyx_mstate_global->__pyx_freecount_6hunter_6_event___pyx_scope_struct__yield_lines];
-    memset(o, 0, sizeof(struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines));
-    (void) PyObject_INIT(o, t);
-    PyObject_GC_Track(o);
-  } else
-  #endif
-  {
-    o = (*t->tp_alloc)(t, 0);
-    if (unlikely(!o)) return 0;
-  }
-  #endif
-  return o;
-}
-
-static void __pyx_tp_dealloc_6hunter_6_event___pyx_scope_struct__yield_lines(PyObject *o) {
-  struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *p = (struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_6hunter_6_event___pyx_scope_struct__yield_lines) {
-      if (PyObject_CallFinalizerFromDealloc(o)) return;
-    }
-  }
-  #endif
-  PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->__pyx_v_collector);
-  Py_CLEAR(p->__pyx_v_dedent);
-  Py_CLEAR(p->__pyx_v_filename);
-  Py_CLEAR(p->__pyx_v_limit);
-  Py_CLEAR(p->__pyx_v_line);
-  Py_CLEAR(p->__pyx_v_module_globals);
-  Py_CLEAR(p->__pyx_v_start);
-  Py_CLEAR(p->__pyx_t_0);
-  #if CYTHON_USE_FREELISTS
-  if (((int)(__pyx_mstate_global->__pyx_freecount_6hunter_6_event___pyx_scope_struct__yield_lines < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines)))) {
-    __pyx_mstate_global->__pyx_freelist_6hunter_6_event___pyx_scope_struct__yield_lines[__pyx_mstate_global->__pyx_freecount_6hunter_6_event___pyx_scope_struct__yield_lines++] = ((struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)o);
-  } else
-  #endif
-  {
-    #if CYTHON_USE_TYPE_SLOTS
-    (*Py_TYPE(o)->tp_free)(o);
-    #else
-    {
-      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
-      if (tp_free) tp_free(o);
-    }
-    #endif
-  }
-}
-
-static int __pyx_tp_traverse_6hunter_6_event___pyx_scope_struct__yield_lines(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *p = (struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines *)o;
-  {
-    e = __Pyx_call_type_traverse(o, 1, v, a);
-    if (e) return e;
-  }
-  if (p->__pyx_v_collector) {
-    e = (*v)(p->__pyx_v_collector, a); if (e) return e;
-  }
-  if (p->__pyx_v_dedent) {
-    e = (*v)(p->__pyx_v_dedent, a); if (e) return e;
-  }
-  if (p->__pyx_v_filename) {
-    e = (*v)(p->__pyx_v_filename, a); if (e) return e;
-  }
-  if (p->__pyx_v_limit) {
-    e = (*v)(p->__pyx_v_limit, a); if (e) return e;
-  }
-  if (p->__pyx_v_line) {
-    e = (*v)(p->__pyx_v_line, a); if (e) return e;
-  }
-  if (p->__pyx_v_module_globals) {
-    e = (*v)(p->__pyx_v_module_globals, a); if (e) return e;
-  }
-  if (p->__pyx_v_start) {
-    e = (*v)(p->__pyx_v_start, a); if (e) return e;
-  }
-  if (p->__pyx_t_0) {
-    e = (*v)(p->__pyx_t_0, a); if (e) return e;
-  }
-  return 0;
-}
-#if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_6hunter_6_event___pyx_scope_struct__yield_lines},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_6hunter_6_event___pyx_scope_struct__yield_lines},
-  {Py_tp_new, (void *)__pyx_tp_new_6hunter_6_event___pyx_scope_struct__yield_lines},
-  {0, 0},
-};
-static PyType_Spec __pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines_spec = {
-  "hunter._event.__pyx_scope_struct__yield_lines",
-  sizeof(struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines),
-  0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
-  __pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines_slots,
-};
-#else
-
-static PyTypeObject __pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "hunter._event.""__pyx_scope_struct__yield_lines", /*tp_name*/
-  sizeof(struct __pyx_obj_6hunter_6_event___pyx_scope_struct__yield_lines), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_6hunter_6_event___pyx_scope_struct__yield_lines, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_as_async*/
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_6hunter_6_event___pyx_scope_struct__yield_lines, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  0, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  #if !CYTHON_USE_TYPE_SPECS
-  0, /*tp_dictoffset*/
-  #endif
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_6hunter_6_event___pyx_scope_struct__yield_lines, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if CYTHON_USE_TP_FINALIZE
-  0, /*tp_finalize*/
-  #else
-  NULL, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if __PYX_NEED_TP_PRINT_SLOT == 1
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030C0000
-  0, /*tp_watched*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030d00A4
-  0, /*tp_versions_used*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-#endif
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-/* #### Code section: initfunc_declarations ### */
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
-/* #### Code section: init_module ### */
-
-static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
-  /*--- Global init code ---*/
-  __pyx_v_6hunter_6_event_UNSET = Py_None; Py_INCREF(Py_None);
-  __pyx_v_6hunter_6_event_CALL = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  __pyx_v_6hunter_6_event_EXCEPTION = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  __pyx_v_6hunter_6_event_LINE = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  __pyx_v_6hunter_6_event_RETURN = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  __Pyx_RefNannyFinishContext();
-  return 0;
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_6hunter_6_event_UNSET = Py_None; Py_INCREF(Py_None);
+  __pyx_v_6hunter_6_event_CALL = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __pyx_v_6hunter_6_event_EXCEPTION = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __pyx_v_6hunter_6_event_LINE = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __pyx_v_6hunter_6_event_RETURN = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
 }
 
 static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
@@ -12527,6 +11010,7 @@ static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
   /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("fast_event", (void (*)(void))__pyx_f_6hunter_6_event_fast_event, "struct __pyx_obj_6hunter_6_event_Event *(FrameType, int, PyObject *, int, int, int)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ExportFunction("fast_clone", (void (*)(void))__pyx_f_6hunter_6_event_fast_clone, "struct __pyx_obj_6hunter_6_event_Event *(struct __pyx_obj_6hunter_6_event_Event *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ExportFunction("fast_detach", (void (*)(void))__pyx_f_6hunter_6_event_fast_detach, "struct __pyx_obj_6hunter_6_event_Event *(struct __pyx_obj_6hunter_6_event_Event *, PyObject *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
@@ -12571,40 +11055,24 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_vtable_6hunter_6_event_Event.threadname_getter = (PyObject *(*)(struct __pyx_obj_6hunter_6_event_Event *))__pyx_f_6hunter_6_event_5Event_threadname_getter;
   __pyx_vtable_6hunter_6_event_Event.instruction_getter = (PyObject *(*)(struct __pyx_obj_6hunter_6_event_Event *))__pyx_f_6hunter_6_event_5Event_instruction_getter;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_6hunter_6_event_Event = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6hunter_6_event_Event_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_6hunter_6_event_Event)) __PYX_ERR(0, 46, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6hunter_6_event_Event_spec, __pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_6hunter_6_event_Event = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6hunter_6_event_Event_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_6hunter_6_event_Event)) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6hunter_6_event_Event_spec, __pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_6hunter_6_event_Event = &__pyx_type_6hunter_6_event_Event;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_6hunter_6_event_Event->tp_dictoffset && __pyx_mstate->__pyx_ptype_6hunter_6_event_Event->tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_mstate->__pyx_ptype_6hunter_6_event_Event->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event, __pyx_vtabptr_6hunter_6_event_Event) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_Event, (PyObject *) __pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
-  #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines)) __PYX_ERR(0, 347, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines_spec, __pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines) < 0) __PYX_ERR(0, 347, __pyx_L1_error)
-  #else
-  __pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines = &__pyx_type_6hunter_6_event___pyx_scope_struct__yield_lines;
-  #endif
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  #endif
-  #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines) < 0) __PYX_ERR(0, 347, __pyx_L1_error)
-  #endif
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines->tp_dictoffset && __pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines->tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_mstate->__pyx_ptype_6hunter_6_event___pyx_scope_struct__yield_lines->tp_getattro = PyObject_GenericGetAttr;
-  }
-  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event, __pyx_vtabptr_6hunter_6_event_Event) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_Event, (PyObject *) __pyx_mstate->__pyx_ptype_6hunter_6_event_Event) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -12952,402 +11420,307 @@ __Pyx_RefNannySetupContext("PyInit__event", 0);
   /* "hunter/_event.pyx":4
  * cimport cython
  * 
- * from functools import partial             # <<<<<<<<<<<<<<
- * from linecache import getline
+ * from linecache import getline             # <<<<<<<<<<<<<<
  * from linecache import getlines
+ * from os.path import basename
 */
   __Pyx_TraceLine(4,4,0,__PYX_ERR(0, 4, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_partial); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_functools, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_linecache, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_partial); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_partial, __pyx_t_2) < 0) __PYX_ERR(0, 4, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_getline, __pyx_t_2) < 0) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "hunter/_event.pyx":5
  * 
- * from functools import partial
- * from linecache import getline             # <<<<<<<<<<<<<<
- * from linecache import getlines
+ * from linecache import getline
+ * from linecache import getlines             # <<<<<<<<<<<<<<
  * from os.path import basename
+ * from os.path import splitext
 */
   __Pyx_TraceLine(5,7,0,__PYX_ERR(0, 5, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_linecache, __pyx_t_3, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_getline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_getline, __pyx_t_3) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_getlines, __pyx_t_3) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "hunter/_event.pyx":6
- * from functools import partial
- * from linecache import getline
- * from linecache import getlines             # <<<<<<<<<<<<<<
- * from os.path import basename
- * from os.path import exists
-*/
-  __Pyx_TraceLine(6,10,0,__PYX_ERR(0, 6, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_linecache, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_getlines); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_getlines, __pyx_t_2) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "hunter/_event.pyx":7
  * from linecache import getline
  * from linecache import getlines
  * from os.path import basename             # <<<<<<<<<<<<<<
- * from os.path import exists
- * from os.path import splitext
-*/
-  __Pyx_TraceLine(7,13,0,__PYX_ERR(0, 7, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_os_path, __pyx_t_3, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_basename, __pyx_t_3) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "hunter/_event.pyx":8
- * from linecache import getlines
- * from os.path import basename
- * from os.path import exists             # <<<<<<<<<<<<<<
  * from os.path import splitext
  * from threading import current_thread
 */
-  __Pyx_TraceLine(8,16,0,__PYX_ERR(0, 8, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_exists); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_TraceLine(6,10,0,__PYX_ERR(0, 6, __pyx_L1_error))
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_os_path, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_os_path, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_exists); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_basename); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_exists, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_basename, __pyx_t_2) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":9
+  /* "hunter/_event.pyx":7
+ * from linecache import getlines
  * from os.path import basename
- * from os.path import exists
  * from os.path import splitext             # <<<<<<<<<<<<<<
  * from threading import current_thread
- * from tokenize import TokenError
+ * 
 */
-  __Pyx_TraceLine(9,19,0,__PYX_ERR(0, 9, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_TraceLine(7,13,0,__PYX_ERR(0, 7, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_os_path, __pyx_t_3, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_os_path, __pyx_t_3, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_splitext); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_splitext, __pyx_t_3) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_splitext, __pyx_t_3) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":10
- * from os.path import exists
+  /* "hunter/_event.pyx":8
+ * from os.path import basename
  * from os.path import splitext
  * from threading import current_thread             # <<<<<<<<<<<<<<
- * from tokenize import TokenError
- * from tokenize import generate_tokens
-*/
-  __Pyx_TraceLine(10,22,0,__PYX_ERR(0, 10, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_threading, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_current_thread, __pyx_t_2) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "hunter/_event.pyx":11
- * from os.path import splitext
- * from threading import current_thread
- * from tokenize import TokenError             # <<<<<<<<<<<<<<
- * from tokenize import generate_tokens
- * 
-*/
-  __Pyx_TraceLine(11,25,0,__PYX_ERR(0, 11, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_TokenError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 11, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_tokenize, __pyx_t_3, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 11, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_TokenError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 11, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_TokenError, __pyx_t_3) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "hunter/_event.pyx":12
- * from threading import current_thread
- * from tokenize import TokenError
- * from tokenize import generate_tokens             # <<<<<<<<<<<<<<
  * 
  * from cpython.pythread cimport PyThread_get_thread_ident
 */
-  __Pyx_TraceLine(12,28,0,__PYX_ERR(0, 12, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_generate_tokens); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_TraceLine(8,16,0,__PYX_ERR(0, 8, __pyx_L1_error))
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_tokenize, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_threading, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_generate_tokens); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_current_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_generate_tokens, __pyx_t_2) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_current_thread, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":17
+  /* "hunter/_event.pyx":13
  * from cpython.ref cimport PyObject
  * 
- * from .const import SITE_PACKAGES_PATHS             # <<<<<<<<<<<<<<
- * from .const import SYS_PREFIX_PATHS
- * from .util import CYTHON_SUFFIX_RE
-*/
-  __Pyx_TraceLine(17,33,0,__PYX_ERR(0, 17, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_SITE_PACKAGES_PATHS); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 17, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_const, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_SITE_PACKAGES_PATHS); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 17, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_SITE_PACKAGES_PATHS, __pyx_t_3) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "hunter/_event.pyx":18
- * 
- * from .const import SITE_PACKAGES_PATHS
- * from .const import SYS_PREFIX_PATHS             # <<<<<<<<<<<<<<
- * from .util import CYTHON_SUFFIX_RE
- * from .util import LEADING_WHITESPACE_RE
-*/
-  __Pyx_TraceLine(18,36,0,__PYX_ERR(0, 18, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_SYS_PREFIX_PATHS); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_const, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_SYS_PREFIX_PATHS); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_SYS_PREFIX_PATHS, __pyx_t_2) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "hunter/_event.pyx":19
- * from .const import SITE_PACKAGES_PATHS
- * from .const import SYS_PREFIX_PATHS
- * from .util import CYTHON_SUFFIX_RE             # <<<<<<<<<<<<<<
- * from .util import LEADING_WHITESPACE_RE
+ * from .util import get_code_fields             # <<<<<<<<<<<<<<
+ * from .util import get_fullsource
  * from .util import get_func_in_mro
 */
-  __Pyx_TraceLine(19,39,0,__PYX_ERR(0, 19, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_CYTHON_SUFFIX_RE); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_TraceLine(13,21,0,__PYX_ERR(0, 13, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_code_fields); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_CYTHON_SUFFIX_RE); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get_code_fields); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 13, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_CYTHON_SUFFIX_RE, __pyx_t_3) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_code_fields, __pyx_t_3) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":20
- * from .const import SYS_PREFIX_PATHS
- * from .util import CYTHON_SUFFIX_RE
- * from .util import LEADING_WHITESPACE_RE             # <<<<<<<<<<<<<<
+  /* "hunter/_event.pyx":14
+ * 
+ * from .util import get_code_fields
+ * from .util import get_fullsource             # <<<<<<<<<<<<<<
  * from .util import get_func_in_mro
  * from .util import get_main_thread
 */
-  __Pyx_TraceLine(20,42,0,__PYX_ERR(0, 20, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_LEADING_WHITESPACE_RE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_TraceLine(14,24,0,__PYX_ERR(0, 14, __pyx_L1_error))
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_fullsource); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_LEADING_WHITESPACE_RE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_get_fullsource); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_LEADING_WHITESPACE_RE, __pyx_t_2) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_fullsource, __pyx_t_2) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":21
- * from .util import CYTHON_SUFFIX_RE
- * from .util import LEADING_WHITESPACE_RE
+  /* "hunter/_event.pyx":15
+ * from .util import get_code_fields
+ * from .util import get_fullsource
  * from .util import get_func_in_mro             # <<<<<<<<<<<<<<
  * from .util import get_main_thread
  * from .util import if_same_code
 */
-  __Pyx_TraceLine(21,45,0,__PYX_ERR(0, 21, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __Pyx_TraceLine(15,27,0,__PYX_ERR(0, 15, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 15, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 15, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get_func_in_mro); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 15, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_func_in_mro, __pyx_t_3) < 0) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_func_in_mro, __pyx_t_3) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":22
- * from .util import LEADING_WHITESPACE_RE
+  /* "hunter/_event.pyx":16
+ * from .util import get_fullsource
  * from .util import get_func_in_mro
  * from .util import get_main_thread             # <<<<<<<<<<<<<<
  * from .util import if_same_code
- * 
+ * from .util import yield_lines as yield_source_lines
 */
-  __Pyx_TraceLine(22,48,0,__PYX_ERR(0, 22, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_TraceLine(16,30,0,__PYX_ERR(0, 16, __pyx_L1_error))
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_get_main_thread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_main_thread, __pyx_t_2) < 0) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_main_thread, __pyx_t_2) < 0) __PYX_ERR(0, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":23
+  /* "hunter/_event.pyx":17
  * from .util import get_func_in_mro
  * from .util import get_main_thread
  * from .util import if_same_code             # <<<<<<<<<<<<<<
+ * from .util import yield_lines as yield_source_lines
  * 
- * __all__ = 'Event',
 */
-  __Pyx_TraceLine(23,51,0,__PYX_ERR(0, 23, __pyx_L1_error))
-  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_TraceLine(17,33,0,__PYX_ERR(0, 17, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_if_same_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_if_same_code, __pyx_t_3) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_if_same_code, __pyx_t_3) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hunter/_event.pyx":25
+  /* "hunter/_event.pyx":18
+ * from .util import get_main_thread
  * from .util import if_same_code
+ * from .util import yield_lines as yield_source_lines             # <<<<<<<<<<<<<<
+ * 
+ * __all__ = 'Event',
+*/
+  __Pyx_TraceLine(18,36,0,__PYX_ERR(0, 18, __pyx_L1_error))
+  __pyx_t_2 = __Pyx_PyList_Pack(1, __pyx_mstate_global->__pyx_n_u_yield_lines); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_util, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_yield_lines); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_yield_source_lines, __pyx_t_2) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "hunter/_event.pyx":20
+ * from .util import yield_lines as yield_source_lines
  * 
  * __all__ = 'Event',             # <<<<<<<<<<<<<<
  * 
  * cdef object UNSET = object()
 */
-  __Pyx_TraceLine(25,53,0,__PYX_ERR(0, 25, __pyx_L1_error))
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_all, __pyx_mstate_global->__pyx_tuple[4]) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_TraceLine(20,38,0,__PYX_ERR(0, 20, __pyx_L1_error))
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_all, __pyx_mstate_global->__pyx_tuple[2]) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
 
-  /* "hunter/_event.pyx":27
+  /* "hunter/_event.pyx":22
  * __all__ = 'Event',
  * 
  * cdef object UNSET = object()             # <<<<<<<<<<<<<<
  * 
  * 
 */
-  __Pyx_TraceLine(27,56,0,__PYX_ERR(0, 27, __pyx_L1_error))
-  __pyx_t_3 = NULL;
+  __Pyx_TraceLine(22,41,0,__PYX_ERR(0, 22, __pyx_L1_error))
+  __pyx_t_2 = NULL;
   __Pyx_INCREF(__pyx_builtin_object);
   __pyx_t_4 = __pyx_builtin_object; 
   __pyx_t_5 = 1;
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 22, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
   }
   __Pyx_XGOTREF(__pyx_v_6hunter_6_event_UNSET);
-  __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_UNSET, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_UNSET, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":30
+  /* "hunter/_event.pyx":25
  * 
  * 
  * cdef str CALL = 'call'             # <<<<<<<<<<<<<<
  * cdef str EXCEPTION = 'exception'
  * cdef str LINE = 'line'
 */
-  __Pyx_TraceLine(30,57,0,__PYX_ERR(0, 30, __pyx_L1_error))
+  __Pyx_TraceLine(25,42,0,__PYX_ERR(0, 25, __pyx_L1_error))
   __Pyx_INCREF(__pyx_mstate_global->__pyx_n_u_call);
   __Pyx_XGOTREF(__pyx_v_6hunter_6_event_CALL);
   __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_CALL, __pyx_mstate_global->__pyx_n_u_call);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_n_u_call);
 
-  /* "hunter/_event.pyx":31
+  /* "hunter/_event.pyx":26
  * 
  * cdef str CALL = 'call'
  * cdef str EXCEPTION = 'exception'             # <<<<<<<<<<<<<<
  * cdef str LINE = 'line'
  * cdef str RETURN = 'return'
 */
-  __Pyx_TraceLine(31,59,0,__PYX_ERR(0, 31, __pyx_L1_error))
+  __Pyx_TraceLine(26,44,0,__PYX_ERR(0, 26, __pyx_L1_error))
   __Pyx_INCREF(__pyx_mstate_global->__pyx_n_u_exception);
   __Pyx_XGOTREF(__pyx_v_6hunter_6_event_EXCEPTION);
   __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_EXCEPTION, __pyx_mstate_global->__pyx_n_u_exception);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_n_u_exception);
 
-  /* "hunter/_event.pyx":32
+  /* "hunter/_event.pyx":27
  * cdef str CALL = 'call'
  * cdef str EXCEPTION = 'exception'
  * cdef str LINE = 'line'             # <<<<<<<<<<<<<<
  * cdef str RETURN = 'return'
  * 
 */
-  __Pyx_TraceLine(32,61,0,__PYX_ERR(0, 32, __pyx_L1_error))
+  __Pyx_TraceLine(27,46,0,__PYX_ERR(0, 27, __pyx_L1_error))
   __Pyx_INCREF(__pyx_mstate_global->__pyx_n_u_line);
   __Pyx_XGOTREF(__pyx_v_6hunter_6_event_LINE);
   __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_LINE, __pyx_mstate_global->__pyx_n_u_line);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_n_u_line);
 
-  /* "hunter/_event.pyx":33
+  /* "hunter/_event.pyx":28
  * cdef str EXCEPTION = 'exception'
  * cdef str LINE = 'line'
  * cdef str RETURN = 'return'             # <<<<<<<<<<<<<<
  * 
  * cdef const PyObject** KIND_NAMES = [
 */
-  __Pyx_TraceLine(33,63,0,__PYX_ERR(0, 33, __pyx_L1_error))
+  __Pyx_TraceLine(28,48,0,__PYX_ERR(0, 28, __pyx_L1_error))
   __Pyx_INCREF(__pyx_mstate_global->__pyx_n_u_return);
   __Pyx_XGOTREF(__pyx_v_6hunter_6_event_RETURN);
   __Pyx_DECREF_SET(__pyx_v_6hunter_6_event_RETURN, __pyx_mstate_global->__pyx_n_u_return);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_n_u_return);
 
-  /* "hunter/_event.pyx":35
+  /* "hunter/_event.pyx":30
  * cdef str RETURN = 'return'
  * 
  * cdef const PyObject** KIND_NAMES = [             # <<<<<<<<<<<<<<
  *     <PyObject*>CALL,
  *     <PyObject*>EXCEPTION,
 */
-  __Pyx_TraceLine(35,66,0,__PYX_ERR(0, 35, __pyx_L1_error))
+  __Pyx_TraceLine(30,51,0,__PYX_ERR(0, 30, __pyx_L1_error))
   __pyx_t_6[0] = ((PyObject *)__pyx_v_6hunter_6_event_CALL);
   __pyx_t_6[1] = ((PyObject *)__pyx_v_6hunter_6_event_EXCEPTION);
   __pyx_t_6[2] = ((PyObject *)__pyx_v_6hunter_6_event_LINE);
@@ -13357,195 +11730,215 @@ __Pyx_RefNannySetupContext("PyInit__event", 0);
   __pyx_t_6[6] = ((PyObject *)__pyx_v_6hunter_6_event_RETURN);
   __pyx_v_6hunter_6_event_KIND_NAMES = __pyx_t_6;
 
-  /* "hunter/_event.pyx":93
+  /* "hunter/_event.pyx":68
  *         return self is other
  * 
  *     def detach(self, value_filter=None):             # <<<<<<<<<<<<<<
  *         return fast_detach(self, value_filter)
  * 
 */
-  __Pyx_TraceLine(93,93,0,__PYX_ERR(0, 93, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_5Event_7detach, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Event_detach, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[5]);
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event, __pyx_mstate_global->__pyx_n_u_detach, __pyx_t_2) < 0) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_TraceLine(68,78,0,__PYX_ERR(0, 68, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_5Event_7detach, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Event_detach, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_mstate_global->__pyx_tuple[3]);
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event, __pyx_mstate_global->__pyx_n_u_detach, __pyx_t_3) < 0) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":96
+  /* "hunter/_event.pyx":71
  *         return fast_detach(self, value_filter)
  * 
  *     def clone(self):             # <<<<<<<<<<<<<<
  *         return fast_clone(self)
  * 
 */
-  __Pyx_TraceLine(96,95,0,__PYX_ERR(0, 96, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_5Event_9clone, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Event_clone, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event, __pyx_mstate_global->__pyx_n_u_clone, __pyx_t_2) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_TraceLine(71,80,0,__PYX_ERR(0, 71, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_5Event_9clone, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_Event_clone, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_6hunter_6_event_Event, __pyx_mstate_global->__pyx_n_u_clone, __pyx_t_3) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hunter/_event.pyx":99
+  /* "hunter/_event.pyx":74
  *         return fast_clone(self)
  * 
  *     cdef inline instruction_getter(self):             # <<<<<<<<<<<<<<
  *         cdef int position
  * 
 */
-  __Pyx_TraceLine(99,96,0,__PYX_ERR(0, 99, __pyx_L1_error))
+  __Pyx_TraceLine(74,81,0,__PYX_ERR(0, 74, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":115
+  /* "hunter/_event.pyx":90
  *         return self.instruction_getter()
  * 
  *     cdef inline threadid_getter(self):             # <<<<<<<<<<<<<<
  *         cdef long current
  * 
 */
-  __Pyx_TraceLine(115,98,0,__PYX_ERR(0, 115, __pyx_L1_error))
+  __Pyx_TraceLine(90,83,0,__PYX_ERR(0, 90, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":131
+  /* "hunter/_event.pyx":106
  *         return self.threadid_getter()
  * 
  *     cdef inline threadname_getter(self):             # <<<<<<<<<<<<<<
  *         if self._threadname is UNSET:
  *             if self._thread is UNSET:
 */
-  __Pyx_TraceLine(131,100,0,__PYX_ERR(0, 131, __pyx_L1_error))
+  __Pyx_TraceLine(106,85,0,__PYX_ERR(0, 106, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":142
+  /* "hunter/_event.pyx":117
  *         return self.threadname_getter()
  * 
  *     cdef inline locals_getter(self):             # <<<<<<<<<<<<<<
  *         if self._locals is UNSET:
  *             if self.builtin:
 */
-  __Pyx_TraceLine(142,102,0,__PYX_ERR(0, 142, __pyx_L1_error))
+  __Pyx_TraceLine(117,87,0,__PYX_ERR(0, 117, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":154
+  /* "hunter/_event.pyx":129
  *         return self.locals_getter()
  * 
  *     cdef inline globals_getter(self):             # <<<<<<<<<<<<<<
  *         if self._globals is UNSET:
  *             if self.builtin:
 */
-  __Pyx_TraceLine(154,104,0,__PYX_ERR(0, 154, __pyx_L1_error))
+  __Pyx_TraceLine(129,89,0,__PYX_ERR(0, 129, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":166
+  /* "hunter/_event.pyx":141
  *         return self.globals_getter()
  * 
  *     cdef inline function_getter(self):             # <<<<<<<<<<<<<<
  *         if self._function is UNSET:
  *             if self.builtin:
 */
-  __Pyx_TraceLine(166,106,0,__PYX_ERR(0, 166, __pyx_L1_error))
+  __Pyx_TraceLine(141,91,0,__PYX_ERR(0, 141, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":209
+  /* "hunter/_event.pyx":184
  *         return self._function_object
  * 
  *     cdef inline module_getter(self):             # <<<<<<<<<<<<<<
  *         if self._module is UNSET:
  *             if self.builtin:
 */
-  __Pyx_TraceLine(209,109,0,__PYX_ERR(0, 209, __pyx_L1_error))
+  __Pyx_TraceLine(184,94,0,__PYX_ERR(0, 184, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":224
+  /* "hunter/_event.pyx":199
  *         return self.module_getter()
  * 
  *     cdef inline filename_getter(self):             # <<<<<<<<<<<<<<
- *         cdef CodeType code
  *         if self._filename is UNSET:
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
-  __Pyx_TraceLine(224,111,0,__PYX_ERR(0, 224, __pyx_L1_error))
+  __Pyx_TraceLine(199,96,0,__PYX_ERR(0, 199, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":250
+  /* "hunter/_event.pyx":208
  *         return self.filename_getter()
  * 
  *     cdef inline lineno_getter(self):             # <<<<<<<<<<<<<<
  *         if self._lineno is UNSET:
  *             self._lineno = Hunter_PyFrame_GetLineNumber(self.frame)
 */
-  __Pyx_TraceLine(250,113,0,__PYX_ERR(0, 250, __pyx_L1_error))
+  __Pyx_TraceLine(208,98,0,__PYX_ERR(0, 208, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":259
+  /* "hunter/_event.pyx":217
  *         return self.lineno_getter()
  * 
  *     cdef inline CodeType code_getter(self):             # <<<<<<<<<<<<<<
  *         if self._code is UNSET:
  *             return Hunter_PyFrame_GetCode(self.frame)
 */
-  __Pyx_TraceLine(259,115,0,__PYX_ERR(0, 259, __pyx_L1_error))
+  __Pyx_TraceLine(217,100,0,__PYX_ERR(0, 217, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":269
+  /* "hunter/_event.pyx":227
  *         return self.code_getter()
  * 
  *     cdef inline stdlib_getter(self):             # <<<<<<<<<<<<<<
  *         if self._stdlib is UNSET:
- *             module_parts = self.module.split('.')
+ *             self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
 */
-  __Pyx_TraceLine(269,117,0,__PYX_ERR(0, 269, __pyx_L1_error))
+  __Pyx_TraceLine(227,102,0,__PYX_ERR(0, 227, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":291
+  /* "hunter/_event.pyx":236
  *         return self.stdlib_getter()
  * 
  *     cdef inline fullsource_getter(self):             # <<<<<<<<<<<<<<
- *         cdef list lines
  *         cdef CodeType code
+ * 
 */
-  __Pyx_TraceLine(291,119,0,__PYX_ERR(0, 291, __pyx_L1_error))
+  __Pyx_TraceLine(236,104,0,__PYX_ERR(0, 236, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":328
+  /* "hunter/_event.pyx":254
  *         return self.fullsource_getter()
  * 
  *     cdef inline source_getter(self):             # <<<<<<<<<<<<<<
  *         if self._source is UNSET:
  *             if self.filename.endswith(('.so', '.pyd')):
 */
-  __Pyx_TraceLine(328,121,0,__PYX_ERR(0, 328, __pyx_L1_error))
+  __Pyx_TraceLine(254,106,0,__PYX_ERR(0, 254, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":347
+  /* "hunter/_event.pyx":273
  * 
  * 
- * def yield_lines(filename, module_globals, start, list collector,             # <<<<<<<<<<<<<<
- *                 limit=10):
- *     dedent = None
+ * cdef inline void init_event(Event event, FrameType frame, int kind, object arg, int depth, int calls,             # <<<<<<<<<<<<<<
+ *                             bint threading_support) noexcept:
+ *     event.arg = arg
 */
-  __Pyx_TraceLine(347,124,0,__PYX_ERR(0, 347, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_1yield_lines, 0, __pyx_mstate_global->__pyx_n_u_yield_lines, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[41])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 347, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[6]);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_yield_lines, __pyx_t_2) < 0) __PYX_ERR(0, 347, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_TraceLine(273,109,0,__PYX_ERR(0, 273, __pyx_L1_error))
 
-  /* "hunter/_event.pyx":362
+
+  /* "hunter/_event.pyx":301
+ * 
+ * 
+ * cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):             # <<<<<<<<<<<<<<
+ *     event = <Event> Event.__new__(Event)
+ *     init_event(event, frame, kind, arg, depth, calls, threading_support)
+*/
+  __Pyx_TraceLine(301,110,0,__PYX_ERR(0, 301, __pyx_L1_error))
+
+
+  /* "hunter/_event.pyx":307
+ * 
+ * 
+ * def yield_lines(filename, module_globals, start, list collector, limit=10):             # <<<<<<<<<<<<<<
+ *     # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+ *     return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)
+*/
+  __Pyx_TraceLine(307,111,0,__PYX_ERR(0, 307, __pyx_L1_error))
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6hunter_6_event_1yield_lines, 0, __pyx_mstate_global->__pyx_n_u_yield_lines, NULL, __pyx_mstate_global->__pyx_n_u_hunter__event, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[43])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_mstate_global->__pyx_tuple[4]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_yield_lines, __pyx_t_3) < 0) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "hunter/_event.pyx":312
  * 
  * 
  * cdef inline Event fast_detach(Event self, object value_filter):             # <<<<<<<<<<<<<<
  *     event = <Event> Event.__new__(Event)
  * 
 */
-  __Pyx_TraceLine(362,126,0,__PYX_ERR(0, 362, __pyx_L1_error))
+  __Pyx_TraceLine(312,113,0,__PYX_ERR(0, 312, __pyx_L1_error))
 
 
-  /* "hunter/_event.pyx":396
+  /* "hunter/_event.pyx":346
  *     return event
  * 
  * cdef inline Event fast_clone(Event self):             # <<<<<<<<<<<<<<
  *     event = <Event> Event.__new__(Event)
  *     event.arg = self.arg
 */
-  __Pyx_TraceLine(396,127,0,__PYX_ERR(0, 396, __pyx_L1_error))
+  __Pyx_TraceLine(346,114,0,__PYX_ERR(0, 346, __pyx_L1_error))
 
 
   /* "hunter/_event.pyx":1
@@ -13554,10 +11947,10 @@ __Pyx_RefNannySetupContext("PyInit__event", 0);
  * 
 */
   __Pyx_TraceLine(1,0,0,__PYX_ERR(0, 1, __pyx_L1_error))
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_TraceReturnValue(Py_None, 0, 0, __PYX_ERR(0, 1, __pyx_L1_error));
   __Pyx_PyMonitoring_ExitScope(0);
 
@@ -13625,29 +12018,24 @@ static const char * const __pyx_string_tab_encodings[] = { 0 };
 static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_, sizeof(__pyx_k_), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_ */
   {__pyx_k_CALL, sizeof(__pyx_k_CALL), 0, 1, 1}, /* PyObject cname: __pyx_n_u_CALL */
-  {__pyx_k_CYTHON_SUFFIX_RE, sizeof(__pyx_k_CYTHON_SUFFIX_RE), 0, 1, 1}, /* PyObject cname: __pyx_n_u_CYTHON_SUFFIX_RE */
   {__pyx_k_EXCEPTION, sizeof(__pyx_k_EXCEPTION), 0, 1, 1}, /* PyObject cname: __pyx_n_u_EXCEPTION */
   {__pyx_k_Event, sizeof(__pyx_k_Event), 0, 1, 1}, /* PyObject cname: __pyx_n_u_Event */
   {__pyx_k_Event_clone, sizeof(__pyx_k_Event_clone), 0, 1, 1}, /* PyObject cname: __pyx_n_u_Event_clone */
   {__pyx_k_Event_detach, sizeof(__pyx_k_Event_detach), 0, 1, 1}, /* PyObject cname: __pyx_n_u_Event_detach */
   {__pyx_k_Event_kind, sizeof(__pyx_k_Event_kind), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Event_kind */
   {__pyx_k_KIND_NAMES, sizeof(__pyx_k_KIND_NAMES), 0, 1, 1}, /* PyObject cname: __pyx_n_u_KIND_NAMES */
-  {__pyx_k_LEADING_WHITESPACE_RE, sizeof(__pyx_k_LEADING_WHITESPACE_RE), 0, 1, 1}, /* PyObject cname: __pyx_n_u_LEADING_WHITESPACE_RE */
   {__pyx_k_LINE, sizeof(__pyx_k_LINE), 0, 1, 1}, /* PyObject cname: __pyx_n_u_LINE */
   {__pyx_k_NO_SOURCE, sizeof(__pyx_k_NO_SOURCE), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_NO_SOURCE */
   {__pyx_k_NO_SOURCE_not_reading_binary, sizeof(__pyx_k_NO_SOURCE_not_reading_binary), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_NO_SOURCE_not_reading_binary */
   {__pyx_k_Note_that_Cython_is_deliberately, sizeof(__pyx_k_Note_that_Cython_is_deliberately), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Note_that_Cython_is_deliberately */
   {__pyx_k_RETURN, sizeof(__pyx_k_RETURN), 0, 1, 1}, /* PyObject cname: __pyx_n_u_RETURN */
-  {__pyx_k_SITE_PACKAGES_PATHS, sizeof(__pyx_k_SITE_PACKAGES_PATHS), 0, 1, 1}, /* PyObject cname: __pyx_n_u_SITE_PACKAGES_PATHS */
-  {__pyx_k_SYS_PREFIX_PATHS, sizeof(__pyx_k_SYS_PREFIX_PATHS), 0, 1, 1}, /* PyObject cname: __pyx_n_u_SYS_PREFIX_PATHS */
-  {__pyx_k_TokenError, sizeof(__pyx_k_TokenError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_TokenError */
   {__pyx_k_UNSET, sizeof(__pyx_k_UNSET), 0, 1, 1}, /* PyObject cname: __pyx_n_u_UNSET */
   {__pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__2 */
   {__pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__3 */
   {__pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__4 */
   {__pyx_k_add_note, sizeof(__pyx_k_add_note), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_add_note */
   {__pyx_k_all, sizeof(__pyx_k_all), 0, 1, 1}, /* PyObject cname: __pyx_n_u_all */
-  {__pyx_k_amount, sizeof(__pyx_k_amount), 0, 1, 1}, /* PyObject cname: __pyx_n_u_amount */
+  {__pyx_k_append, sizeof(__pyx_k_append), 0, 1, 1}, /* PyObject cname: __pyx_n_u_append */
   {__pyx_k_arg, sizeof(__pyx_k_arg), 0, 1, 1}, /* PyObject cname: __pyx_n_u_arg */
   {__pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_asyncio_coroutines */
   {__pyx_k_basename, sizeof(__pyx_k_basename), 0, 1, 1}, /* PyObject cname: __pyx_n_u_basename */
@@ -13655,18 +12043,13 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_call, sizeof(__pyx_k_call), 0, 1, 1}, /* PyObject cname: __pyx_n_u_call */
   {__pyx_k_calls, sizeof(__pyx_k_calls), 0, 1, 1}, /* PyObject cname: __pyx_n_u_calls */
   {__pyx_k_candidate, sizeof(__pyx_k_candidate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_candidate */
-  {__pyx_k_class, sizeof(__pyx_k_class), 0, 1, 1}, /* PyObject cname: __pyx_n_u_class */
   {__pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_cline_in_traceback */
   {__pyx_k_clone, sizeof(__pyx_k_clone), 0, 1, 1}, /* PyObject cname: __pyx_n_u_clone */
-  {__pyx_k_close, sizeof(__pyx_k_close), 0, 1, 1}, /* PyObject cname: __pyx_n_u_close */
   {__pyx_k_code, sizeof(__pyx_k_code), 0, 1, 1}, /* PyObject cname: __pyx_n_u_code */
   {__pyx_k_code_2, sizeof(__pyx_k_code_2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_code_2 */
   {__pyx_k_code_getter, sizeof(__pyx_k_code_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_code_getter */
   {__pyx_k_collector, sizeof(__pyx_k_collector), 0, 1, 1}, /* PyObject cname: __pyx_n_u_collector */
-  {__pyx_k_const, sizeof(__pyx_k_const), 0, 1, 1}, /* PyObject cname: __pyx_n_u_const */
   {__pyx_k_current_thread, sizeof(__pyx_k_current_thread), 0, 1, 1}, /* PyObject cname: __pyx_n_u_current_thread */
-  {__pyx_k_dedent, sizeof(__pyx_k_dedent), 0, 1, 1}, /* PyObject cname: __pyx_n_u_dedent */
-  {__pyx_k_def, sizeof(__pyx_k_def), 0, 1, 1}, /* PyObject cname: __pyx_n_u_def */
   {__pyx_k_depth, sizeof(__pyx_k_depth), 0, 1, 1}, /* PyObject cname: __pyx_n_u_depth */
   {__pyx_k_detach, sizeof(__pyx_k_detach), 0, 1, 1}, /* PyObject cname: __pyx_n_u_detach */
   {__pyx_k_detached, sizeof(__pyx_k_detached), 0, 1, 1}, /* PyObject cname: __pyx_n_u_detached */
@@ -13674,18 +12057,16 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_enable */
   {__pyx_k_endswith, sizeof(__pyx_k_endswith), 0, 1, 1}, /* PyObject cname: __pyx_n_u_endswith */
   {__pyx_k_eq, sizeof(__pyx_k_eq), 0, 1, 1}, /* PyObject cname: __pyx_n_u_eq */
+  {__pyx_k_event, sizeof(__pyx_k_event), 0, 1, 1}, /* PyObject cname: __pyx_n_u_event */
   {__pyx_k_exception, sizeof(__pyx_k_exception), 0, 1, 1}, /* PyObject cname: __pyx_n_u_exception */
-  {__pyx_k_exists, sizeof(__pyx_k_exists), 0, 1, 1}, /* PyObject cname: __pyx_n_u_exists */
-  {__pyx_k_f_globals, sizeof(__pyx_k_f_globals), 0, 1, 1}, /* PyObject cname: __pyx_n_u_f_globals */
   {__pyx_k_fast_clone, sizeof(__pyx_k_fast_clone), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fast_clone */
   {__pyx_k_fast_detach, sizeof(__pyx_k_fast_detach), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fast_detach */
-  {__pyx_k_file, sizeof(__pyx_k_file), 0, 1, 1}, /* PyObject cname: __pyx_n_u_file */
-  {__pyx_k_file_2, sizeof(__pyx_k_file_2), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_file_2 */
+  {__pyx_k_fast_event, sizeof(__pyx_k_fast_event), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fast_event */
+  {__pyx_k_file, sizeof(__pyx_k_file), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_file */
   {__pyx_k_filename, sizeof(__pyx_k_filename), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_filename */
   {__pyx_k_filename_2, sizeof(__pyx_k_filename_2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_filename_2 */
   {__pyx_k_filename_3, sizeof(__pyx_k_filename_3), 0, 1, 1}, /* PyObject cname: __pyx_n_u_filename_3 */
   {__pyx_k_filename_getter, sizeof(__pyx_k_filename_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_filename_getter */
-  {__pyx_k_findall, sizeof(__pyx_k_findall), 0, 1, 1}, /* PyObject cname: __pyx_n_u_findall */
   {__pyx_k_first_arg, sizeof(__pyx_k_first_arg), 0, 1, 1}, /* PyObject cname: __pyx_n_u_first_arg */
   {__pyx_k_frame, sizeof(__pyx_k_frame), 0, 1, 1}, /* PyObject cname: __pyx_n_u_frame */
   {__pyx_k_fullsource, sizeof(__pyx_k_fullsource), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fullsource */
@@ -13697,11 +12078,11 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_function_3, sizeof(__pyx_k_function_3), 0, 1, 1}, /* PyObject cname: __pyx_n_u_function_3 */
   {__pyx_k_function_getter, sizeof(__pyx_k_function_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_function_getter */
   {__pyx_k_function_object, sizeof(__pyx_k_function_object), 0, 1, 1}, /* PyObject cname: __pyx_n_u_function_object */
-  {__pyx_k_functools, sizeof(__pyx_k_functools), 0, 1, 1}, /* PyObject cname: __pyx_n_u_functools */
   {__pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_gc */
-  {__pyx_k_generate_tokens, sizeof(__pyx_k_generate_tokens), 0, 1, 1}, /* PyObject cname: __pyx_n_u_generate_tokens */
   {__pyx_k_get, sizeof(__pyx_k_get), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get */
   {__pyx_k_get_2, sizeof(__pyx_k_get_2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_2 */
+  {__pyx_k_get_code_fields, sizeof(__pyx_k_get_code_fields), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_code_fields */
+  {__pyx_k_get_fullsource, sizeof(__pyx_k_get_fullsource), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_fullsource */
   {__pyx_k_get_func_in_mro, sizeof(__pyx_k_get_func_in_mro), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_func_in_mro */
   {__pyx_k_get_main_thread, sizeof(__pyx_k_get_main_thread), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_main_thread */
   {__pyx_k_getitem, sizeof(__pyx_k_getitem), 0, 1, 1}, /* PyObject cname: __pyx_n_u_getitem */
@@ -13714,6 +12095,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_ident, sizeof(__pyx_k_ident), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ident */
   {__pyx_k_if_same_code, sizeof(__pyx_k_if_same_code), 0, 1, 1}, /* PyObject cname: __pyx_n_u_if_same_code */
   {__pyx_k_init, sizeof(__pyx_k_init), 0, 1, 1}, /* PyObject cname: __pyx_n_u_init */
+  {__pyx_k_init_event, sizeof(__pyx_k_init_event), 0, 1, 1}, /* PyObject cname: __pyx_n_u_init_event */
   {__pyx_k_instruction, sizeof(__pyx_k_instruction), 0, 1, 1}, /* PyObject cname: __pyx_n_u_instruction */
   {__pyx_k_instruction_getter, sizeof(__pyx_k_instruction_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_instruction_getter */
   {__pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 1, 1}, /* PyObject cname: __pyx_n_u_is_coroutine */
@@ -13721,7 +12103,6 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_item, sizeof(__pyx_k_item), 0, 1, 1}, /* PyObject cname: __pyx_n_u_item */
   {__pyx_k_items, sizeof(__pyx_k_items), 0, 1, 1}, /* PyObject cname: __pyx_n_u_items */
   {__pyx_k_kind, sizeof(__pyx_k_kind), 0, 1, 1}, /* PyObject cname: __pyx_n_u_kind */
-  {__pyx_k_lambda, sizeof(__pyx_k_lambda), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lambda */
   {__pyx_k_limit, sizeof(__pyx_k_limit), 0, 1, 1}, /* PyObject cname: __pyx_n_u_limit */
   {__pyx_k_line, sizeof(__pyx_k_line), 0, 1, 1}, /* PyObject cname: __pyx_n_u_line */
   {__pyx_k_linecache, sizeof(__pyx_k_linecache), 0, 1, 1}, /* PyObject cname: __pyx_n_u_linecache */
@@ -13742,40 +12123,26 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_module_globals, sizeof(__pyx_k_module_globals), 0, 1, 1}, /* PyObject cname: __pyx_n_u_module_globals */
   {__pyx_k_name, sizeof(__pyx_k_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_name */
   {__pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 1, 1}, /* PyObject cname: __pyx_n_u_name_2 */
-  {__pyx_k_namedtuple, sizeof(__pyx_k_namedtuple), 0, 1, 1}, /* PyObject cname: __pyx_n_u_namedtuple */
-  {__pyx_k_next, sizeof(__pyx_k_next), 0, 1, 1}, /* PyObject cname: __pyx_n_u_next */
   {__pyx_k_object, sizeof(__pyx_k_object), 0, 1, 1}, /* PyObject cname: __pyx_n_u_object */
   {__pyx_k_os_path, sizeof(__pyx_k_os_path), 0, 1, 1}, /* PyObject cname: __pyx_n_u_os_path */
   {__pyx_k_other, sizeof(__pyx_k_other), 0, 1, 1}, /* PyObject cname: __pyx_n_u_other */
-  {__pyx_k_partial, sizeof(__pyx_k_partial), 0, 1, 1}, /* PyObject cname: __pyx_n_u_partial */
-  {__pyx_k_pkg_resources, sizeof(__pyx_k_pkg_resources), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pkg_resources */
   {__pyx_k_pop, sizeof(__pyx_k_pop), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pop */
-  {__pyx_k_py, sizeof(__pyx_k_py), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_py */
-  {__pyx_k_pyc, sizeof(__pyx_k_pyc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_pyc */
   {__pyx_k_pyd, sizeof(__pyx_k_pyd), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_pyd */
-  {__pyx_k_pyo, sizeof(__pyx_k_pyo), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_pyo */
-  {__pyx_k_pyx, sizeof(__pyx_k_pyx), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_pyx */
   {__pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_vtable */
   {__pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 1, 1}, /* PyObject cname: __pyx_n_u_qualname */
   {__pyx_k_repr, sizeof(__pyx_k_repr), 0, 1, 1}, /* PyObject cname: __pyx_n_u_repr */
   {__pyx_k_return, sizeof(__pyx_k_return), 0, 1, 1}, /* PyObject cname: __pyx_n_u_return */
   {__pyx_k_self, sizeof(__pyx_k_self), 0, 1, 1}, /* PyObject cname: __pyx_n_u_self */
-  {__pyx_k_send, sizeof(__pyx_k_send), 0, 1, 1}, /* PyObject cname: __pyx_n_u_send */
   {__pyx_k_set_name, sizeof(__pyx_k_set_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_set_name */
-  {__pyx_k_site, sizeof(__pyx_k_site), 0, 1, 1}, /* PyObject cname: __pyx_n_u_site */
   {__pyx_k_so, sizeof(__pyx_k_so), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_so */
   {__pyx_k_source, sizeof(__pyx_k_source), 0, 1, 1}, /* PyObject cname: __pyx_n_u_source */
   {__pyx_k_source_getter, sizeof(__pyx_k_source_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_source_getter */
-  {__pyx_k_split, sizeof(__pyx_k_split), 0, 1, 1}, /* PyObject cname: __pyx_n_u_split */
   {__pyx_k_splitext, sizeof(__pyx_k_splitext), 0, 1, 1}, /* PyObject cname: __pyx_n_u_splitext */
   {__pyx_k_src_hunter__event_pxd, sizeof(__pyx_k_src_hunter__event_pxd), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_src_hunter__event_pxd */
   {__pyx_k_src_hunter__event_pyx, sizeof(__pyx_k_src_hunter__event_pyx), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_src_hunter__event_pyx */
   {__pyx_k_start, sizeof(__pyx_k_start), 0, 1, 1}, /* PyObject cname: __pyx_n_u_start */
-  {__pyx_k_startswith, sizeof(__pyx_k_startswith), 0, 1, 1}, /* PyObject cname: __pyx_n_u_startswith */
   {__pyx_k_stdlib, sizeof(__pyx_k_stdlib), 0, 1, 1}, /* PyObject cname: __pyx_n_u_stdlib */
   {__pyx_k_stdlib_getter, sizeof(__pyx_k_stdlib_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_stdlib_getter */
-  {__pyx_k_string, sizeof(__pyx_k_string), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_string */
-  {__pyx_k_sub, sizeof(__pyx_k_sub), 0, 1, 1}, /* PyObject cname: __pyx_n_u_sub */
   {__pyx_k_test, sizeof(__pyx_k_test), 0, 1, 1}, /* PyObject cname: __pyx_n_u_test */
   {__pyx_k_thread, sizeof(__pyx_k_thread), 0, 1, 1}, /* PyObject cname: __pyx_n_u_thread */
   {__pyx_k_threadid_getter, sizeof(__pyx_k_threadid_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_threadid_getter */
@@ -13784,14 +12151,12 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_threading_support, sizeof(__pyx_k_threading_support), 0, 1, 1}, /* PyObject cname: __pyx_n_u_threading_support */
   {__pyx_k_threadname, sizeof(__pyx_k_threadname), 0, 1, 1}, /* PyObject cname: __pyx_n_u_threadname */
   {__pyx_k_threadname_getter, sizeof(__pyx_k_threadname_getter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_threadname_getter */
-  {__pyx_k_throw, sizeof(__pyx_k_throw), 0, 1, 1}, /* PyObject cname: __pyx_n_u_throw */
-  {__pyx_k_tokenize, sizeof(__pyx_k_tokenize), 0, 1, 1}, /* PyObject cname: __pyx_n_u_tokenize */
   {__pyx_k_util, sizeof(__pyx_k_util), 0, 1, 1}, /* PyObject cname: __pyx_n_u_util */
   {__pyx_k_v, sizeof(__pyx_k_v), 0, 1, 1}, /* PyObject cname: __pyx_n_u_v */
-  {__pyx_k_value, sizeof(__pyx_k_value), 0, 1, 1}, /* PyObject cname: __pyx_n_u_value */
   {__pyx_k_value_filter, sizeof(__pyx_k_value_filter), 0, 1, 1}, /* PyObject cname: __pyx_n_u_value_filter */
   {__pyx_k_values, sizeof(__pyx_k_values), 0, 1, 1}, /* PyObject cname: __pyx_n_u_values */
   {__pyx_k_yield_lines, sizeof(__pyx_k_yield_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_yield_lines */
+  {__pyx_k_yield_source_lines, sizeof(__pyx_k_yield_source_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_yield_source_lines */
   {0, 0, 0, 0, 0}
 };
 /* InitStrings.proto */
@@ -13801,7 +12166,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry const *t, PyObject **target, c
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_object); if (!__pyx_builtin_object) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_object); if (!__pyx_builtin_object) __PYX_ERR(0, 22, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -13813,93 +12178,60 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "hunter/_event.pyx":214
+  /* "hunter/_event.pyx":189
  *                 module = self.arg.__module__
  *             else:
  *                 module = self.globals.get('__name__', '')             # <<<<<<<<<<<<<<
  *             if module is None:
  *                 module = '?'
 */
-  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_name_2, __pyx_mstate_global->__pyx_kp_u__2); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 214, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_name_2, __pyx_mstate_global->__pyx_kp_u__2); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
 
-  /* "hunter/_event.pyx":233
- *             if not filename:
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):             # <<<<<<<<<<<<<<
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):
+  /* "hunter/_event.pyx":256
+ *     cdef inline source_getter(self):
+ *         if self._source is UNSET:
+ *             if self.filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
+ *                 self._source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
+ *             try:
 */
-  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_kp_u_pyc, __pyx_mstate_global->__pyx_kp_u_pyo); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_kp_u_so, __pyx_mstate_global->__pyx_kp_u_pyd); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 256, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
 
-  /* "hunter/_event.pyx":234
- *                 filename = '?'
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]             # <<<<<<<<<<<<<<
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
-*/
-  __pyx_mstate_global->__pyx_slice[0] = PySlice_New(Py_None, __pyx_mstate_global->__pyx_int_neg_1, Py_None); if (unlikely(!__pyx_mstate_global->__pyx_slice[0])) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_slice[0]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_slice[0]);
-
-  /* "hunter/_event.pyx":235
- *             elif filename.endswith(('.pyc', '.pyo')):
- *                 filename = filename[:-1]
- *             elif filename.endswith(('.so', '.pyd')):             # <<<<<<<<<<<<<<
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):
-*/
-  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_kp_u_so, __pyx_mstate_global->__pyx_kp_u_pyd); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 235, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
-
-  /* "hunter/_event.pyx":237
- *             elif filename.endswith(('.so', '.pyd')):
- *                 cybasename = CYTHON_SUFFIX_RE.sub('', filename)
- *                 for ext in ('.pyx', '.py'):             # <<<<<<<<<<<<<<
- *                     cyfilename = cybasename + ext
- *                     if exists(cyfilename):
-*/
-  __pyx_mstate_global->__pyx_tuple[3] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_kp_u_pyx, __pyx_mstate_global->__pyx_kp_u_py); if (unlikely(!__pyx_mstate_global->__pyx_tuple[3])) __PYX_ERR(0, 237, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[3]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[3]);
-
-  /* "hunter/_event.pyx":25
- * from .util import if_same_code
+  /* "hunter/_event.pyx":20
+ * from .util import yield_lines as yield_source_lines
  * 
  * __all__ = 'Event',             # <<<<<<<<<<<<<<
  * 
  * cdef object UNSET = object()
 */
-  __pyx_mstate_global->__pyx_tuple[4] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_n_u_Event); if (unlikely(!__pyx_mstate_global->__pyx_tuple[4])) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[4]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[4]);
+  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_n_u_Event); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
 
-  /* "hunter/_event.pyx":93
+  /* "hunter/_event.pyx":68
  *         return self is other
  * 
  *     def detach(self, value_filter=None):             # <<<<<<<<<<<<<<
  *         return fast_detach(self, value_filter)
  * 
 */
-  __pyx_mstate_global->__pyx_tuple[5] = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_mstate_global->__pyx_tuple[5])) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[5]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[5]);
+  __pyx_mstate_global->__pyx_tuple[3] = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_mstate_global->__pyx_tuple[3])) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[3]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[3]);
 
-  /* "hunter/_event.pyx":347
+  /* "hunter/_event.pyx":307
  * 
  * 
- * def yield_lines(filename, module_globals, start, list collector,             # <<<<<<<<<<<<<<
- *                 limit=10):
- *     dedent = None
+ * def yield_lines(filename, module_globals, start, list collector, limit=10):             # <<<<<<<<<<<<<<
+ *     # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+ *     return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)
 */
-  __pyx_mstate_global->__pyx_tuple[6] = PyTuple_Pack(1, ((PyObject*)__pyx_mstate_global->__pyx_int_10)); if (unlikely(!__pyx_mstate_global->__pyx_tuple[6])) __PYX_ERR(0, 347, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[6]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[6]);
+  __pyx_mstate_global->__pyx_tuple[4] = PyTuple_Pack(1, ((PyObject*)__pyx_mstate_global->__pyx_int_10)); if (unlikely(!__pyx_mstate_global->__pyx_tuple[4])) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[4]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[4]);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -13913,9 +12245,7 @@ static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
   if (__Pyx_InitStrings(__pyx_string_tab, __pyx_mstate->__pyx_string_tab, __pyx_string_tab_encodings) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_mstate->__pyx_int_1 = PyLong_FromLong(1); if (unlikely(!__pyx_mstate->__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_mstate->__pyx_int_10 = PyLong_FromLong(10); if (unlikely(!__pyx_mstate->__pyx_int_10)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_mstate->__pyx_int_neg_1 = PyLong_FromLong(-1); if (unlikely(!__pyx_mstate->__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -13946,167 +12276,167 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 59, 176};
+    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 57, 21};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_init, __pyx_k_A_G1_IQ_HF_AQ_IQ_IQ_L_KuBa_IQ_M, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_init, __pyx_k_A_6_e7, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 85, 28};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 60, 28};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_repr, __pyx_k_A_q_t_d_4_a, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 90, 11};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 65, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_other};
     __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_eq, __pyx_k_A_uCq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 93, 16};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 68, 16};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_value_filter};
     __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_detach, __pyx_k_6, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 96, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 71, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_clone, __pyx_k_A_z, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 99, 86};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 74, 86};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_instruction_getter, __pyx_k_A_4_S_at1_nAT_Q_xt3ay_a_G1A_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 111, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 86, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_a, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 115, 70};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 90, 70};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_threadid_getter, __pyx_k_A_4_3a_q_uG5_HCt1_N_N_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 127, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 102, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[8] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[8])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 131, 51};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 106, 51};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_threadname_getter, __pyx_k_A_4_Cq_t9Cq_K_Q_t81_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 138, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 113, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 142, 48};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 117, 48};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_locals_getter, __pyx_k_A_4y_1_t1_Kq_K_7q_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 150, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 125, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[12] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[12])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 154, 48};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 129, 48};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[13] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_globals_getter, __pyx_k_A_4z_A_t1_Kq_L_9_a_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[13])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 162, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 137, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[14] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_2, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[14])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 166, 51};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 141, 51};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_function_getter, __pyx_k_A_4_Q_t1_M_T_M_1_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 174, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 149, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 178, 213};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 153, 213};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_code_2, __pyx_mstate->__pyx_n_u_candidate, __pyx_mstate->__pyx_n_u_func_2, __pyx_mstate->__pyx_n_u_first_arg, __pyx_mstate->__pyx_n_u_v};
     __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_4q_4q_3a_4_1_t9Cq_q_HD_Zq_q_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 209, 72};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 184, 72};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_module_getter, __pyx_k_A_4y_1_t1_T_XT_a_wc_1_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 220, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 195, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 224, 157};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 199, 56};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
-    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_filename_getter, __pyx_k_A_4_Q_4_1_t1_t1_4xt1A_t1_1_HA_83, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_filename_getter, __pyx_k_A_4_Q_D_4_4tSaaeeiixxy_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 246, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 204, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[21] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[21])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 250, 34};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 208, 34};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[22] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_lineno_getter, __pyx_k_A_4y_1_7q_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[22])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 255, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 213, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[23] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[23])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 259, 32};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 217, 32};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[24] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_code_getter, __pyx_k_A_4wc_a_4q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[24])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 265, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 223, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[25] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[25])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 269, 136};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 227, 56};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
-    __pyx_mstate_global->__pyx_codeobj_tab[26] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_stdlib_getter, __pyx_k_A_4y_1_4wfAQ_s_Kq_Zs_U_g_X___ggj, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[26])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[26] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_stdlib_getter, __pyx_k_A_4y_1_D_4_4tSaaeeiixxy_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[26])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 287, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 232, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[27] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[27])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 291, 212};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 236, 139};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
-    __pyx_mstate_global->__pyx_codeobj_tab[28] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fullsource_getter, __pyx_k_A_4_Cq_O1_t_q_4vS_t4y_1_A_Cwc_E, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[28])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[28] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fullsource_getter, __pyx_k_A_4_Cq_t_q_4vS_t4y_1_Qd_J_dR_ddh, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[28])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 324, 12};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 250, 12};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[29] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[29])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 328, 110};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 254, 110};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_detached, __pyx_mstate->__pyx_n_u_builtin, __pyx_mstate->__pyx_n_u_code, __pyx_mstate->__pyx_n_u_filename_3, __pyx_mstate->__pyx_n_u_fullsource, __pyx_mstate->__pyx_n_u_function_3, __pyx_mstate->__pyx_n_u_function_object, __pyx_mstate->__pyx_n_u_globals_2, __pyx_mstate->__pyx_n_u_lineno_3, __pyx_mstate->__pyx_n_u_locals_2, __pyx_mstate->__pyx_n_u_module_5, __pyx_mstate->__pyx_n_u_source, __pyx_mstate->__pyx_n_u_stdlib, __pyx_mstate->__pyx_n_u_thread, __pyx_mstate->__pyx_n_u_threadidn, __pyx_mstate->__pyx_n_u_threadname, __pyx_mstate->__pyx_n_u_instruction};
     __pyx_mstate_global->__pyx_codeobj_tab[30] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_source_getter, __pyx_k_A_4y_1_t9IRwa_Kr_GxqPXXYY_hhiij, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[30])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 339, 11};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 265, 11};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[31] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_get_2, __pyx_k_A_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[31])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 343, 13};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 269, 13};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_item};
     __pyx_mstate_global->__pyx_codeobj_tab[32] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_getitem, __pyx_k_A_wavQ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[32])) goto bad;
   }
@@ -14151,19 +12481,29 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[40] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pxd, __pyx_mstate->__pyx_n_u_get_2, __pyx_k__5, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[40])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 8, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS|CO_GENERATOR), 347, 5};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_filename_2, __pyx_mstate->__pyx_n_u_module_globals, __pyx_mstate->__pyx_n_u_start, __pyx_mstate->__pyx_n_u_collector, __pyx_mstate->__pyx_n_u_limit, __pyx_mstate->__pyx_n_u_dedent, __pyx_mstate->__pyx_n_u_amount, __pyx_mstate->__pyx_n_u_line};
-    __pyx_mstate_global->__pyx_codeobj_tab[41] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_yield_lines, __pyx_k__6, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[41])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 13, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 273, 176};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_event, __pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_UNSET, __pyx_mstate->__pyx_n_u_CALL, __pyx_mstate->__pyx_n_u_EXCEPTION, __pyx_mstate->__pyx_n_u_LINE, __pyx_mstate->__pyx_n_u_RETURN, __pyx_mstate->__pyx_n_u_KIND_NAMES};
+    __pyx_mstate_global->__pyx_codeobj_tab[41] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_init_event, __pyx_k_z_a_Q_E_1_a_Q_a_Q_A_A_A_A_A_q_A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[41])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 12, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 301, 39};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_frame, __pyx_mstate->__pyx_n_u_kind, __pyx_mstate->__pyx_n_u_arg, __pyx_mstate->__pyx_n_u_depth, __pyx_mstate->__pyx_n_u_calls, __pyx_mstate->__pyx_n_u_threading_support, __pyx_mstate->__pyx_n_u_UNSET, __pyx_mstate->__pyx_n_u_CALL, __pyx_mstate->__pyx_n_u_EXCEPTION, __pyx_mstate->__pyx_n_u_LINE, __pyx_mstate->__pyx_n_u_RETURN, __pyx_mstate->__pyx_n_u_KIND_NAMES};
+    __pyx_mstate_global->__pyx_codeobj_tab[42] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fast_event, __pyx_k_HE_awgV5_wa_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[42])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 307, 32};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_filename_2, __pyx_mstate->__pyx_n_u_module_globals, __pyx_mstate->__pyx_n_u_start, __pyx_mstate->__pyx_n_u_collector, __pyx_mstate->__pyx_n_u_limit};
+    __pyx_mstate_global->__pyx_codeobj_tab[43] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_yield_lines, __pyx_k_A_Qhaz1B_R, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[43])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 8, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 362, 311};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 8, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 312, 311};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_value_filter, __pyx_mstate->__pyx_n_u_UNSET, __pyx_mstate->__pyx_n_u_CALL, __pyx_mstate->__pyx_n_u_EXCEPTION, __pyx_mstate->__pyx_n_u_LINE, __pyx_mstate->__pyx_n_u_RETURN, __pyx_mstate->__pyx_n_u_KIND_NAMES};
-    __pyx_mstate_global->__pyx_codeobj_tab[42] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fast_detach, __pyx_k_HE_l_d_a_T_d_D_a_D_a_D_a_D_a_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[42])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[44] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fast_detach, __pyx_k_HE_l_d_a_T_d_D_a_D_a_D_a_D_a_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[44])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 396, 228};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 346, 228};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_UNSET, __pyx_mstate->__pyx_n_u_CALL, __pyx_mstate->__pyx_n_u_EXCEPTION, __pyx_mstate->__pyx_n_u_LINE, __pyx_mstate->__pyx_n_u_RETURN, __pyx_mstate->__pyx_n_u_KIND_NAMES};
-    __pyx_mstate_global->__pyx_codeobj_tab[43] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fast_clone, __pyx_k_HE_A_D_a_a_Q_a_Q_d_a_d_A_T_d_T, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[43])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[45] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_hunter__event_pyx, __pyx_mstate->__pyx_n_u_fast_clone, __pyx_k_HE_A_D_a_a_Q_a_Q_d_a_d_A_T_d_T, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[45])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -16233,68 +14573,6 @@ static CYTHON_INLINE int __Pyx_dict_iter_next(
     return 1;
 }
 
-/* SliceObject */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
-        Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
-        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
-    __Pyx_TypeName obj_type_name;
-#if CYTHON_USE_TYPE_SLOTS
-    PyMappingMethods* mp = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(mp && mp->mp_subscript))
-#endif
-    {
-        PyObject* result;
-        PyObject *py_slice, *py_start, *py_stop;
-        if (_py_slice) {
-            py_slice = *_py_slice;
-        } else {
-            PyObject* owned_start = NULL;
-            PyObject* owned_stop = NULL;
-            if (_py_start) {
-                py_start = *_py_start;
-            } else {
-                if (has_cstart) {
-                    owned_start = py_start = PyLong_FromSsize_t(cstart);
-                    if (unlikely(!py_start)) goto bad;
-                } else
-                    py_start = Py_None;
-            }
-            if (_py_stop) {
-                py_stop = *_py_stop;
-            } else {
-                if (has_cstop) {
-                    owned_stop = py_stop = PyLong_FromSsize_t(cstop);
-                    if (unlikely(!py_stop)) {
-                        Py_XDECREF(owned_start);
-                        goto bad;
-                    }
-                } else
-                    py_stop = Py_None;
-            }
-            py_slice = PySlice_New(py_start, py_stop, Py_None);
-            Py_XDECREF(owned_start);
-            Py_XDECREF(owned_stop);
-            if (unlikely(!py_slice)) goto bad;
-        }
-#if CYTHON_USE_TYPE_SLOTS
-        result = mp->mp_subscript(obj, py_slice);
-#else
-        result = PyObject_GetItem(obj, py_slice);
-#endif
-        if (!_py_slice) {
-            Py_DECREF(py_slice);
-        }
-        return result;
-    }
-    obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
-    PyErr_Format(PyExc_TypeError,
-        "'" __Pyx_FMT_TYPENAME "' object is unsliceable", obj_type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-bad:
-    return NULL;
-}
-
 /* ExtTypeTest */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     __Pyx_TypeName obj_type_name;
@@ -16315,222 +14593,6 @@ static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     return 0;
 }
 
-/* IterNextPlain */
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-static PyObject *__Pyx_GetBuiltinNext_LimitedAPI(void) {
-    if (unlikely(!__pyx_mstate_global->__Pyx_GetBuiltinNext_LimitedAPI_cache))
-        __pyx_mstate_global->__Pyx_GetBuiltinNext_LimitedAPI_cache = __Pyx_GetBuiltinName(__pyx_mstate_global->__pyx_n_u_next);
-    return __pyx_mstate_global->__Pyx_GetBuiltinNext_LimitedAPI_cache;
-}
-#endif
-static CYTHON_INLINE PyObject *__Pyx_PyIter_Next_Plain(PyObject *iterator) {
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-    PyObject *result;
-    PyObject *next = __Pyx_GetBuiltinNext_LimitedAPI();
-    if (unlikely(!next)) return NULL;
-    result = PyObject_CallFunctionObjArgs(next, iterator, NULL);
-    return result;
-#else
-    (void)__Pyx_GetBuiltinName; // only for early limited API
-    iternextfunc iternext = __Pyx_PyObject_GetIterNextFunc(iterator);
-    assert(iternext);
-    return iternext(iterator);
-#endif
-}
-
-/* IterNext */
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x03080000
-static PyObject *__Pyx_PyIter_Next2(PyObject *o, PyObject *defval) {
-    PyObject *result;
-    PyObject *next = __Pyx_GetBuiltinNext_LimitedAPI();
-    if (unlikely(!next)) return NULL;
-    result = PyObject_CallFunctionObjArgs(next, o, defval, NULL);
-    return result;
-}
-#else
-static PyObject *__Pyx_PyIter_Next2Default(PyObject* defval) {
-    PyObject* exc_type;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    exc_type = __Pyx_PyErr_CurrentExceptionType();
-    if (unlikely(exc_type)) {
-        if (!defval || unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))
-            return NULL;
-        __Pyx_PyErr_Clear();
-        Py_INCREF(defval);
-        return defval;
-    }
-    if (defval) {
-        Py_INCREF(defval);
-        return defval;
-    }
-    __Pyx_PyErr_SetNone(PyExc_StopIteration);
-    return NULL;
-}
-static void __Pyx_PyIter_Next_ErrorNoIterator(PyObject *iterator) {
-    __Pyx_TypeName iterator_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(iterator));
-    PyErr_Format(PyExc_TypeError,
-        __Pyx_FMT_TYPENAME " object is not an iterator", iterator_type_name);
-    __Pyx_DECREF_TypeName(iterator_type_name);
-}
-static CYTHON_INLINE PyObject *__Pyx_PyIter_Next2(PyObject* iterator, PyObject* defval) {
-    PyObject* next;
-#if !CYTHON_COMPILING_IN_LIMITED_API
-    iternextfunc iternext = __Pyx_PyObject_TryGetSlot(iterator, tp_iternext, iternextfunc);
-    if (likely(iternext)) {
-        next = iternext(iterator);
-        if (likely(next))
-            return next;
-    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030d0000
-        if (unlikely(iternext == &_PyObject_NextNotImplemented))
-            return NULL;
-    #endif
-    } else if (CYTHON_USE_TYPE_SLOTS) {
-        __Pyx_PyIter_Next_ErrorNoIterator(iterator);
-        return NULL;
-    } else
-#endif
-    if (unlikely(!PyIter_Check(iterator))) {
-        __Pyx_PyIter_Next_ErrorNoIterator(iterator);
-        return NULL;
-    } else {
-        next = defval ? PyIter_Next(iterator) : __Pyx_PyIter_Next_Plain(iterator);
-        if (likely(next))
-            return next;
-    }
-    return __Pyx_PyIter_Next2Default(defval);
-}
-#endif
-
-/* PyLongBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_Fallback___Pyx_PyLong_SubtractObjC(PyObject *op1, PyObject *op2, int inplace) {
-    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
-}
-#if CYTHON_USE_PYLONG_INTERNALS
-static PyObject* __Pyx_Unpacked___Pyx_PyLong_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    long a, x;
-#ifdef HAVE_LONG_LONG
-    const PY_LONG_LONG llb = intval;
-    PY_LONG_LONG lla, llx;
-#endif
-    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
-        return PyLong_FromLong(-intval);
-    }
-    if (likely(__Pyx_PyLong_IsCompact(op1))) {
-        a = __Pyx_PyLong_CompactValue(op1);
-    } else {
-        const digit* digits = __Pyx_PyLong_Digits(op1);
-        const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
-        switch (size) {
-            case -2:
-                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                    a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 2:
-                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                    a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case -3:
-                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                    a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 3:
-                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                    a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case -4:
-                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                    a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                    lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            case 4:
-                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                    a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    break;
-                #ifdef HAVE_LONG_LONG
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    goto long_long;
-                #endif
-                }
-                CYTHON_FALLTHROUGH;
-            default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
-        }
-    }
-            x = a - b;
-        return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-    long_long:
-            llx = lla - llb;
-        return PyLong_FromLongLong(llx);
-#endif
-    return __Pyx_Fallback___Pyx_PyLong_SubtractObjC(op1, op2, inplace);
-    
-    
-}
-#endif
-static PyObject* __Pyx_Float___Pyx_PyLong_SubtractObjC(PyObject *float_val, long intval, int zerodivision_check) {
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
-        double result;
-        
-        result = ((double)a) - (double)b;
-        return PyFloat_FromDouble(result);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyLong_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        return __Pyx_Unpacked___Pyx_PyLong_SubtractObjC(op1, op2, intval, inplace, zerodivision_check);
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        return __Pyx_Float___Pyx_PyLong_SubtractObjC(op1, intval, zerodivision_check);
-    }
-    return __Pyx_Fallback___Pyx_PyLong_SubtractObjC(op1, op2, inplace);
-}
-#endif
-
 /* GetTopmostException */
 #if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
 static _PyErr_StackItem *
@@ -16613,136 +14675,49 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 }
 #endif
 
-/* FastTypeChecks */
-#if CYTHON_COMPILING_IN_CPYTHON
-static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
-    while (a) {
-        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
-        if (a == b)
-            return 1;
-    }
-    return b == &PyBaseObject_Type;
-}
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (a == b) return 1;
-    mro = a->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
-                return 1;
-        }
-        return 0;
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if PY_VERSION_HEX >= 0x030C0000
+    local_value = tstate->current_exception;
+    tstate->current_exception = 0;
+  #else
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+  #endif
+#elif __PYX_LIMITED_VERSION_HEX > 0x030C0000
+    local_value = PyErr_GetRaisedException();
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+#if __PYX_LIMITED_VERSION_HEX > 0x030C0000
+    if (likely(local_value)) {
+        local_type = (PyObject*) Py_TYPE(local_value);
+        Py_INCREF(local_type);
+        local_tb = PyException_GetTraceback(local_value);
     }
-    return __Pyx_InBases(a, b);
-}
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (cls == a || cls == b) return 1;
-    mro = cls->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            PyObject *base = PyTuple_GET_ITEM(mro, i);
-            if (base == (PyObject *)a || base == (PyObject *)b)
-                return 1;
-        }
-        return 0;
-    }
-    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
-}
-static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
-    if (exc_type1) {
-        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
-    } else {
-        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
-    }
-}
-static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    assert(PyExceptionClass_Check(exc_type));
-    n = PyTuple_GET_SIZE(tuple);
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-    for (i=0; i<n; i++) {
-        PyObject *t = PyTuple_GET_ITEM(tuple, i);
-        if (likely(PyExceptionClass_Check(t))) {
-            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
-        } else {
-        }
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
-    if (likely(err == exc_type)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        if (likely(PyExceptionClass_Check(exc_type))) {
-            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
-        } else if (likely(PyTuple_Check(exc_type))) {
-            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
-        } else {
-        }
-    }
-    return PyErr_GivenExceptionMatches(err, exc_type);
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
-    assert(PyExceptionClass_Check(exc_type1));
-    assert(PyExceptionClass_Check(exc_type2));
-    if (likely(err == exc_type1 || err == exc_type2)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
-    }
-    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
-}
-#endif
-
-/* GetException */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
-#else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
-#endif
-{
-    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
-#if CYTHON_FAST_THREAD_STATE
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-  #if PY_VERSION_HEX >= 0x030C0000
-    local_value = tstate->current_exception;
-    tstate->current_exception = 0;
-  #else
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-  #endif
-#elif __PYX_LIMITED_VERSION_HEX > 0x030C0000
-    local_value = PyErr_GetRaisedException();
-#else
-    PyErr_Fetch(&local_type, &local_value, &local_tb);
-#endif
-#if __PYX_LIMITED_VERSION_HEX > 0x030C0000
-    if (likely(local_value)) {
-        local_type = (PyObject*) Py_TYPE(local_value);
-        Py_INCREF(local_type);
-        local_tb = PyException_GetTraceback(local_value);
-    }
-#else
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-#if CYTHON_FAST_THREAD_STATE
-    if (unlikely(tstate->curexc_type))
-#else
-    if (unlikely(PyErr_Occurred()))
-#endif
-        goto bad;
-    if (local_tb) {
-        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-            goto bad;
+#else
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
     }
 #endif // __PYX_LIMITED_VERSION_HEX > 0x030C0000
     Py_XINCREF(local_tb);
@@ -16866,6 +14841,42 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
     return PyObject_GetAttr(o, n);
 }
 
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+    CYTHON_UNUSED_VAR(clineno);
+    CYTHON_UNUSED_VAR(lineno);
+    CYTHON_UNUSED_VAR(filename);
+    CYTHON_MAYBE_UNUSED_VAR(nogil);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(0);
+    }
+    ctx = PyUnicode_FromString(name);
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+    if (nogil)
+        PyGILState_Release(state);
+}
+
 /* ArgTypeTest */
 static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
 {
@@ -16914,36 +14925,6 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
     return 0;
 }
 
-/* pep479 */
-static void __Pyx_Generator_Replace_StopIteration(int in_async_gen) {
-    PyObject *exc, *val, *tb, *cur_exc, *new_exc;
-    __Pyx_PyThreadState_declare
-    int is_async_stopiteration = 0;
-    CYTHON_MAYBE_UNUSED_VAR(in_async_gen);
-    __Pyx_PyThreadState_assign
-    cur_exc = __Pyx_PyErr_CurrentExceptionType();
-    if (likely(!__Pyx_PyErr_GivenExceptionMatches(cur_exc, PyExc_StopIteration))) {
-        if (in_async_gen && unlikely(__Pyx_PyErr_GivenExceptionMatches(cur_exc, PyExc_StopAsyncIteration))) {
-            is_async_stopiteration = 1;
-        } else {
-            return;
-        }
-    }
-    __Pyx_GetException(&exc, &val, &tb);
-    Py_XDECREF(exc);
-    Py_XDECREF(tb);
-    new_exc = PyObject_CallFunction(PyExc_RuntimeError, "s",
-        is_async_stopiteration ? "async generator raised StopAsyncIteration" :
-        in_async_gen ? "async generator raised StopIteration" :
-        "generator raised StopIteration");
-    if (!new_exc) {
-        Py_XDECREF(val);
-        return;
-    }
-    PyException_SetCause(new_exc, val); // steals ref to val
-    PyErr_SetObject(PyExc_RuntimeError, new_exc);
-}
-
 /* CallTypeTraverse */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #else
@@ -19944,1243 +17925,92 @@ raise_neg_overflow:
     return (long) -1;
 }
 
-/* RaiseException */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
-                } else {
-                    type = instance_class;
-                }
-            }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
     }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
         }
-        PyException_SetCause(value, fixed_cause);
+        return 0;
     }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-        PyException_SetTraceback(value, tb);
-#elif CYTHON_FAST_THREAD_STATE
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
         }
-#else
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
+        return 0;
     }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-
-/* PyObjectCall2Args */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args[3] = {NULL, arg1, arg2};
-    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
-
-/* PyObjectCallMethod1 */
-#if !(CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000)))
-static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
-    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
-    Py_DECREF(method);
-    return result;
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
 }
-#endif
-static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
-#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000))
-    PyObject *args[2] = {obj, arg};
-    (void) __Pyx_PyObject_GetMethod;
-    (void) __Pyx_PyObject_CallOneArg;
-    (void) __Pyx_PyObject_Call2Args;
-    return PyObject_VectorcallMethod(method_name, args, 2 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
-#else
-    PyObject *method = NULL, *result;
-    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
-    if (likely(is_method)) {
-        result = __Pyx_PyObject_Call2Args(method, obj, arg);
-        Py_DECREF(method);
-        return result;
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
     }
-    if (unlikely(!method)) return NULL;
-    return __Pyx__PyObject_CallMethod1(method, arg);
-#endif
 }
-
-/* ReturnWithStopIteration */
-static void __Pyx__ReturnWithStopIteration(PyObject* value, int async);
-static CYTHON_INLINE void __Pyx_ReturnWithStopIteration(PyObject* value, int async, int iternext) {
-    if (value == Py_None) {
-        if (async || !iternext)
-            PyErr_SetNone(async ? PyExc_StopAsyncIteration : PyExc_StopIteration);
-        return;
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
     }
-    __Pyx__ReturnWithStopIteration(value, async);
+    return 0;
 }
-static void __Pyx__ReturnWithStopIteration(PyObject* value, int async) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    __Pyx_PyThreadState_declare
-#endif
-    PyObject *exc;
-    PyObject *exc_type = async ? PyExc_StopAsyncIteration : PyExc_StopIteration;
-#if CYTHON_COMPILING_IN_CPYTHON
-    if ((PY_VERSION_HEX >= (0x030C00A6)) || unlikely(PyTuple_Check(value) || PyExceptionInstance_Check(value))) {
-        if (PY_VERSION_HEX >= (0x030e00A1)) {
-            exc = __Pyx_PyObject_CallOneArg(exc_type, value);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
         } else {
-            PyObject *args_tuple = PyTuple_New(1);
-            if (unlikely(!args_tuple)) return;
-            Py_INCREF(value);
-            PyTuple_SET_ITEM(args_tuple, 0, value);
-            exc = PyObject_Call(exc_type, args_tuple, NULL);
-            Py_DECREF(args_tuple);
         }
-        if (unlikely(!exc)) return;
-    } else {
-        Py_INCREF(value);
-        exc = value;
     }
-    #if CYTHON_FAST_THREAD_STATE
-    __Pyx_PyThreadState_assign
-    #if CYTHON_USE_EXC_INFO_STACK
-    if (!__pyx_tstate->exc_info->exc_value)
-    #else
-    if (!__pyx_tstate->exc_type)
-    #endif
-    {
-        Py_INCREF(exc_type);
-        __Pyx_ErrRestore(exc_type, exc, NULL);
-        return;
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
     }
-    #endif
-#else
-    exc = __Pyx_PyObject_CallOneArg(exc_type, value);
-    if (unlikely(!exc)) return;
-#endif
-    PyErr_SetObject(exc_type, exc);
-    Py_DECREF(exc);
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
 }
-
-/* CoroutineBase */
-#if !CYTHON_COMPILING_IN_LIMITED_API
-#include <frameobject.h>
-#if PY_VERSION_HEX >= 0x030b00a6 && !defined(PYPY_VERSION)
-  #ifndef Py_BUILD_CORE
-    #define Py_BUILD_CORE 1
-  #endif
-  #include "internal/pycore_frame.h"
 #endif
-#endif // CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_INLINE void
-__Pyx_Coroutine_Undelegate(__pyx_CoroutineObject *gen) {
-#if CYTHON_USE_AM_SEND
-    gen->yieldfrom_am_send = NULL;
-#endif
-    Py_CLEAR(gen->yieldfrom);
-}
-static int __Pyx_PyGen__FetchStopIterationValue(PyThreadState *__pyx_tstate, PyObject **pvalue) {
-    PyObject *et, *ev, *tb;
-    PyObject *value = NULL;
-    CYTHON_UNUSED_VAR(__pyx_tstate);
-    __Pyx_ErrFetch(&et, &ev, &tb);
-    if (!et) {
-        Py_XDECREF(tb);
-        Py_XDECREF(ev);
-        Py_INCREF(Py_None);
-        *pvalue = Py_None;
-        return 0;
-    }
-    if (likely(et == PyExc_StopIteration)) {
-        if (!ev) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-        else if (likely(__Pyx_IS_TYPE(ev, (PyTypeObject*)PyExc_StopIteration))) {
-            #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL
-            value = PyObject_GetAttr(ev, __pyx_mstate_global->__pyx_n_u_value);
-            if (unlikely(!value)) goto limited_api_failure;
-            #else
-            value = ((PyStopIterationObject *)ev)->value;
-            Py_INCREF(value);
-            #endif
-            Py_DECREF(ev);
-        }
-        else if (unlikely(PyTuple_Check(ev))) {
-            Py_ssize_t tuple_size = __Pyx_PyTuple_GET_SIZE(ev);
-            #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely(tuple_size < 0)) {
-                Py_XDECREF(tb);
-                Py_DECREF(ev);
-                Py_DECREF(et);
-                return -1;
-            }
-            #endif
-            if (tuple_size >= 1) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                value = PyTuple_GET_ITEM(ev, 0);
-                Py_INCREF(value);
-#elif CYTHON_ASSUME_SAFE_MACROS
-                value = PySequence_ITEM(ev, 0);
-#else
-                value = PySequence_GetItem(ev, 0);
-                if (!value) goto limited_api_failure;
-#endif
-            } else {
-                Py_INCREF(Py_None);
-                value = Py_None;
-            }
-            Py_DECREF(ev);
-        }
-        else if (!__Pyx_TypeCheck(ev, (PyTypeObject*)PyExc_StopIteration)) {
-            value = ev;
-        }
-        if (likely(value)) {
-            Py_XDECREF(tb);
-            Py_DECREF(et);
-            *pvalue = value;
-            return 0;
-        }
-    } else if (!__Pyx_PyErr_GivenExceptionMatches(et, PyExc_StopIteration)) {
-        __Pyx_ErrRestore(et, ev, tb);
-        return -1;
-    }
-    PyErr_NormalizeException(&et, &ev, &tb);
-    if (unlikely(!PyObject_TypeCheck(ev, (PyTypeObject*)PyExc_StopIteration))) {
-        __Pyx_ErrRestore(et, ev, tb);
-        return -1;
-    }
-    Py_XDECREF(tb);
-    Py_DECREF(et);
-#if CYTHON_COMPILING_IN_LIMITED_API
-    value = PyObject_GetAttr(ev, __pyx_mstate_global->__pyx_n_u_value);
-#else
-    value = ((PyStopIterationObject *)ev)->value;
-    Py_INCREF(value);
-#endif
-    Py_DECREF(ev);
-#if CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(!value)) return -1;
-#endif
-    *pvalue = value;
-    return 0;
-#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL || !CYTHON_ASSUME_SAFE_MACROS
-  limited_api_failure:
-    Py_XDECREF(et);
-    Py_XDECREF(tb);
-    Py_XDECREF(ev);
-    return -1;
-#endif
-}
-static CYTHON_INLINE
-__Pyx_PySendResult __Pyx_Coroutine_status_from_result(PyObject **retval) {
-    if (*retval) {
-        return PYGEN_NEXT;
-    } else if (likely(__Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, retval) == 0)) {
-        return PYGEN_RETURN;
-    } else {
-        return PYGEN_ERROR;
-    }
-}
-static CYTHON_INLINE
-void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *exc_state) {
-#if PY_VERSION_HEX >= 0x030B00a4
-    Py_CLEAR(exc_state->exc_value);
-#else
-    PyObject *t, *v, *tb;
-    t = exc_state->exc_type;
-    v = exc_state->exc_value;
-    tb = exc_state->exc_traceback;
-    exc_state->exc_type = NULL;
-    exc_state->exc_value = NULL;
-    exc_state->exc_traceback = NULL;
-    Py_XDECREF(t);
-    Py_XDECREF(v);
-    Py_XDECREF(tb);
-#endif
-}
-#define __Pyx_Coroutine_AlreadyRunningError(gen)  (__Pyx__Coroutine_AlreadyRunningError(gen), (PyObject*)NULL)
-static void __Pyx__Coroutine_AlreadyRunningError(__pyx_CoroutineObject *gen) {
-    const char *msg;
-    CYTHON_MAYBE_UNUSED_VAR(gen);
-    if ((0)) {
-    #ifdef __Pyx_Coroutine_USED
-    } else if (__Pyx_Coroutine_Check((PyObject*)gen)) {
-        msg = "coroutine already executing";
-    #endif
-    #ifdef __Pyx_AsyncGen_USED
-    } else if (__Pyx_AsyncGen_CheckExact((PyObject*)gen)) {
-        msg = "async generator already executing";
-    #endif
-    } else {
-        msg = "generator already executing";
-    }
-    PyErr_SetString(PyExc_ValueError, msg);
-}
-static void __Pyx_Coroutine_AlreadyTerminatedError(PyObject *gen, PyObject *value, int closing) {
-    CYTHON_MAYBE_UNUSED_VAR(gen);
-    CYTHON_MAYBE_UNUSED_VAR(closing);
-    #ifdef __Pyx_Coroutine_USED
-    if (!closing && __Pyx_Coroutine_Check(gen)) {
-        PyErr_SetString(PyExc_RuntimeError, "cannot reuse already awaited coroutine");
-    } else
-    #endif
-    if (value) {
-        #ifdef __Pyx_AsyncGen_USED
-        if (__Pyx_AsyncGen_CheckExact(gen))
-            PyErr_SetNone(PyExc_StopAsyncIteration);
-        else
-        #endif
-        PyErr_SetNone(PyExc_StopIteration);
-    }
-}
-static
-__Pyx_PySendResult __Pyx_Coroutine_SendEx(__pyx_CoroutineObject *self, PyObject *value, PyObject **result, int closing) {
-    __Pyx_PyThreadState_declare
-    PyThreadState *tstate;
-    __Pyx_ExcInfoStruct *exc_state;
-    PyObject *retval;
-    assert(__Pyx_Coroutine_get_is_running(self));  // Callers should ensure is_running
-    if (unlikely(self->resume_label == -1)) {
-        __Pyx_Coroutine_AlreadyTerminatedError((PyObject*)self, value, closing);
-        return PYGEN_ERROR;
-    }
-#if CYTHON_FAST_THREAD_STATE
-    __Pyx_PyThreadState_assign
-    tstate = __pyx_tstate;
-#else
-    tstate = __Pyx_PyThreadState_Current;
-#endif
-    exc_state = &self->gi_exc_state;
-    if (exc_state->exc_value) {
-        #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
-        #else
-        PyObject *exc_tb;
-        #if PY_VERSION_HEX >= 0x030B00a4 && !CYTHON_COMPILING_IN_CPYTHON
-        exc_tb = PyException_GetTraceback(exc_state->exc_value);
-        #elif PY_VERSION_HEX >= 0x030B00a4
-        exc_tb = ((PyBaseExceptionObject*) exc_state->exc_value)->traceback;
-        #else
-        exc_tb = exc_state->exc_traceback;
-        #endif
-        if (exc_tb) {
-            PyTracebackObject *tb = (PyTracebackObject *) exc_tb;
-            PyFrameObject *f = tb->tb_frame;
-            assert(f->f_back == NULL);
-            #if PY_VERSION_HEX >= 0x030B00A1
-            f->f_back = PyThreadState_GetFrame(tstate);
-            #else
-            Py_XINCREF(tstate->frame);
-            f->f_back = tstate->frame;
-            #endif
-            #if PY_VERSION_HEX >= 0x030B00a4 && !CYTHON_COMPILING_IN_CPYTHON
-            Py_DECREF(exc_tb);
-            #endif
-        }
-        #endif
-    }
-#if CYTHON_USE_EXC_INFO_STACK
-    exc_state->previous_item = tstate->exc_info;
-    tstate->exc_info = exc_state;
-#else
-    if (exc_state->exc_type) {
-        __Pyx_ExceptionSwap(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
-    } else {
-        __Pyx_Coroutine_ExceptionClear(exc_state);
-        __Pyx_ExceptionSave(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
-    }
-#endif
-    retval = self->body(self, tstate, value);
-#if CYTHON_USE_EXC_INFO_STACK
-    exc_state = &self->gi_exc_state;
-    tstate->exc_info = exc_state->previous_item;
-    exc_state->previous_item = NULL;
-    __Pyx_Coroutine_ResetFrameBackpointer(exc_state);
-#endif
-    *result = retval;
-    if (self->resume_label == -1) {
-        return likely(retval) ? PYGEN_RETURN : PYGEN_ERROR;
-    }
-    return PYGEN_NEXT;
-}
-static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
-    CYTHON_UNUSED_VAR(exc_state);
-#else
-    PyObject *exc_tb;
-    #if PY_VERSION_HEX >= 0x030B00a4
-    if (!exc_state->exc_value) return;
-    exc_tb = PyException_GetTraceback(exc_state->exc_value);
-    #else
-    exc_tb = exc_state->exc_traceback;
-    #endif
-    if (likely(exc_tb)) {
-        PyTracebackObject *tb = (PyTracebackObject *) exc_tb;
-        PyFrameObject *f = tb->tb_frame;
-        Py_CLEAR(f->f_back);
-        #if PY_VERSION_HEX >= 0x030B00a4
-        Py_DECREF(exc_tb);
-        #endif
-    }
-#endif
-}
-#define __Pyx_Coroutine_MethodReturnFromResult(gen, result, retval, iternext)\
-    ((result) == PYGEN_NEXT ? (retval) : __Pyx__Coroutine_MethodReturnFromResult(gen, result, retval, iternext))
-static PyObject *
-__Pyx__Coroutine_MethodReturnFromResult(PyObject* gen, __Pyx_PySendResult result, PyObject *retval, int iternext) {
-    CYTHON_MAYBE_UNUSED_VAR(gen);
-    if (likely(result == PYGEN_RETURN)) {
-        int is_async = 0;
-        #ifdef __Pyx_AsyncGen_USED
-        is_async = __Pyx_AsyncGen_CheckExact(gen);
-        #endif
-        __Pyx_ReturnWithStopIteration(retval, is_async, iternext);
-        Py_XDECREF(retval);
-    }
-    return NULL;
-}
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE
-PyObject *__Pyx_PyGen_Send(PyGenObject *gen, PyObject *arg) {
-#if PY_VERSION_HEX <= 0x030A00A1
-    return _PyGen_Send(gen, arg);
-#else
-    PyObject *result;
-    if (PyIter_Send((PyObject*)gen, arg ? arg : Py_None, &result) == PYGEN_RETURN) {
-        if (PyAsyncGen_CheckExact(gen)) {
-            assert(result == Py_None);
-            PyErr_SetNone(PyExc_StopAsyncIteration);
-        }
-        else if (result == Py_None) {
-            PyErr_SetNone(PyExc_StopIteration);
-        }
-        else {
-#if PY_VERSION_HEX < 0x030d00A1
-            _PyGen_SetStopIterationValue(result);
-#else
-            if (!PyTuple_Check(result) && !PyExceptionInstance_Check(result)) {
-                PyErr_SetObject(PyExc_StopIteration, result);
-            } else {
-                PyObject *exc = __Pyx_PyObject_CallOneArg(PyExc_StopIteration, result);
-                if (likely(exc != NULL)) {
-                    PyErr_SetObject(PyExc_StopIteration, exc);
-                    Py_DECREF(exc);
-                }
-            }
-#endif
-        }
-        Py_DECREF(result);
-        result = NULL;
-    }
-    return result;
-#endif
-}
-#endif
-static CYTHON_INLINE __Pyx_PySendResult
-__Pyx_Coroutine_FinishDelegation(__pyx_CoroutineObject *gen, PyObject** retval) {
-    __Pyx_PySendResult result;
-    PyObject *val = NULL;
-    assert(__Pyx_Coroutine_get_is_running(gen));
-    __Pyx_Coroutine_Undelegate(gen);
-    __Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, &val);
-    result = __Pyx_Coroutine_SendEx(gen, val, retval, 0);
-    Py_XDECREF(val);
-    return result;
-}
-#if CYTHON_USE_AM_SEND
-static __Pyx_PySendResult
-__Pyx_Coroutine_SendToDelegate(__pyx_CoroutineObject *gen, __Pyx_pyiter_sendfunc gen_am_send, PyObject *value, PyObject **retval) {
-    PyObject *ret = NULL;
-    __Pyx_PySendResult delegate_result, result;
-    assert(__Pyx_Coroutine_get_is_running(gen));
-    delegate_result = gen_am_send(gen->yieldfrom, value, &ret);
-    if (delegate_result == PYGEN_NEXT) {
-        assert (ret != NULL);
-        *retval = ret;
-        return PYGEN_NEXT;
-    }
-    assert (delegate_result != PYGEN_ERROR || ret == NULL);
-    __Pyx_Coroutine_Undelegate(gen);
-    result = __Pyx_Coroutine_SendEx(gen, ret, retval, 0);
-    Py_XDECREF(ret);
-    return result;
-}
-#endif
-static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value) {
-    PyObject *retval = NULL;
-    __Pyx_PySendResult result = __Pyx_Coroutine_AmSend(self, value, &retval);
-    return __Pyx_Coroutine_MethodReturnFromResult(self, result, retval, 0);
-}
-static __Pyx_PySendResult
-__Pyx_Coroutine_AmSend(PyObject *self, PyObject *value, PyObject **retval) {
-    __Pyx_PySendResult result;
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject*) self;
-    if (unlikely(__Pyx_Coroutine_test_and_set_is_running(gen))) {
-        *retval = __Pyx_Coroutine_AlreadyRunningError(gen);
-        return PYGEN_ERROR;
-    }
-    #if CYTHON_USE_AM_SEND
-    if (gen->yieldfrom_am_send) {
-        result = __Pyx_Coroutine_SendToDelegate(gen, gen->yieldfrom_am_send, value, retval);
-    } else
-    #endif
-    if (gen->yieldfrom) {
-        PyObject *yf = gen->yieldfrom;
-        PyObject *ret;
-      #if !CYTHON_USE_AM_SEND
-        #ifdef __Pyx_Generator_USED
-        if (__Pyx_Generator_CheckExact(yf)) {
-            ret = __Pyx_Coroutine_Send(yf, value);
-        } else
-        #endif
-        #ifdef __Pyx_Coroutine_USED
-        if (__Pyx_Coroutine_Check(yf)) {
-            ret = __Pyx_Coroutine_Send(yf, value);
-        } else
-        #endif
-        #ifdef __Pyx_AsyncGen_USED
-        if (__pyx_PyAsyncGenASend_CheckExact(yf)) {
-            ret = __Pyx_async_gen_asend_send(yf, value);
-        } else
-        #endif
-        #if CYTHON_COMPILING_IN_CPYTHON
-        if (PyGen_CheckExact(yf)) {
-            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
-        } else
-        if (PyCoro_CheckExact(yf)) {
-            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
-        } else
-        #endif
-      #endif
-        {
-            #if !CYTHON_COMPILING_IN_LIMITED_API || __PYX_LIMITED_VERSION_HEX >= 0x03080000
-            if (value == Py_None && PyIter_Check(yf))
-                ret = __Pyx_PyIter_Next_Plain(yf);
-            else
-            #endif
-                ret = __Pyx_PyObject_CallMethod1(yf, __pyx_mstate_global->__pyx_n_u_send, value);
-        }
-        if (likely(ret)) {
-            __Pyx_Coroutine_unset_is_running(gen);
-            *retval = ret;
-            return PYGEN_NEXT;
-        }
-        result = __Pyx_Coroutine_FinishDelegation(gen, retval);
-    } else {
-        result = __Pyx_Coroutine_SendEx(gen, value, retval, 0);
-    }
-    __Pyx_Coroutine_unset_is_running(gen);
-    return result;
-}
-static int __Pyx_Coroutine_CloseIter(__pyx_CoroutineObject *gen, PyObject *yf) {
-    __Pyx_PySendResult result;
-    PyObject *retval = NULL;
-    CYTHON_UNUSED_VAR(gen);
-    assert(__Pyx_Coroutine_get_is_running(gen));
-    #ifdef __Pyx_Generator_USED
-    if (__Pyx_Generator_CheckExact(yf)) {
-        result = __Pyx_Coroutine_Close(yf, &retval);
-    } else
-    #endif
-    #ifdef __Pyx_Coroutine_USED
-    if (__Pyx_Coroutine_Check(yf)) {
-        result = __Pyx_Coroutine_Close(yf, &retval);
-    } else
-    if (__Pyx_CoroutineAwait_CheckExact(yf)) {
-        result = __Pyx_CoroutineAwait_Close((__pyx_CoroutineAwaitObject*)yf);
-    } else
-    #endif
-    #ifdef __Pyx_AsyncGen_USED
-    if (__pyx_PyAsyncGenASend_CheckExact(yf)) {
-        retval = __Pyx_async_gen_asend_close(yf, NULL);
-        result = PYGEN_RETURN;
-    } else
-    if (__pyx_PyAsyncGenAThrow_CheckExact(yf)) {
-        retval = __Pyx_async_gen_athrow_close(yf, NULL);
-        result = PYGEN_RETURN;
-    } else
-    #endif
-    {
-        PyObject *meth;
-        result = PYGEN_RETURN;
-        meth = __Pyx_PyObject_GetAttrStrNoError(yf, __pyx_mstate_global->__pyx_n_u_close);
-        if (unlikely(!meth)) {
-            if (unlikely(PyErr_Occurred())) {
-                PyErr_WriteUnraisable(yf);
-            }
-        } else {
-            retval = __Pyx_PyObject_CallNoArg(meth);
-            Py_DECREF(meth);
-            if (unlikely(!retval)) {
-                result = PYGEN_ERROR;
-            }
-        }
-    }
-    Py_XDECREF(retval);
-    return result == PYGEN_ERROR ? -1 : 0;
-}
-static PyObject *__Pyx_Generator_Next(PyObject *self) {
-    __Pyx_PySendResult result;
-    PyObject *retval = NULL;
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject*) self;
-    if (unlikely(__Pyx_Coroutine_test_and_set_is_running(gen))) {
-        return __Pyx_Coroutine_AlreadyRunningError(gen);
-    }
-    #if CYTHON_USE_AM_SEND
-    if (gen->yieldfrom_am_send) {
-        result = __Pyx_Coroutine_SendToDelegate(gen, gen->yieldfrom_am_send, Py_None, &retval);
-    } else
-    #endif
-    if (gen->yieldfrom) {
-        PyObject *yf = gen->yieldfrom;
-        PyObject *ret;
-        #ifdef __Pyx_Generator_USED
-        if (__Pyx_Generator_CheckExact(yf)) {
-            ret = __Pyx_Generator_Next(yf);
-        } else
-        #endif
-        #ifdef __Pyx_Coroutine_USED
-        if (__Pyx_Coroutine_CheckExact(yf)) {
-            ret = __Pyx_Coroutine_Send(yf, Py_None);
-        } else
-        #endif
-        #if CYTHON_COMPILING_IN_CPYTHON && (PY_VERSION_HEX < 0x030A00A3 || !CYTHON_USE_AM_SEND)
-        if (PyGen_CheckExact(yf)) {
-            ret = __Pyx_PyGen_Send((PyGenObject*)yf, NULL);
-        } else
-        #endif
-            ret = __Pyx_PyIter_Next_Plain(yf);
-        if (likely(ret)) {
-            __Pyx_Coroutine_unset_is_running(gen);
-            return ret;
-        }
-        result = __Pyx_Coroutine_FinishDelegation(gen, &retval);
-    } else {
-        result = __Pyx_Coroutine_SendEx(gen, Py_None, &retval, 0);
-    }
-    __Pyx_Coroutine_unset_is_running(gen);
-    return __Pyx_Coroutine_MethodReturnFromResult(self, result, retval, 1);
-}
-static PyObject *__Pyx_Coroutine_Close_Method(PyObject *self, PyObject *arg) {
-    PyObject *retval = NULL;
-    __Pyx_PySendResult result;
-    CYTHON_UNUSED_VAR(arg);
-    result = __Pyx_Coroutine_Close(self, &retval);
-    if (unlikely(result == PYGEN_ERROR))
-        return NULL;
-    Py_XDECREF(retval);
-    Py_RETURN_NONE;
-}
-static __Pyx_PySendResult
-__Pyx_Coroutine_Close(PyObject *self, PyObject **retval) {
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
-    __Pyx_PySendResult result;
-    PyObject *yf;
-    int err = 0;
-    if (unlikely(__Pyx_Coroutine_test_and_set_is_running(gen))) {
-        *retval = __Pyx_Coroutine_AlreadyRunningError(gen);
-        return PYGEN_ERROR;
-    }
-    yf = gen->yieldfrom;
-    if (yf) {
-        Py_INCREF(yf);
-        err = __Pyx_Coroutine_CloseIter(gen, yf);
-        __Pyx_Coroutine_Undelegate(gen);
-        Py_DECREF(yf);
-    }
-    if (err == 0)
-        PyErr_SetNone(PyExc_GeneratorExit);
-    result = __Pyx_Coroutine_SendEx(gen, NULL, retval, 1);
-    if (result == PYGEN_ERROR) {
-        __Pyx_PyThreadState_declare
-        __Pyx_PyThreadState_assign
-        __Pyx_Coroutine_unset_is_running(gen);
-        if (!__Pyx_PyErr_Occurred()) {
-            return PYGEN_RETURN;
-        } else if (likely(__Pyx_PyErr_ExceptionMatches2(PyExc_GeneratorExit, PyExc_StopIteration))) {
-            __Pyx_PyErr_Clear();
-            return PYGEN_RETURN;
-        }
-        return PYGEN_ERROR;
-    } else if (likely(result == PYGEN_RETURN && *retval == Py_None)) {
-        __Pyx_Coroutine_unset_is_running(gen);
-        return PYGEN_RETURN;
-    } else {
-        const char *msg;
-        Py_DECREF(*retval);
-        *retval = NULL;
-        if ((0)) {
-        #ifdef __Pyx_Coroutine_USED
-        } else if (__Pyx_Coroutine_Check(self)) {
-            msg = "coroutine ignored GeneratorExit";
-        #endif
-        #ifdef __Pyx_AsyncGen_USED
-        } else if (__Pyx_AsyncGen_CheckExact(self)) {
-            msg = "async generator ignored GeneratorExit";
-        #endif
-        } else {
-            msg = "generator ignored GeneratorExit";
-        }
-        PyErr_SetString(PyExc_RuntimeError, msg);
-        __Pyx_Coroutine_unset_is_running(gen);
-        return PYGEN_ERROR;
-    }
-}
-static PyObject *__Pyx__Coroutine_Throw(PyObject *self, PyObject *typ, PyObject *val, PyObject *tb,
-                                        PyObject *args, int close_on_genexit) {
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
-    PyObject *yf;
-    if (unlikely(__Pyx_Coroutine_test_and_set_is_running(gen)))
-        return __Pyx_Coroutine_AlreadyRunningError(gen);
-    yf = gen->yieldfrom;
-    if (yf) {
-        __Pyx_PySendResult result;
-        PyObject *ret;
-        Py_INCREF(yf);
-        if (__Pyx_PyErr_GivenExceptionMatches(typ, PyExc_GeneratorExit) && close_on_genexit) {
-            int err = __Pyx_Coroutine_CloseIter(gen, yf);
-            Py_DECREF(yf);
-            __Pyx_Coroutine_Undelegate(gen);
-            if (err < 0)
-                goto propagate_exception;
-            goto throw_here;
-        }
-        if (0
-        #ifdef __Pyx_Generator_USED
-            || __Pyx_Generator_CheckExact(yf)
-        #endif
-        #ifdef __Pyx_Coroutine_USED
-            || __Pyx_Coroutine_Check(yf)
-        #endif
-            ) {
-            ret = __Pyx__Coroutine_Throw(yf, typ, val, tb, args, close_on_genexit);
-        #ifdef __Pyx_Coroutine_USED
-        } else if (__Pyx_CoroutineAwait_CheckExact(yf)) {
-            ret = __Pyx__Coroutine_Throw(((__pyx_CoroutineAwaitObject*)yf)->coroutine, typ, val, tb, args, close_on_genexit);
-        #endif
-        } else {
-            PyObject *meth = __Pyx_PyObject_GetAttrStrNoError(yf, __pyx_mstate_global->__pyx_n_u_throw);
-            if (unlikely(!meth)) {
-                Py_DECREF(yf);
-                if (unlikely(PyErr_Occurred())) {
-                    __Pyx_Coroutine_unset_is_running(gen);
-                    return NULL;
-                }
-                __Pyx_Coroutine_Undelegate(gen);
-                goto throw_here;
-            }
-            if (likely(args)) {
-                ret = __Pyx_PyObject_Call(meth, args, NULL);
-            } else {
-                PyObject *cargs[4] = {NULL, typ, val, tb};
-                ret = __Pyx_PyObject_FastCall(meth, cargs+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-            }
-            Py_DECREF(meth);
-        }
-        Py_DECREF(yf);
-        if (ret) {
-            __Pyx_Coroutine_unset_is_running(gen);
-            return ret;
-        }
-        result = __Pyx_Coroutine_FinishDelegation(gen, &ret);
-        __Pyx_Coroutine_unset_is_running(gen);
-        return __Pyx_Coroutine_MethodReturnFromResult(self, result, ret, 0);
-    }
-throw_here:
-    __Pyx_Raise(typ, val, tb, NULL);
-propagate_exception:
-    {
-        PyObject *retval = NULL;
-        __Pyx_PySendResult result = __Pyx_Coroutine_SendEx(gen, NULL, &retval, 0);
-        __Pyx_Coroutine_unset_is_running(gen);
-        return __Pyx_Coroutine_MethodReturnFromResult(self, result, retval, 0);
-    }
-}
-static PyObject *__Pyx_Coroutine_Throw(PyObject *self, PyObject *args) {
-    PyObject *typ;
-    PyObject *val = NULL;
-    PyObject *tb = NULL;
-    if (unlikely(!PyArg_UnpackTuple(args, "throw", 1, 3, &typ, &val, &tb)))
-        return NULL;
-    return __Pyx__Coroutine_Throw(self, typ, val, tb, args, 1);
-}
-static CYTHON_INLINE int __Pyx_Coroutine_traverse_excstate(__Pyx_ExcInfoStruct *exc_state, visitproc visit, void *arg) {
-#if PY_VERSION_HEX >= 0x030B00a4
-    Py_VISIT(exc_state->exc_value);
-#else
-    Py_VISIT(exc_state->exc_type);
-    Py_VISIT(exc_state->exc_value);
-    Py_VISIT(exc_state->exc_traceback);
-#endif
-    return 0;
-}
-static int __Pyx_Coroutine_traverse(__pyx_CoroutineObject *gen, visitproc visit, void *arg) {
-    {
-        int e = __Pyx_call_type_traverse((PyObject*)gen, 1, visit, arg);
-        if (e) return e;
-    }
-    Py_VISIT(gen->closure);
-    Py_VISIT(gen->classobj);
-    Py_VISIT(gen->yieldfrom);
-    return __Pyx_Coroutine_traverse_excstate(&gen->gi_exc_state, visit, arg);
-}
-static int __Pyx_Coroutine_clear(PyObject *self) {
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
-    Py_CLEAR(gen->closure);
-    Py_CLEAR(gen->classobj);
-    __Pyx_Coroutine_Undelegate(gen);
-    __Pyx_Coroutine_ExceptionClear(&gen->gi_exc_state);
-#ifdef __Pyx_AsyncGen_USED
-    if (__Pyx_AsyncGen_CheckExact(self)) {
-        Py_CLEAR(((__pyx_PyAsyncGenObject*)gen)->ag_finalizer);
-    }
-#endif
-    Py_CLEAR(gen->gi_code);
-    Py_CLEAR(gen->gi_frame);
-    Py_CLEAR(gen->gi_name);
-    Py_CLEAR(gen->gi_qualname);
-    Py_CLEAR(gen->gi_modulename);
-    return 0;
-}
-static void __Pyx_Coroutine_dealloc(PyObject *self) {
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
-    PyObject_GC_UnTrack(gen);
-    if (gen->gi_weakreflist != NULL)
-        PyObject_ClearWeakRefs(self);
-    if (gen->resume_label >= 0) {
-        PyObject_GC_Track(self);
-#if CYTHON_USE_TP_FINALIZE
-        if (unlikely(PyObject_CallFinalizerFromDealloc(self)))
-#else
-        {
-            destructor del = __Pyx_PyObject_GetSlot(gen, tp_del, destructor);
-            if (del) del(self);
-        }
-        if (unlikely(Py_REFCNT(self) > 0))
-#endif
-        {
-            return;
-        }
-        PyObject_GC_UnTrack(self);
-    }
-#ifdef __Pyx_AsyncGen_USED
-    if (__Pyx_AsyncGen_CheckExact(self)) {
-        /* We have to handle this case for asynchronous generators
-           right here, because this code has to be between UNTRACK
-           and GC_Del. */
-        Py_CLEAR(((__pyx_PyAsyncGenObject*)self)->ag_finalizer);
-    }
-#endif
-    __Pyx_Coroutine_clear(self);
-    __Pyx_PyHeapTypeObject_GC_Del(gen);
-}
-#if CYTHON_USE_TP_FINALIZE
-static void __Pyx_Coroutine_del(PyObject *self) {
-    PyObject *error_type, *error_value, *error_traceback;
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
-    __Pyx_PyThreadState_declare
-    if (gen->resume_label < 0) {
-        return;
-    }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&error_type, &error_value, &error_traceback);
-#ifdef __Pyx_AsyncGen_USED
-    if (__Pyx_AsyncGen_CheckExact(self)) {
-        __pyx_PyAsyncGenObject *agen = (__pyx_PyAsyncGenObject*)self;
-        PyObject *finalizer = agen->ag_finalizer;
-        if (finalizer && !agen->ag_closed) {
-            PyObject *res = __Pyx_PyObject_CallOneArg(finalizer, self);
-            if (unlikely(!res)) {
-                PyErr_WriteUnraisable(self);
-            } else {
-                Py_DECREF(res);
-            }
-            __Pyx_ErrRestore(error_type, error_value, error_traceback);
-            return;
-        }
-    }
-#endif
-    if (unlikely(gen->resume_label == 0 && !error_value)) {
-#ifdef __Pyx_Coroutine_USED
-#ifdef __Pyx_Generator_USED
-    if (!__Pyx_Generator_CheckExact(self))
-#endif
-        {
-        PyObject_GC_UnTrack(self);
-        if (unlikely(PyErr_WarnFormat(PyExc_RuntimeWarning, 1, "coroutine '%.50S' was never awaited", gen->gi_qualname) < 0))
-            PyErr_WriteUnraisable(self);
-        PyObject_GC_Track(self);
-        }
-#endif
-    } else {
-        PyObject *retval = NULL;
-        __Pyx_PySendResult result = __Pyx_Coroutine_Close(self, &retval);
-        if (result == PYGEN_ERROR) {
-            PyErr_WriteUnraisable(self);
-        } else {
-            Py_XDECREF(retval);
-        }
-    }
-    __Pyx_ErrRestore(error_type, error_value, error_traceback);
-}
-#endif
-static PyObject *
-__Pyx_Coroutine_get_name(__pyx_CoroutineObject *self, void *context)
-{
-    PyObject *name = self->gi_name;
-    CYTHON_UNUSED_VAR(context);
-    if (unlikely(!name)) name = Py_None;
-    Py_INCREF(name);
-    return name;
-}
-static int
-__Pyx_Coroutine_set_name(__pyx_CoroutineObject *self, PyObject *value, void *context)
-{
-    CYTHON_UNUSED_VAR(context);
-    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
-        PyErr_SetString(PyExc_TypeError,
-                        "__name__ must be set to a string object");
-        return -1;
-    }
-    Py_INCREF(value);
-    __Pyx_Py_XDECREF_SET(self->gi_name, value);
-    return 0;
-}
-static PyObject *
-__Pyx_Coroutine_get_qualname(__pyx_CoroutineObject *self, void *context)
-{
-    PyObject *name = self->gi_qualname;
-    CYTHON_UNUSED_VAR(context);
-    if (unlikely(!name)) name = Py_None;
-    Py_INCREF(name);
-    return name;
-}
-static int
-__Pyx_Coroutine_set_qualname(__pyx_CoroutineObject *self, PyObject *value, void *context)
-{
-    CYTHON_UNUSED_VAR(context);
-    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
-        PyErr_SetString(PyExc_TypeError,
-                        "__qualname__ must be set to a string object");
-        return -1;
-    }
-    Py_INCREF(value);
-    __Pyx_Py_XDECREF_SET(self->gi_qualname, value);
-    return 0;
-}
-static PyObject *
-__Pyx__Coroutine_get_frame(__pyx_CoroutineObject *self)
-{
-#if !CYTHON_COMPILING_IN_LIMITED_API
-    PyObject *frame;
-    #if PY_VERSION_HEX >= 0x030d0000
-    Py_BEGIN_CRITICAL_SECTION(self);
-    #endif
-    frame = self->gi_frame;
-    if (!frame) {
-        if (unlikely(!self->gi_code)) {
-            Py_RETURN_NONE;
-        }
-        PyObject *globals = PyDict_New();
-        if (unlikely(!globals)) return NULL;
-        frame = (PyObject *) PyFrame_New(
-            PyThreadState_Get(),            /*PyThreadState *tstate,*/
-            (PyCodeObject*) self->gi_code,  /*PyCodeObject *code,*/
-            globals,                        /*PyObject *globals,*/
-            0                               /*PyObject *locals*/
-        );
-        Py_DECREF(globals);
-        if (unlikely(!frame))
-            return NULL;
-        if (unlikely(self->gi_frame)) {
-            Py_DECREF(frame);
-            frame = self->gi_frame;
-        } else {
-            self->gi_frame = frame;
-        }
-    }
-    Py_INCREF(frame);
-    #if PY_VERSION_HEX >= 0x030d0000
-    Py_END_CRITICAL_SECTION();
-    #endif
-    return frame;
-#else
-    CYTHON_UNUSED_VAR(self);
-    Py_RETURN_NONE;
-#endif
-}
-static PyObject *
-__Pyx_Coroutine_get_frame(__pyx_CoroutineObject *self, void *context) {
-    CYTHON_UNUSED_VAR(context);
-    PyObject *frame = self->gi_frame;
-    if (frame)
-        return __Pyx_NewRef(frame);
-    return __Pyx__Coroutine_get_frame(self);
-}
-static __pyx_CoroutineObject *__Pyx__Coroutine_New(
-            PyTypeObject* type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
-            PyObject *name, PyObject *qualname, PyObject *module_name) {
-    __pyx_CoroutineObject *gen = PyObject_GC_New(__pyx_CoroutineObject, type);
-    if (unlikely(!gen))
-        return NULL;
-    return __Pyx__Coroutine_NewInit(gen, body, code, closure, name, qualname, module_name);
-}
-static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
-            __pyx_CoroutineObject *gen, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
-            PyObject *name, PyObject *qualname, PyObject *module_name) {
-    gen->body = body;
-    gen->closure = closure;
-    Py_XINCREF(closure);
-    gen->is_running = 0;
-    gen->resume_label = 0;
-    gen->classobj = NULL;
-    gen->yieldfrom = NULL;
-    gen->yieldfrom_am_send = NULL;
-    #if PY_VERSION_HEX >= 0x030B00a4 && !CYTHON_COMPILING_IN_LIMITED_API
-    gen->gi_exc_state.exc_value = NULL;
-    #else
-    gen->gi_exc_state.exc_type = NULL;
-    gen->gi_exc_state.exc_value = NULL;
-    gen->gi_exc_state.exc_traceback = NULL;
-    #endif
-#if CYTHON_USE_EXC_INFO_STACK
-    gen->gi_exc_state.previous_item = NULL;
-#endif
-    gen->gi_weakreflist = NULL;
-    Py_XINCREF(qualname);
-    gen->gi_qualname = qualname;
-    Py_XINCREF(name);
-    gen->gi_name = name;
-    Py_XINCREF(module_name);
-    gen->gi_modulename = module_name;
-    Py_XINCREF(code);
-    gen->gi_code = code;
-    gen->gi_frame = NULL;
-    PyObject_GC_Track(gen);
-    return gen;
-}
-static char __Pyx_Coroutine_test_and_set_is_running(__pyx_CoroutineObject *gen) {
-    char result;
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_BEGIN_CRITICAL_SECTION(gen);
-    #endif
-    result = gen->is_running;
-    gen->is_running = 1;
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_END_CRITICAL_SECTION();
-    #endif
-    return result;
-}
-static void __Pyx_Coroutine_unset_is_running(__pyx_CoroutineObject *gen) {
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_BEGIN_CRITICAL_SECTION(gen);
-    #endif
-    assert(gen->is_running);
-    gen->is_running = 0;
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_END_CRITICAL_SECTION();
-    #endif
-}
-static char __Pyx_Coroutine_get_is_running(__pyx_CoroutineObject *gen) {
-    char result;
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_BEGIN_CRITICAL_SECTION(gen);
-    #endif
-    result = gen->is_running;
-    #if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
-    Py_END_CRITICAL_SECTION();
-    #endif
-    return result;
-}
-static PyObject *__Pyx_Coroutine_get_is_running_getter(PyObject *gen, void *closure) {
-    CYTHON_UNUSED_VAR(closure);
-    char result = __Pyx_Coroutine_get_is_running((__pyx_CoroutineObject*)gen);
-    if (result) Py_RETURN_TRUE;
-    else Py_RETURN_FALSE;
-}
-#if __PYX_HAS_PY_AM_SEND == 2
-static void __Pyx_SetBackportTypeAmSend(PyTypeObject *type, __Pyx_PyAsyncMethodsStruct *static_amsend_methods, __Pyx_pyiter_sendfunc am_send) {
-    Py_ssize_t ptr_offset = (char*)(type->tp_as_async) - (char*)type;
-    if (ptr_offset < 0 || ptr_offset > type->tp_basicsize) {
-        return;
-    }
-    memcpy((void*)static_amsend_methods, (void*)(type->tp_as_async), sizeof(*type->tp_as_async));
-    static_amsend_methods->am_send = am_send;
-    type->tp_as_async = __Pyx_SlotTpAsAsync(static_amsend_methods);
-}
-#endif
-static PyObject *__Pyx_Coroutine_fail_reduce_ex(PyObject *self, PyObject *arg) {
-    CYTHON_UNUSED_VAR(arg);
-    __Pyx_TypeName self_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE((PyObject*)self));
-    PyErr_Format(PyExc_TypeError, "cannot pickle '" __Pyx_FMT_TYPENAME "' object",
-                         self_type_name);
-    __Pyx_DECREF_TypeName(self_type_name);
-    return NULL;
-}
-
-/* Generator */
-static PyMethodDef __pyx_Generator_methods[] = {
-    {"send", (PyCFunction) __Pyx_Coroutine_Send, METH_O,
-     PyDoc_STR("send(arg) -> send 'arg' into generator,\nreturn next yielded value or raise StopIteration.")},
-    {"throw", (PyCFunction) __Pyx_Coroutine_Throw, METH_VARARGS,
-     PyDoc_STR("throw(typ[,val[,tb]]) -> raise exception in generator,\nreturn next yielded value or raise StopIteration.")},
-    {"close", (PyCFunction) __Pyx_Coroutine_Close_Method, METH_NOARGS,
-     PyDoc_STR("close() -> raise GeneratorExit inside generator.")},
-    {"__reduce_ex__", (PyCFunction) __Pyx_Coroutine_fail_reduce_ex, METH_O, 0},
-    {"__reduce__", (PyCFunction) __Pyx_Coroutine_fail_reduce_ex, METH_NOARGS, 0},
-    {0, 0, 0, 0}
-};
-static PyMemberDef __pyx_Generator_memberlist[] = {
-    {"gi_yieldfrom", T_OBJECT, offsetof(__pyx_CoroutineObject, yieldfrom), READONLY,
-     PyDoc_STR("object being iterated by 'yield from', or None")},
-    {"gi_code", T_OBJECT, offsetof(__pyx_CoroutineObject, gi_code), READONLY, NULL},
-    {"__module__", T_OBJECT, offsetof(__pyx_CoroutineObject, gi_modulename), 0, 0},
-    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CoroutineObject, gi_weakreflist), READONLY, 0},
-    {0, 0, 0, 0, 0}
-};
-static PyGetSetDef __pyx_Generator_getsets[] = {
-    {"__name__", (getter)__Pyx_Coroutine_get_name, (setter)__Pyx_Coroutine_set_name,
-     PyDoc_STR("name of the generator"), 0},
-    {"__qualname__", (getter)__Pyx_Coroutine_get_qualname, (setter)__Pyx_Coroutine_set_qualname,
-     PyDoc_STR("qualified name of the generator"), 0},
-    {"gi_frame", (getter)__Pyx_Coroutine_get_frame, NULL,
-     PyDoc_STR("Frame of the generator"), 0},
-    {"gi_running", __Pyx_Coroutine_get_is_running_getter, NULL, NULL, NULL},
-    {0, 0, 0, 0, 0}
-};
-static PyType_Slot __pyx_GeneratorType_slots[] = {
-    {Py_tp_dealloc, (void *)__Pyx_Coroutine_dealloc},
-    {Py_tp_traverse, (void *)__Pyx_Coroutine_traverse},
-    {Py_tp_iter, (void *)PyObject_SelfIter},
-    {Py_tp_iternext, (void *)__Pyx_Generator_Next},
-    {Py_tp_methods, (void *)__pyx_Generator_methods},
-    {Py_tp_members, (void *)__pyx_Generator_memberlist},
-    {Py_tp_getset, (void *)__pyx_Generator_getsets},
-    {Py_tp_getattro, (void *) PyObject_GenericGetAttr},
-#if CYTHON_USE_TP_FINALIZE
-    {Py_tp_finalize, (void *)__Pyx_Coroutine_del},
-#endif
-#if __PYX_HAS_PY_AM_SEND == 1
-    {Py_am_send, (void *)__Pyx_Coroutine_AmSend},
-#endif
-    {0, 0},
-};
-static PyType_Spec __pyx_GeneratorType_spec = {
-    __PYX_TYPE_MODULE_PREFIX "generator",
-    sizeof(__pyx_CoroutineObject),
-    0,
-#if PY_VERSION_HEX >= 0x030A0000
-    Py_TPFLAGS_IMMUTABLETYPE |
-#endif
-    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_FINALIZE | __Pyx_TPFLAGS_HAVE_AM_SEND,
-    __pyx_GeneratorType_slots
-};
-#if __PYX_HAS_PY_AM_SEND == 2
-static __Pyx_PyAsyncMethodsStruct __pyx_Generator_as_async;
-#endif
-static int __pyx_Generator_init(PyObject *module) {
-    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
-    mstate->__pyx_GeneratorType = __Pyx_FetchCommonTypeFromSpec(
-        mstate->__pyx_CommonTypesMetaclassType, module, &__pyx_GeneratorType_spec, NULL);
-    if (unlikely(!mstate->__pyx_GeneratorType)) {
-        return -1;
-    }
-#if __PYX_HAS_PY_AM_SEND == 2
-    __Pyx_SetBackportTypeAmSend(mstate->__pyx_GeneratorType, &__pyx_Generator_as_async, &__Pyx_Coroutine_AmSend);
-#endif
-    return 0;
-}
-static PyObject *__Pyx_Generator_GetInlinedResult(PyObject *self) {
-    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject*) self;
-    PyObject *retval = NULL;
-    if (unlikely(__Pyx_Coroutine_test_and_set_is_running(gen))) {
-        return __Pyx_Coroutine_AlreadyRunningError(gen);
-    }
-    __Pyx_PySendResult result = __Pyx_Coroutine_SendEx(gen, Py_None, &retval, 0);
-    __Pyx_Coroutine_unset_is_running(gen);
-    (void) result;
-    assert (result == PYGEN_RETURN || result == PYGEN_ERROR);
-    assert ((result == PYGEN_RETURN && retval != NULL) || (result == PYGEN_ERROR && retval == NULL));
-    return retval;
-}
 
 /* GetRuntimeVersion */
 static unsigned long __Pyx_get_runtime_version(void) {
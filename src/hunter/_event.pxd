@@ -78,5 +78,6 @@ cdef class Event:
         object threadname_getter(self)
         object instruction_getter(self)
 
+cdef Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support)
 cdef Event fast_clone(Event self)
 cdef Event fast_detach(Event self, object value_filter)
@@ -1,26 +1,21 @@
 # cython: linetrace=True, language_level=3str, c_string_encoding=ascii, freethreading_compatible=True
 cimport cython
 
-from functools import partial
 from linecache import getline
 from linecache import getlines
 from os.path import basename
-from os.path import exists
 from os.path import splitext
 from threading import current_thread
-from tokenize import TokenError
-from tokenize import generate_tokens
 
 from cpython.pythread cimport PyThread_get_thread_ident
 from cpython.ref cimport PyObject
 
-from .const import SITE_PACKAGES_PATHS
-from .const import SYS_PREFIX_PATHS
-from .util import CYTHON_SUFFIX_RE
-from .util import LEADING_WHITESPACE_RE
+from .util import get_code_fields
+from .util import get_fullsource
 from .util import get_func_in_mro
 from .util import get_main_thread
 from .util import if_same_code
+from .util import yield_lines as yield_source_lines
 
 __all__ = 'Event',
 
@@ -43,7 +38,10 @@ cdef const PyObject** KIND_NAMES = [
 ]
 
 
+# Events that the handler doesn't keep around are released right after the handler returns; the freelist makes the
+# next allocation reuse their memory instead of going through the allocator every time.
 @cython.auto_pickle(False)
+@cython.freelist(64)
 cdef class Event:
     """
     A wrapper object for Frame objects. Instances of this are passed to your custom functions or predicates.
@@ -57,30 +55,7 @@ cdef class Event:
             may be expected.
     """
     def __init__(self, FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
-        self.arg = arg
-        self.frame = frame
-        self.kind = <str> KIND_NAMES[kind]
-        self.depth = depth
-        self.calls = calls
-        self.threading_support = threading_support
-        self.detached = False
-        self.builtin = kind > 3
-
-        self._code = UNSET
-        self._filename = UNSET
-        self._fullsource = UNSET
-        self._function_object = UNSET
-        self._function = UNSET
-        self._globals = UNSET
-        self._lineno = UNSET
-        self._locals = UNSET
-        self._module = UNSET
-        self._source = UNSET
-        self._stdlib = UNSET
-        self._threadidn = UNSET
-        self._threadname = UNSET
-        self._thread = UNSET
-        self._instruction = UNSET
+        init_event(self, frame, kind, arg, depth, calls, threading_support)
 
     def __repr__(self):
         return '<Event kind=%r function=%r module=%r filename=%r lineno=%s>' % (
@@ -222,25 +197,8 @@ cdef class Event:
         return self.module_getter()
 
     cdef inline filename_getter(self):
-        cdef CodeType code
         if self._filename is UNSET:
-            code = self.code_getter()
-            filename = code.co_filename
-            if not filename:
-                filename = self.globals.get('__file__')
-            if not filename:
-                filename = '?'
-            elif filename.endswith(('.pyc', '.pyo')):
-                filename = filename[:-1]
-            elif filename.endswith(('.so', '.pyd')):
-                cybasename = CYTHON_SUFFIX_RE.sub('', filename)
-                for ext in ('.pyx', '.py'):
-                    cyfilename = cybasename + ext
-                    if exists(cyfilename):
-                        filename = cyfilename
-                        break
-
-            self._filename = filename
+            self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
         return self._filename
 
     @property
@@ -268,20 +226,7 @@ cdef class Event:
 
     cdef inline stdlib_getter(self):
         if self._stdlib is UNSET:
-            module_parts = self.module.split('.')
-            if 'pkg_resources' in module_parts:
-                # skip this over-vendored module
-                self._stdlib = True
-            elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):
-                # skip namedtuple exec garbage
-                self._stdlib = True
-            elif self.filename.startswith(SITE_PACKAGES_PATHS):
-                # if in site-packages then definitely not stdlib
-                self._stdlib = False
-            elif self.filename.startswith(SYS_PREFIX_PATHS):
-                self._stdlib = True
-            else:
-                self._stdlib = False
+            self._filename, self._stdlib = get_code_fields(self.code_getter(), self.module_getter(), self.globals_getter())
         return self._stdlib
 
     @property
@@ -289,34 +234,15 @@ cdef class Event:
         return self.stdlib_getter()
 
     cdef inline fullsource_getter(self):
-        cdef list lines
         cdef CodeType code
 
         if self._fullsource is UNSET:
             try:
-                self._fullsource = None
                 code = self.code_getter()
                 if self.kind == 'call' and code.co_name != '<module>':
-                    lines = []
-                    try:
-                        for _, token, _, _, _ in generate_tokens(
-                            partial(
-                                next,
-                                yield_lines(
-                                    self.filename,
-                                    self.frame.f_globals,
-                                    self.lineno - 1,
-                                    lines,
-                                ),
-                            )
-                        ):
-                            if token in ('def', 'class', 'lambda'):
-                                self._fullsource = ''.join(lines)
-                                break
-                    except TokenError:
-                        pass
-                if self._fullsource is None:
-                    self._fullsource = getline(self.filename, self.lineno, self.globals)
+                    self._fullsource = get_fullsource(self.filename_getter(), self.lineno_getter(), self.globals_getter())
+                else:
+                    self._fullsource = getline(self.filename_getter(), self.lineno_getter(), self.globals_getter())
             except Exception as exc:
                 self._fullsource = f'??? NO SOURCE: {exc!r}'
         return self._fullsource
@@ -344,19 +270,43 @@ cdef class Event:
         return getattr(self, item)
 
 
-def yield_lines(filename, module_globals, start, list collector,
-                limit=10):
-    dedent = None
-    amount = 0
-    for line in getlines(filename, module_globals)[start:start + limit]:
-        if dedent is None:
-            dedent = LEADING_WHITESPACE_RE.findall(line)
-            dedent = dedent[0] if dedent else ''
-            amount = len(dedent)
-        elif not line.startswith(dedent):
-            break
-        collector.append(line)
-        yield line[amount:]
+cdef inline void init_event(Event event, FrameType frame, int kind, object arg, int depth, int calls,
+                            bint threading_support) noexcept:
+    event.arg = arg
+    event.frame = frame
+    event.kind = <str> KIND_NAMES[kind]
+    event.depth = depth
+    event.calls = calls
+    event.threading_support = threading_support
+    event.detached = False
+    event.builtin = kind > 3
+
+    event._code = UNSET
+    event._filename = UNSET
+    event._fullsource = UNSET
+    event._function_object = UNSET
+    event._function = UNSET
+    event._globals = UNSET
+    event._lineno = UNSET
+    event._locals = UNSET
+    event._module = UNSET
+    event._source = UNSET
+    event._stdlib = UNSET
+    event._threadidn = UNSET
+    event._threadname = UNSET
+    event._thread = UNSET
+    event._instruction = UNSET
+
+
+cdef inline Event fast_event(FrameType frame, int kind, object arg, int depth, int calls, bint threading_support):
+    event = <Event> Event.__new__(Event)
+    init_event(event, frame, kind, arg, depth, calls, threading_support)
+    return event
+
+
+def yield_lines(filename, module_globals, start, list collector, limit=10):
+    # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+    return yield_source_lines(getlines(filename, module_globals), start, collector.append, limit)
 
 
 cdef inline Event fast_detach(Event self, object value_filter):
@@ -17,6 +17,7 @@ cdef class Query:
         readonly tuple query_lte
         readonly tuple query_regex
         readonly tuple query_startswith
+        tuple checks
 
 
 @cython.final
@@ -14,6 +14,10 @@ from ._tracer cimport *
 
 from .actions import Action
 from .actions import ColorStreamAction
+from .util import Affixes
+from .util import MatchCache
+from .util import ValueSet
+from .util import affixes
 
 __all__ = (
     'And',
@@ -34,6 +38,27 @@ cdef tuple ALLOWED_OPERATORS = (
     'gt', 'gte', 'lt', 'lte',
 )
 
+cdef enum:
+    QUERY_EQ
+    QUERY_IN
+    QUERY_CONTAINS
+    QUERY_STARTSWITH
+    QUERY_ENDSWITH
+    QUERY_REGEX
+    QUERY_GT
+    QUERY_GTE
+    QUERY_LT
+    QUERY_LTE
+
+# Relative costs used to order the checks of a Query (cheapest first). Fields not listed here are the most expensive
+# (arg, globals and locals can have values of any type, thus they are checked last).
+cdef dict FIELD_COSTS = {
+    'builtin': 0, 'calls': 0, 'depth': 0, 'kind': 0,
+    'filename': 1, 'function': 1, 'lineno': 1, 'module': 1,
+    'instruction': 2, 'stdlib': 2, 'threadid': 2, 'threadname': 2,
+    'source': 4,
+}
+
 ctypedef object (*Event_getter_typedef)(Event)
 cdef inline Event_get_function(Event event): return event.function_getter()
 cdef inline Event_get_module(Event event): return event.module_getter()
@@ -78,12 +103,24 @@ cdef Event_getter_typedef[17] Event_getters = [
 cdef class QueryEntry:
     cdef Event_getter_typedef getter
     cdef int getter_index
-    cdef object value
+    cdef int operator
+    cdef int cost
+    cdef bint search
+    cdef object match
+    cdef readonly object value
 
-    def __init__(self, object value, str name):
+    def __init__(self, object value, str name, int operator):
         self.value = value
         self.getter_index = ALLOWED_KEYS.index(name)
         self.getter = Event_getters[self.getter_index]
+        self.operator = operator
+        cdef int field_cost = FIELD_COSTS.get(name, 5)
+        # the cheap int fields go first, the rest are kept in the order of the operator groups (the equality checks can
+        # guard the ordering checks, eg: module='foo', arg_gt=1)
+        self.cost = (field_cost > 0) * 100 + operator * 10 + field_cost
+        self.search = type(value) is Affixes
+        if operator == QUERY_REGEX:
+            self.match = MatchCache(value).match
 
     def __repr__(self):
         return repr(self.value)
@@ -151,39 +188,54 @@ cdef class Query:
                     if not isinstance(value, basestring):
                         if not isinstance(value, (list, set, tuple)):
                             raise ValueError(f'Value {value!r} for {key!r} is invalid. Must be a string, list, tuple or set.')
-                        value = tuple(value)
+                        value = affixes(value)
                     mapping = query_startswith
+                    operator_code = QUERY_STARTSWITH
                 elif operator in ('endswith', 'ew'):
                     if not isinstance(value, basestring):
                         if not isinstance(value, (list, set, tuple)):
                             raise ValueError(f'Value {value!r} for {key!r} is invalid. Must be a string, list, tuple or set.')
-                        value = tuple(value)
+                        value = affixes(value, suffixes=True)
                     mapping = query_endswith
+                    operator_code = QUERY_ENDSWITH
                 elif operator == 'in':
+                    if isinstance(value, (list, set, tuple, frozenset)):
+                        try:
+                            value = ValueSet(value)
+                        except TypeError:  # unhashable values
+                            value = tuple(value)
                     mapping = query_in
+                    operator_code = QUERY_IN
                 elif operator in ('contains', 'has'):
                     mapping = query_contains
+                    operator_code = QUERY_CONTAINS
                 elif operator in ('regex', 'rx'):
                     value = re_compile(value)
                     mapping = query_regex
+                    operator_code = QUERY_REGEX
                 elif operator == 'lt':
                     mapping = query_lt
+                    operator_code = QUERY_LT
                 elif operator == 'lte':
                     mapping = query_lte
+                    operator_code = QUERY_LTE
                 elif operator == 'gt':
                     mapping = query_gt
+                    operator_code = QUERY_GT
                 elif operator == 'gte':
                     mapping = query_gte
+                    operator_code = QUERY_GTE
                 else:
                     raise TypeError(f'Unexpected operator {operator!r}. Must be one of {ALLOWED_OPERATORS}.')
             else:
                 mapping = query_eq
+                operator_code = QUERY_EQ
                 prefix = key
 
             if prefix not in ALLOWED_KEYS:
                 raise TypeError(f'Unexpected argument {key!r}. Must be one of {ALLOWED_KEYS}.')
 
-            mapping[prefix] = QueryEntry(value, prefix)
+            mapping[prefix] = QueryEntry(value, prefix, operator_code)
 
         self.query_eq = tuple(sorted(query_eq.items()))
         self.query_startswith = tuple(sorted(query_startswith.items()))
@@ -195,6 +247,17 @@ cdef class Query:
         self.query_lte = tuple(sorted(query_lte.items()))
         self.query_gt = tuple(sorted(query_gt.items()))
         self.query_gte = tuple(sorted(query_gte.items()))
+        self.checks = tuple(sorted(
+            [
+                entry
+                for mapping in (
+                    self.query_eq, self.query_in, self.query_contains, self.query_startswith, self.query_endswith,
+                    self.query_regex, self.query_gt, self.query_gte, self.query_lt, self.query_lte,
+                )
+                for _, entry in mapping
+            ],
+            key=lambda entry: (<QueryEntry> entry).cost,
+        ))
 
     def __str__(self):
         return 'Query(%s)' % (
@@ -261,47 +324,58 @@ cdef class Query:
     def __invert__(self):
         return Not(self)
 
+cdef inline bint fast_in(object value_from_event, object values) except -1:
+    try:
+        return value_from_event in values
+    except TypeError:  # unhashable event value (eg: a list returned by the traced function) and a frozenset of values
+        for value in values:
+            if value_from_event == value:
+                return True
+        return False
+
 cdef inline fast_Query_call(Query self, Event event):
-    for key, entry in self.query_eq:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if value_from_event != (<QueryEntry> entry).value:
-            return False
-    for key, entry in self.query_in:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if (<str?>value_from_event) not in (<QueryEntry> entry).value:
-            return False
-    for key, entry in self.query_contains:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if (<QueryEntry> entry).value not in (<str?>value_from_event):
-            return False
-    for key, entry in self.query_startswith:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not (<str?>value_from_event).startswith((<QueryEntry> entry).value):
-            return False
-    for key, entry in self.query_endswith:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not (<str?>value_from_event).endswith((<QueryEntry> entry).value):
-            return False
-    for key, entry in self.query_regex:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not (<QueryEntry> entry).value.match(value_from_event):
-            return False
-    for key, entry in self.query_gt:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not value_from_event > (<QueryEntry> entry).value:
-            return False
-    for key, entry in self.query_gte:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not value_from_event >= (<QueryEntry> entry).value:
-            return False
-    for key, entry in self.query_lt:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not value_from_event < (<QueryEntry> entry).value:
-            return False
-    for key, entry in self.query_lte:
-        value_from_event = (<QueryEntry> entry).getter(event)
-        if not value_from_event <= (<QueryEntry> entry).value:
-            return False
+    cdef QueryEntry entry
+    cdef int operator
+
+    for entry in self.checks:
+        value_from_event = entry.getter(event)
+        operator = entry.operator
+        if operator == QUERY_EQ:
+            if value_from_event != entry.value:
+                return False
+        elif operator == QUERY_IN:
+            if not fast_in(value_from_event, entry.value):
+                return False
+        elif operator == QUERY_CONTAINS:
+            if entry.value not in (<str?>value_from_event):
+                return False
+        elif operator == QUERY_STARTSWITH:
+            if entry.search:
+                if not entry.value.match(<str?>value_from_event):
+                    return False
+            elif not (<str?>value_from_event).startswith(entry.value):
+                return False
+        elif operator == QUERY_ENDSWITH:
+            if entry.search:
+                if not entry.value.match(<str?>value_from_event):
+                    return False
+            elif not (<str?>value_from_event).endswith(entry.value):
+                return False
+        elif operator == QUERY_REGEX:
+            if not entry.match(value_from_event):
+                return False
+        elif operator == QUERY_GT:
+            if not value_from_event > entry.value:
+                return False
+        elif operator == QUERY_GTE:
+            if not value_from_event >= entry.value:
+                return False
+        elif operator == QUERY_LT:
+            if not value_from_event < entry.value:
+                return False
+        elif operator == QUERY_LTE:
+            if not value_from_event <= entry.value:
+                return False
 
     return True
 
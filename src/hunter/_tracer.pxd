@@ -22,6 +22,55 @@ cdef extern from "pystate.h":
         Py_tracefunc c_profilefunc
 
 
+@cython.final
+cdef class ThreadCounters:
+    cdef:
+        readonly int depth
+        readonly int calls
+        bint unsampled
+        object sharded
+        object handler
+        object residual
+        readonly unsigned long long events
+        readonly unsigned long long handled
+        readonly double time
+        readonly double handler_time
+
+
+@cython.final
+cdef class CountersToken:
+    cdef:
+        Py_tss_t* key
+        unsigned long ident
+
+        object __weakref__
+
+
+@cython.final
+cdef class Budget:
+    cdef:
+        readonly object max_events
+        readonly object max_events_per_second
+        readonly object max_cpu_fraction
+        readonly str over_budget
+        public bint calls_only
+        readonly unsigned long long events
+        readonly double handler_time
+
+        unsigned long long _max_events
+        unsigned long long _max_events_per_second
+        double _max_cpu_fraction
+        unsigned long long _window_events
+        double _start
+        double _window_start
+
+    cpdef reset(self)
+    cpdef bint timed(self)
+    cpdef add_time(self, double duration)
+    cpdef str exceeded(self)
+    cpdef object admit(self, bint is_call)
+
+
 @cython.final
 cdef class Tracer:
     cdef:
@@ -29,10 +78,27 @@ cdef class Tracer:
         readonly object previous
         readonly object threading_support
         readonly bint profiling_mode
-        readonly int depth
-        readonly int calls
+        readonly bint builtin_events
+        readonly bint sharding
+        readonly object instrument
+        readonly object instrumented
+        readonly object sample
+        readonly object sample_rate
+        readonly Budget budget
 
         object __weakref__
 
         readonly object _threading_previous
         Py_tracefunc _previousfunc
+        dict _code_handlers
+        object _static
+        object _residual
+        Py_tss_t* _counters_key
+        readonly object _registry
+        object _local
+        bint _sampling
+        unsigned long long _sample_every
+        unsigned long long _top_calls
+
+    cdef ThreadCounters get_counters(self)
+    cdef bint sample_next(self)
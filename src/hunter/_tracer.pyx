@@ -1,15 +1,35 @@
 # cython: linetrace=True, language_level=3str, freethreading_compatible=True
 import threading
 import traceback
+from random import random
+from time import perf_counter
 
 from cpython.pystate cimport PyThreadState_Get
 from cpython.pystate cimport PyFrameObject
+from cpython.pythread cimport PyThread_get_thread_ident
+from cpython.pythread cimport PyThread_tss_alloc
+from cpython.pythread cimport PyThread_tss_create
+from cpython.pythread cimport PyThread_tss_free
+from cpython.pythread cimport PyThread_tss_get
+from cpython.pythread cimport PyThread_tss_set
 from ._event cimport Event
+from ._event cimport Hunter_PyFrame_GetCode
+from ._event cimport fast_event
 from ._predicates cimport fast_call
 
 import hunter
 
-__all__ = 'Tracer',
+from .predicates import CODE_FIELDS
+from .predicates import _code_cacheable
+from .predicates import _deliverable
+from .predicates import _shard
+from .predicates import analyze
+from .predicates import instrument
+from .predicates import optimize
+from .util import CountersRegistry
+from .util import flush_buffers
+
+__all__ = 'Budget', 'Tracer'
 
 cdef dict KIND_INTS = {
     'call': 0,
@@ -21,14 +41,131 @@ cdef dict KIND_INTS = {
     'c_return': 6,
 }
 
+cdef class ThreadCounters:
+    def reset_stats(self):
+        self.events = self.handled = 0
+        self.time = self.handler_time = 0
+
+
+cdef class CountersToken:
+    def __cinit__(self, Tracer tracer):
+        self.key = tracer._counters_key
+        self.ident = PyThread_get_thread_ident()
+
+    def __dealloc__(self):
+        # the thread-local was cleared, thus the registry can drop the counters, don't let the slot point to them anymore
+        if self.ident == PyThread_get_thread_ident():
+            PyThread_tss_set(self.key, NULL)
+
+
+cdef enum:
+    BUDGET_TIMING_INTERVAL = 16  # only one in this many events are timed
+    BUDGET_CHECK_INTERVAL = 1024  # the handler time is checked once every this many events
+    STATS_TIMING_INTERVAL = 16  # only one in this many events are timed for Tracer.stats()
+
+
+cdef class Budget:
+    def __init__(self, max_events=None, max_events_per_second=None, max_cpu_fraction=None, over_budget='stop'):
+        for name, value in (
+            ('max_events', max_events),
+            ('max_events_per_second', max_events_per_second),
+            ('max_cpu_fraction', max_cpu_fraction),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f'Invalid {name}={value!r}. Must be a positive number.')
+        if max_cpu_fraction is not None and max_cpu_fraction > 1:
+            raise ValueError(f'Invalid max_cpu_fraction={max_cpu_fraction!r}. Must be a number between 0 (exclusive) and 1.')
+        if over_budget not in ('stop', 'calls'):
+            raise ValueError(f"Invalid over_budget={over_budget!r}. Must be 'stop' or 'calls'.")
+        self.max_events = max_events
+        self.max_events_per_second = max_events_per_second
+        self.max_cpu_fraction = max_cpu_fraction
+        self.over_budget = over_budget
+        self._max_events = max_events or 0
+        self._max_events_per_second = max_events_per_second or 0
+        self._max_cpu_fraction = max_cpu_fraction or 0
+        self.calls_only = False
+        self.reset()
+
+    def __repr__(self):
+        return (
+            f'<hunter._tracer.Budget: max_events={self.max_events}, max_events_per_second={self.max_events_per_second}, '
+            f'max_cpu_fraction={self.max_cpu_fraction}, over_budget={self.over_budget!r}, calls_only={self.calls_only}>'
+        )
+
+    cpdef reset(self):
+        self.events = 0
+        self.handler_time = 0
+        self._window_events = 0
+        self._start = self._window_start = perf_counter()
+
+    cpdef bint timed(self):
+        return self._max_cpu_fraction and self.events % BUDGET_TIMING_INTERVAL == 0
+
+    cpdef add_time(self, double duration):
+        self.handler_time += duration * BUDGET_TIMING_INTERVAL
+
+    cpdef str exceeded(self):
+        cdef double now
+
+        self.events += 1
+        if self._max_events and self.events > self._max_events:
+            return f'more than {self.max_events} events'
+        if self._max_events_per_second:
+            self._window_events += 1
+            if self._window_events > self._max_events_per_second:
+                now = perf_counter()
+                if now - self._window_start < 1:
+                    return f'more than {self.max_events_per_second} events per second'
+                self._window_start = now
+                self._window_events = 1
+        if self._max_cpu_fraction and self.events % BUDGET_CHECK_INTERVAL == 0:
+            if self.handler_time > (perf_counter() - self._start) * self._max_cpu_fraction:
+                return f'more than {self.max_cpu_fraction:.0%} of the time spent in the handler'
+        return None
+
+    cpdef object admit(self, bint is_call):
+        if self.calls_only and not is_call:
+            return False
+        reason = self.exceeded()
+        if reason is None:
+            return True
+        elif self.over_budget == 'calls' and not self.calls_only:
+            hunter._default_stream.write(f'Only tracing calls from now on because the tracer is over budget ({reason}).\n')
+            self.calls_only = True
+            self.reset()
+            return self.admit(is_call)
+        else:
+            hunter._default_stream.write(f'Disabling tracer because it is over budget ({reason}).\n')
+            return None
+
+
+cdef object code_handler(Tracer self, Event event):
+    # returns what needs to be called for the events from event's code object, or None if nothing there can match
+    try:
+        if _deliverable(self.handler, event, CODE_FIELDS) and (self._static is None or self._static(event)):
+            return self._residual
+    except Exception:
+        return self.handler
+
+
+cdef inline int skip_event(ThreadCounters counters, FrameType frame_object, int kind) noexcept:
+    # only keeps the depth right, line events are disabled for the frame
+    if kind == 0:
+        frame_object.f_trace_lines = False
+        counters.depth += 1
+        counters.calls += 1
+    elif kind == 2:
+        frame_object.f_trace_lines = False
+    return 0
+
+
 cdef int trace_func(PyObject* tracer, PyFrameObject* frame, int kind, PyObject* arg) noexcept:
     cdef Tracer self = <Tracer?> tracer
-    cdef FrameType frame_object = <FrameType> frame
-
-    frame_object.f_trace = self
-    handler = self.handler
+    cdef ThreadCounters counters
+    cdef double start
 
-    if handler is None:  # the tracer was stopped
+    if self.handler is None:  # the tracer was stopped
         # make sure it's uninstalled even for running threads
         if self.profiling_mode:
             PyEval_SetProfile(NULL, NULL)
@@ -36,12 +173,90 @@ cdef int trace_func(PyObject* tracer, PyFrameObject* frame, int kind, PyObject*
             PyEval_SetTrace(NULL, NULL)
         return 0
 
-    if kind == 3 and self.depth > 0:
-        self.depth -= 1
+    counters = self.get_counters()
+    counters.events += 1
+    if counters.events % STATS_TIMING_INTERVAL:
+        return trace_event(self, counters, <FrameType> frame, kind, arg, False)
+    else:
+        start = perf_counter()
+        trace_event(self, counters, <FrameType> frame, kind, arg, True)
+        counters.time += (perf_counter() - start) * STATS_TIMING_INTERVAL
+        return 0
+
+
+cdef int trace_event(Tracer self, ThreadCounters counters, FrameType frame_object, int kind, PyObject* arg,
+                     bint timed) noexcept:
+    cdef Event event = None
+    cdef tuple entry
+    cdef double start, duration
+    cdef bint budget_timed
+
+    handler = predicate = self.handler
+
+    if kind > 3 and not self.builtin_events:
+        return 0
+
+    if kind == 3 and counters.depth > 0:
+        counters.depth -= 1
+
+    if self._sampling and kind == 0 and counters.depth == 0:
+        counters.unsampled = not self.sample_next()
+    if counters.unsampled:
+        if kind == 3 and counters.depth == 0:  # the top-level call that was not sampled just ended
+            counters.unsampled = False
+        return skip_event(counters, frame_object, kind)
+
+    if kind < 4 and self._code_handlers is not None:
+        code = Hunter_PyFrame_GetCode(frame_object)
+        entry = self._code_handlers.get(id(code))
+        if entry is None or entry[0] is not code:
+            event = fast_event(frame_object, kind, None if arg is NULL else <object> arg,
+                               counters.depth, counters.calls, self.threading_support)
+            # the code object is kept alive so that its id can't be reused
+            entry = self._code_handlers[id(code)] = code, code_handler(self, event)
+        predicate = entry[1]
+        if predicate is None:  # the handler would never match anything in this code object
+            return skip_event(counters, frame_object, kind)
+    elif self._code_handlers is None:  # there's no static part thus the residual is the whole (optimized) handler
+        predicate = self._residual
+
+    if self.budget is not None:
+        admitted = self.budget.admit(kind == 0 or kind == 4)
+        if not admitted:
+            if admitted is None:
+                self.stop()
+            else:
+                frame_object.f_trace_lines = False
+            return 0
+
+    if self.sharding:
+        if counters.sharded is not handler:
+            memo = {}
+            counters.handler = _shard(handler, memo)
+            counters.residual = _shard(self._residual, memo)
+            counters.sharded = handler
+        if predicate is handler:
+            predicate = counters.handler
+        elif predicate is self._residual:
+            predicate = counters.residual
 
-    cdef Event event = Event(<FrameType> frame, kind, None if arg is NULL else <object> arg, self.depth, self.calls, self.threading_support)
+    frame_object.f_trace = self
+    if event is None:
+        event = fast_event(frame_object, kind, None if arg is NULL else <object> arg,
+                           counters.depth, counters.calls, self.threading_support)
+    counters.handled += 1
     try:
-        fast_call(handler, event)
+        budget_timed = self.budget is not None and self.budget.timed()
+        if timed or budget_timed:
+            start = perf_counter()
+            fast_call(predicate, event)
+            duration = perf_counter() - start
+            if timed:
+                counters.handler_time += duration * STATS_TIMING_INTERVAL
+            if budget_timed:
+                self.budget.add_time(duration)
+        else:
+            fast_call(predicate, event)
     except Exception as exc:
         traceback.print_exc(file=hunter._default_stream)
         hunter._default_stream.write('Disabling tracer because handler %r failed (%r) at %r.\n\n' % (
@@ -50,31 +265,96 @@ cdef int trace_func(PyObject* tracer, PyFrameObject* frame, int kind, PyObject*
         return 0
 
     if kind == 0:
-        self.depth += 1
-        self.calls += 1
+        counters.depth += 1
+        counters.calls += 1
     return 0
 
 
 cdef class Tracer:
-    def __cinit__(self, threading_support=None, profiling_mode=False):
+    def __cinit__(self, threading_support=None, profiling_mode=False, sample=None, sample_rate=None, Budget budget=None,
+                  builtin_events=True, sharding=False, instrument=False):
+        if sample is not None and sample_rate is not None:
+            raise ValueError('Only one of sample or sample_rate can be used.')
+        if sample is not None and sample < 1:
+            raise ValueError(f'Invalid sample={sample!r}. Must be a positive integer.')
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError(f'Invalid sample_rate={sample_rate!r}. Must be a number between 0 (exclusive) and 1.')
         self.handler = None
         self.previous = None
         self._previousfunc = NULL
         self._threading_previous = None
         self.threading_support = threading_support
         self.profiling_mode = profiling_mode
-        self.depth = 0
-        self.calls = 0
+        self.builtin_events = builtin_events
+        self.sharding = sharding
+        self.instrument = instrument
+        self.instrumented = None
+        self.sample = sample
+        self.sample_rate = sample_rate
+        self.budget = budget
+        self._sampling = sample is not None or sample_rate is not None
+        self._sample_every = sample or 1
+        self._top_calls = 0
+        self._counters_key = PyThread_tss_alloc()
+        if self._counters_key is NULL or PyThread_tss_create(self._counters_key):
+            raise MemoryError()
+        self._registry = CountersRegistry()
+        # the registry owns the counters and drops them once the token in the thread-local is gone (with the thread)
+        self._local = threading.local()
+        self._code_handlers = None
+        self._static = self._residual = None
 
     def __dealloc__(self):
         cdef PyThreadState *state = PyThreadState_Get()
         if state.c_traceobj is <PyObject*> self:
             self.stop()
+        # the tokens need the key
+        self._local = None
+        if self._counters_key is not NULL:
+            PyThread_tss_free(self._counters_key)
+
+    cdef ThreadCounters get_counters(self):
+        cdef void* counters = PyThread_tss_get(self._counters_key)
+        if counters is NULL:
+            new_counters = ThreadCounters()
+            self._local.token = self._registry.add(new_counters, CountersToken(self))
+            # the slot only has a borrowed reference, the registry drops the counters only after the thread is gone
+            PyThread_tss_set(self._counters_key, <void*> new_counters)
+            return new_counters
+        else:
+            return <ThreadCounters> counters
+
+    cdef bint sample_next(self):
+        cdef bint sampled
+        if self.sample_rate is None:
+            sampled = self._top_calls % self._sample_every == 0
+            self._top_calls += 1
+            return sampled
+        else:
+            return random() < self.sample_rate
+
+    @property
+    def hook(self):
+        if not self.profiling_mode:
+            return 'settrace'
+        elif self.builtin_events:
+            return 'setprofile'
+        else:
+            return 'setprofile (without builtins)'
+
+    @property
+    def depth(self):
+        return self.get_counters().depth
+
+    @property
+    def calls(self):
+        return self.get_counters().calls
 
     def __repr__(self):
-        return '<hunter._tracer.Tracer at 0x%x: threading_support=%s, %s%s%s%s>' % (
+        return '<hunter._tracer.Tracer at 0x%x: threading_support=%s, hook=%s, %s%s%s%s>' % (
             id(self),
             self.threading_support,
+            self.hook,
             '<stopped>' if self.handler is None else 'handler=',
             '' if self.handler is None else repr(self.handler),
             '' if self.previous is None else ', previous=',
@@ -87,8 +367,20 @@ cdef class Tracer:
             PyEval_SetTrace(trace_func, <PyObject*> self)
         return self
 
+    def stats(self):
+        return self._registry.stats()
+
     def trace(self, predicate):
         self.handler = predicate
+        if self.budget is not None:
+            self.budget.calls_only = False
+            self.budget.reset()
+        self._registry.reset_stats()
+        optimized = optimize(predicate)
+        if self.instrument:
+            optimized = self.instrumented = instrument(optimized, timing=self.instrument == 'time')
+        self._static, self._residual = analyze(optimized)
+        self._code_handlers = None if self._static is None and not _code_cacheable(predicate) else {}
         cdef PyThreadState *state = PyThreadState_Get()
 
         if self.profiling_mode:
@@ -117,6 +409,10 @@ cdef class Tracer:
 
     def stop(self):
         if self.handler is not None:
+            # releasing these can run code (eg: weakref callbacks for the code objects) that would be traced, thus they are
+            # only released (at the end) after the hook is uninstalled
+            released = self._code_handlers, self._static, self._residual
+            self._code_handlers = self._static = self._residual = None
             if self.profiling_mode:
                 if self.previous is None:
                     PyEval_SetProfile(NULL, NULL)
@@ -137,6 +433,7 @@ cdef class Tracer:
                 if self.threading_support is None or self.threading_support:
                     threading.settrace(self._threading_previous)
                     self._threading_previous = None
+            flush_buffers()
 
     def __enter__(self):
         return self
@@ -1,22 +1,34 @@
 # ruff: noqa: B008
 import collections
+import copy
+import json
 import opcode
 import os
 import threading
 from collections import defaultdict
 from itertools import islice
 from os import getpid
+from time import perf_counter_ns
 from typing import ClassVar
 
 from . import config
+from .recording import Encoder
+from .recording import RingBuffer
+from .recording import _iter_ring
+from .recording import render
+from .util import BUFFERED_STREAMS
 from .util import BUILTIN_SYMBOLS
 from .util import CALL_COLORS
 from .util import CODE_COLORS
+from .util import FLUSH_INTERVAL
 from .util import MISSING
 from .util import OTHER_COLORS
+from .util import QUEUE_SIZE
 from .util import builtins
 from .util import frame_iterator
 from .util import get_arguments
+from .util import get_background_stream
+from .util import get_buffered_stream
 from .util import iter_symbols
 from .util import safe_repr
 from .vendor.colorama import AnsiToWin32
@@ -28,9 +40,12 @@ except ImportError:
 
 __all__ = [
     'Action',
+    'BinaryRecorder',
     'CallPrinter',
+    'ChromeTraceRecorder',
     'CodePrinter',
     'Debugger',
+    'FlightRecorder',
     'Manhole',
     'VarsPrinter',
 ]
@@ -42,6 +57,13 @@ class Action:
     def __call__(self, event):
         raise NotImplementedError
 
+    def shard(self):
+        """
+        Returns the instance that a single thread should use when the tracer keeps per-thread state (see the ``sharding``
+        option of :func:`hunter.trace`). Actions that keep state between events return a copy with fresh state.
+        """
+        return self
+
 
 class LazyImportPdb:
     def __repr__(self):
@@ -109,6 +131,11 @@ class ColorStreamAction(Action):
     _stream = None
     _tty = None
     _repr_func = None
+    buffer_size = 0
+    flush_interval = FLUSH_INTERVAL
+    background = False
+    queue_size = QUEUE_SIZE
+    overflow = 'block'
 
     OTHER_COLORS = OTHER_COLORS
     EVENT_COLORS = CODE_COLORS
@@ -123,9 +150,19 @@ class ColorStreamAction(Action):
         pid_alignment=config.Default('pid_alignment', 9),
         repr_limit=config.Default('repr_limit', 1024),
         repr_func=config.Default('repr_func', 'safe_repr'),
+        buffer_size=config.Default('buffer_size', 0),
+        flush_interval=config.Default('flush_interval', FLUSH_INTERVAL),
+        background=config.Default('background', False),
+        queue_size=config.Default('queue_size', QUEUE_SIZE),
+        overflow=config.Default('overflow', 'block'),
     ):
         self.force_colors = config.resolve(force_colors)
         self.force_pid = config.resolve(force_pid)
+        self.buffer_size = config.resolve(buffer_size)
+        self.flush_interval = config.resolve(flush_interval)
+        self.background = config.resolve(background)
+        self.queue_size = config.resolve(queue_size)
+        self.overflow = config.resolve(overflow)
         stream = config.resolve(stream)
         if stream is None:
             from . import _default_stream as stream
@@ -176,7 +213,7 @@ class ColorStreamAction(Action):
             if value in self._stream_cache:
                 value = self._stream_cache[value]
             else:
-                value = self._stream_cache[value] = open(value, 'a', buffering=0)
+                value = self._stream_cache[value] = open(value, 'a', buffering=1)
 
         isatty = getattr(value, 'isatty', None)
         if self.force_colors or (isatty and isatty() and os.name != 'java'):
@@ -189,6 +226,10 @@ class ColorStreamAction(Action):
             self._stream = value
             self.event_colors = dict.fromkeys(self.EVENT_COLORS, '')
             self.other_colors = dict.fromkeys(self.OTHER_COLORS, '')
+        if self.buffer_size:
+            self._stream = get_buffered_stream(value, self._stream, self.buffer_size, self.flush_interval)
+        if self.background:
+            self._stream = get_background_stream(value, self._stream, self.queue_size, self.overflow)
 
     @property
     def repr_func(self):
@@ -358,6 +399,12 @@ class CodePrinter(ColorStreamAction):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
     """
 
     def __call__(self, event):
@@ -426,6 +473,12 @@ class CallPrinter(CodePrinter):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
 
     .. versionadded:: 1.2.0
     """
@@ -573,6 +626,12 @@ class VarsPrinter(ColorStreamAction):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
     """
 
     def __init__(self, *names, **options):
@@ -646,12 +705,23 @@ class VarsSnooper(ColorStreamAction):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
     """
 
     def __init__(self, **options):
         super().__init__(**options)
         self.stored_reprs = defaultdict(dict)
 
+    def shard(self):
+        action = copy.copy(self)
+        action.stored_reprs = defaultdict(dict)
+        return action
+
     def __call__(self, event):
         """
         Handle event and print the specified variables.
@@ -756,6 +826,12 @@ class ErrorSnooper(CodePrinter):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
 
     .. versionadded:: 3.1.0
     """
@@ -769,6 +845,13 @@ class ErrorSnooper(CodePrinter):
         self.events = None
         super().__init__(*args, **kwargs)
 
+    def shard(self):
+        action = copy.copy(self)
+        action.backlog = collections.deque(maxlen=self.max_backlog)
+        action.origin = None
+        action.events = None
+        return action
+
     def __call__(self, event):
         if self.max_backlog:
             detached_event = event.detach(self.try_repr)
@@ -836,6 +919,12 @@ class StackPrinter(ColorStreamAction):
         repr_limit (bool): Limit length of ``repr()`` output. Default: ``512``.
         repr_func (string or callable): Function to use instead of ``repr``.
             If string must be one of 'repr' or 'safe_repr'. Default: ``'safe_repr'``.
+        buffer_size (int): Collect up to this many characters before writing to the stream. Default: ``0`` (unbuffered).
+        flush_interval (float): Don't keep buffered output for longer than this many seconds. Default: ``1.0``.
+        background (bool): Write to the stream from a separate (untraced) thread. Default: ``False``.
+        queue_size (int): How many writes can wait for the background thread. Default: ``10000``.
+        overflow (str): What to do with writes when the background queue is full: ``'block'`` (wait) or ``'drop'``.
+            Default: ``'block'``.
     """
 
     def __init__(self, depth=15, limit=2, **options):
@@ -873,3 +962,288 @@ class StackPrinter(ColorStreamAction):
             thread_prefix,
             filename_prefix,
         )
+
+
+class BinaryRecorder(Action):
+    """
+    An action that records the events in a compact binary format (see :mod:`hunter.recording`) instead of formatting them.
+    Use :func:`hunter.recording.read_recording` or the ``hunter-dump`` command to read the recording.
+
+    Events from a forked child process are not recorded (the parent is still writing to the same file).
+
+    Args:
+        stream (str or file-like): Path (appended to) or binary file to write to.
+        reprs (bool): Record the ``repr()`` of the arguments, return values and exceptions. Default: ``True``.
+        repr_limit (int): Limit length of the recorded reprs. Default: ``1024``.
+        buffer_size (int): Size of the write buffer, in bytes (only used when ``stream`` is a path). Default: ``65536``.
+
+    .. versionadded:: 3.10.0
+    """
+
+    def __init__(self, stream, reprs=True, repr_limit=1024, buffer_size=65536):
+        self.stream = stream
+        self.reprs = reprs
+        self.repr_limit = repr_limit
+        self.buffer_size = buffer_size
+        self.encoder = Encoder(reprs, repr_limit)
+        self.file = open(stream, 'ab', buffering=buffer_size) if isinstance(stream, str) else stream
+        self.file.write(self.encoder.reset())
+        self.lock = threading.Lock()
+        BUFFERED_STREAMS.add(self)
+
+    def __repr__(self):
+        return f'BinaryRecorder(stream={self.stream!r}, reprs={self.reprs!r}, repr_limit={self.repr_limit!r})'
+
+    def __call__(self, event):
+        """
+        Handle event and record it.
+        """
+        out = bytearray()
+        with self.lock:
+            if self.file is None:
+                return
+            self.encoder.encode(event, out)
+            self.file.write(out)
+            self.encoder.commit()
+
+    def flush(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+
+    def close(self):
+        """
+        Stops recording. Closes the file if the recorder opened it.
+        """
+        with self.lock:
+            if self.file is not None:
+                if isinstance(self.stream, str):
+                    self.file.close()
+                else:
+                    self.file.flush()
+                self.file = None
+
+    def _reset(self):
+        self.file = None
+        self.lock = threading.Lock()
+
+
+class FlightRecorder(Action):
+    """
+    An action that keeps the most recent events in a memory-mapped circular file, in the :class:`BinaryRecorder` format.
+    Like :class:`~hunter.predicates.Backlog`, but the events are only encoded (not formatted or kept alive) and the file
+    survives a crash of the process (read it with :func:`hunter.recording.read_recording` or ``hunter-dump``).
+
+    The file is divided in blocks that are overwritten in circular order, thus it holds at least the last
+    ``size - block_size`` bytes of events. The file is overwritten when the recorder is created.
+
+    Events from a forked child process are not recorded.
+
+    Args:
+        path (str): Path of the file.
+        size (int): Size of the file, in bytes. Default: ``16 MiB``.
+        block_size (int): Size of the blocks, in bytes. Events that don't fit in a block are dropped. Default: ``65536``.
+        reprs (bool): Record the ``repr()`` of the arguments, return values and exceptions. Default: ``True``.
+        repr_limit (int): Limit length of the recorded reprs. Default: ``256``.
+        dump_on (callable): A predicate. If it matches an event then the events recorded since the last dump are printed
+            (see :meth:`dump`). Eg: ``dump_on=Q(kind='exception')``. Default: ``None``.
+        action (class): The action used for printing. Default: :class:`CallPrinter`.
+
+    .. versionadded:: 3.10.0
+    """
+
+    def __init__(
+        self,
+        path,
+        size=16 * 1024 * 1024,
+        block_size=65536,
+        reprs=True,
+        repr_limit=256,
+        dump_on=None,
+        action=CallPrinter,
+    ):
+        self.path = path
+        self.size = size
+        self.block_size = block_size
+        self.reprs = reprs
+        self.repr_limit = repr_limit
+        self.dump_on = dump_on
+        self.action = action
+        self.encoder = Encoder(reprs, repr_limit)
+        self.ring = RingBuffer(path, size, block_size)
+        self.lock = threading.Lock()
+        self.dropped = 0
+        self.dumped = None
+        BUFFERED_STREAMS.add(self)
+
+    def __repr__(self):
+        return (
+            f'FlightRecorder(path={self.path!r}, size={self.size!r}, block_size={self.block_size!r}, reprs={self.reprs!r}, '
+            f'repr_limit={self.repr_limit!r}, dump_on={self.dump_on!r}, action={self.action!r})'
+        )
+
+    def __call__(self, event):
+        """
+        Handle event and record it. Prints the events recorded since the last dump if ``dump_on`` matches the event.
+        """
+        with self.lock:
+            ring = self.ring
+            if ring is None:
+                return
+            out = bytearray()
+            self.encoder.encode(event, out)
+            recorded = ring.append(out)
+            if not recorded:
+                # each block has its own session, thus the blocks can be overwritten and read independently
+                ring.next_block(self.encoder.reset())
+                out = bytearray()
+                self.encoder.encode(event, out)
+                recorded = ring.append(out)
+            if recorded:
+                self.encoder.commit()
+            else:
+                self.dropped += 1
+                # the tables must only have what was written in the block
+                self.encoder.rollback()
+        if self.dump_on is not None and self.dump_on(event):
+            self.dump()
+
+    def dump(self, action=None):
+        """
+        Prints the events recorded since the last dump, using ``action`` (a class, or a callable that returns the action
+        instance). Default: the ``action`` given to the recorder.
+
+        It doesn't wait for the event being recorded in another thread (if any), thus it can be used from a signal handler.
+        """
+        ring = self.ring
+        if ring is None:
+            return
+        position = ring.sequence, ring.events
+        render(_iter_ring(ring.map, self.dumped), action or self.action)
+        self.dumped = position
+
+    def flush(self):
+        with self.lock:
+            if self.ring is not None:
+                self.ring.flush()
+
+    def close(self):
+        """
+        Stops recording and unmaps the file.
+        """
+        with self.lock:
+            if self.ring is not None:
+                self.ring.close()
+                self.ring = None
+
+    def _reset(self):
+        self.ring = None
+        self.lock = threading.Lock()
+
+
+class ChromeTraceRecorder(Action):
+    """
+    An action that writes the call and return events in the `Trace Event Format
+    <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_ (JSON) used by Perfetto and
+    ``chrome://tracing``. Each call is a slice named after the module and function, in a track for each thread.
+
+    The events are written as they come (with the file's buffering) thus memory usage doesn't grow with the number of
+    events. The closing ``]`` is written by :meth:`close`, but it is optional in this format (an unfinished file can be
+    loaded too). Other event kinds are ignored, so use it with ``kind_in=['call', 'return']``.
+
+    Events from a forked child process are not written.
+
+    Args:
+        stream (str or file-like): Path or text file to write to.
+        complete (bool): Write a single ``X`` (complete) event with the duration on return instead of ``B`` (begin) and
+            ``E`` (end) events. Returns without a matching call are ignored in this mode. Default: ``False``.
+
+    .. versionadded:: 3.10.0
+    """
+
+    def __init__(self, stream, complete=False):
+        self.stream = stream
+        self.complete = complete
+        self.file = open(stream, 'w') if isinstance(stream, str) else stream
+        self.file.write('[\n')
+        self.pid = getpid()
+        self.main_ident = threading.main_thread().ident
+        self.names = {}
+        self.threads = set()
+        self.stacks = defaultdict(list)
+        self.separator = ''
+        self.lock = threading.Lock()
+        BUFFERED_STREAMS.add(self)
+
+    def __repr__(self):
+        return f'ChromeTraceRecorder(stream={self.stream!r}, complete={self.complete!r})'
+
+    def __call__(self, event):
+        """
+        Handle event and write it.
+        """
+        kind = event.kind
+        if kind != 'call' and kind != 'return':
+            return
+        timestamp = perf_counter_ns() / 1000
+        tid = event.threadid
+        if tid is None:
+            tid = self.main_ident
+        key = event.module, event.function, event.builtin
+        name = self.names.get(key)
+        if name is None:
+            name = self.names[key] = json.dumps(f'{event.module}.{event.function}')
+        with self.lock:
+            file = self.file
+            if file is None:
+                return
+            if tid not in self.threads:
+                self.threads.add(tid)
+                self._write(
+                    f'{{"name":"thread_name","ph":"M","pid":{self.pid},"tid":{tid},"args":{{"name":{json.dumps(event.threadname)}}}}}'
+                )
+            category = 'builtin' if event.builtin else 'python'
+            if self.complete:
+                stack = self.stacks[tid]
+                if kind == 'call':
+                    stack.append((timestamp, event.filename, event.lineno))
+                elif stack:
+                    start, filename, lineno = stack.pop()
+                    self._write(
+                        f'{{"name":{name},"cat":"{category}","ph":"X","ts":{start:.3f},"dur":{timestamp - start:.3f},'
+                        f'"pid":{self.pid},"tid":{tid},"args":{{"filename":{json.dumps(filename)},"lineno":{lineno}}}}}'
+                    )
+            elif kind == 'call':
+                self._write(
+                    f'{{"name":{name},"cat":"{category}","ph":"B","ts":{timestamp:.3f},"pid":{self.pid},"tid":{tid},'
+                    f'"args":{{"filename":{json.dumps(event.filename)},"lineno":{event.lineno}}}}}'
+                )
+            else:
+                self._write(f'{{"name":{name},"cat":"{category}","ph":"E","ts":{timestamp:.3f},"pid":{self.pid},"tid":{tid}}}')
+
+    def _write(self, record):
+        self.file.write(self.separator)
+        self.file.write(record)
+        self.separator = ',\n'
+
+    def flush(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+
+    def close(self):
+        """
+        Writes the closing ``]``. Closes the file if the recorder opened it.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.file.write('\n]\n')
+                if isinstance(self.stream, str):
+                    self.file.close()
+                else:
+                    self.file.flush()
+                self.file = None
+
+    def _reset(self):
+        self.file = None
+        self.lock = threading.Lock()
@@ -44,3 +44,23 @@ for prop in (
         SYS_PREFIX_PATHS.add(getattr(sys, prop))
 
 SYS_PREFIX_PATHS = tuple(sorted(SYS_PREFIX_PATHS, key=len, reverse=True))
+
+
+def _expand(paths):
+    """
+    Yields the given paths and their resolved variants (eg: a virtualenv's ``lib`` could be a symlink to the base install).
+    """
+    for path in paths:
+        if not path:
+            continue
+        yield path
+        if not path.startswith('<'):
+            for variant in (os.path.normpath(path), os.path.realpath(path)):
+                if variant != path:
+                    yield variant
+
+
+#: Maps directories (and special filenames like ``<frozen importlib._bootstrap>``) to ``True`` if they hold the standard
+#: library or to ``False`` if they hold third party code (site-packages has priority as it's usually inside the prefix).
+STDLIB_PATH_INDEX = dict.fromkeys(_expand(SYS_PREFIX_PATHS), True)
+STDLIB_PATH_INDEX.update(dict.fromkeys(_expand(SITE_PACKAGES_PATHS), False))
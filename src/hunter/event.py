@@ -1,23 +1,26 @@
 import linecache
-from functools import partial
 from os.path import basename
-from os.path import exists
 from os.path import splitext
 from threading import current_thread
-from tokenize import TokenError
-from tokenize import generate_tokens
+from threading import get_ident
 
-from .const import SITE_PACKAGES_PATHS
-from .const import SYS_PREFIX_PATHS
-from .util import CYTHON_SUFFIX_RE
 from .util import LEADING_WHITESPACE_RE
-from .util import cached_property
+from .util import get_code_fields
+from .util import get_fullsource
 from .util import get_func_in_mro
 from .util import get_main_thread
 from .util import if_same_code
+from .util import yield_lines as yield_source_lines
 
 __all__ = ('Event',)
 
+UNSET = object()
+BUILTIN_KINDS = {
+    'c_call': 'call',
+    'c_exception': 'exception',
+    'c_return': 'return',
+}
+
 
 class Event:
     """
@@ -34,12 +37,30 @@ class Event:
             Needed for the ``calls`` and ``depth`` fields.
     """
 
-    frame = None
-    kind = None
-    arg = None
-    depth = None
-    calls = None
-    builtin = None
+    __slots__ = (
+        '_code',
+        '_filename',
+        '_fullsource',
+        '_function',
+        '_function_object',
+        '_globals',
+        '_instruction',
+        '_lineno',
+        '_locals',
+        '_module',
+        '_source',
+        '_stdlib',
+        '_threadid',
+        '_threadname',
+        'arg',
+        'builtin',
+        'calls',
+        'depth',
+        'detached',
+        'frame',
+        'kind',
+        'threading_support',
+    )
 
     def __init__(
         self,
@@ -58,8 +79,8 @@ class Event:
         #:  You may access it from your custom predicate though.
         self.frame = frame
 
-        if kind.startswith('c_'):
-            kind = kind[2:]
+        if kind in BUILTIN_KINDS:
+            kind = BUILTIN_KINDS[kind]
             builtin = True
         else:
             builtin = False
@@ -101,6 +122,10 @@ class Event:
         #: :type: bool
         self.detached = False
 
+        self._code = self._filename = self._fullsource = self._function = self._function_object = UNSET
+        self._globals = self._instruction = self._lineno = self._locals = self._module = UNSET
+        self._source = self._stdlib = self._threadid = self._threadname = UNSET
+
     def __repr__(self):
         return (
             f'<Event kind={self.kind!r} function={self.function!r} module={self.module!r} filename={self.filename!r} lineno={self.lineno}>'
@@ -135,32 +160,34 @@ class Event:
         """
         event = Event.__new__(Event)
 
-        event.__dict__['code'] = self.code
-        event.__dict__['filename'] = self.filename
-        event.__dict__['fullsource'] = self.fullsource
-        event.__dict__['function'] = self.function
-        event.__dict__['lineno'] = self.lineno
-        event.__dict__['module'] = self.module
-        event.__dict__['source'] = self.source
-        event.__dict__['stdlib'] = self.stdlib
-        event.__dict__['threadid'] = self.threadid
-        event.__dict__['threadname'] = self.threadname
-        event.__dict__['instruction'] = self.instruction
+        event._code = self.code
+        event._filename = self.filename
+        event._fullsource = self.fullsource
+        event._function = self.function
+        event._function_object = self._function_object
+        event._instruction = self.instruction
+        event._lineno = self.lineno
+        event._module = self.module
+        event._source = self.source
+        event._stdlib = self.stdlib
+        event._threadid = self.threadid
+        event._threadname = self.threadname
 
         if value_filter:
-            event.__dict__['arg'] = value_filter(self.arg)
-            event.__dict__['globals'] = {key: value_filter(value) for key, value in self.globals.items()}
-            event.__dict__['locals'] = {key: value_filter(value) for key, value in self.locals.items()}
+            event.arg = value_filter(self.arg)
+            event._globals = {key: value_filter(value) for key, value in self.globals.items()}
+            event._locals = {key: value_filter(value) for key, value in self.locals.items()}
         else:
-            event.__dict__['globals'] = {}
-            event.__dict__['locals'] = {}
-            event.__dict__['arg'] = None
+            event._globals = {}
+            event._locals = {}
+            event.arg = None
 
         event.threading_support = self.threading_support
         event.calls = self.calls
         event.depth = self.depth
         event.kind = self.kind
         event.builtin = self.builtin
+        event.frame = None
 
         event.detached = True
 
@@ -168,10 +195,31 @@ class Event:
 
     def clone(self):
         event = Event.__new__(Event)
-        event.__dict__ = dict(self.__dict__)
+        event.arg = self.arg
+        event.builtin = self.builtin
+        event.calls = self.calls
+        event.depth = self.depth
+        event.detached = self.detached
+        event.frame = self.frame
+        event.kind = self.kind
+        event.threading_support = self.threading_support
+        event._code = self._code
+        event._filename = self._filename
+        event._fullsource = self._fullsource
+        event._function = self._function
+        event._function_object = self._function_object
+        event._globals = self._globals
+        event._instruction = self._instruction
+        event._lineno = self._lineno
+        event._locals = self._locals
+        event._module = self._module
+        event._source = self._source
+        event._stdlib = self._stdlib
+        event._threadid = self._threadid
+        event._threadname = self._threadname
         return event
 
-    @cached_property
+    @property
     def instruction(self):
         """
         Last byte instruction. If no bytecode was used (Cython code) then it returns ``None``.
@@ -179,73 +227,81 @@ class Event:
 
         :type: int or single char string or None
         """
-        if self.frame.f_code.co_code and len(self.frame.f_code.co_code) > self.frame.f_lasti >= 0:
-            return self.frame.f_code.co_code[self.frame.f_lasti]
-
-    @cached_property
+        instruction = self._instruction
+        if instruction is UNSET:
+            co_code = self.frame.f_code.co_code
+            if co_code and len(co_code) > self.frame.f_lasti >= 0:
+                instruction = co_code[self.frame.f_lasti]
+            else:
+                instruction = None
+            self._instruction = instruction
+        return instruction
+
+    @property
     def threadid(self):
         """
         Current thread ident. If current thread is main thread then it returns ``None``.
 
         :type: int or None
         """
-        current = self._thread.ident
-        main = get_main_thread()
-        if main is None:
-            return current
-        else:
-            return current if current != main.ident else None
-
-    @cached_property
+        threadid = self._threadid
+        if threadid is UNSET:
+            threadid = get_ident()
+            main = get_main_thread()
+            if main is not None and threadid == main.ident:
+                threadid = None
+            self._threadid = threadid
+        return threadid
+
+    @property
     def threadname(self):
         """
         Current thread name.
 
         :type: str
         """
-        return self._thread.name
+        threadname = self._threadname
+        if threadname is UNSET:
+            threadname = self._threadname = current_thread().name
+        return threadname
 
-    @cached_property
-    def _thread(self):
-        return current_thread()
-
-    @cached_property
+    @property
     def locals(self):
         """
         A dict with local variables.
 
         :type: dict
         """
-        if self.builtin:
-            return {}
+        local_vars = self._locals
+        if local_vars is UNSET:
+            local_vars = self._locals = {} if self.builtin else self.frame.f_locals
+        return local_vars
 
-        return self.frame.f_locals
-
-    @cached_property
+    @property
     def globals(self):
         """
         A dict with global variables.
 
         :type: dict
         """
-        if self.builtin:
-            return {}
-
-        return self.frame.f_globals
+        global_vars = self._globals
+        if global_vars is UNSET:
+            global_vars = self._globals = {} if self.builtin else self.frame.f_globals
+        return global_vars
 
-    @cached_property
+    @property
     def function(self):
         """
         A string with function name.
 
         :type: str
         """
-        if self.builtin:
-            return self.arg.__name__
-        else:
-            return self.code.co_name
+        function = self._function
+        if function is UNSET:
+            function = self._function = self.arg.__name__ if self.builtin else self.code.co_name
+        return function
 
-    @cached_property
+    @property
     def function_object(self):
         """
         The function instance.
@@ -261,7 +317,11 @@ class Event:
         # Based on MonkeyType's get_func
         if self.builtin:
             return self.builtin
+        if self._function_object is UNSET:
+            self._function_object = self._find_function_object()
+        return self._function_object
 
+    def _find_function_object(self):
         code = self.code
         if code.co_name is None:
             return None
@@ -286,22 +346,25 @@ class Event:
                     break
         return func
 
-    @cached_property
+    @property
     def module(self):
         """
         A string with module name (like ``'foo.bar'``).
 
         :type: str
         """
-        if self.builtin:
-            module = self.arg.__module__
-        else:
-            module = self.frame.f_globals.get('__name__', '')
-        if module is None:
-            module = '?'
+        module = self._module
+        if module is UNSET:
+            if self.builtin:
+                module = self.arg.__module__
+            else:
+                module = self.frame.f_globals.get('__name__', '')
+            if module is None:
+                module = '?'
+            self._module = module
         return module
 
-    @cached_property
+    @property
     def filename(self):
         """
         A string with the path to the module's file. May be empty if ``__file__`` attribute is missing.
@@ -309,67 +372,48 @@ class Event:
 
         :type: str
         """
-        # if self.builtin:
-        #     return '<builtin>'
-        # if self.builtin:
-        #     return '<builtin>'
-        filename = self.frame.f_code.co_filename
-        if not filename:
-            filename = self.frame.f_globals.get('__file__')
-        if not filename:
-            filename = '?'
-        if filename.endswith(('.pyc', '.pyo')):
-            filename = filename[:-1]
-        elif filename.endswith('$py.class'):  # Jython
-            filename = filename[:-9] + '.py'
-        elif filename.endswith(('.so', '.pyd')):
-            basename = CYTHON_SUFFIX_RE.sub('', filename)
-            for ext in ('.pyx', '.py'):
-                cyfilename = basename + ext
-                if exists(cyfilename):
-                    filename = cyfilename
-                    break
+        filename = self._filename
+        if filename is UNSET:
+            filename, self._stdlib = get_code_fields(self.code, self.module, self.frame.f_globals)
+            self._filename = filename
         return filename
 
-    @cached_property
+    @property
     def lineno(self):
         """
         An integer with line number in file.
 
         :type: int
         """
-        return self.frame.f_lineno
+        lineno = self._lineno
+        if lineno is UNSET:
+            lineno = self._lineno = self.frame.f_lineno
+        return lineno
 
-    @cached_property
+    @property
     def code(self):
         """
         A code object (not a string).
         """
-        return self.frame.f_code
+        code = self._code
+        if code is UNSET:
+            code = self._code = self.frame.f_code
+        return code
 
-    @cached_property
+    @property
     def stdlib(self):
         """
         A boolean flag. ``True`` if frame is in stdlib.
 
         :type: bool
         """
-        module_parts = self.module.split('.')
-        if 'pkg_resources' in module_parts:
-            # skip this over-vendored module
-            return True
-        elif self.filename == '<string>' and (self.module.startswith('namedtuple_') or self.module == 'site'):
-            # skip namedtuple exec garbage
-            return True
-        elif self.filename.startswith(SITE_PACKAGES_PATHS):
-            # if it's in site-packages then its definitely not stdlib
-            return False
-        elif self.filename.startswith(SYS_PREFIX_PATHS):
-            return True
-        else:
-            return False
+        stdlib = self._stdlib
+        if stdlib is UNSET:
+            self._filename, stdlib = get_code_fields(self.code, self.module, self.frame.f_globals)
+            self._stdlib = stdlib
+        return stdlib
 
-    @cached_property
+    @property
     def fullsource(self):
         """
         A string with the sourcecode for the current statement (from ``linecache`` - failures are ignored).
@@ -378,31 +422,19 @@ class Event:
 
         :type: str
         """
+        if self._fullsource is UNSET:
+            self._fullsource = self._read_fullsource()
+        return self._fullsource
+
+    def _read_fullsource(self):
         try:
             if self.kind == 'call' and self.code.co_name != '<module>':
-                lines = []
-                try:
-                    for _, token, _, _, _ in generate_tokens(
-                        partial(
-                            next,
-                            yield_lines(
-                                self.filename,
-                                self.frame.f_globals,
-                                self.lineno - 1,
-                                lines.append,
-                            ),
-                        )
-                    ):
-                        if token in ('def', 'class', 'lambda'):
-                            return ''.join(lines)
-                except TokenError:
-                    pass
-
+                return get_fullsource(self.filename, self.lineno, self.frame.f_globals)
             return linecache.getline(self.filename, self.lineno, self.frame.f_globals)
         except Exception as exc:
             return f'??? NO SOURCE: {exc!r}'
 
-    @cached_property
+    @property
     def source(self):
         """
         A string with the sourcecode for the current line (from ``linecache`` - failures are ignored).
@@ -411,32 +443,21 @@ class Event:
 
         :type: str
         """
-        if self.filename.endswith(('.so', '.pyd')):
-            return f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
-        try:
-            return linecache.getline(self.filename, self.lineno, self.frame.f_globals)
-        except Exception as exc:
-            return f'??? NO SOURCE: {exc!r}'
+        source = self._source
+        if source is UNSET:
+            if self.filename.endswith(('.so', '.pyd')):
+                source = f'??? NO SOURCE: not reading binary {splitext(basename(self.filename))[1]} file'
+            else:
+                try:
+                    source = linecache.getline(self.filename, self.lineno, self.frame.f_globals)
+                except Exception as exc:
+                    source = f'??? NO SOURCE: {exc!r}'
+            self._source = source
+        return source
 
     __getitem__ = object.__getattribute__
 
 
-def yield_lines(
-    filename,
-    module_globals,
-    start,
-    collector,
-    limit=10,
-    leading_whitespace_re=LEADING_WHITESPACE_RE,
-):
-    dedent = None
-    amount = 0
-    for line in linecache.getlines(filename, module_globals)[start : start + limit]:
-        if dedent is None:
-            dedent = leading_whitespace_re.findall(line)
-            dedent = dedent[0] if dedent else ''
-            amount = len(dedent)
-        elif not line.startswith(dedent):
-            break
-        collector(line)
-        yield line[amount:]
+def yield_lines(filename, module_globals, start, collector, limit=10, leading_whitespace_re=LEADING_WHITESPACE_RE):
+    # kept for backwards compatibility, the source is read through hunter.util.read_fullsource now
+    return yield_source_lines(linecache.getlines(filename, module_globals), start, collector, limit, leading_whitespace_re)
@@ -0,0 +1,476 @@
+import sys
+import threading
+import traceback
+from collections import ChainMap
+from random import random
+from time import perf_counter
+from types import BuiltinFunctionType
+from types import MethodDescriptorType
+
+import hunter
+
+from . import Event
+from .predicates import CODE_FIELDS
+from .predicates import _deliverable
+from .predicates import _uses_depth
+from .predicates import analyze
+from .predicates import instrument
+from .predicates import optimize
+from .tracer import STATS_TIMING_INTERVAL
+from .tracer import LocalCounters
+from .tracer import check_sampling
+from .tracer import get_shard
+from .util import IGNORED_CODE
+from .util import IGNORED_THREADS
+from .util import CountersRegistry
+from .util import flush_buffers
+
+try:
+    from sys import monitoring
+except ImportError:
+    monitoring = None
+
+__all__ = ('Tracer',)
+
+if Event.__module__ == 'hunter._event':
+    CALL, EXCEPTION, LINE, RETURN, C_CALL, C_EXCEPTION, C_RETURN = range(7)
+else:
+    CALL, EXCEPTION, LINE, RETURN = 'call', 'exception', 'line', 'return'
+    C_CALL, C_EXCEPTION, C_RETURN = 'c_call', 'c_exception', 'c_return'
+
+#: Fields that can be used to decide per code location and event kind if the predicate could ever match.
+STATIC_FIELDS = CODE_FIELDS | {'kind'}
+#: Tool ids used by tracers that might have disabled code locations. These stay disabled for the tool id (even after it's
+#: freed) until :func:`sys.monitoring.restart_events` is called.
+DISABLED_TOOL_IDS = set()
+
+
+class Tracer:
+    """
+    Tracer object that uses :mod:`sys.monitoring` (:pep:`669`) instead of ``sys.settrace``/``sys.setprofile``. Requires Python 3.12+.
+
+    Only the event kinds that the predicate can match are subscribed to, and code locations where the predicate could never
+    match (eg: code from other modules when you filter by ``module``) are disabled after the first event.
+
+    Note that re-enabling the disabled locations (needed when a tool id is reused by another tracer) can only be done for all
+    the tools, thus a tracer may re-enable locations disabled by other :mod:`sys.monitoring` tools (eg: coverage). Tool ids
+    that were not used by another tracer are preferred to avoid that.
+
+    Args:
+        threading_support (bool): Traces events from all threads if ``True`` or ``None`` (including threads that are already running).
+            If ``False`` events from other threads than the one that started the tracer are ignored.
+        profiling_mode (bool): Emit the same events as ``sys.setprofile`` would (no line or exception events but builtin
+            calls are included).
+        sample (int): Only trace one in every ``sample`` top-level calls (calls made at depth 0).
+        sample_rate (float): Only trace a top-level call with the given probability (between 0 and 1).
+        budget (Budget): Limits for the events delivered to the handler (see :class:`hunter.tracer.Budget`).
+        sharding (bool): Give each thread its own copy of the predicates and actions that keep state between events
+            (see :class:`hunter.tracer.Tracer`).
+        instrument (bool or str): Count how many times each part of the predicate is evaluated and how many times it
+            matched (see :func:`hunter.stats`). Use ``'time'`` to also measure the time spent in each part.
+    """
+
+    def __init__(
+        self,
+        threading_support=None,
+        profiling_mode=False,
+        sample=None,
+        sample_rate=None,
+        budget=None,
+        sharding=False,
+        instrument=False,
+    ):
+        if monitoring is None:
+            raise RuntimeError('The sys.monitoring API is not available (it requires Python 3.12+).')
+        check_sampling(sample, sample_rate)
+        self._handler = None
+        self._tool_id = None
+        self._thread_ident = None
+        self._code_entries = {}
+        self._kinds = ()
+        self._static = self._residual = None
+        self._uses_depth = True
+
+        #: True if threading support was enabled. Should be considered read-only.
+        #:
+        #: :type: bool
+        self.threading_support = threading_support
+
+        #: True if profiling mode was enabled. Should be considered read-only.
+        #:
+        #: :type: bool
+        self.profiling_mode = profiling_mode
+
+        #: Trace one in every ``sample`` top-level calls (if set). Should be considered read-only.
+        #:
+        #: :type: int
+        self.sample = sample
+
+        #: Probability of tracing a top-level call (if set). Should be considered read-only.
+        #:
+        #: :type: float
+        self.sample_rate = sample_rate
+
+        #: The budget (if any). Should be considered read-only.
+        #:
+        #: :type: Budget
+        self.budget = budget
+
+        #: True if each thread gets its own copy of the stateful predicates and actions. Should be considered read-only.
+        #:
+        #: :type: bool
+        self.sharding = sharding
+
+        #: If set, the predicate is instrumented (``'time'`` if the time spent is measured too). Should be considered read-only.
+        #:
+        #: :type: bool or str
+        self.instrument = instrument
+
+        #: The instrumented predicate (made via :func:`hunter.predicates.instrument`) if ``instrument`` is set. It is kept
+        #: after the tracer is stopped.
+        #:
+        #: :type: hunter.predicates.Instrumented
+        self.instrumented = None
+
+        self._sampling = sample is not None or sample_rate is not None
+        self._top_calls = 0
+        self._registry = CountersRegistry()
+        self._local = LocalCounters(self._registry)
+
+    @property
+    def hook(self):
+        """
+        Always ``'sys.monitoring'``.
+        """
+        return 'sys.monitoring'
+
+    @property
+    def depth(self):
+        """
+        Tracing depth in the current thread (increases on calls, decreases on returns).
+
+        :type: int
+        """
+        return self._local.counters.depth
+
+    @property
+    def calls(self):
+        """
+        A counter for total number of 'call' frames that this Tracer went through in the current thread.
+
+        :type: int
+        """
+        return self._local.counters.calls
+
+    @property
+    def handler(self):
+        """
+        The current predicate. Set via :func:`hunter.Tracer.trace`.
+        """
+        return self._handler
+
+    @property
+    def previous(self):
+        """
+        Always ``None`` - tools using :mod:`sys.monitoring` don't replace each other.
+        """
+        return None
+
+    @property
+    def tool_id(self):
+        """
+        The :mod:`sys.monitoring` tool id in use, or ``None`` if the tracer is stopped.
+        """
+        return self._tool_id
+
+    def __repr__(self):
+        return '<hunter.monitoring.Tracer at 0x{:x}: threading_support={}, hook={}, {}{}>'.format(
+            id(self),
+            self.threading_support,
+            self.hook,
+            '<stopped>' if self._handler is None else 'handler=',
+            '' if self._handler is None else repr(self._handler),
+        )
+
+    def trace(self, predicate):
+        """
+        Starts tracing with the given callable. If already tracing, the previous predicate is stopped first.
+
+        Args:
+            predicate (callable that accepts a single :obj:`~hunter.event.Event` argument):
+        Return:
+            self
+        """
+        self.stop()
+        tool_ids = (monitoring.DEBUGGER_ID, monitoring.PROFILER_ID, 3, 4, monitoring.COVERAGE_ID)
+        for tool_id in sorted(tool_ids, key=DISABLED_TOOL_IDS.__contains__):
+            if monitoring.get_tool(tool_id) is None:
+                break
+        else:
+            raise RuntimeError('All the sys.monitoring tool ids are in use.')
+        monitoring.use_tool_id(tool_id, 'hunter')
+        self._tool_id = tool_id
+        self._handler = predicate
+        if self.budget is not None:
+            self.budget.calls_only = False
+            self.budget.reset()
+        self._registry.reset_stats()
+        self._thread_ident = threading.get_ident()
+        self._code_entries.clear()
+        optimized = optimize(predicate)
+        if self.instrument:
+            optimized = self.instrumented = instrument(optimized, timing=self.instrument == 'time')
+        self._static, self._residual = analyze(optimized)
+        # sampling needs the depth to find the top-level calls
+        self._uses_depth = self._sampling or _uses_depth(predicate)
+        self._kinds = kinds = tuple(
+            kind
+            for kind in (('call', 'return') if self.profiling_mode else ('call', 'exception', 'line', 'return'))
+            if _deliverable(predicate, {'kind': kind, 'builtin': False}, ('kind', 'builtin'))
+        )
+        events = monitoring.events
+
+        event_set = 0
+        if 'call' in kinds or 'return' in kinds or self._uses_depth:
+            # calls and returns are always needed to keep track of depth
+            event_set |= events.PY_START | events.PY_RESUME | events.PY_THROW | events.PY_RETURN | events.PY_YIELD | events.PY_UNWIND
+        if 'exception' in kinds:
+            event_set |= events.RAISE
+        if 'line' in kinds:
+            event_set |= events.LINE
+        if self.profiling_mode and any(
+            _deliverable(predicate, {'kind': kind, 'builtin': True}, ('kind', 'builtin')) for kind in ('call', 'exception', 'return')
+        ):
+            event_set |= events.CALL | events.C_RETURN | events.C_RAISE
+
+        for event, callback in self._callbacks():
+            if event_set & event:
+                monitoring.register_callback(tool_id, event, callback)
+        if tool_id in DISABLED_TOOL_IDS:
+            # code locations disabled by a previous tracer need to be re-enabled (unfortunately this is process-wide)
+            monitoring.restart_events()
+            DISABLED_TOOL_IDS.discard(tool_id)
+        if event_set & events.LINE or not self._uses_depth:
+            DISABLED_TOOL_IDS.add(tool_id)
+        monitoring.set_events(tool_id, event_set)
+        return self
+
+    def stop(self):
+        """
+        Stop tracing. Releases the :mod:`sys.monitoring` tool id.
+        """
+        if self._handler is not None:
+            tool_id = self._tool_id
+            monitoring.set_events(tool_id, 0)
+            for event, _ in self._callbacks():
+                monitoring.register_callback(tool_id, event, None)
+            monitoring.free_tool_id(tool_id)
+            self._handler = self._tool_id = self._static = self._residual = None
+            self._code_entries.clear()
+            flush_buffers()
+
+    def _callbacks(self):
+        events = monitoring.events
+        return (
+            (events.PY_START, self._on_call),
+            (events.PY_RESUME, self._on_call),
+            (events.PY_THROW, self._on_throw),
+            (events.PY_RETURN, self._on_return),
+            (events.PY_YIELD, self._on_return),
+            (events.PY_UNWIND, self._on_unwind),
+            (events.RAISE, self._on_raise),
+            (events.LINE, self._on_line),
+            (events.CALL, self._on_builtin_call),
+            (events.C_RETURN, self._on_builtin_return),
+            (events.C_RAISE, self._on_builtin_raise),
+        )
+
+    def _get_code_entry(self, code, frame):
+        """
+        Returns the event kinds that need to be delivered for the given ``code`` and what needs to be called for them.
+        Computed once per code object.
+        """
+        entry = self._code_entries.get(id(code))
+        if entry is None or entry[0] is not code:
+            counters = self._local.counters
+            event = Event(frame, CALL, None, counters.depth, counters.calls, self.threading_support)
+            kinds = frozenset(kind for kind in self._kinds if _deliverable(self._handler, ChainMap({'kind': kind}, event), STATIC_FIELDS))
+            try:
+                handler = self._residual if self._static is None or self._static(event) else None
+            except Exception:
+                handler = self._handler
+            if handler is None or code in IGNORED_CODE:
+                kinds = frozenset()
+            # note that the code object is kept alive so that its id can't be reused
+            entry = self._code_entries[id(code)] = code, kinds, handler
+        return entry
+
+    def _ignored(self):
+        """
+        Returns ``True`` if the callback must not do anything. Otherwise the event is counted (see :meth:`stats`).
+        """
+        if self._handler is None or (self.threading_support is False and threading.get_ident() != self._thread_ident):
+            return True
+        if IGNORED_THREADS and threading.get_ident() in IGNORED_THREADS:
+            return True
+        self._local.counters.events += 1
+        return False
+
+    def stats(self):
+        """
+        Returns counters for the work done by the tracer (see :meth:`hunter.tracer.Tracer.stats`). Note that the callbacks are not
+        timed, thus ``time`` is always ``None``.
+        """
+        stats = self._registry.stats()
+        stats['time'] = None
+        return stats
+
+    def _emit(self, frame, kind, arg, handler):
+        budget = self.budget
+        if budget is not None:
+            admitted = budget.admit(kind == CALL or kind == C_CALL)
+            if admitted is None:
+                self.stop()
+                return False
+            elif not admitted:
+                return True
+        counters = self._local.counters
+        if self.sharding:
+            handler = get_shard(counters, handler, self._handler, self._residual)
+        event = Event(frame, kind, arg, counters.depth, counters.calls, self.threading_support)
+        counters.handled += 1
+        try:
+            timed = counters.handled % STATS_TIMING_INTERVAL == 0
+            budget_timed = budget is not None and budget.timed()
+            if timed or budget_timed:
+                start = perf_counter()
+                handler(event)
+                duration = perf_counter() - start
+                if timed:
+                    counters.handler_time += duration * STATS_TIMING_INTERVAL
+                if budget_timed:
+                    budget.add_time(duration)
+            else:
+                handler(event)
+        except Exception as exc:
+            traceback.print_exc(file=hunter._default_stream)
+            hunter._default_stream.write(f'Disabling tracer because handler {self._handler!r} failed ({exc!r}) at {event!r}.\n\n')
+            self.stop()
+            return False
+        return True
+
+    def _sample_next(self):
+        if self.sample_rate is None:
+            sampled = self._top_calls % self.sample == 0
+            self._top_calls += 1
+            return sampled
+        else:
+            return random() < self.sample_rate  # noqa: S311
+
+    def _on_call(self, code, instruction_offset):
+        if self._ignored():
+            return
+        counters = self._local.counters
+        if self._sampling and counters.depth == 0:
+            counters.unsampled = not self._sample_next()
+        if counters.unsampled:
+            counters.depth += 1
+            counters.calls += 1
+            return
+        frame = sys._getframe(1)
+        _, kinds, handler = self._get_code_entry(code, frame)
+        if 'call' in kinds:
+            if not self._emit(frame, CALL, None, handler):
+                return
+        elif not self._uses_depth:
+            return monitoring.DISABLE
+        counters.depth += 1
+        counters.calls += 1
+
+    def _on_throw(self, code, instruction_offset, exception):
+        # same as a call, except that PY_THROW can't be disabled
+        self._on_call(code, instruction_offset)
+
+    def _on_return(self, code, instruction_offset, retval):
+        if self._ignored():
+            return
+        counters = self._local.counters
+        if counters.depth > 0:
+            counters.depth -= 1
+        if counters.unsampled:
+            if counters.depth == 0:  # the top-level call that was not sampled just ended
+                counters.unsampled = False
+            return
+        frame = sys._getframe(1)
+        _, kinds, handler = self._get_code_entry(code, frame)
+        if 'return' in kinds:
+            self._emit(frame, RETURN, retval, handler)
+        elif not self._uses_depth:
+            return monitoring.DISABLE
+
+    def _on_unwind(self, code, instruction_offset, exception):
+        if self._ignored():
+            return
+        counters = self._local.counters
+        if counters.depth > 0:
+            counters.depth -= 1
+        if counters.unsampled:
+            if counters.depth == 0:  # the top-level call that was not sampled just ended
+                counters.unsampled = False
+            return
+        frame = sys._getframe(1)
+        _, kinds, handler = self._get_code_entry(code, frame)
+        if 'return' in kinds:
+            self._emit(frame, RETURN, None, handler)
+
+    def _on_raise(self, code, instruction_offset, exception):
+        if self._ignored() or self._local.counters.unsampled:
+            return
+        frame = sys._getframe(1)
+        _, kinds, handler = self._get_code_entry(code, frame)
+        if 'exception' in kinds:
+            self._emit(frame, EXCEPTION, (type(exception), exception, exception.__traceback__), handler)
+
+    def _on_line(self, code, line_number):
+        if self._ignored() or self._local.counters.unsampled:
+            return
+        frame = sys._getframe(1)
+        _, kinds, handler = self._get_code_entry(code, frame)
+        if 'line' in kinds:
+            self._emit(frame, LINE, None, handler)
+        else:
+            return monitoring.DISABLE
+
+    def _builtin(self, kind, callable, arg0):
+        if self._ignored() or self._local.counters.unsampled:
+            return
+        if type(callable) is MethodDescriptorType:
+            if arg0 is monitoring.MISSING:
+                return
+            callable = callable.__get__(arg0, type(arg0))
+        elif type(callable) is not BuiltinFunctionType:
+            return
+        self._emit(sys._getframe(2), kind, callable, self._handler)
+
+    def _on_builtin_call(self, code, instruction_offset, callable, arg0):
+        self._builtin(C_CALL, callable, arg0)
+
+    def _on_builtin_return(self, code, instruction_offset, callable, arg0):
+        self._builtin(C_RETURN, callable, arg0)
+
+    def _on_builtin_raise(self, code, instruction_offset, callable, arg0):
+        self._builtin(C_EXCEPTION, callable, arg0)
+
+    def __enter__(self):
+        """
+        Does nothing. Users are expected to call :meth:`~hunter.monitoring.Tracer.trace`.
+
+        Returns: self
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Wrapper around :meth:`~hunter.monitoring.Tracer.stop`. Does nothing with the arguments.
+        """
+        self.stop()
@@ -1,11 +1,30 @@
 import collections
 import inspect
 import re
+import warnings
 from itertools import chain
+from operator import itemgetter
+from time import perf_counter_ns
 
 from .actions import Action
+from .actions import CallPrinter
+from .actions import CodePrinter
 from .actions import ColorStreamAction
+from .actions import Debugger
+from .actions import Manhole
+from .actions import StackPrinter
+from .actions import VarsPrinter
+from .actions import VarsSnooper
 from .event import Event
+from .util import Affixes
+from .util import MatchCache
+from .util import ValueSet
+from .util import affixes
+
+try:
+    from . import _predicates
+except ImportError:
+    _predicates = None
 
 __all__ = (
     'And',
@@ -14,9 +33,48 @@ __all__ = (
     'Or',
     'Query',
     'When',
+    'analyze',
+    'format_stats',
+    'instrument',
+    'optimize',
 )
 
-ALLOWED_KEYS = tuple(sorted(i for i in Event.__dict__.keys() if not i.startswith('_') and i not in ('tracer', 'thread', 'frame')))
+ALLOWED_KEYS = tuple(
+    sorted(
+        i
+        for i in Event.__dict__.keys()
+        if not i.startswith('_') and i not in ('tracer', 'thread', 'frame', 'detached', 'threading_support')
+    )
+)
+#: Relative cost of reading event fields, used to check the cheap fields of a :class:`Query` first. Fields that are not listed
+#: here are the most expensive (``arg``, ``globals`` and ``locals`` can have values of any type, thus they are checked last).
+FIELD_COSTS = {
+    'builtin': 0,
+    'calls': 0,
+    'depth': 0,
+    'kind': 0,
+    'filename': 1,
+    'function': 1,
+    'lineno': 1,
+    'module': 1,
+    'instruction': 2,
+    'stdlib': 2,
+    'threadid': 2,
+    'threadname': 2,
+    'source': 4,
+}
+OPERATOR_COSTS = {
+    'eq': 0,
+    'in': 0,
+    'gt': 0,
+    'gte': 0,
+    'lt': 0,
+    'lte': 0,
+    'contains': 1,
+    'startswith': 1,
+    'endswith': 1,
+    'regex': 2,
+}
 ALLOWED_OPERATORS = (
     'startswith',
     'endswith',
@@ -32,6 +90,8 @@ ALLOWED_OPERATORS = (
     'lt',
     'lte',
 )
+#: Numbered backreferences and conditional groups, which would refer to other groups if patterns are merged.
+BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?\(')
 
 
 class BasePredicate:
@@ -93,15 +153,20 @@ class Query:
                     if not isinstance(value, str):
                         if not isinstance(value, (list, set, tuple)):
                             raise ValueError(f'Value {value!r} for {key!r} is invalid. Must be a string, list, tuple or set.')
-                        value = tuple(value)
+                        value = affixes(value)
                     mapping = query_startswith
                 elif operator in ('endswith', 'ew'):
                     if not isinstance(value, str):
                         if not isinstance(value, (list, set, tuple)):
                             raise ValueError(f'Value {value!r} for {key!r} is invalid. Must be a string, list, tuple or set.')
-                        value = tuple(value)
+                        value = affixes(value, suffixes=True)
                     mapping = query_endswith
                 elif operator == 'in':
+                    if isinstance(value, (list, set, tuple, frozenset)):
+                        try:
+                            value = ValueSet(value)
+                        except TypeError:  # unhashable values
+                            value = tuple(value)
                     mapping = query_in
                 elif operator in ('contains', 'has'):
                     mapping = query_contains
@@ -138,6 +203,16 @@ class Query:
         self.query_gt = tuple(sorted(query_gt.items()))
         self.query_gte = tuple(sorted(query_gte.items()))
 
+        # the cheap int fields go first, the rest are kept in the order of the operator groups (the equality checks can
+        # guard the ordering checks, eg: module='foo', arg_gt=1)
+        checks = [
+            (FIELD_COSTS.get(key, 5) > 0, group, FIELD_COSTS.get(key, 5), key, check, MatchCache(value) if operator == 'regex' else value)
+            for group, (operator, attribute, check) in enumerate(QUERY_OPERATORS)
+            for key, value in getattr(self, attribute)
+        ]
+        checks.sort(key=itemgetter(0, 1, 2))
+        self._checks = tuple((key, check, value) for _, _, _, key, check, value in checks)
+
     def __str__(self):
         return 'Query(%s)' % (  # noqa: UP031
             ', '.join(
@@ -193,47 +268,11 @@ class Query:
 
     def __call__(self, event):
         """
-        Handles event. Returns True if all criteria matched.
+        Handles event. Returns True if all criteria matched. The criteria on the cheap fields (like ``kind`` or ``depth``) are
+        checked first.
         """
-        for key, value in self.query_eq:
-            evalue = event[key]
-            if evalue != value:
-                return False
-        for key, value in self.query_in:
-            evalue = event[key]
-            if evalue not in value:
-                return False
-        for key, value in self.query_contains:
-            evalue = event[key]
-            if value not in evalue:
-                return False
-        for key, value in self.query_startswith:
-            evalue = event[key]
-            if not evalue.startswith(value):
-                return False
-        for key, value in self.query_endswith:
-            evalue = event[key]
-            if not evalue.endswith(value):
-                return False
-        for key, value in self.query_regex:
-            evalue = event[key]
-            if not value.match(evalue):
-                return False
-        for key, value in self.query_gt:
-            evalue = event[key]
-            if not evalue > value:
-                return False
-        for key, value in self.query_gte:
-            evalue = event[key]
-            if not evalue >= value:
-                return False
-        for key, value in self.query_lt:
-            evalue = event[key]
-            if not evalue < value:
-                return False
-        for key, value in self.query_lte:
-            evalue = event[key]
-            if not evalue <= value:
+        for key, check, value in self._checks:
+            if not check(event[key], value):
                 return False
 
         return True
@@ -709,8 +748,8 @@ class Backlog:
                             )
                             if not self.vars:
                                 # noinspection PyPropertyAccess
-                                stack_event.locals = {}
-                                stack_event.globals = {}
+                                stack_event._locals = {}
+                                stack_event._globals = {}
                                 stack_event.detached = True
                             stack_events.appendleft(stack_event)
                             frame = frame.f_back
@@ -813,3 +852,652 @@ class Backlog:
             action=self.action,
             filter=_merge(*predicates, **kwargs),
         )
+
+
+class Instrumented:
+    """
+    Wraps a predicate and counts how many times it was evaluated and how many times it returned a true value. If ``timing``
+    is enabled it also measures the time spent in the predicate (in nanoseconds, including the time spent in its children).
+
+    Made via :func:`instrument`. Copies made for other threads (see :func:`_shard`) share the counters with the original.
+    """
+
+    def __init__(self, predicate, timing=False, counters=None):
+        self.predicate = predicate
+        self.timing = timing
+        self.counters = [0, 0, 0] if counters is None else counters
+
+    def __str__(self):
+        return f'Instrumented({self.predicate}, timing={self.timing})'
+
+    def __repr__(self):
+        return f'<hunter.predicates.Instrumented: predicate={self.predicate!r}, timing={self.timing!r}, counters={self.counters!r}>'
+
+    def __eq__(self, other):
+        return isinstance(other, Instrumented) and self.predicate == other.predicate and self.timing == other.timing
+
+    def __call__(self, event):
+        """
+        Handles the event.
+        """
+        counters = self.counters
+        counters[0] += 1
+        if self.timing:
+            start = perf_counter_ns()
+            result = self.predicate(event)
+            counters[2] += perf_counter_ns() - start
+        else:
+            result = self.predicate(event)
+        if result:
+            counters[1] += 1
+        return result
+
+    @property
+    def evaluations(self):
+        """
+        How many times the predicate was evaluated.
+        """
+        return self.counters[0]
+
+    @property
+    def hits(self):
+        """
+        How many times the predicate returned a true value.
+        """
+        return self.counters[1]
+
+    @property
+    def elapsed(self):
+        """
+        Nanoseconds spent in the predicate (always ``0`` if ``timing`` is disabled).
+        """
+        return self.counters[2]
+
+
+def _in(evalue, value):
+    try:
+        return evalue in value
+    except TypeError:  # unhashable event value (eg: a list returned by the traced function) and a frozenset of values
+        return any(evalue == item for item in value)
+
+
+def _startswith(evalue, value):
+    return value.match(evalue) if type(value) is Affixes else evalue.startswith(value)
+
+
+def _endswith(evalue, value):
+    return value.match(evalue) if type(value) is Affixes else evalue.endswith(value)
+
+
+QUERY_OPERATORS = (
+    ('eq', 'query_eq', lambda evalue, value: evalue == value),
+    ('in', 'query_in', _in),
+    ('contains', 'query_contains', lambda evalue, value: value in evalue),
+    ('startswith', 'query_startswith', _startswith),
+    ('endswith', 'query_endswith', _endswith),
+    ('regex', 'query_regex', lambda evalue, value: value.match(evalue)),
+    ('gt', 'query_gt', lambda evalue, value: evalue > value),
+    ('gte', 'query_gte', lambda evalue, value: evalue >= value),
+    ('lt', 'query_lt', lambda evalue, value: evalue < value),
+    ('lte', 'query_lte', lambda evalue, value: evalue <= value),
+)
+
+
+def _implementations(name):
+    if _predicates is None:
+        return (globals()[name],)
+    else:
+        return globals()[name], getattr(_predicates, name)
+
+
+QUERY_TYPES = _implementations('Query')
+AND_TYPES = _implementations('And')
+OR_TYPES = _implementations('Or')
+NOT_TYPES = _implementations('Not')
+WHEN_TYPES = _implementations('When')
+FROM_TYPES = _implementations('From')
+BACKLOG_TYPES = _implementations('Backlog')
+
+
+def _query_entries(query):
+    """
+    Yields ``(key, operator, check, value)`` for every criteria in the given :class:`~hunter.predicates.Query` (either implementation).
+    """
+    for operator, attribute, check in QUERY_OPERATORS:
+        for key, value in getattr(query, attribute):
+            if not isinstance(query, Query):
+                value = value.value  # the Cython Query wraps values in QueryEntry objects
+            yield key, operator, check, value
+
+
+#: Fields that only depend on the code object being run (and its module), thus an outcome computed from these can be cached per code object.
+CODE_FIELDS = frozenset(('builtin', 'filename', 'function', 'module', 'stdlib'))
+
+
+def _evaluate(predicate, event, known):
+    """
+    Partially evaluate ``predicate`` using only the fields listed in ``known`` (read via ``event[field]``).
+
+    Returns a ``(result, observes)`` tuple where ``result`` is ``True`` or ``False`` if the outcome is certain for any event that has the
+    given ``known`` fields, or ``None`` if it depends on other fields. The ``observes`` flag is ``True`` if the predicate may have
+    side effects or keep state even when it returns ``False`` (eg: :class:`~hunter.predicates.Backlog`, arbitrary callables or
+    a :class:`~hunter.predicates.When` that may run its actions) - such predicates need to see all events no matter the result.
+    """
+    if isinstance(predicate, QUERY_TYPES):
+        result = True
+        for key, _, check, value in _query_entries(predicate):
+            if key not in known:
+                result = None
+                continue
+            try:
+                if not check(event[key], value):
+                    return False, False
+            except Exception:
+                result = None
+        return result, False
+    elif isinstance(predicate, AND_TYPES):
+        result = True
+        observes = False
+        for child in predicate.predicates:
+            child_result, child_observes = _evaluate(child, event, known)
+            observes = observes or child_observes
+            if child_result is False:
+                return False, observes
+            elif child_result is None:
+                result = None
+        return result, observes
+    elif isinstance(predicate, OR_TYPES):
+        result = False
+        observes = False
+        for child in predicate.predicates:
+            child_result, child_observes = _evaluate(child, event, known)
+            observes = observes or child_observes
+            if child_result is True:
+                return True, observes
+            elif child_result is None:
+                result = None
+        return result, observes
+    elif isinstance(predicate, NOT_TYPES):
+        result, observes = _evaluate(predicate.predicate, event, known)
+        return None if result is None else not result, observes
+    elif isinstance(predicate, WHEN_TYPES):
+        # the actions are side effects, thus the When observes unless its condition can never match
+        result, observes = _evaluate(predicate.condition, event, known)
+        return result, observes or result is not False
+    elif isinstance(predicate, BACKLOG_TYPES):
+        result, _ = _evaluate(predicate.condition, event, known)
+        return result, True
+    else:
+        return None, True
+
+
+def _deliverable(predicate, event, known):
+    """
+    Returns ``False`` if ``predicate`` can safely be skipped for any event with the given ``known`` fields.
+    """
+    result, observes = _evaluate(predicate, event, known)
+    return observes or result is not False
+
+
+def _needs_trace_hook(predicate):
+    """
+    Returns ``True`` if ``predicate`` could match (or needs to observe) the events that only ``sys.settrace`` produces (``'line'``
+    and ``'exception'`` events).
+    """
+    return any(_deliverable(predicate, {'kind': kind, 'builtin': False}, ('kind', 'builtin')) for kind in ('line', 'exception'))
+
+
+def _observes(predicate):
+    """
+    Returns ``True`` if ``predicate`` needs to see every event (see :func:`_evaluate`).
+    """
+    return _evaluate(predicate, {}, ())[1]
+
+
+def _code_cacheable(predicate):
+    """
+    Returns ``True`` if ``predicate`` might be skipped for some code objects. Top level :class:`~hunter.predicates.When`
+    actions only run if the condition matches, thus only the condition is checked for side effects.
+    """
+    if isinstance(predicate, WHEN_TYPES):
+        predicate = predicate.condition
+    return not _observes(predicate)
+
+
+DEPTH_AGNOSTIC_ACTIONS = (CallPrinter, CodePrinter, Debugger, Manhole, StackPrinter, VarsPrinter, VarsSnooper)
+
+
+def _uses_depth(predicate):
+    """
+    Returns ``True`` if ``predicate`` (or any of the actions it runs) might look at the ``depth`` or ``calls`` fields.
+    """
+    if isinstance(predicate, QUERY_TYPES):
+        return any(key in ('depth', 'calls') for key, _, _, _ in _query_entries(predicate))
+    elif isinstance(predicate, AND_TYPES + OR_TYPES):
+        return any(_uses_depth(child) for child in predicate.predicates)
+    elif isinstance(predicate, NOT_TYPES):
+        return _uses_depth(predicate.predicate)
+    elif isinstance(predicate, WHEN_TYPES):
+        return _uses_depth(predicate.condition) or any(type(action) not in DEPTH_AGNOSTIC_ACTIONS for action in predicate.actions)
+    else:
+        return True
+
+
+def _is_static(predicate):
+    """
+    Returns ``True`` if ``predicate`` only looks at :data:`CODE_FIELDS` and has no side effects.
+    """
+    if isinstance(predicate, QUERY_TYPES):
+        return all(key in CODE_FIELDS for key, _, _, _ in _query_entries(predicate))
+    elif isinstance(predicate, AND_TYPES + OR_TYPES):
+        return all(_is_static(child) for child in predicate.predicates)
+    elif isinstance(predicate, NOT_TYPES):
+        return _is_static(predicate.predicate)
+    else:
+        return False
+
+
+def _sibling(predicate, name):
+    """
+    Returns the predicate class called ``name`` from the same implementation as ``predicate``.
+    """
+    return getattr(_predicates, name) if type(predicate).__module__ == 'hunter._predicates' else globals()[name]
+
+
+def _conjunction(template, predicates):
+    if not predicates:
+        return None
+    elif len(predicates) == 1:
+        return predicates[0]
+    else:
+        return _sibling(template, 'And')(*predicates)
+
+
+def analyze(predicate):
+    """
+    Splits ``predicate`` in a part that only depends on the code object being run (the ``module``, ``filename``, ``function``,
+    ``stdlib`` and ``builtin`` fields) and a residual part that needs the live frame (eg: ``depth``, ``calls``, ``locals``,
+    ``lineno``, ``source``).
+
+    Returns a ``(static, residual)`` tuple such that ``predicate(event)`` is equivalent to ``static(event) and residual(event)``.
+    Either can be ``None`` if there's nothing left for that part.
+
+    The static part only needs to be checked once per code object. Static criteria are not moved ahead of predicates that
+    have side effects (eg: :class:`~hunter.predicates.When` actions, :class:`~hunter.predicates.Backlog` or arbitrary
+    callables), as that would change what events these see.
+
+    Example:
+
+        >>> from hunter import Q
+        >>> analyze(Q(module='foo', depth_lt=2))
+        (<hunter.predicates.Query: query_eq=(('module', 'foo'),)>, <hunter.predicates.Query: query_lt=(('depth', 2),)>)
+    """
+    if isinstance(predicate, QUERY_TYPES):
+        static = {}
+        residual = {}
+        for key, operator, _, value in _query_entries(predicate):
+            (static if key in CODE_FIELDS else residual)[key if operator == 'eq' else f'{key}_{operator}'] = value
+        return (
+            type(predicate)(**static) if static else None,
+            type(predicate)(**residual) if residual else None,
+        )
+    elif isinstance(predicate, AND_TYPES):
+        static = []
+        residual = []
+        for position, child in enumerate(predicate.predicates):
+            if _observes(child):
+                residual.extend(predicate.predicates[position:])
+                break
+            child_static, child_residual = analyze(child)
+            if child_static is not None:
+                static.append(child_static)
+            if child_residual is not None:
+                residual.append(child_residual)
+        return _conjunction(predicate, static), _conjunction(predicate, residual)
+    elif isinstance(predicate, WHEN_TYPES):
+        if _observes(predicate.condition):
+            return None, predicate
+        static, residual = analyze(predicate.condition)
+        if residual is None:
+            residual = _sibling(predicate, 'And')()
+        return static, type(predicate)(residual, *predicate.actions)
+    elif _is_static(predicate):
+        return predicate, None
+    else:
+        return None, predicate
+
+
+def _query_arguments(query):
+    """
+    Returns the keyword arguments that would create an equivalent :class:`Query`.
+    """
+    return {key if operator == 'eq' else f'{key}_{operator}': value for key, operator, _, value in _query_entries(query)}
+
+
+def _cost(predicate):
+    """
+    Estimates the cost of calling ``predicate`` (see :data:`FIELD_COSTS` and :data:`OPERATOR_COSTS`).
+    """
+    if isinstance(predicate, QUERY_TYPES):
+        return min(
+            (FIELD_COSTS.get(key, 5) * 3 + OPERATOR_COSTS[operator] for key, operator, _, _ in _query_entries(predicate)),
+            default=0,
+        )
+    elif isinstance(predicate, AND_TYPES + OR_TYPES):
+        return sum(_cost(child) for child in predicate.predicates)
+    elif isinstance(predicate, NOT_TYPES):
+        return _cost(predicate.predicate)
+    else:
+        return 100
+
+
+def _merge_queries(template, queries):
+    """
+    Merges the criteria of ``queries`` in a single :class:`Query`. Returns ``None`` if they have conflicting criteria.
+    """
+    arguments = {}
+    for query in queries:
+        for name, value in _query_arguments(query).items():
+            if arguments.setdefault(name, value) != value:
+                return None
+    return type(template)(**arguments)
+
+
+def _membership(query):
+    """
+    Returns a ``(key, values)`` tuple if ``query`` only checks that a field is equal to (or in) some hashable values.
+    """
+    entries = list(_query_entries(query))
+    if len(entries) == 1:
+        key, operator, _, value = entries[0]
+        try:
+            if operator == 'eq':
+                return key, frozenset((value,))
+            elif operator == 'in' and isinstance(value, (list, tuple, set, frozenset)):
+                return key, frozenset(value)
+        except TypeError:  # unhashable values
+            pass
+
+
+def _regex(query):
+    """
+    Returns a ``((key, flags), pattern)`` tuple if ``query`` only checks that a field matches a regular expression that can be
+    merged with others (doesn't have backreferences or named groups, as those would clash or change meaning in an alternation).
+    """
+    entries = list(_query_entries(query))
+    if len(entries) == 1:
+        key, operator, _, value = entries[0]
+        if operator == 'regex' and isinstance(value.pattern, str) and not value.groupindex and not BACKREFERENCE_RE.search(value.pattern):
+            return (key, value.flags), value
+
+
+def _alternation(patterns, flags):
+    """
+    Returns a single compiled regular expression that matches whatever any of the ``patterns`` matches. Returns ``None`` if
+    they can't be merged (eg: they use inline global flags).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            return re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in patterns), flags)
+        except (re.error, DeprecationWarning):
+            pass
+
+
+def _optimize_children(predicate, merge):
+    children = []
+    for child in predicate.predicates:
+        child = optimize(child)
+        if isinstance(child, type(predicate)):
+            children.extend(child.predicates)
+        else:
+            children.append(child)
+
+    # the predicates that have side effects (eg: When actions) are barriers: only the predicates without side effects that
+    # are between the same barriers can be merged or moved around
+    optimized = []
+    pure = []
+    for child in children:
+        if _observes(child):
+            optimized.extend(_optimize_pure(predicate, merge, pure))
+            optimized.append(child)
+            pure = []
+        else:
+            pure.append(child)
+    optimized.extend(_optimize_pure(predicate, merge, pure))
+    return optimized
+
+
+def _optimize_pure(predicate, merge, children):
+    unique = []
+    for child in children:
+        if child not in unique:
+            unique.append(child)
+    children = merge(predicate, unique)
+    children.sort(key=_cost)
+    return children
+
+
+def _merge_and_children(template, children):
+    queries = [child for child in children if isinstance(child, QUERY_TYPES)]
+    if len(queries) > 1:
+        merged = _merge_queries(queries[0], queries)
+        if merged is not None:
+            return [merged] + [child for child in children if not isinstance(child, QUERY_TYPES)]
+    return children
+
+
+def _merge_or_children(template, children):
+    memberships = {}
+    for child in children:
+        if isinstance(child, QUERY_TYPES):
+            membership = _membership(child)
+            if membership is not None:
+                memberships.setdefault(membership[0], []).append((child, membership[1]))
+    merged = []
+    for child in children:
+        membership = _membership(child) if isinstance(child, QUERY_TYPES) else None
+        if membership is None or len(memberships[membership[0]]) == 1:
+            merged.append(child)
+        elif memberships[membership[0]][0][0] is child:
+            key, group = membership[0], memberships[membership[0]]
+            merged.append(type(child)(**{f'{key}_in': frozenset().union(*(values for _, values in group))}))
+    return _merge_regexes(merged)
+
+
+def _merge_regexes(children):
+    regexes = {}
+    for child in children:
+        if isinstance(child, QUERY_TYPES):
+            regex = _regex(child)
+            if regex is not None:
+                regexes.setdefault(regex[0], []).append((child, regex[1]))
+    merged = []
+    for child in children:
+        regex = _regex(child) if isinstance(child, QUERY_TYPES) else None
+        if regex is None or len(regexes[regex[0]]) == 1:
+            merged.append(child)
+        elif regexes[regex[0]][0][0] is child:
+            (key, flags), group = regex[0], regexes[regex[0]]
+            alternation = _alternation([pattern for _, pattern in group], flags)
+            if alternation is None:
+                merged.extend(query for query, _ in group)
+            else:
+                merged.append(type(child)(**{f'{key}_regex': alternation}))
+    return merged
+
+
+def optimize(predicate):
+    """
+    Returns a predicate equivalent to ``predicate`` that is cheaper to evaluate:
+
+    * sibling :class:`Query` objects in an :class:`And` are merged in a single :class:`Query`
+    * :class:`Query` objects in an :class:`Or` that check the same field for equality are merged in a single ``_in`` check
+      (eg: ``Or(Q(module='a'), Q(module='b'))`` becomes ``Q(module_in={'a', 'b'})``)
+    * :class:`Query` objects in an :class:`Or` that match the same field against regular expressions are merged in a single
+      ``_regex`` check with an alternation (eg: ``Or(Q(module_regex='a'), Q(module_regex='b'))`` becomes
+      ``Q(module_regex='(?:a)|(?:b)')``)
+    * duplicate predicates are removed from :class:`And` and :class:`Or`
+    * double negations are removed
+    * the predicates in :class:`And` and :class:`Or` are reordered so that the cheapest are checked first (as estimated from
+      the fields and operators that are used)
+
+    Predicates that keep state (eg: :class:`Backlog`, :class:`From` or arbitrary callables) are not copied. Nothing is
+    moved across the predicates that keep state or have side effects (eg: :class:`When` actions).
+
+    Example:
+
+        >>> from hunter import Q
+        >>> optimize(Q(module='foo') & Q(depth_lt=2))
+        <hunter.predicates.Query: query_eq=(('module', 'foo'),) query_lt=(('depth', 2),)>
+    """
+    if isinstance(predicate, AND_TYPES):
+        children = _optimize_children(predicate, _merge_and_children)
+        return children[0] if len(children) == 1 else type(predicate)(*children)
+    elif isinstance(predicate, OR_TYPES):
+        children = _optimize_children(predicate, _merge_or_children)
+        return children[0] if len(children) == 1 else type(predicate)(*children)
+    elif isinstance(predicate, NOT_TYPES):
+        child = optimize(predicate.predicate)
+        if isinstance(child, NOT_TYPES):
+            # Not(Not(x)) returns a bool while x may return anything, but the tracer (and all the predicates) only use truthiness
+            return child.predicate
+        return type(predicate)(child)
+    elif isinstance(predicate, WHEN_TYPES):
+        return type(predicate)(optimize(predicate.condition), *predicate.actions)
+    else:
+        return predicate
+
+
+def instrument(predicate, timing=False):
+    """
+    Returns a copy of ``predicate`` where every node (:class:`Query`, :class:`And`, :class:`Or`, :class:`Not`, :class:`When`,
+    :class:`From`, :class:`Backlog` or any other callable) is wrapped in an :class:`Instrumented` that counts evaluations and
+    matches (and the time spent if ``timing`` is enabled).
+
+    Note that this is slow - only use it to find out what parts of a complicated predicate are expensive (see :func:`hunter.stats`).
+    """
+    if isinstance(predicate, AND_TYPES + OR_TYPES):
+        predicate = type(predicate)(*(instrument(child, timing) for child in predicate.predicates))
+    elif isinstance(predicate, NOT_TYPES):
+        predicate = type(predicate)(instrument(predicate.predicate, timing))
+    elif isinstance(predicate, WHEN_TYPES):
+        predicate = type(predicate)(instrument(predicate.condition, timing), *predicate.actions)
+    elif isinstance(predicate, FROM_TYPES):
+        predicate = type(predicate)(
+            instrument(predicate.condition, timing),
+            None if predicate.predicate is None else instrument(predicate.predicate, timing),
+            predicate.watermark,
+        )
+    elif isinstance(predicate, BACKLOG_TYPES):
+        predicate = type(predicate)(
+            instrument(predicate.condition, timing),
+            size=predicate.size,
+            stack=predicate.stack,
+            vars=predicate.vars,
+            strip=predicate.strip,
+            action=predicate.action,
+            filter=predicate._filter,
+        )
+    elif isinstance(predicate, Action):
+        return predicate
+    return Instrumented(predicate, timing)
+
+
+def _instrumented_children(predicate):
+    if isinstance(predicate, AND_TYPES + OR_TYPES):
+        return predicate.predicates
+    elif isinstance(predicate, NOT_TYPES):
+        return (predicate.predicate,)
+    elif isinstance(predicate, (*WHEN_TYPES, *BACKLOG_TYPES)):
+        return (predicate.condition,)
+    elif isinstance(predicate, FROM_TYPES):
+        return predicate.condition, predicate.predicate
+    else:
+        return ()
+
+
+def _instrumented_label(predicate):
+    if isinstance(predicate, AND_TYPES + OR_TYPES + NOT_TYPES):
+        return type(predicate).__name__
+    elif isinstance(predicate, WHEN_TYPES):
+        return 'When -> {}'.format(', '.join(type(action).__name__ for action in predicate.actions))
+    elif isinstance(predicate, FROM_TYPES):
+        return f'From(watermark={predicate.watermark})'
+    elif isinstance(predicate, BACKLOG_TYPES):
+        return f'Backlog(size={predicate.size}, stack={predicate.stack})'
+    else:
+        return str(predicate)
+
+
+def format_stats(predicate, indent=''):
+    """
+    Returns the counters from a predicate made with :func:`instrument` as an indented tree (one node per line).
+    """
+    lines = []
+    if isinstance(predicate, Instrumented):
+        evaluations = predicate.evaluations
+        line = f'{indent}{_instrumented_label(predicate.predicate)}: evaluations={evaluations} hits={predicate.hits}'
+        if evaluations:
+            line += f' ({predicate.hits / evaluations:.1%})'
+        if predicate.timing:
+            line += f' time={predicate.elapsed / 1e6:.3f}ms'
+        lines.append(line)
+        for child in _instrumented_children(predicate.predicate):
+            if child is not None:
+                lines.append(format_stats(child, indent + '    '))
+    else:
+        lines.append(f'{indent}{predicate}')
+    return '\n'.join(lines)
+
+
+def _shard(predicate, memo):
+    """
+    Returns a copy of ``predicate`` that has fresh state for everything that keeps state between events (:class:`From`,
+    :class:`Backlog` and stateful actions). Parts without state are shared with the original.
+
+    The ``memo`` dict maps ids of already copied predicates to their copies, so that parts shared between the trees copied
+    with the same ``memo`` (eg: a handler and its residual from :func:`analyze`) are still shared in the copies.
+    """
+    if predicate is None:
+        return None
+    key = id(predicate)
+    if key not in memo:
+        memo[key] = predicate, _copy_state(predicate, memo)
+    return memo[key][1]
+
+
+def _copy_state(predicate, memo):
+    if isinstance(predicate, AND_TYPES + OR_TYPES):
+        predicates = tuple(_shard(child, memo) for child in predicate.predicates)
+        if all(copy is child for copy, child in zip(predicates, predicate.predicates)):
+            return predicate
+        return type(predicate)(*predicates)
+    elif isinstance(predicate, NOT_TYPES):
+        child = _shard(predicate.predicate, memo)
+        return predicate if child is predicate.predicate else type(predicate)(child)
+    elif isinstance(predicate, WHEN_TYPES):
+        condition = _shard(predicate.condition, memo)
+        actions = tuple(_shard(action, memo) for action in predicate.actions)
+        if condition is predicate.condition and all(copy is action for copy, action in zip(actions, predicate.actions)):
+            return predicate
+        return type(predicate)(condition, *actions)
+    elif isinstance(predicate, FROM_TYPES):
+        return type(predicate)(_shard(predicate.condition, memo), _shard(predicate.predicate, memo), predicate.watermark)
+    elif isinstance(predicate, BACKLOG_TYPES):
+        return type(predicate)(
+            _shard(predicate.condition, memo),
+            size=predicate.size,
+            stack=predicate.stack,
+            vars=predicate.vars,
+            strip=predicate.strip,
+            action=_shard(predicate.action, memo),
+            filter=_shard(predicate._filter, memo),
+        )
+    elif isinstance(predicate, Instrumented):
+        child = _shard(predicate.predicate, memo)
+        return predicate if child is predicate.predicate else Instrumented(child, predicate.timing, predicate.counters)
+    elif isinstance(predicate, Action):
+        return predicate.shard()
+    else:
+        return predicate
@@ -0,0 +1,590 @@
+"""
+A compact binary format for events, written by :class:`hunter.actions.BinaryRecorder`.
+
+A recording is a sequence of sessions. Each session starts with :data:`MAGIC` and is followed by records, each starting
+with a tag byte:
+
+* ``STRING``: a string (utf-8 encoded, length prefixed), implicitly numbered in the order they appear.
+* ``CODE``: the filename, module and function (as string numbers) and the argument names of a code object.
+* ``THREAD``: a thread ident and the thread name.
+* ``EVENT``: the kind (and flags), the code, line number, depth, calls and thread numbers and optionally the reprs of the
+  arguments (for calls) or of the return value or exception.
+
+All the integers are varints (7 bits per byte, least significant first), the signed ones zigzag encoded. Strings, code
+objects and threads are only written the first time they are used in a session.
+
+A flight recording (see :class:`hunter.actions.FlightRecorder`) is a fixed size file that starts with
+:data:`RING_MAGIC`, the block size and the number of blocks. Each block holds a sequence number, the number of bytes used
+and a whole session (thus blocks can be overwritten and decoded independently).
+"""
+
+import argparse
+import linecache
+import mmap
+import os
+import struct
+import sys
+from collections import defaultdict
+from inspect import CO_VARARGS
+from inspect import CO_VARKEYWORDS
+from itertools import islice
+from types import SimpleNamespace
+
+from .util import get_fullsource
+from .util import get_stdlib
+from .util import safe_repr
+
+__all__ = (
+    'Encoder',
+    'RecordedEvent',
+    'RingBuffer',
+    'main',
+    'read_recording',
+)
+
+MAGIC = b'HUNTER\x00\x01'
+RING_MAGIC = b'HUNTFR\x00\x01'
+RING_HEADER = struct.Struct('<8sII')
+RING_HEADER_SIZE = 64
+BLOCK_HEADER = struct.Struct('<QI')
+STRING = 1
+CODE = 2
+THREAD = 3
+EVENT = 4
+
+KINDS = 'call', 'line', 'return', 'exception'
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+KIND_MASK = 3
+BUILTIN_FLAG = 4
+REPRS_FLAG = 8
+THREADING_SUPPORT_FLAGS = {None: 0, False: 16, True: 32}
+THREADING_SUPPORT_MASK = 48
+THREADING_SUPPORT_VALUES = {flag: value for value, flag in THREADING_SUPPORT_FLAGS.items()}
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_signed(out, value):
+    write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def read_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def read_signed(data, position):
+    value, position = read_varint(data, position)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), position
+
+
+def write_bytes(out, value):
+    write_varint(out, len(value))
+    out += value
+
+
+def read_bytes(data, position):
+    length, position = read_varint(data, position)
+    end = position + length
+    if end > len(data):
+        raise IndexError('truncated record')
+    return bytes(data[position:end]), end
+
+
+def _argument_count(code):
+    flags = code.co_flags
+    return code.co_argcount + code.co_kwonlyargcount + bool(flags & CO_VARARGS) + bool(flags & CO_VARKEYWORDS)
+
+
+def _encode_text(value):
+    return value.encode('utf-8', 'surrogatepass')
+
+
+def _decode_text(value):
+    return value.decode('utf-8', 'surrogatepass')
+
+
+class Encoder:
+    """
+    Encodes events as records. Keeps the tables of the strings, code objects and threads that were already written (in
+    the current session). The table entries added by :meth:`encode` are only kept if :meth:`commit` is called (after the
+    records were written), otherwise they are discarded by the next :meth:`encode`.
+
+    Args:
+        reprs (bool): Include the ``repr()`` of the arguments (for calls) and of the return values and exceptions.
+        repr_limit (int): Maximum length of the reprs (longer reprs keep their ends).
+    """
+
+    def __init__(self, reprs=True, repr_limit=1024):
+        self.reprs = reprs
+        self.repr_limit = repr_limit
+        self.reset()
+
+    def reset(self):
+        """
+        Starts a new session: clears the tables and returns the session header.
+        """
+        self.strings = {}
+        self.codes = {}
+        self.threads = {}
+        self.committed = 0, 0, 0
+        return MAGIC
+
+    def commit(self):
+        """
+        Keeps the table entries added by the last :meth:`encode`. Must be called after its records were written.
+        """
+        self.committed = len(self.strings), len(self.codes), len(self.threads)
+
+    def rollback(self):
+        """
+        Discards the table entries that were not committed.
+        """
+        for table, size in zip((self.strings, self.codes, self.threads), self.committed):
+            while len(table) > size:
+                table.popitem()
+
+    def string(self, out, value):
+        number = self.strings.get(value)
+        if number is None:
+            number = self.strings[value] = len(self.strings)
+            out.append(STRING)
+            write_bytes(out, _encode_text(value))
+        return number
+
+    def code(self, out, event):
+        builtin = event.builtin
+        key = (event.module, event.function, event.filename) if builtin else event.code
+        number = self.codes.get(key)
+        if number is None:
+            if builtin:
+                argcount = kwonlyargcount = flags = 0
+                names = ()
+            else:
+                code = event.code
+                argcount = code.co_argcount
+                kwonlyargcount = code.co_kwonlyargcount
+                flags = code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+                names = code.co_varnames[: _argument_count(code)]
+            fields = [self.string(out, event.filename), self.string(out, event.module), self.string(out, event.function)]
+            fields.extend(self.string(out, name) for name in names)
+            number = self.codes[key] = len(self.codes)
+            out.append(CODE)
+            for field in fields[:3]:
+                write_varint(out, field)
+            write_varint(out, argcount)
+            write_varint(out, kwonlyargcount)
+            write_varint(out, flags)
+            write_varint(out, len(names))
+            for field in fields[3:]:
+                write_varint(out, field)
+        return number
+
+    def thread(self, out, event):
+        key = event.threadid, event.threadname
+        number = self.threads.get(key)
+        if number is None:
+            name = self.string(out, event.threadname)
+            number = self.threads[key] = len(self.threads)
+            out.append(THREAD)
+            write_varint(out, 0 if event.threadid is None else event.threadid + 1)
+            write_varint(out, name)
+        return number
+
+    def repr(self, value):
+        limit = self.repr_limit
+        try:
+            value = safe_repr(value)
+        except Exception as exc:
+            value = f'!!! FAILED REPR: {exc!r}'
+        value = value.replace('\n', r'\n')
+        if len(value) > limit:
+            cutoff = limit // 2
+            value = f'{value[:cutoff]} [...] {value[-cutoff:]}'
+        return _encode_text(value)
+
+    def encode(self, event, out):
+        """
+        Appends the records for ``event`` (the event record and the table records it needs) to the ``out`` bytearray.
+        """
+        self.rollback()
+        kind = event.kind
+        threading_support = event.threading_support
+        code = self.code(out, event)
+        thread = self.thread(out, event)
+        flags = KIND_CODES[kind] | THREADING_SUPPORT_FLAGS[None if threading_support is None else bool(threading_support)]
+        if event.builtin:
+            flags |= BUILTIN_FLAG
+        if self.reprs:
+            flags |= REPRS_FLAG
+        out.append(EVENT)
+        out.append(flags)
+        write_varint(out, code)
+        write_varint(out, event.lineno or 0)
+        write_signed(out, event.depth)
+        write_signed(out, event.calls)
+        write_varint(out, thread)
+        if self.reprs:
+            if kind == 'call':
+                if event.builtin:
+                    write_varint(out, 0)
+                else:
+                    local_vars = event.locals
+                    names = event.code.co_varnames[: _argument_count(event.code)]
+                    write_varint(out, len(names))
+                    for name in names:
+                        write_bytes(out, self.repr(local_vars[name]) if name in local_vars else b'?')
+            elif kind in ('return', 'exception') and not event.builtin:
+                write_bytes(out, self.repr(event.arg))
+
+
+class RecordedEvent:
+    """
+    An event read from a recording. Has the same fields as a detached :class:`hunter.event.Event` except ``globals``
+    (always empty), ``locals`` (only the reprs of the arguments for calls) and ``arg`` (the repr of the return value or
+    exception). The source fields are read from the files, if they are still around.
+    """
+
+    __slots__ = (
+        '_fullsource',
+        '_source',
+        'arg',
+        'builtin',
+        'calls',
+        'code',
+        'depth',
+        'filename',
+        'function',
+        'kind',
+        'lineno',
+        'locals',
+        'module',
+        'threadid',
+        'threading_support',
+        'threadname',
+    )
+
+    detached = True
+    frame = None
+    function_object = None
+    instruction = None
+
+    def __init__(self, kind, builtin, code, lineno, depth, calls, thread, threading_support, arg, local_vars):
+        self.kind = kind
+        self.builtin = builtin
+        self.code = code
+        self.filename = code.co_filename
+        self.module = code.co_module
+        self.function = code.co_name
+        self.lineno = lineno
+        self.depth = depth
+        self.calls = calls
+        self.threadid, self.threadname = thread
+        self.threading_support = threading_support
+        self.arg = arg
+        self.locals = local_vars
+        self._fullsource = self._source = None
+
+    def __repr__(self):
+        return (
+            f'<RecordedEvent kind={self.kind!r} function={self.function!r} module={self.module!r} '
+            f'filename={self.filename!r} lineno={self.lineno}>'
+        )
+
+    @property
+    def globals(self):
+        return {}
+
+    @property
+    def stdlib(self):
+        return get_stdlib(self.module, self.filename)
+
+    @property
+    def source(self):
+        if self._source is None:
+            self._source = linecache.getline(self.filename, self.lineno)
+        return self._source
+
+    @property
+    def fullsource(self):
+        if self._fullsource is None:
+            if self.kind == 'call' and self.function != '<module>':
+                self._fullsource = get_fullsource(self.filename, self.lineno, None)
+            else:
+                self._fullsource = linecache.getline(self.filename, self.lineno)
+        return self._fullsource
+
+
+class RingBuffer:
+    """
+    A memory-mapped file divided in ``size // block_size`` blocks that are reused in circular order. The data written in a
+    block is visible in the file right away (the used length is updated after the data), thus it survives a crash of the
+    process.
+    """
+
+    def __init__(self, path, size, block_size):
+        if block_size <= BLOCK_HEADER.size + len(MAGIC):
+            raise ValueError(f'Block size {block_size} is too small.')
+        self.path = path
+        self.block_size = block_size
+        self.block_count = max(2, size // block_size)
+        self.capacity = block_size - BLOCK_HEADER.size
+        with open(path, 'wb') as fh:
+            fh.truncate(RING_HEADER_SIZE + self.block_count * block_size)
+        fd = os.open(path, os.O_RDWR)
+        try:
+            self.map = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        RING_HEADER.pack_into(self.map, 0, RING_MAGIC, block_size, self.block_count)
+        self.sequence = 0
+        self.start = None
+        self.used = self.events = 0
+
+    def next_block(self, header):
+        """
+        Starts the next block (overwriting the oldest one) with ``header`` (the session header from :meth:`Encoder.reset`).
+        """
+        self.sequence += 1
+        self.start = RING_HEADER_SIZE + (self.sequence - 1) % self.block_count * self.block_size
+        self.used = self.events = 0
+        BLOCK_HEADER.pack_into(self.map, self.start, self.sequence, 0)
+        self._write(header)
+
+    def append(self, data):
+        """
+        Adds ``data`` (the records for an event) to the current block. Returns ``False`` if it doesn't fit.
+        """
+        if self.start is None or self.used + len(data) > self.capacity:
+            return False
+        self._write(data)
+        self.events += 1
+        return True
+
+    def _write(self, data):
+        used = self.used
+        position = self.start + BLOCK_HEADER.size + used
+        self.map[position : position + len(data)] = data
+        self.used = used = used + len(data)
+        BLOCK_HEADER.pack_into(self.map, self.start, self.sequence, used)
+
+    def flush(self):
+        self.map.flush()
+
+    def close(self):
+        self.map.close()
+
+
+def read_recording(file, since=None):
+    """
+    Iterates the events (:class:`RecordedEvent` objects) in a recording or flight recording. A truncated record at the
+    end (eg: if the process was killed while writing) is ignored.
+
+    Args:
+        file (str or file-like): Path or binary file to read from.
+        since (tuple): For flight recordings, only read the events after the given position (a ``(sequence, events)``
+            tuple, as in :attr:`RingBuffer.sequence` and :attr:`RingBuffer.events`).
+    """
+    if isinstance(file, str):
+        with open(file, 'rb') as fh:
+            yield from read_recording(fh, since)
+        return
+    try:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):  # not a real file or it's empty
+        data = file.read()
+    try:
+        if data[: len(RING_MAGIC)] == RING_MAGIC:
+            yield from _iter_ring(data, since)
+        else:
+            yield from _iter_events(data)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _iter_ring(data, since=None):
+    _, block_size, block_count = RING_HEADER.unpack_from(data, 0)
+    blocks = []
+    for index in range(block_count):
+        start = RING_HEADER_SIZE + index * block_size
+        sequence, used = BLOCK_HEADER.unpack_from(data, start)
+        if sequence:
+            blocks.append((sequence, start + BLOCK_HEADER.size, min(used, block_size - BLOCK_HEADER.size)))
+    since_sequence, since_events = since or (0, 0)
+    for sequence, start, used in sorted(blocks):
+        if sequence < since_sequence:
+            continue
+        events = _iter_events(bytes(data[start : start + used]))
+        if sequence == since_sequence:
+            events = islice(events, since_events, None)
+        yield from events
+
+
+def _iter_events(data):
+    strings = codes = threads = None
+    size = len(data)
+    position = 0
+    try:
+        while position < size:
+            tag = data[position]
+            if tag == MAGIC[0]:
+                if data[position : position + len(MAGIC)] != MAGIC:
+                    raise ValueError(f'Unsupported recording format at offset {position}.')
+                position += len(MAGIC)
+                strings = []
+                codes = []
+                threads = []
+                continue
+            elif strings is None:
+                raise ValueError('Not a recording (missing header).')
+            position += 1
+            if tag == STRING:
+                value, position = read_bytes(data, position)
+                strings.append(_decode_text(value))
+            elif tag == CODE:
+                filename, position = read_varint(data, position)
+                module, position = read_varint(data, position)
+                function, position = read_varint(data, position)
+                argcount, position = read_varint(data, position)
+                kwonlyargcount, position = read_varint(data, position)
+                flags, position = read_varint(data, position)
+                count, position = read_varint(data, position)
+                names = []
+                for _ in range(count):
+                    name, position = read_varint(data, position)
+                    names.append(strings[name])
+                codes.append(
+                    SimpleNamespace(
+                        co_filename=strings[filename],
+                        co_module=strings[module],
+                        co_name=strings[function],
+                        co_argcount=argcount,
+                        co_kwonlyargcount=kwonlyargcount,
+                        co_flags=flags,
+                        co_varnames=tuple(names),
+                    )
+                )
+            elif tag == THREAD:
+                ident, position = read_varint(data, position)
+                name, position = read_varint(data, position)
+                threads.append((ident - 1 if ident else None, strings[name]))
+            elif tag == EVENT:
+                flags = data[position]
+                position += 1
+                code, position = read_varint(data, position)
+                lineno, position = read_varint(data, position)
+                depth, position = read_signed(data, position)
+                calls, position = read_signed(data, position)
+                thread, position = read_varint(data, position)
+                kind = KINDS[flags & KIND_MASK]
+                builtin = bool(flags & BUILTIN_FLAG)
+                code = codes[code]
+                arg = None
+                local_vars = {}
+                if flags & REPRS_FLAG:
+                    if kind == 'call':
+                        count, position = read_varint(data, position)
+                        for name in code.co_varnames[:count]:
+                            value, position = read_bytes(data, position)
+                            local_vars[name] = _decode_text(value)
+                    elif kind in ('return', 'exception') and not builtin:
+                        value, position = read_bytes(data, position)
+                        arg = _decode_text(value)
+                yield RecordedEvent(
+                    kind,
+                    builtin,
+                    code,
+                    lineno,
+                    depth,
+                    calls,
+                    threads[thread],
+                    THREADING_SUPPORT_VALUES[flags & THREADING_SUPPORT_MASK],
+                    arg,
+                    local_vars,
+                )
+            else:
+                raise ValueError(f'Unknown record {tag!r} at offset {position - 1}.')
+    except IndexError:  # a truncated record
+        return
+
+
+def render(events, action):
+    """
+    Passes the recorded ``events`` to a text ``action`` class (:class:`~hunter.actions.CallPrinter` or
+    :class:`~hunter.actions.CodePrinter`), with one action instance for each thread in the recording (so that
+    :class:`~hunter.actions.CallPrinter` tracks the call stacks per thread).
+    """
+    actions = {}
+    threads = set()
+    for event in events:
+        threads.add(event.threadid)
+        instance = actions.get(event.threadid)
+        if instance is None:
+            instance = actions[event.threadid] = action()
+            instance.locals = defaultdict(list)
+            instance.thread_prefix = _recorded_thread_prefix(instance, threads)
+        instance(event)
+
+
+def _recorded_thread_prefix(action, threads):
+    def thread_prefix(event):
+        if event.threading_support is False:
+            threading_support = False
+        elif event.threading_support:
+            threading_support = True
+        else:
+            threading_support = len(threads) > 1
+        thread_name = event.threadname if threading_support else ''
+        thread_align = action.thread_alignment if threading_support else ''
+        return f'{thread_name:{thread_align}}'
+
+    return thread_prefix
+
+
+parser = argparse.ArgumentParser(description='Print the events from a recording made with hunter.actions.BinaryRecorder.')
+parser.add_argument('path', metavar='PATH', help='The recording file.')
+parser.add_argument(
+    '-f',
+    '--format',
+    dest='format',
+    choices=('call', 'code'),
+    default='call',
+    help='Output format: "call" for CallPrinter, "code" for CodePrinter. Default: %(default)s.',
+)
+parser.add_argument(
+    '--force-colors',
+    dest='force_colors',
+    action='store_true',
+    help='Use colors even if the output is not a terminal.',
+)
+parser.add_argument(
+    '--filename-alignment',
+    dest='filename_alignment',
+    default=40,
+    type=int,
+    help='Size of the filename column. Default: %(default)s.',
+)
+
+
+def main(args=None):
+    from .actions import CallPrinter
+    from .actions import CodePrinter
+
+    args = parser.parse_args(args)
+    klass = CallPrinter if args.format == 'call' else CodePrinter
+    render(
+        read_recording(args.path),
+        lambda: klass(stream=sys.stdout, force_colors=args.force_colors, filename_alignment=args.filename_alignment),
+    )
@@ -1,12 +1,176 @@
 import sys
 import threading
 import traceback
+from random import random
+from time import perf_counter
 
 import hunter
 
 from .event import Event
+from .predicates import CODE_FIELDS
+from .predicates import _code_cacheable
+from .predicates import _deliverable
+from .predicates import _shard
+from .predicates import analyze
+from .predicates import instrument
+from .predicates import optimize
+from .util import CountersRegistry
+from .util import flush_buffers
 
-__all__ = ('Tracer',)
+__all__ = (
+    'Budget',
+    'Tracer',
+)
+
+BUILTIN_KINDS = frozenset(('c_call', 'c_exception', 'c_return'))
+BUDGET_TIMING_INTERVAL = 16  # only one in this many events are timed
+BUDGET_CHECK_INTERVAL = 1024  # the handler time is checked once every this many events
+STATS_TIMING_INTERVAL = 16  # only one in this many events are timed for Tracer.stats()
+
+
+class ThreadCounters:
+    __slots__ = 'calls', 'depth', 'events', 'handled', 'handler', 'handler_time', 'residual', 'sharded', 'time', 'unsampled'
+
+    def __init__(self):
+        self.depth = self.calls = 0
+        self.unsampled = False
+        self.sharded = self.handler = self.residual = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.events = self.handled = 0
+        self.time = self.handler_time = 0.0
+
+
+class LocalCounters(threading.local):
+    def __init__(self, registry):
+        # this runs once in every thread that uses the counters, the registry drops them after the thread is gone
+        self.counters = ThreadCounters()
+        self.token = registry.add(self.counters)
+
+
+def get_shard(counters, predicate, handler, residual):
+    """
+    Returns the current thread's copy of ``predicate`` (either the tracer's ``handler`` or its ``residual``).
+    """
+    if counters.sharded is not handler:
+        memo = {}
+        counters.handler = _shard(handler, memo)
+        counters.residual = _shard(residual, memo)
+        counters.sharded = handler
+    if predicate is handler:
+        return counters.handler
+    elif predicate is residual:
+        return counters.residual
+    else:
+        return predicate
+
+
+def check_sampling(sample, sample_rate):
+    if sample is not None and sample_rate is not None:
+        raise ValueError('Only one of sample or sample_rate can be used.')
+    if sample is not None and sample < 1:
+        raise ValueError(f'Invalid sample={sample!r}. Must be a positive integer.')
+    if sample_rate is not None and not 0 < sample_rate <= 1:
+        raise ValueError(f'Invalid sample_rate={sample_rate!r}. Must be a number between 0 (exclusive) and 1.')
+
+
+class Budget:
+    """
+    Limits for the events a tracer delivers to its handler.
+
+    Args:
+        max_events (int): Maximum number of events.
+        max_events_per_second (int): Maximum number of events in any one second interval.
+        max_cpu_fraction (float): Maximum fraction (between 0 and 1) of the time spent in the handler since tracing started.
+            The handler time is estimated by only timing one in every 16 events.
+        over_budget (str): What to do when a limit is exceeded: ``'stop'`` the tracer or only deliver ``'calls'`` from
+            then on (with a fresh budget - if that is exceeded too the tracer is stopped).
+    """
+
+    def __init__(self, max_events=None, max_events_per_second=None, max_cpu_fraction=None, over_budget='stop'):
+        for name, value in (
+            ('max_events', max_events),
+            ('max_events_per_second', max_events_per_second),
+            ('max_cpu_fraction', max_cpu_fraction),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f'Invalid {name}={value!r}. Must be a positive number.')
+        if max_cpu_fraction is not None and max_cpu_fraction > 1:
+            raise ValueError(f'Invalid max_cpu_fraction={max_cpu_fraction!r}. Must be a number between 0 (exclusive) and 1.')
+        if over_budget not in ('stop', 'calls'):
+            raise ValueError(f"Invalid over_budget={over_budget!r}. Must be 'stop' or 'calls'.")
+        self.max_events = max_events
+        self.max_events_per_second = max_events_per_second
+        self.max_cpu_fraction = max_cpu_fraction
+        self.over_budget = over_budget
+
+        #: True if the budget was exceeded once and only calls are delivered.
+        #:
+        #: :type: bool
+        self.calls_only = False
+        self.reset()
+
+    def __repr__(self):
+        return (
+            f'<hunter.tracer.Budget: max_events={self.max_events}, max_events_per_second={self.max_events_per_second}, '
+            f'max_cpu_fraction={self.max_cpu_fraction}, over_budget={self.over_budget!r}, calls_only={self.calls_only}>'
+        )
+
+    def reset(self):
+        """
+        Starts counting from zero.
+        """
+        self.events = 0
+        self.handler_time = 0.0
+        self._window_events = 0
+        self._start = self._window_start = perf_counter()
+
+    def timed(self):
+        """
+        Returns ``True`` if the handler should be timed (via :meth:`add_time`) for the event that was just admitted.
+        """
+        return self.max_cpu_fraction is not None and self.events % BUDGET_TIMING_INTERVAL == 0
+
+    def add_time(self, duration):
+        self.handler_time += duration * BUDGET_TIMING_INTERVAL
+
+    def exceeded(self):
+        """
+        Counts an event. Returns a description of the limit that was exceeded or ``None``.
+        """
+        self.events += 1
+        if self.max_events is not None and self.events > self.max_events:
+            return f'more than {self.max_events} events'
+        if self.max_events_per_second is not None:
+            self._window_events += 1
+            if self._window_events > self.max_events_per_second:
+                now = perf_counter()
+                if now - self._window_start < 1:
+                    return f'more than {self.max_events_per_second} events per second'
+                self._window_start = now
+                self._window_events = 1
+        if self.max_cpu_fraction is not None and self.events % BUDGET_CHECK_INTERVAL == 0:
+            if self.handler_time > (perf_counter() - self._start) * self.max_cpu_fraction:
+                return f'more than {self.max_cpu_fraction:.0%} of the time spent in the handler'
+
+    def admit(self, is_call):
+        """
+        Returns ``True`` if the event can be delivered, ``False`` if it should be skipped or ``None`` if the tracer must be stopped.
+        """
+        if self.calls_only and not is_call:
+            return False
+        reason = self.exceeded()
+        if reason is None:
+            return True
+        elif self.over_budget == 'calls' and not self.calls_only:
+            hunter._default_stream.write(f'Only tracing calls from now on because the tracer is over budget ({reason}).\n')
+            self.calls_only = True
+            self.reset()
+            return self.admit(is_call)
+        else:
+            hunter._default_stream.write(f'Disabling tracer because it is over budget ({reason}).\n')
+            return None
 
 
 class Tracer:
@@ -15,12 +179,36 @@ class Tracer:
 
     Args:
         threading_support (bool): Hooks the tracer into ``threading.settrace`` as well if True.
+        profiling_mode (bool): Use ``sys.setprofile`` instead of ``sys.settrace``.
+        sample (int): Only trace one in every ``sample`` top-level calls (calls made at depth 0). The other top-level calls
+            (and everything inside them) are skipped.
+        sample_rate (float): Only trace a top-level call with the given probability (between 0 and 1).
+        budget (Budget): Limits for the events delivered to the handler.
+        builtin_events (bool): In profiling mode, also deliver the events for builtin functions.
+        sharding (bool): Give each thread its own copy of the predicates and actions that keep state between events
+            (like :class:`~hunter.predicates.From`, :class:`~hunter.predicates.Backlog` or
+            :class:`~hunter.actions.ErrorSnooper`). Their output still goes to the same streams.
+        instrument (bool or str): Count how many times each part of the predicate is evaluated and how many times it
+            matched (see :func:`hunter.stats`). Use ``'time'`` to also measure the time spent in each part.
     """
 
-    def __init__(self, threading_support=None, profiling_mode=False):
+    def __init__(
+        self,
+        threading_support=None,
+        profiling_mode=False,
+        sample=None,
+        sample_rate=None,
+        budget=None,
+        builtin_events=True,
+        sharding=False,
+        instrument=False,
+    ):
+        check_sampling(sample, sample_rate)
         self._handler = None
         self._previous = None
         self._threading_previous = None
+        self._code_handlers = None
+        self._static = self._residual = None
 
         #: True if threading support was enabled. Should be considered read-only.
         #:
@@ -32,15 +220,76 @@ class Tracer:
         #: :type: bool
         self.profiling_mode = profiling_mode
 
-        #: Tracing depth (increases on calls, decreases on returns)
+        #: True if the events for builtin functions are delivered in profiling mode. Should be considered read-only.
         #:
-        #: :type: int
-        self.depth = 0
+        #: :type: bool
+        self.builtin_events = builtin_events
 
-        #: A counter for total number of 'call' frames that this Tracer went through.
+        #: True if each thread gets its own copy of the stateful predicates and actions. Should be considered read-only.
+        #:
+        #: :type: bool
+        self.sharding = sharding
+
+        #: If set, the predicate is instrumented (``'time'`` if the time spent is measured too). Should be considered read-only.
+        #:
+        #: :type: bool or str
+        self.instrument = instrument
+
+        #: The instrumented predicate (made via :func:`hunter.predicates.instrument`) if ``instrument`` is set. It is kept
+        #: after the tracer is stopped.
+        #:
+        #: :type: hunter.predicates.Instrumented
+        self.instrumented = None
+
+        #: Trace one in every ``sample`` top-level calls (if set). Should be considered read-only.
         #:
         #: :type: int
-        self.calls = 0
+        self.sample = sample
+
+        #: Probability of tracing a top-level call (if set). Should be considered read-only.
+        #:
+        #: :type: float
+        self.sample_rate = sample_rate
+
+        #: The :class:`~hunter.tracer.Budget` (if any). Should be considered read-only.
+        #:
+        #: :type: Budget
+        self.budget = budget
+
+        self._sampling = sample is not None or sample_rate is not None
+        self._top_calls = 0
+        self._registry = CountersRegistry()
+        self._local = LocalCounters(self._registry)
+
+    @property
+    def hook(self):
+        """
+        The hook used by the tracer: ``'settrace'``, ``'setprofile'`` or ``'setprofile (without builtins)'``.
+        """
+        if not self.profiling_mode:
+            return 'settrace'
+        elif self.builtin_events:
+            return 'setprofile'
+        else:
+            return 'setprofile (without builtins)'
+
+    @property
+    def depth(self):
+        """
+        Tracing depth in the current thread (increases on calls, decreases on returns).
+
+        :type: int
+        """
+        return self._local.counters.depth
+
+    @property
+    def calls(self):
+        """
+        A counter for total number of 'call' frames that this Tracer went through in the current thread.
+
+        :type: int
+        """
+        return self._local.counters.calls
 
     @property
     def handler(self):
@@ -57,15 +306,29 @@ class Tracer:
         return self._previous
 
     def __repr__(self):
-        return '<hunter.tracer.Tracer at 0x{:x}: threading_support={}, {}{}{}{}>'.format(
+        return '<hunter.tracer.Tracer at 0x{:x}: threading_support={}, hook={}, {}{}{}{}>'.format(
             id(self),
             self.threading_support,
+            self.hook,
             '<stopped>' if self._handler is None else 'handler=',
             '' if self._handler is None else repr(self._handler),
             '' if self._previous is None else ', previous=',
             '' if self._previous is None else repr(self._previous),
         )
 
+    def stats(self):
+        """
+        Returns counters for the work done by the tracer (in all threads) since :meth:`trace` was called:
+
+        * ``events`` - how many events were received from the trace hook
+        * ``handled`` - how many events were passed to the handler
+        * ``time`` - estimated seconds spent in the tracer (including the handler)
+        * ``handler_time`` - estimated seconds spent in the handler (the predicates and the actions)
+
+        The times are estimated from timing only one in every 16 events, thus they are cheap to keep track of.
+        """
+        return self._registry.stats()
+
     def __call__(self, frame, kind, arg):
         """
         The settrace function.
@@ -76,21 +339,104 @@ class Tracer:
             because it might match further inside.
         """
         if self._handler is not None:
-            if kind == 'return' and self.depth > 0:
-                self.depth -= 1
-            event = Event(frame, kind, arg, self.depth, self.calls, self.threading_support)
+            counters = self._local.counters
+            counters.events += 1
+            if counters.events % STATS_TIMING_INTERVAL:
+                return self._trace(frame, kind, arg, counters, False)
+            start = perf_counter()
             try:
-                self._handler(event)
-            except Exception as exc:
-                traceback.print_exc(file=hunter._default_stream)
-                hunter._default_stream.write(f'Disabling tracer because handler {self._handler!r} failed ({exc!r}) at {event!r}.\n\n')
-                self.stop()
-                return
-            if kind == 'call':
-                self.depth += 1
-                self.calls += 1
+                return self._trace(frame, kind, arg, counters, True)
+            finally:
+                counters.time += (perf_counter() - start) * STATS_TIMING_INTERVAL
 
+    def _trace(self, frame, kind, arg, counters, timed):
+        if kind in BUILTIN_KINDS and not self.builtin_events:
+            return
+        if kind == 'return' and counters.depth > 0:
+            counters.depth -= 1
+        if self._sampling and kind == 'call' and counters.depth == 0:
+            counters.unsampled = not self._sample_next()
+        if counters.unsampled:
+            if kind == 'call':
+                counters.depth += 1
+                counters.calls += 1
+            elif kind == 'return' and counters.depth == 0:  # the top-level call that was not sampled just ended
+                counters.unsampled = False
+            frame.f_trace_lines = False
             return self
+        event = None
+        code_handlers = self._code_handlers
+        # without a static part the residual is the whole (optimized) handler
+        handler = self._residual if code_handlers is None else self._handler
+        if code_handlers is not None and kind not in BUILTIN_KINDS:
+            code = frame.f_code
+            entry = code_handlers.get(id(code))
+            if entry is None or entry[0] is not code:
+                event = Event(frame, kind, arg, counters.depth, counters.calls, self.threading_support)
+                # the code object is kept alive so that its id can't be reused
+                entry = code_handlers[id(code)] = code, self._code_handler(event)
+            handler = entry[1]
+            if handler is None:  # the handler would never match anything in this code object
+                if kind == 'call':
+                    counters.depth += 1
+                    counters.calls += 1
+                # still need the return event to keep the depth right, but lines can be skipped
+                frame.f_trace_lines = False
+                return self
+        budget = self.budget
+        if budget is not None:
+            admitted = budget.admit(kind == 'call' or kind == 'c_call')
+            if not admitted:
+                if admitted is None:
+                    self.stop()
+                    return
+                frame.f_trace_lines = False
+                return self
+        if self.sharding:
+            handler = get_shard(counters, handler, self._handler, self._residual)
+        if event is None:
+            event = Event(frame, kind, arg, counters.depth, counters.calls, self.threading_support)
+        counters.handled += 1
+        try:
+            budget_timed = budget is not None and budget.timed()
+            if timed or budget_timed:
+                start = perf_counter()
+                handler(event)
+                duration = perf_counter() - start
+                if timed:
+                    counters.handler_time += duration * STATS_TIMING_INTERVAL
+                if budget_timed:
+                    budget.add_time(duration)
+            else:
+                handler(event)
+        except Exception as exc:
+            traceback.print_exc(file=hunter._default_stream)
+            hunter._default_stream.write(f'Disabling tracer because handler {self._handler!r} failed ({exc!r}) at {event!r}.\n\n')
+            self.stop()
+            return
+        if kind == 'call':
+            counters.depth += 1
+            counters.calls += 1
+
+        return self
+
+    def _sample_next(self):
+        if self.sample_rate is None:
+            sampled = self._top_calls % self.sample == 0
+            self._top_calls += 1
+            return sampled
+        else:
+            return random() < self.sample_rate  # noqa: S311
+
+    def _code_handler(self, event):
+        """
+        Returns what needs to be called for the events from ``event.code`` or ``None`` if nothing there can match.
+        """
+        try:
+            if _deliverable(self._handler, event, CODE_FIELDS) and (self._static is None or self._static(event)):
+                return self._residual
+        except Exception:
+            return self._handler
 
     def trace(self, predicate):
         """
@@ -102,6 +448,15 @@ class Tracer:
             self
         """
         self._handler = predicate
+        if self.budget is not None:
+            self.budget.calls_only = False
+            self.budget.reset()
+        self._registry.reset_stats()
+        optimized = optimize(predicate)
+        if self.instrument:
+            optimized = self.instrumented = instrument(optimized, timing=self.instrument == 'time')
+        self._static, self._residual = analyze(optimized)
+        self._code_handlers = None if self._static is None and not _code_cacheable(predicate) else {}
         if self.profiling_mode:
             if self.threading_support is None or self.threading_support:
                 self._threading_previous = getattr(threading, '_profile_hook', None)
@@ -133,6 +488,9 @@ class Tracer:
                 if self.threading_support is None or self.threading_support:
                     threading.settrace(self._threading_previous)
                     self._threading_previous = None
+            # only cleared after the hook is uninstalled, as the events from this method still use these
+            self._code_handlers = self._static = self._residual = None
+            flush_buffers()
 
     def __enter__(self):
         """
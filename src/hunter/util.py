@@ -1,8 +1,13 @@
 import ast
+import atexit
 import builtins
+import linecache
+import os
 import re
 import types
 import weakref
+from _thread import start_new_thread
+from bisect import bisect_right
 from collections import Counter
 from collections import OrderedDict
 from collections import defaultdict
@@ -11,12 +16,27 @@ from datetime import date
 from datetime import datetime
 from datetime import time
 from datetime import timedelta
+from functools import lru_cache
+from functools import partial
 from inspect import CO_VARARGS
 from inspect import CO_VARKEYWORDS
 from inspect import getattr_static
+from os.path import dirname
+from os.path import exists
+from os.path import isabs
+from os.path import realpath
+from queue import Empty
+from queue import Full
+from queue import Queue
 from re import RegexFlag
+from threading import Lock
+from threading import get_ident
 from threading import main_thread
+from time import monotonic
+from tokenize import TokenError
+from tokenize import generate_tokens
 
+from .const import STDLIB_PATH_INDEX
 from .vendor.colorama import Back
 from .vendor.colorama import Fore
 from .vendor.colorama import Style
@@ -64,6 +84,19 @@ CODE_COLORS = {
 MISSING = type('MISSING', (), {'__repr__': lambda _: '?'})()
 BUILTIN_SYMBOLS = set(vars(builtins))
 CYTHON_SUFFIX_RE = re.compile(r'([.].+)?[.](so|pyd)$', re.IGNORECASE)
+#: Minimum number of prefixes (or suffixes) for which a binary search is faster than trying all of them.
+AFFIXES_SEARCH_THRESHOLD = 64
+#: How many values have their regular expression match results memoized (per pattern).
+MATCH_CACHE_SIZE = 4096
+#: How many filenames have their stdlib/site-packages classification cached.
+FILENAME_CACHE_SIZE = 4096
+#: Upper bound for the total length (in characters) of the statements cached by :func:`get_fullsource` and of the source
+#: files they were read from.
+FULLSOURCE_CACHE_SIZE = 8 * 1024 * 1024
+#: How long (in seconds) a :class:`BufferedStream` can hold written data before writing it out (checked on writes).
+FLUSH_INTERVAL = 1.0
+#: How many writes a :class:`BackgroundStream` can have pending.
+QUEUE_SIZE = 10000
 LEADING_WHITESPACE_RE = re.compile('(^[ \t]*)(?:[^ \t\n])', re.MULTILINE)
 
 get_main_thread = weakref.ref(main_thread())
@@ -108,6 +141,80 @@ class cached_property:
         return value
 
 
+class Affixes(tuple):
+    """
+    A tuple of prefixes (or suffixes) that can be matched against a string using a binary search instead of trying all of
+    them like ``str.startswith(tuple)`` does.
+
+    Values that start with another value are redundant thus not used as search keys. In the sorted keys that remain the only
+    one that can be a prefix of a string is the greatest key that is not greater than the string. Suffixes are matched the
+    same way, with the values and the string reversed.
+    """
+
+    def __new__(cls, values, suffixes=False):
+        self = super().__new__(cls, values)
+        keys = []
+        for key in sorted({value[::-1] if suffixes else value for value in self}):
+            if not keys or not key.startswith(keys[-1]):
+                keys.append(key)
+        self.keys = keys
+        self.suffixes = suffixes
+        return self
+
+    def __getnewargs__(self):
+        return tuple(self), self.suffixes
+
+    def match(self, string):
+        if self.suffixes:
+            string = string[::-1]
+        keys = self.keys
+        position = bisect_right(keys, string)
+        return position > 0 and string.startswith(keys[position - 1])
+
+
+class ValueSet(frozenset):
+    """
+    A frozenset that shows its values in a stable order (sorted if possible), unlike a frozenset of strings whose order
+    changes from one process to another.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        try:
+            values = sorted(self)
+        except TypeError:  # values of different types
+            values = sorted(self, key=repr)
+        return 'frozenset({%s})' % ', '.join(map(repr, values)) if values else 'frozenset()'  # noqa: UP031
+
+
+class MatchCache:
+    """
+    Wraps a compiled regular expression and memoizes whether values match it, for the most recently used ``maxsize`` values.
+    Event fields like ``module`` or ``filename`` repeat a lot thus matching them mostly becomes a cache lookup.
+    """
+
+    __slots__ = 'match', 'pattern'
+
+    def __init__(self, pattern, maxsize=MATCH_CACHE_SIZE):
+        self.pattern = pattern
+        self.match = lru_cache(maxsize)(lambda value: pattern.match(value) is not None)
+
+    def __repr__(self):
+        return repr(self.pattern)
+
+
+def affixes(values, suffixes=False):
+    """
+    Returns the ``values`` as a tuple, or as :class:`Affixes` if there are enough of them to make a binary search worth it.
+    """
+    values = tuple(values)
+    if len(values) < AFFIXES_SEARCH_THRESHOLD:
+        return values
+    else:
+        return Affixes(values, suffixes)
+
+
 def get_func_in_mro(obj, code):
     """Attempt to find a function in a side-effect free way.
 
@@ -135,6 +242,458 @@ def if_same_code(func, code):
     return None
 
 
+def get_filename(code, module_globals):
+    """
+    Returns the path to the source file of ``code`` (eg: the ``.py`` or ``.pyx`` file instead of the ``.pyc`` or ``.so``).
+    """
+    filename = code.co_filename
+    if not filename:
+        filename = module_globals.get('__file__')
+    if not filename:
+        filename = '?'
+    elif filename.endswith(('.pyc', '.pyo')):
+        filename = filename[:-1]
+    elif filename.endswith('$py.class'):  # Jython
+        filename = filename[:-9] + '.py'
+    elif filename.endswith(('.so', '.pyd')):
+        basename = CYTHON_SUFFIX_RE.sub('', filename)
+        for ext in ('.pyx', '.py'):
+            cyfilename = basename + ext
+            if exists(cyfilename):
+                filename = cyfilename
+                break
+    return filename
+
+
+def _classify_path(path, index=STDLIB_PATH_INDEX):
+    stdlib = None
+    while True:
+        found = index.get(path)
+        if found is False:
+            return False
+        elif found:
+            stdlib = True
+        parent = dirname(path)
+        if parent == path or not parent:
+            return stdlib
+        path = parent
+
+
+@lru_cache(FILENAME_CACHE_SIZE)
+def classify_filename(filename):
+    """
+    Returns ``True`` if ``filename`` is in the standard library, ``False`` if it's in site-packages or ``None`` otherwise.
+
+    Uses the directory index from :mod:`hunter.const` (walking up the parent directories, then the ones of the resolved
+    path if the file is reached through a symlink). The results for the most recently used filenames are cached.
+    """
+    stdlib = _classify_path(filename)
+    if stdlib is None and isabs(filename):
+        try:
+            real = realpath(filename)
+        except (OSError, ValueError):
+            return None
+        if real != filename:
+            stdlib = _classify_path(real)
+    return stdlib
+
+
+def get_stdlib(module, filename):
+    """
+    Returns ``True`` if the given module (from the given file) is part of the standard library.
+    """
+    if 'pkg_resources' in module and 'pkg_resources' in module.split('.'):
+        # skip this over-vendored module
+        return True
+    elif filename == '<string>' and (module.startswith('namedtuple_') or module == 'site'):
+        # skip namedtuple exec garbage
+        return True
+    else:
+        # if it's in site-packages then its definitely not stdlib
+        return classify_filename(filename) is True
+
+
+#: Maps ids of code objects to ``(weakref to the code object, filename, module, stdlib)``. See :func:`get_code_fields`.
+CODE_FIELDS_CACHE = {}
+#: Minimum number of entries in :data:`CODE_FIELDS_CACHE` before the entries for dead code objects are dropped.
+CODE_FIELDS_CACHE_SWEEP = 1024
+_code_fields_sweep_at = CODE_FIELDS_CACHE_SWEEP
+
+
+def _sweep_code_fields():
+    global _code_fields_sweep_at
+
+    for key, entry in list(CODE_FIELDS_CACHE.items()):
+        if entry[0]() is None:
+            CODE_FIELDS_CACHE.pop(key, None)
+    _code_fields_sweep_at = max(CODE_FIELDS_CACHE_SWEEP, 2 * len(CODE_FIELDS_CACHE))
+
+
+def get_code_fields(code, module, module_globals):
+    """
+    Returns the ``(filename, stdlib)`` fields for events from ``code`` running in ``module``.
+
+    They are computed once per code object. The ``stdlib`` field is recomputed if the code runs in another module (eg:
+    builtin calls are attributed to the builtin's module).
+
+    Entries hold weak references (without callbacks, as those would run traced code at random points) and the entries of
+    garbage collected code objects are dropped whenever the cache doubles in size.
+    """
+    key = id(code)
+    entry = CODE_FIELDS_CACHE.get(key)
+    if entry is None or entry[0]() is not code:
+        filename = get_filename(code, module_globals)
+        stdlib = get_stdlib(module, filename)
+        try:
+            ref = weakref.ref(code)
+        except TypeError:  # code objects might not be weakly referenceable on other implementations
+            return filename, stdlib
+        if len(CODE_FIELDS_CACHE) >= _code_fields_sweep_at:
+            _sweep_code_fields()
+        CODE_FIELDS_CACHE[key] = ref, filename, module, stdlib
+        return filename, stdlib
+    elif entry[2] == module:
+        return entry[1], entry[3]
+    else:
+        return entry[1], get_stdlib(module, entry[1])
+
+
+def yield_lines(lines, start, collector, limit=10, leading_whitespace_re=LEADING_WHITESPACE_RE):
+    dedent = None
+    amount = 0
+    for line in lines[start : start + limit]:
+        if dedent is None:
+            dedent = leading_whitespace_re.findall(line)
+            dedent = dedent[0] if dedent else ''
+            amount = len(dedent)
+        elif not line.startswith(dedent):
+            break
+        collector(line)
+        yield line[amount:]
+
+
+def read_fullsource(lines, lineno):
+    """
+    Returns the whole statement at ``lineno`` if it's a class or function definition (tokenizing at most 10 lines, thus
+    including decorators), otherwise just the line.
+    """
+    collected = []
+    try:
+        for _, token, _, _, _ in generate_tokens(partial(next, yield_lines(lines, lineno - 1, collected.append))):
+            if token in ('def', 'class', 'lambda'):
+                return ''.join(collected)
+    except TokenError:
+        pass
+    return lines[lineno - 1] if 1 <= lineno <= len(lines) else ''
+
+
+class SourceCache:
+    """
+    Cache for :func:`read_fullsource` results, keyed by filename and line number.
+
+    The entries of a file are only reused while :mod:`linecache` has the same list of lines for the file (linecache
+    reloads the file if it's modified and :func:`linecache.checkcache` is called). The oldest entries are evicted once the
+    total length of the cached statements and of the lines kept for validating them exceeds ``maxsize`` characters. The
+    lines of a file are dropped together with its last entry.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.size = 0
+        self.entries = OrderedDict()
+        self.files = {}
+        self.lock = Lock()
+
+    def get(self, filename, lineno, module_globals):
+        lines = linecache.getlines(filename, module_globals)
+        file = self.files.get(filename)
+        if file is not None and file[0] is lines:
+            source = self.entries.get((filename, lineno))
+            if source is not None:
+                return source
+        source = read_fullsource(lines, lineno)
+        with self.lock:
+            file = self.files.get(filename)
+            if file is None or file[0] is not lines:
+                if file is not None:
+                    self.discard(filename)
+                file = self.files[filename] = lines, sum(map(len, lines)), set()
+                self.size += file[1]
+            key = filename, lineno
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            file[2].add(lineno)
+            self.entries[key] = source
+            self.size += len(source)
+            while self.size > self.maxsize and self.entries:
+                (evicted_filename, evicted_lineno), evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                evicted_file = self.files[evicted_filename]
+                evicted_file[2].discard(evicted_lineno)
+                if not evicted_file[2]:
+                    del self.files[evicted_filename]
+                    self.size -= evicted_file[1]
+        return source
+
+    def discard(self, filename):
+        """
+        Drops the lines and the entries of the given file. Must be called with the lock held.
+        """
+        _, size, linenos = self.files.pop(filename)
+        self.size -= size
+        for lineno in linenos:
+            self.size -= len(self.entries.pop((filename, lineno)))
+
+
+#: Shared by both :class:`~hunter.event.Event` implementations.
+FULLSOURCE_CACHE = SourceCache(FULLSOURCE_CACHE_SIZE)
+get_fullsource = FULLSOURCE_CACHE.get
+
+
+class CountersToken:
+    __slots__ = ('__weakref__',)
+
+
+class CountersRegistry:
+    """
+    Keeps track of the counters that a tracer has in each thread, for the ``stats()`` of the tracer.
+
+    The registry owns the counters of each thread and keeps them until the token returned by :meth:`add` is gone (the
+    token is stored in a thread-local, thus it goes away together with the thread). Counters without a token are pruned
+    when counters are added or when the stats are read or reset, their stats are kept in the totals.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.retired = {'events': 0, 'handled': 0, 'time': 0.0, 'handler_time': 0.0}
+
+    def add(self, counters, token=None):
+        self.prune()
+        if token is None:
+            token = CountersToken()
+        self.counters[counters] = weakref.ref(token)
+        return token
+
+    def prune(self):
+        retired = self.retired
+        for counters, token in list(self.counters.items()):
+            if token() is None and self.counters.pop(counters, None) is not None:
+                retired['events'] += counters.events
+                retired['handled'] += counters.handled
+                retired['time'] += counters.time
+                retired['handler_time'] += counters.handler_time
+
+    def reset_stats(self):
+        self.prune()
+        self.retired = {'events': 0, 'handled': 0, 'time': 0.0, 'handler_time': 0.0}
+        for counters in list(self.counters):
+            counters.reset_stats()
+
+    def stats(self):
+        self.prune()
+        stats = dict(self.retired)
+        for counters in list(self.counters):
+            stats['events'] += counters.events
+            stats['handled'] += counters.handled
+            stats['time'] += counters.time
+            stats['handler_time'] += counters.handler_time
+        return stats
+
+
+class BufferedStream:
+    """
+    Collects the writes for a stream and writes them out in batches: once ``buffer_size`` characters are pending or if
+    ``flush_interval`` seconds passed since the last flush (only checked when something is written).
+
+    Pending data is also written out when tracing is stopped, at exit and before forking.
+    """
+
+    def __init__(self, stream, buffer_size, flush_interval=FLUSH_INTERVAL):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.size = 0
+        self.deadline = monotonic() + flush_interval
+        self.lock = Lock()
+        BUFFERED_STREAMS.add(self)
+
+    def __repr__(self):
+        return f'<BufferedStream stream={self.stream!r} buffer_size={self.buffer_size!r} flush_interval={self.flush_interval!r}>'
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, data):
+        with self.lock:
+            self.pending.append(data)
+            self.size += len(data)
+            if self.size < self.buffer_size and monotonic() < self.deadline:
+                return
+            self._flush()
+
+    def _flush(self):
+        pending = self.pending
+        self.pending = []
+        self.size = 0
+        self.deadline = monotonic() + self.flush_interval
+        if pending:
+            self.stream.write(''.join(pending))
+        flush = getattr(self.stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _reset(self):
+        # whatever was pending when forking is written out by the parent process
+        self.pending = []
+        self.size = 0
+        self.lock = Lock()
+
+
+class BackgroundStream:
+    """
+    Passes the writes for a stream to a writer thread, through a queue that holds up to ``queue_size`` writes. When the
+    queue is full the write either waits (``overflow='block'``) or is discarded and counted in ``dropped``
+    (``overflow='drop'``).
+
+    The writer thread is not started via :mod:`threading` (thus :func:`threading.settrace` hooks are not installed in it)
+    and it's in :data:`IGNORED_THREADS`, so it's never traced. Errors from the stream are kept in ``error``.
+    """
+
+    def __init__(self, stream, queue_size=QUEUE_SIZE, overflow='block'):
+        if overflow not in ('block', 'drop'):
+            raise ValueError(f'Expected overflow to be either "block" or "drop", not {overflow!r}.')
+        self.stream = stream
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.dropped = 0
+        self.error = None
+        self._reset()
+        BUFFERED_STREAMS.add(self)
+
+    def __repr__(self):
+        return f'<BackgroundStream stream={self.stream!r} queue_size={self.queue_size!r} overflow={self.overflow!r}>'
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, data):
+        if self.ident is None:
+            self._start()
+        if self.overflow == 'block':
+            self.queue.put(data)
+        else:
+            try:
+                self.queue.put_nowait(data)
+            except Full:
+                self.dropped += 1
+
+    def _start(self):
+        with self.lock:
+            if self.ident is None:
+                self.ident = start_new_thread(self._run, (self.queue,))
+                IGNORED_THREADS.add(self.ident)
+
+    def _run(self, queue):
+        IGNORED_THREADS.add(get_ident())
+        while True:
+            batch = [queue.get()]
+            try:
+                while True:
+                    batch.append(queue.get_nowait())
+            except Empty:
+                pass
+            try:
+                self.stream.write(''.join(batch))
+            except Exception as exc:
+                self.error = exc
+            for _ in batch:
+                queue.task_done()
+
+    def flush(self):
+        """
+        Waits for the writer thread to write out all the pending data.
+        """
+        self.queue.join()
+        flush = getattr(self.stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def _reset(self):
+        # the writer thread doesn't exist in a forked child, whatever was pending is written out by the parent process
+        self.queue = Queue(self.queue_size)
+        self.ident = None
+        self.lock = Lock()
+
+
+#: Idents of the threads that the tracers must ignore.
+IGNORED_THREADS = set()
+#: Code objects that only run in the ignored threads.
+IGNORED_CODE = {BackgroundStream._run.__code__}
+
+BUFFERED_STREAMS = weakref.WeakSet()
+_BUFFERED_STREAMS_BY_TARGET = weakref.WeakKeyDictionary()
+_BACKGROUND_STREAMS_BY_TARGET = weakref.WeakKeyDictionary()
+
+
+def get_buffered_stream(target, stream, buffer_size, flush_interval=FLUSH_INTERVAL):
+    """
+    Returns a :class:`BufferedStream` for ``stream`` (which writes to ``target``, eg: ``target`` wrapped for ANSI
+    conversion). All the actions writing to the same ``target`` get the same buffer so their output is not reordered.
+    """
+    try:
+        buffered = _BUFFERED_STREAMS_BY_TARGET.get(target)
+    except TypeError:
+        return BufferedStream(stream, buffer_size, flush_interval)
+    if buffered is None or buffered.buffer_size != buffer_size or buffered.flush_interval != flush_interval:
+        if buffered is not None:
+            buffered.flush()
+        buffered = _BUFFERED_STREAMS_BY_TARGET[target] = BufferedStream(stream, buffer_size, flush_interval)
+    return buffered
+
+
+def get_background_stream(target, stream, queue_size=QUEUE_SIZE, overflow='block'):
+    """
+    Returns a :class:`BackgroundStream` for ``stream`` (which writes to ``target``). Like :func:`get_buffered_stream`, the
+    actions writing to the same ``target`` share it.
+    """
+    try:
+        background = _BACKGROUND_STREAMS_BY_TARGET.get(target)
+    except TypeError:
+        return BackgroundStream(stream, queue_size, overflow)
+    if background is None or background.queue_size != queue_size or background.overflow != overflow:
+        if background is not None:
+            background.flush()
+        background = _BACKGROUND_STREAMS_BY_TARGET[target] = BackgroundStream(stream, queue_size, overflow)
+    return background
+
+
+def flush_buffers():
+    """
+    Writes out the pending data of all the :class:`BufferedStream` and :class:`BackgroundStream` objects.
+    """
+    for buffered in list(BUFFERED_STREAMS):
+        try:
+            buffered.flush()
+        except (OSError, ValueError):  # the stream was closed
+            pass
+
+
+def _reset_buffers():
+    for buffered in list(BUFFERED_STREAMS):
+        buffered._reset()
+
+
+atexit.register(flush_buffers)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=flush_buffers, after_in_child=_reset_buffers)
+
+
 def iter_symbols(code):
     """
     Iterate all the variable names in the given expression.
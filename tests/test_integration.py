@@ -4,6 +4,7 @@ import inspect
 import os
 import subprocess
 import sys
+from io import StringIO
 from pprint import pprint
 
 import pytest
@@ -11,6 +12,8 @@ from process_tests import TestProcess
 from process_tests import dump_on_error
 from process_tests import wait_for_strings
 
+import hunter
+from hunter import And
 from hunter import Backlog
 from hunter import CallPrinter
 from hunter import CodePrinter
@@ -216,6 +219,346 @@ def test_profile_mode(LineMatcher, module):
         )
 
 
+def test_auto_profile_mode(LineMatcher):
+    lines = StringIO()
+    with trace(kind_in=['call', 'return'], action=CallPrinter(stream=lines)) as tracer:
+
+        def a():
+            sys.getsizeof(a)
+            return 1
+
+        a()
+    assert 'hook=setprofile (without builtins)' in repr(tracer)
+    print(lines.getvalue())
+    lm = LineMatcher(lines.getvalue().splitlines())
+    lm.fnmatch_lines(
+        [
+            '*test_integration.py:* call      => a()',
+            '*test_integration.py:* return    <= a: 1',
+        ]
+    )
+    assert 'getsizeof' not in lines.getvalue()
+
+
+@pytest.mark.parametrize('options', [{'kind': 'line'}, {'kind': 'call', 'profile': False}, {'function': 'a'}])
+def test_auto_profile_mode_needs_settrace(options):
+    with trace(action=CallPrinter(stream=StringIO()), **options) as tracer:
+        pass
+    assert 'hook=settrace' in repr(tracer)
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_mode(LineMatcher):
+    lines = StringIO()
+    with trace(monitoring=True, action=CallPrinter(stream=lines)) as tracer:
+
+        def a():
+            b()
+            return 1
+
+        def b():
+            raise ValueError('b')
+
+        try:
+            a()
+        except ValueError:
+            pass
+    assert 'hunter.monitoring.Tracer' in repr(tracer)
+    print(lines.getvalue())
+    lm = LineMatcher(lines.getvalue().splitlines())
+    lm.fnmatch_lines(
+        [
+            '*test_integration.py:* call      => a()',
+            '*test_integration.py:* line         b()',
+            '*test_integration.py:* call         => b()',
+            '*test_integration.py:* line            raise ValueError(*)',
+            '*test_integration.py:* exception     ! b: (<*ValueError*>, ValueError(*b*), <traceback object at *>)',
+            '*test_integration.py:* return       <= b: None',
+            '*test_integration.py:* exception  ! a: (<*ValueError*>, ValueError(*b*), <traceback object at *>)',
+            '*test_integration.py:* return    <= a: None',
+        ]
+    )
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+@pytest.mark.parametrize('module', ['sys', 'builtins'])
+def test_monitoring_profile_mode(LineMatcher, module):
+    lines = StringIO()
+    with trace(profile=True, monitoring=True, action=CallPrinter(stream=lines)):
+
+        def a():
+            foo = 1
+            sys.getsizeof(foo, 2)
+            return getattr(a, 'b', foo)
+
+        a()
+    print(lines.getvalue())
+    lm = LineMatcher(lines.getvalue().splitlines())
+    if module == 'sys':
+        lm.fnmatch_lines(
+            [
+                '*test_integration.py:* call   * > sys.getsizeof: *',
+                '*test_integration.py:* return * < sys.getsizeof',
+            ]
+        )
+    else:
+        lm.fnmatch_lines(
+            [
+                '*test_integration.py:* call   * > *builtin*.getattr: *',
+                '*test_integration.py:* return * < *builtin*.getattr',
+            ]
+        )
+    assert ' line ' not in lines.getvalue()
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_disabled_locations(LineMatcher):
+    lines = StringIO()
+
+    def a(n):
+        return b(n) + 1
+
+    def b(n):
+        return n * 2
+
+    with trace(function='b', kind='call', monitoring=True, action=CallPrinter(stream=lines)):
+        for i in range(3):
+            a(i)
+            os.path.join('a', 'b')
+    print(lines.getvalue())
+    lm = LineMatcher(lines.getvalue().splitlines())
+    lm.fnmatch_lines(
+        [
+            '*test_integration.py:* call * => b(n=0)',
+            '*test_integration.py:* call * => b(n=1)',
+            '*test_integration.py:* call * => b(n=2)',
+        ]
+    )
+    assert 'join' not in lines.getvalue()
+    assert lines.getvalue().count(' call ') == 3
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_trace_twice():
+    from hunter.monitoring import DISABLED_TOOL_IDS
+
+    calls = []
+
+    def a(n):
+        return n
+
+    def hunter_tool_ids():
+        return [tool_id for tool_id in range(6) if sys.monitoring.get_tool(tool_id) == 'hunter']
+
+    tracer = hunter.monitoring.Tracer()
+    try:
+        tracer.trace(Q(function='a', kind='line', action=lambda event: calls.append(1)))
+        first = tracer.tool_id
+        a(1)
+        assert first in DISABLED_TOOL_IDS
+        tracer.trace(Q(function='a', kind='line', action=lambda event: calls.append(2)))
+        assert hunter_tool_ids() == [tracer.tool_id]
+        assert tracer.tool_id != first
+        a(2)
+    finally:
+        tracer.stop()
+    assert hunter_tool_ids() == []
+    assert calls == [1, 2]
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_generator_throw():
+    calls = []
+
+    def gen():
+        try:
+            yield 1
+        except ValueError:
+            yield 2
+
+    with trace(function='gen', kind='call', monitoring=True, action=lambda event: calls.append(event.depth)):
+        generator = gen()
+        assert next(generator) == 1
+        assert generator.throw(ValueError) == 2
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('monitoring', [True, False], ids='monitoring={}'.format)
+def test_trace_instrument(monitoring):
+    if monitoring and not hasattr(sys, 'monitoring'):
+        pytest.skip('requires sys.monitoring')
+
+    def a(n):
+        return b(n) + 1
+
+    def b(n):
+        return n * 2
+
+    with trace(Q(function='a') | Q(function='b'), kind='call', monitoring=monitoring, instrument=True, action=lambda event: None) as tracer:
+        for i in range(3):
+            a(i)
+    lines = hunter.stats(tracer).splitlines()
+    assert lines[0].startswith('When -> function: evaluations=')
+    assert lines[1].startswith("    Query(kind='call', function_in=frozenset({")
+    assert ' hits=6 (' in lines[1]
+    assert len(lines) == 2
+    assert 'time=' not in lines[0]
+
+
+@pytest.mark.parametrize('monitoring', [True, False], ids='monitoring={}'.format)
+def test_trace_background(monitoring):
+    if monitoring and not hasattr(sys, 'monitoring'):
+        pytest.skip('requires sys.monitoring')
+
+    def a(n):
+        return n
+
+    lines = StringIO()
+    with trace(
+        Q(function='a') | Q(module_in=['queue', 'threading', 'hunter.util']),
+        kind='call',
+        monitoring=monitoring,
+        threading_support=True,
+        action=CallPrinter(stream=lines, background=True),
+    ):
+        for i in range(3):
+            a(i)
+    output = lines.getvalue()
+    assert output.count('=> a(n=') == 3, output
+    assert output.count(' call ') == 3, output
+
+
+@pytest.mark.parametrize('predicate', [Q(kind='return', arg_in=[None, 0]), Q(kind='return') & (Q(arg=None) | Q(arg=0))], ids=['in', 'or'])
+def test_trace_in_unhashable(predicate):
+    def a(n):
+        return [n] if n else n
+
+    calls = []
+    with trace(Q(predicate, function='a'), action=lambda event: calls.append(event.arg)):
+        for i in range(3):
+            a(i)
+            a(0)
+    assert calls == [0, 0, 0, 0]
+
+
+@pytest.mark.parametrize('monitoring', [True, False], ids='monitoring={}'.format)
+def test_trace_nested_when(monitoring):
+    if monitoring and not hasattr(sys, 'monitoring'):
+        pytest.skip('requires sys.monitoring')
+
+    def f():
+        return g()
+
+    def g():
+        return 1
+
+    calls = []
+    with trace(
+        And(When(Q(module=__name__, kind='call'), lambda event: calls.append(event.function)), Q(function='f')),
+        monitoring=monitoring,
+        action=lambda event: None,
+    ):
+        f()
+        f()
+    assert calls.count('f') == calls.count('g') == 2
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_stats():
+    def a(n):
+        return n
+
+    with trace(function='a', kind='call', monitoring=True, action=lambda event: None) as tracer:
+        for i in range(32):
+            a(i)
+    stats = tracer.stats()
+    assert stats['events'] >= stats['handled'] == 32
+    assert stats['handler_time'] > 0
+    assert stats['time'] is None
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+@pytest.mark.parametrize('depth', [2, 3, 4], ids='depth_lt={}'.format)
+def test_monitoring_depth_limit(LineMatcher, depth):
+    buf = StringIO()
+    from sample7 import one
+
+    with trace(depth_lt=depth, monitoring=True, action=CallPrinter(stream=buf)):
+        one()
+    output = buf.getvalue()
+    lm = LineMatcher(output.splitlines())
+    lm.fnmatch_lines(
+        [
+            '* call      => one()',
+            '* line         for i in range(1):  # one',
+            '* line         two()',
+            '* call         => two()',
+            '* return       <= two: None',
+            '* line         for i in range(1):  # one',
+            '* return    <= one: None',
+        ]
+    )
+    if depth < 3:
+        assert '=> three' not in output
+    if depth < 4:
+        assert '=> four' not in output
+    if depth < 5:
+        assert '=> five' not in output
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_sample(LineMatcher):
+    lines = StringIO()
+
+    def foo(i):
+        return bar(i)
+
+    def bar(i):
+        return i
+
+    tracer = trace(function_in=['foo', 'bar'], kind='call', monitoring=True, sample=2, action=CallPrinter(stream=lines))
+    try:
+        for i in range(4):
+            foo(i)
+    finally:
+        tracer.stop()
+    print(lines.getvalue())
+    lm = LineMatcher(lines.getvalue().splitlines())
+    lm.fnmatch_lines(
+        [
+            '*test_integration.py:* call      => foo(i=0)',
+            '*test_integration.py:* call         => bar(i=0)',
+            '*test_integration.py:* call            => foo(i=2)',
+            '*test_integration.py:* call               => bar(i=2)',
+        ]
+    )
+    assert 'i=1' not in lines.getvalue()
+    assert 'i=3' not in lines.getvalue()
+
+
+@pytest.mark.parametrize(
+    'monitoring',
+    [False, pytest.param(True, marks=pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring'))],
+)
+def test_trace_budget(monkeypatch, monitoring):
+    output = StringIO()
+    monkeypatch.setattr(hunter, '_default_stream', output)
+    lines = StringIO()
+
+    def foo(i):
+        return i
+
+    tracer = trace(function='foo', monitoring=monitoring, max_events=4, over_budget='calls', action=CallPrinter(stream=lines))
+    try:
+        for i in range(4):
+            foo(i)
+    finally:
+        tracer.stop()
+    print(lines.getvalue())
+    assert [line.split()[-1] for line in lines.getvalue().splitlines()] == ['foo(i=0)', 'i', '0', 'foo(i=1)', 'foo(i=2)', 'foo(i=3)']
+    assert 'Only tracing calls from now on because the tracer is over budget (more than 4 events).' in output.getvalue()
+
+
 def test_tracing_reinstall(LineMatcher):
     lines = StringIO()
     with trace(CodePrinter(stream=lines)):
@@ -1,5 +1,7 @@
 from __future__ import print_function
 
+import pickle
+import re
 import sys
 
 import pytest
@@ -19,6 +21,15 @@ from hunter import Query
 from hunter import When
 from hunter import _Backlog
 from hunter.actions import ColorStreamAction
+from hunter.actions import ErrorSnooper
+from hunter.predicates import Instrumented
+from hunter.predicates import _shard
+from hunter.predicates import analyze
+from hunter.predicates import format_stats
+from hunter.predicates import instrument
+from hunter.predicates import optimize
+from hunter.util import Affixes
+from hunter.util import MatchCache
 
 
 class FakeCallable:
@@ -85,6 +96,66 @@ def test_from_kwargs_split():
     )
 
 
+def test_query_cheap_fields_first(mockevent):
+    # locals is a dict thus it would fail the startswith check if it were checked before depth
+    assert Q(locals_startswith='foo', depth_gt=0)(mockevent) is False
+    assert Q(module_regex='.*', kind_in=['call', 'return'], depth=0)(mockevent) is False
+    with pytest.raises((AttributeError, TypeError)):
+        Q(locals_startswith='foo', depth=0)(mockevent)
+
+
+def test_query_in(mockevent):
+    assert Q(module_in=['a', 'b']) == Q(module_in=('b', 'a', 'b')) == Q(module_in={'a', 'b'})
+    assert str(Q(module_in=['a'])) == "Query(module_in=frozenset({'a'}))"
+    # the values are shown sorted, the order of a frozenset of strings changes between processes
+    assert str(Q(module_in=['gamma', 'alpha', 'beta'])) == "Query(module_in=frozenset({'alpha', 'beta', 'gamma'}))"
+    assert repr(Q(module_in={'gamma', 'alpha', 'beta'})).endswith("query_in=(('module', frozenset({'alpha', 'beta', 'gamma'})),)>")
+    assert str(Q(module_in=frozenset(['b', 'a']))) == "Query(module_in=frozenset({'a', 'b'}))"
+    assert str(Q(arg_in=['b', 1, None])) == "Query(arg_in=frozenset({'b', 1, None}))"
+    assert Q(module_in=['gamma', 'alpha', 'beta']) == Q(module_in=frozenset(['alpha', 'beta', 'gamma']))
+    assert Q(module_in=[__name__, 'a'])(mockevent) is True
+    assert Q(module_in=__name__ + 'foo')(mockevent) is True  # strings are not converted (substring check)
+    assert Q(lineno_in=[mockevent.lineno, 1])(mockevent) is True
+    assert Q(lineno_in=(1, 2))(mockevent) is False
+    assert Q(arg_in=[[], None])(mockevent) is True  # unhashable values are kept in a tuple
+    assert str(Q(arg_in=[[], None])) == 'Query(arg_in=([], None))'
+
+
+def test_query_many_affixes(mockevent):
+    prefixes = ['prefix%s' % i for i in range(100)]
+    assert Q(module_startswith=prefixes)(mockevent) is False
+    assert Q(module_startswith=[*prefixes, 'test_'])(mockevent) is True
+    assert Q(module_startswith=[*prefixes, 'test_predicates_'])(mockevent) is False
+    assert Q(module_startswith=[*prefixes, 'test_', 'test_pred'])(mockevent) is True
+    assert Q(module_startswith=[*prefixes, 'test_pred', 'test_'])(mockevent) is True
+    assert Q(module_startswith=[*prefixes, 'test_predicates'])(mockevent) is True
+    assert Q(module_startswith=[*prefixes, 'a', 'z'])(mockevent) is False
+    assert Q(module_startswith=prefixes) == Q(module_startswith=tuple(prefixes))
+
+    suffixes = ['suffix%s' % i for i in range(100)]
+    assert Q(module_endswith=suffixes)(mockevent) is False
+    assert Q(module_endswith=[*suffixes, 'predicates'])(mockevent) is True
+    assert Q(module_endswith=[*suffixes, '_predicates', 's'])(mockevent) is True
+    assert Q(module_endswith=[*suffixes, 'test_predicates'])(mockevent) is True
+    assert Q(module_endswith=[*suffixes, 'xtest_predicates'])(mockevent) is False
+
+
+def test_affixes():
+    values = Affixes(['ab', 'abc', 'b', 'ba', 'x'] * 20)
+    assert values.keys == ['ab', 'b', 'x']
+    assert values.match('abd') is True
+    assert values.match('a') is False
+    assert values.match('bzz') is True
+    assert values.match('') is False
+    assert values.match('y') is False
+    values = Affixes(['.py', '.pyc', 'c', '_test.py'], suffixes=True)
+    assert values.keys == ['c', 'yp.']
+    assert values.match('foo.py') is True
+    assert values.match('foo.pyx') is False
+    assert values.match('foo.pyc') is True
+    assert pickle.loads(pickle.dumps(values)).match('foo.py') is True
+
+
 def test_not(mockevent):
     assert Not(1).predicate == 1
     assert ~Or(1, 2) == Not(Or(1, 2))
@@ -448,3 +519,187 @@ def test_q_expansion():
     assert Q(C(1), C(2), module=3) == And(C(1), C(2), Q(module=3))
     assert Q(C(1), C(2), module=3, action=C(4)) == When(And(C(1), C(2), Q(module=3)), C(4))
     assert Q(C(1), C(2), module=3, actions=[C(4), C(5)]) == When(And(C(1), C(2), Q(module=3)), C(4), C(5))
+
+
+def test_analyze_query():
+    assert analyze(Q(module='a', depth_lt=2, function_startswith='b')) == (Q(module='a', function_startswith='b'), Q(depth_lt=2))
+    assert analyze(Q(module='a', stdlib=False)) == (Q(module='a', stdlib=False), None)
+    assert analyze(Q(lineno=1)) == (None, Q(lineno=1))
+
+
+def test_analyze_and():
+    assert analyze(Q(Q(depth=1), ~Q(module='a'), Q(module='b') | Q(filename='c'), Q(function='d', calls=2))) == (
+        And(Not(Q(module='a')), Or(Q(module='b'), Q(filename='c')), Q(function='d')),
+        And(Q(depth=1), Q(calls=2)),
+    )
+    assert analyze(Q(Q(module='a') | Q(depth=1), Q(function='b'))) == (Q(function='b'), Q(module='a') | Q(depth=1))
+
+
+def test_analyze_side_effects():
+    backlog = Backlog(module='b')
+    assert analyze(Q(Q(module='a'), backlog, Q(function='c'))) == (Q(module='a'), And(backlog, Q(function='c')))
+    assert analyze(Q(C(1), module='a')) == (None, And(C(1), Q(module='a')))
+    assert analyze(C(1)) == (None, C(1))
+
+
+def test_analyze_nested_when():
+    when = When(Q(depth=1), C(2))
+    assert analyze(And(Q(module='a'), when, Q(function='b', depth=2))) == (Q(module='a'), And(when, Q(function='b', depth=2)))
+    assert analyze(And(when, Q(function='b'))) == (None, And(when, Q(function='b')))
+
+
+def test_analyze_when():
+    assert analyze(Q(module='a', depth=1, action=C(2))) == (Q(module='a'), When(Q(depth=1), C(2)))
+    assert analyze(Q(module='a', action=C(2))) == (Q(module='a'), When(hunter._And(), C(2)))
+    assert analyze(Q(C(1), module='a', action=C(2))) == (None, When(And(C(1), Q(module='a')), C(2)))
+
+
+def test_optimize_and():
+    assert optimize(Q(Q(module='a'), Q(depth_lt=2), Q(function='b'))) == Q(module='a', function='b', depth_lt=2)
+    assert optimize(Q(Q(module='a'), Q(module='b'))) == And(Q(module='a'), Q(module='b'))
+    assert optimize(And(C(1), Q(module='a'), Q(depth=1))) == And(C(1), Q(module='a', depth=1))
+    assert optimize(And(Q(source_contains='a') | Q(fullsource_contains='b'), Q(kind='call'), C(1), Q(module='a'))) == And(
+        Q(kind='call'), Or(Q(source_contains='a'), Q(fullsource_contains='b')), C(1), Q(module='a')
+    )
+
+
+def test_optimize_or():
+    assert optimize(Or(Q(module='a'), Q(module='b'), Q(function='c'), Q(module_in=['d']))) == Or(
+        Q(module_in=frozenset('abd')), Q(function='c')
+    )
+    assert optimize(Or(Q(module='a'), Q(module_in='bc'))) == Or(Q(module='a'), Q(module_in='bc'))
+    assert optimize(Or(Q(module='a'), Q(module='a'))) == Q(module='a')
+    assert optimize(Or(Q(lineno=1), Q(lineno=2), C(1), Q(lineno=3))) == Or(Q(lineno_in=frozenset((1, 2))), C(1), Q(lineno=3))
+
+
+def test_optimize_regex(mockevent):
+    optimized = optimize(Or(Q(module_regex='a'), Q(function='c'), Q(module_regex='b.*'), Q(function_regex='d')))
+    assert optimized == Or(Q(function='c'), Q(module_regex='(?:a)|(?:b.*)'), Q(function_regex='d'))
+    assert optimize(Or(Q(module_regex='x'), Q(module_regex='test_')))(mockevent) is True
+    assert optimize(Or(Q(module_regex='x'), Q(module_regex='test$')))(mockevent) is False
+    # these can't be merged: different flags, backreferences, named groups and inline global flags
+    predicate = Or(Q(module_regex='a'), Q(module_regex=re.compile('b', re.IGNORECASE)))
+    assert optimize(predicate) == predicate
+    predicate = Or(Q(module_regex='a'), Q(module_regex=r'(b)\1'))
+    assert optimize(predicate) == predicate
+    predicate = Or(Q(module_regex='a'), Q(module_regex='(?P<name>b)'))
+    assert optimize(predicate) == predicate
+    predicate = Or(Q(module_regex='(?i)a'), Q(module_regex='(?i)b'))
+    assert optimize(predicate) == predicate
+
+
+def test_query_regex_cache(mockevent):
+    query = Q(module_regex='test_')
+    assert query(mockevent) is True
+    assert query(mockevent) is True
+    assert query == Q(module_regex='test_')
+    assert str(query) == "Query(module_regex=re.compile('test_'))"
+    cache = MatchCache(re.compile('a+'), maxsize=2)
+    assert cache.match('aaa') is True
+    assert cache.match('b') is False
+    assert cache.match('aaa') is True
+    assert cache.match.cache_info().hits == 1
+    assert cache.match.cache_info().currsize == 2
+
+
+def test_optimize_not():
+    assert optimize(Not(Not(Q(module='a')))) == Q(module='a')
+    assert optimize(Not(Not(Not(Q(module='a'))))) == Not(Q(module='a'))
+    assert optimize(Q(Not(Not(Q(module='a'))), Q(depth=1))) == Q(module='a', depth=1)
+
+
+def test_optimize_keeps_state():
+    backlog = Backlog(module='a')
+    origin = From(Q(module='b'))
+    optimized = optimize(And(Q(module='c'), backlog, Or(Q(depth=1), origin), When(Q(Q(kind='call'), Q(depth=1)), C(1))))
+    assert optimized == And(Q(module='c'), backlog, Or(Q(depth=1), origin), When(Q(kind='call', depth=1), C(1)))
+    assert optimized.predicates[1] is backlog
+    assert optimized.predicates[2].predicates[1] is origin
+
+
+def test_optimize_when_barrier():
+    when = When(Q(module='a'), C(1))
+    assert optimize(Or(when, Q(function='f'))) == Or(when, Q(function='f'))
+    assert optimize(And(Q(depth=1), Q(depth_lt=5), when, Q(function='f'), Q(module='b'))) == And(
+        Q(depth=1, depth_lt=5), when, Q(function='f', module='b')
+    )
+    assert optimize(Or(Q(lineno=1), when, Q(lineno=2), Q(kind='call'), Q(lineno=3))) == Or(
+        Q(lineno=1), when, Q(kind='call'), Q(lineno_in=frozenset((2, 3)))
+    )
+
+
+@pytest.mark.parametrize('combine', [And, Or], ids=['And', 'Or'])
+def test_optimize_when_actions(mockevent, combine):
+    calls = []
+    predicate = optimize(combine(When(Q(module='test_predicates'), calls.append), Q(function='other'), Q(kind='line')))
+    predicate(mockevent)
+    assert calls == [mockevent]
+
+
+def test_optimize_equivalent(mockevent):
+    for predicate in [
+        Q(module=__name__) | Q(module='foo'),
+        Q(Q(module=__name__), Q(kind='line'), ~~Q(depth=0)),
+        ~Q(Q(function='foo') | Q(function='bar'), module=__name__),
+    ]:
+        assert bool(optimize(predicate)(mockevent)) == bool(predicate(mockevent))
+
+
+def test_shard():
+    stateless = Q(Q(module='a') | ~Q(function='b'), action=C(1))
+    assert _shard(stateless, {}) is stateless
+
+    snooper = ErrorSnooper(max_backlog=5)
+    snooper.backlog.append(1)
+    origin = From(Q(function='a'), Q(depth_lt=2))
+    backlog = Backlog(Q(function='c'), size=3, stack=2, vars=True).filter(module='d')
+    predicate = And(stateless, When(Q(kind='call'), snooper), origin, backlog)
+    memo = {}
+    copy = _shard(predicate, memo)
+    assert copy == And(stateless, copy.predicates[1], origin, backlog)
+    assert copy.predicates[0] is stateless
+    assert copy.predicates[1].actions[0] is not snooper
+    assert copy.predicates[1].actions[0].max_backlog == 5
+    assert list(copy.predicates[1].actions[0].backlog) == []
+    assert copy.predicates[2] is not origin
+    assert copy.predicates[3] is not backlog
+    assert copy.predicates[3].queue is not backlog.queue
+    assert _shard(origin, memo) is copy.predicates[2]
+
+
+def test_instrument(mockevent):
+    origin = From(Q(module='foo'), Q(depth=1))
+    predicate = instrument(Or(Q(module='foo'), Not(Q(function='bar')), origin, When(Q(kind='call'), C(1))))
+    assert predicate == Instrumented(
+        Or(
+            Instrumented(Q(module='foo')),
+            Instrumented(Not(Instrumented(Q(function='bar')))),
+            Instrumented(From(Instrumented(Q(module='foo')), Instrumented(Q(depth=1)))),
+            Instrumented(When(Instrumented(Q(kind='call')), C(1))),
+        )
+    )
+    assert predicate(mockevent)
+    assert predicate.evaluations == predicate.hits == 1
+    assert predicate.elapsed == 0
+    assert format_stats(predicate).splitlines() == [
+        'Or: evaluations=1 hits=1 (100.0%)',
+        "    Query(module='foo'): evaluations=1 hits=0 (0.0%)",
+        '    Not: evaluations=1 hits=1 (100.0%)',
+        "        Query(function='bar'): evaluations=1 hits=0 (0.0%)",
+        '    From(watermark=0): evaluations=0 hits=0',
+        "        Query(module='foo'): evaluations=0 hits=0",
+        '        Query(depth=1): evaluations=0 hits=0',
+        '    When -> FakeCallable: evaluations=0 hits=0',
+        "        Query(kind='call'): evaluations=0 hits=0",
+    ]
+
+
+def test_instrument_shard(mockevent):
+    predicate = instrument(From(Q(module=__name__), Q(depth=0)), timing=True)
+    copy = _shard(predicate, {})
+    assert copy is not predicate
+    assert copy.predicate is not predicate.predicate
+    assert copy.counters is predicate.counters
+    copy(mockevent)
+    assert predicate.evaluations == 1
+    assert predicate.elapsed > 0
@@ -0,0 +1,288 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from io import BytesIO
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+
+import hunter
+from hunter import BinaryRecorder
+from hunter import CallPrinter
+from hunter import ChromeTraceRecorder
+from hunter import CodePrinter
+from hunter import FlightRecorder
+from hunter import Q
+from hunter.recording import MAGIC
+from hunter.recording import Encoder
+from hunter.recording import main
+from hunter.recording import read_recording
+from hunter.recording import read_signed
+from hunter.recording import read_varint
+from hunter.recording import write_signed
+from hunter.recording import write_varint
+
+pytest_plugins = ('pytester',)
+
+
+def foo(a, *args, b=2, **kwargs):
+    x = [a] * 3
+    return bar(x)
+
+
+def bar(x):
+    try:
+        raise ValueError(x)
+    except ValueError:
+        return len(x)
+
+
+@pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 2**32, 2**70])
+def test_varint(value):
+    out = bytearray()
+    write_varint(out, value)
+    assert read_varint(out, 0) == (value, len(out))
+    out = bytearray()
+    write_signed(out, -value)
+    assert read_signed(out, 0) == (-value, len(out))
+
+
+def test_read_recording(tmp_path):
+    path = str(tmp_path / 'trace.bin')
+    events = []
+    recorder = BinaryRecorder(path)
+    with hunter.trace(function_in=['foo', 'bar'], actions=[recorder, lambda event: events.append(event.detach())]):
+        foo(1, 'z', b='y', c=3)
+        thread = threading.Thread(target=foo, args=(5,))
+        thread.start()
+        thread.join()
+    recorder.close()
+
+    recorded = list(read_recording(path))
+    assert len(recorded) == len(events) == 22
+    for event, recorded_event in zip(events, recorded):
+        for field in 'kind', 'builtin', 'depth', 'calls', 'filename', 'module', 'function', 'lineno', 'threadid', 'threadname':
+            assert getattr(recorded_event, field) == getattr(event, field), field
+        assert recorded_event.source == event.source
+        assert recorded_event.fullsource == event.fullsource
+    assert recorded[0].locals == {'a': '1', 'args': "('z',)", 'b': "'y'", 'kwargs': "{'c': 3}"}
+    assert recorded[0].threadname == 'MainThread'
+    assert recorded[-1].kind == 'return'
+    assert recorded[-1].arg == '3'
+    assert recorded[-1].threadname == thread.name
+
+
+def test_read_recording_sessions():
+    buff = BytesIO()
+    for n in 1, 2:
+        with hunter.trace(function='foo', kind='call', action=BinaryRecorder(buff, repr_limit=5)):
+            foo('x' * 100 * n)
+    data = buff.getvalue()
+    assert data.count(MAGIC) == 2
+    assert [event.locals['a'] for event in read_recording(BytesIO(data))] == ["'x [...] x'"] * 2
+    assert [event.function for event in read_recording(BytesIO(data[:-1]))] == ['foo']
+
+
+def test_read_recording_no_reprs():
+    buff = BytesIO()
+    with hunter.trace(function='foo', action=BinaryRecorder(buff, reprs=False)):
+        foo(1)
+    events = list(read_recording(BytesIO(buff.getvalue())))
+    assert [event.kind for event in events] == ['call', 'line', 'line', 'return']
+    assert events[0].locals == {}
+    assert events[-1].arg is None
+
+
+def test_encoder_rollback():
+    encoder = Encoder()
+    out = bytearray(encoder.reset())
+    functions = []
+
+    def record(event):
+        encoder.encode(event, bytearray())  # discarded, the table entries must not be kept
+        event = SimpleNamespace(
+            **{
+                field: getattr(event, field)
+                for field in ('kind', 'builtin', 'code', 'filename', 'module', 'function', 'lineno', 'depth', 'calls', 'locals', 'arg')
+            },
+            threadid=event.threadid,
+            threadname=event.threadname,
+            threading_support=1,
+        )
+        encoder.encode(event, out)
+        encoder.commit()
+        functions.append(event.function)
+
+    with hunter.trace(function_in=['foo', 'bar'], action=record):
+        foo(1)
+    events = list(read_recording(BytesIO(bytes(out))))
+    assert [event.function for event in events] == functions
+    assert len(events) == 11
+    assert {event.threading_support for event in events} == {True}
+    assert events[0].locals == {'a': '1', 'args': '()', 'b': '2', 'kwargs': '{}'}
+
+
+def test_read_recording_invalid():
+    with pytest.raises(ValueError, match='Not a recording'):
+        list(read_recording(BytesIO(b'\x01\x00')))
+
+
+@pytest.mark.parametrize('action', [CallPrinter, CodePrinter])
+def test_dump(tmp_path, capsys, action):
+    path = str(tmp_path / 'trace.bin')
+    out = StringIO()
+    recorder = BinaryRecorder(path)
+    with hunter.trace(function_in=['foo', 'bar'], actions=[recorder, action(stream=out)]):
+        foo(1, 'z', b='y', c=3)
+    recorder.close()
+    main([path, '--format', 'call' if action is CallPrinter else 'code'])
+    assert capsys.readouterr().out == out.getvalue()
+
+
+def test_flight_recorder(tmp_path):
+    path = str(tmp_path / 'flight.bin')
+    recorder = FlightRecorder(path, size=4096, block_size=1024)
+    with hunter.trace(function_in=['foo', 'bar'], action=recorder):
+        for i in range(100):
+            foo(i)
+    assert recorder.ring.sequence > 4
+    events = list(read_recording(path))
+    assert 0 < len(events) < 1200
+    assert [event.kind for event in events[-2:]] == ['return', 'return']
+    assert events[-1].function == 'foo'
+    assert events[-1].arg == '3'
+    assert events[-2].locals == {} and events[-2].arg == '3'
+    calls = [int(event.locals['a']) for event in events if event.kind == 'call' and event.function == 'foo']
+    assert calls == list(range(100 - len(calls), 100))
+    recorder.close()
+
+
+def test_flight_recorder_oversized(tmp_path):
+    path = str(tmp_path / 'flight.bin')
+    recorder = FlightRecorder(path, size=4096, block_size=512, repr_limit=1024)
+    with hunter.trace(function_in=['foo', 'bar'], kind_in=['call', 'return'], action=recorder):
+        foo('x' * 1000)
+        foo(1)
+    recorder.close()
+    assert recorder.dropped == 2
+    events = list(read_recording(path))
+    assert [(event.kind, event.function) for event in events] == [
+        ('return', 'bar'),
+        ('return', 'foo'),
+        ('call', 'foo'),
+        ('call', 'bar'),
+        ('return', 'bar'),
+        ('return', 'foo'),
+    ]
+    assert events[2].locals == {'a': '1', 'args': '()', 'b': '2', 'kwargs': '{}'}
+    with pytest.raises(ValueError, match='too small'):
+        FlightRecorder(path, block_size=16)
+
+
+def test_flight_recorder_crash(tmp_path):
+    path = str(tmp_path / 'flight.bin')
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            f'import hunter, os, test_recording; '
+            f'hunter.trace(function="bar", action=hunter.FlightRecorder({path!r}, size=4096, block_size=1024)); '
+            f'test_recording.foo(123); '
+            f'os._exit(1)',
+        ],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        check=False,
+    )
+    assert process.returncode == 1
+    events = list(read_recording(path))
+    assert [event.kind for event in events] == ['call', 'line', 'line', 'exception', 'line', 'line', 'return']
+    assert events[0].locals == {'x': '[123, 123, 123]'}
+
+
+def test_flight_recorder_dump_on(tmp_path, LineMatcher):
+    path = str(tmp_path / 'flight.bin')
+    out = StringIO()
+    recorder = FlightRecorder(
+        path,
+        dump_on=Q(kind='exception'),
+        action=lambda: CallPrinter(stream=out),
+    )
+    with hunter.trace(function_in=['foo', 'bar'], action=recorder):
+        foo(1)
+        foo(2)
+    recorder.close()
+    lm = LineMatcher(out.getvalue().splitlines())
+    lm.fnmatch_lines(
+        [
+            '*call      => foo(a=1, *args=(), b=2, **kwargs={})',
+            '*line         x = [[]a[]] * 3',
+            '*line         return bar(x)',
+            '*call         => bar(x=[[]1, 1, 1[]])',
+            '*line            try:',
+            '*line            raise ValueError(x)',
+            '*exception     ! bar: (*ValueError*)',
+            '*call         => bar(x=[[]2, 2, 2[]])',
+            '*line            try:',
+            '*line            raise ValueError(x)',
+            '*exception     ! bar: (*ValueError*)',
+        ]
+    )
+    assert out.getvalue().count('=> foo') == 2
+
+
+def test_chrome_trace(tmp_path):
+    path = str(tmp_path / 'trace.json')
+    recorder = ChromeTraceRecorder(path)
+    with hunter.trace(function_in=['foo', 'bar'], kind_in=['call', 'return'], action=recorder):
+        foo(1)
+        thread = threading.Thread(target=foo, args=(5,))
+        thread.start()
+        thread.join()
+    recorder.close()
+    with open(path) as fh:
+        events = json.load(fh)
+    assert [event['name'] for event in events] == [
+        'thread_name',
+        'test_recording.foo',
+        'test_recording.bar',
+        'test_recording.bar',
+        'test_recording.foo',
+        'thread_name',
+        'test_recording.foo',
+        'test_recording.bar',
+        'test_recording.bar',
+        'test_recording.foo',
+    ]
+    assert [event['ph'] for event in events] == ['M', 'B', 'B', 'E', 'E'] * 2
+    assert events[0]['args'] == {'name': 'MainThread'}
+    assert events[5]['args'] == {'name': thread.name}
+    assert {event['pid'] for event in events} == {os.getpid()}
+    assert {event['tid'] for event in events[:5]} == {threading.main_thread().ident}
+    assert {event['tid'] for event in events[5:]} == {thread.ident}
+    assert events[1]['args'] == {'filename': __file__, 'lineno': foo.__code__.co_firstlineno}
+    assert events[1]['cat'] == 'python'
+    timestamps = [event['ts'] for event in events if event['ph'] != 'M']
+    assert timestamps == sorted(timestamps)
+
+
+def test_chrome_trace_complete(tmp_path):
+    out = StringIO()
+    recorder = ChromeTraceRecorder(out, complete=True)
+    with hunter.trace(function_in=['foo', 'bar'], kind_in=['call', 'return'], action=recorder):
+        foo(1)
+        foo(2)
+    events = json.loads(out.getvalue() + ']')
+    assert [(event['name'], event['ph']) for event in events] == [
+        ('thread_name', 'M'),
+        ('test_recording.bar', 'X'),
+        ('test_recording.foo', 'X'),
+        ('test_recording.bar', 'X'),
+        ('test_recording.foo', 'X'),
+    ]
+    assert events[2]['ts'] <= events[1]['ts']
+    assert events[2]['ts'] + events[2]['dur'] >= events[1]['ts'] + events[1]['dur']
+    recorder.close()
+    assert json.loads(out.getvalue()) == events
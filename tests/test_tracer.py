@@ -3,11 +3,14 @@ from __future__ import print_function
 import asyncio
 import faulthandler
 import functools
+import gc
 import os
 import pickle
 import platform
+import re
 import sys
 import threading
+import time
 from io import StringIO
 from pprint import pprint
 from urllib.parse import urlencode
@@ -463,6 +466,36 @@ def test_locals():
     assert out.getvalue().endswith("node += 'x'\n")
 
 
+def test_buffered_output(tmp_path):
+    path = str(tmp_path / 'trace.log')
+    out = StringIO()
+    with hunter.trace(
+        module=__name__,
+        function='foo',
+        actions=[
+            CodePrinter(stream=out, buffer_size=1 << 20, flush_interval=60),
+            VarsPrinter('a', stream=out, buffer_size=1 << 20, flush_interval=60),
+            CallPrinter(stream=path, buffer_size=1 << 20, flush_interval=60),
+        ],
+    ):
+
+        def foo():
+            a = 1
+            return a
+
+        foo()
+        assert out.getvalue() == ''
+        with open(path) as fh:
+            assert fh.read() == ''
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 7
+    assert 'a = 1' in lines[1]
+    assert 'return a' in lines[2]
+    assert 'a => 1' in lines[3]
+    with open(path) as fh:
+        assert fh.read().endswith('return    <= foo: 1\n')
+
+
 def test_fullsource_decorator_issue(LineMatcher):
     out = StringIO()
     with trace(kind='call', action=CodePrinter(stream=out)):
@@ -951,6 +984,389 @@ def tracer_impl(request):
     return Tracer
 
 
+def test_code_verdict_cache(tracer_impl):
+    calls = []
+    trace_lines = []
+
+    def foo():
+        trace_lines.append(sys._getframe().f_trace_lines)
+        return bar()
+
+    def bar():
+        trace_lines.append(sys._getframe().f_trace_lines)
+        return 1
+
+    t = tracer_impl()
+    with t.trace(Q(function='bar', action=lambda event: calls.append((event.kind, event.function, event.depth)))):
+        foo()
+        foo()
+
+    expected = [
+        ('call', 'bar', 1),
+        ('line', 'bar', 2),
+        ('line', 'bar', 2),
+        ('return', 'bar', 1),
+    ]
+    assert calls == expected * 2
+    assert trace_lines == [False, True] * 2
+
+
+def test_code_verdict_cache_observer(tracer_impl):
+    calls = []
+
+    def foo():
+        return 1
+
+    t = tracer_impl()
+    with t.trace(Q(lambda event: calls.append(event.function), function='bar')):
+        foo()
+        foo()
+
+    assert calls.count('foo') == 6
+
+
+def test_retained_events(tracer_impl):
+    events = []
+
+    def foo(a):
+        return a
+
+    t = tracer_impl()
+    with t.trace(Q(function='foo', action=events.append)):
+        for i in range(100):
+            foo(i)
+
+    assert [(event.kind, event.function) for event in events] == [('call', 'foo'), ('line', 'foo'), ('return', 'foo')] * 100
+    assert [event.arg for event in events if event.kind == 'return'] == list(range(100))
+    assert len(set(map(id, events))) == len(events)
+
+
+def test_recycled_events():
+    Event = pytest.importorskip('hunter._event').Event
+    frame = sys._getframe()
+    event = Event(frame, 0, None, 0, 0, False)
+    address = id(event)
+    size = sys.getsizeof(event)
+    del event
+    # without the freelist the memory of the released event would be reused for this object (it has the same size)
+    filler = bytes(size - sys.getsizeof(b''))
+    event = Event(frame, 0, None, 0, 0, False)
+    assert id(event) == address
+    del filler
+
+
+def test_per_thread_depth(tracer_impl):
+    calls = []
+    barrier = threading.Barrier(2, timeout=10)
+
+    def inner():
+        barrier.wait()
+
+    def outer():
+        barrier.wait()
+        inner()
+
+    t = tracer_impl(threading_support=True)
+    with t.trace(Q(function_in=['outer', 'inner'], kind='call', action=lambda event: calls.append((event.function, event.depth)))):
+        threads = [threading.Thread(target=outer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(calls) == [('inner', 2), ('inner', 2), ('outer', 1), ('outer', 1)]
+
+
+@pytest.mark.parametrize('sharding', [True, False], ids='sharding={}'.format)
+def test_sharding(tracer_impl, sharding):
+    calls = []
+
+    def inner(name):
+        return name
+
+    def other():
+        inner('other')
+
+    def outer():
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+        inner('outer')
+
+    t = tracer_impl(threading_support=True, sharding=sharding)
+    with t.trace(
+        From(Q(function='outer', kind='call'), Q(function='inner', kind='call', action=lambda event: calls.append(event.locals['name'])))
+    ):
+        thread = threading.Thread(target=outer)
+        thread.start()
+        thread.join()
+
+    if sharding:
+        assert calls == ['outer']
+    else:  # the other thread sees the state of From and resets it when it returns to depth 0
+        assert 'outer' not in calls
+
+
+@pytest.mark.parametrize('sharding', [True, False], ids='sharding={}'.format)
+def test_instrument(tracer_impl, sharding):
+    def foo(i):
+        return bar(i)
+
+    def bar(i):
+        return i
+
+    t = tracer_impl(sharding=sharding, instrument='time')
+    with t.trace(Q(Q(function='foo') | Q(function='bar', lineno_gt=0), kind='call', action=lambda event: None)):
+        for i in range(3):
+            foo(i)
+
+    instrumented = t.instrumented
+    assert instrumented.evaluations >= 6
+    assert instrumented.hits == 6
+    assert instrumented.elapsed > 0
+    lines = hunter.stats(t).splitlines()
+    assert all(' time=' in line for line in lines)
+    lines = [re.sub(r' time=.*', '', line) for line in lines]
+    assert lines[0].startswith('When -> function: evaluations=')
+    assert lines[1].startswith('    And: evaluations=')
+    assert lines[2].startswith("        Query(kind='call'): evaluations=")
+    assert lines[3:] == [
+        '        Or: evaluations=6 hits=6 (100.0%)',
+        "            Query(function='foo'): evaluations=6 hits=3 (50.0%)",
+        "            Query(function='bar', lineno_gt=0): evaluations=3 hits=3 (100.0%)",
+    ]
+
+
+def test_instrument_disabled(tracer_impl):
+    t = tracer_impl()
+    with t.trace(Q(function='foo', action=lambda event: None)):
+        pass
+    assert t.instrumented is None
+    with pytest.raises(ValueError, match='The tracer is not instrumented'):
+        hunter.stats(t)
+
+
+def test_stats(tracer_impl):
+    calls = []
+
+    def foo(i):
+        return bar(i)
+
+    def bar(i):
+        return i
+
+    t = tracer_impl()
+    assert t.stats() == {'events': 0, 'handled': 0, 'time': 0.0, 'handler_time': 0.0}
+    with t.trace(Q(function='foo', kind='call', action=calls.append)):
+        for i in range(100):
+            foo(i)
+        thread = threading.Thread(target=foo, args=(1,))
+        thread.start()
+        thread.join()
+    stats = t.stats()
+    assert len(calls) == 101
+    # the events from bar are skipped before reaching the handler
+    assert stats['events'] > stats['handled'] >= 101
+    assert stats['time'] > stats['handler_time'] > 0
+
+    with t.trace(Q(function='foo', kind='call', action=calls.append)):
+        pass
+    assert t.stats()['handled'] == 0
+
+
+def test_trace_guarded_ordering_check():
+    def a(n):
+        return n
+
+    calls = []
+    # the ordering check can't be done on the None arg of call events, the module check must run first
+    with hunter.trace(Q(module='nomatch', arg_gt=5, action=calls.append) | Q(function='a', kind='return', action=calls.append)):
+        for i in range(3):
+            a(i)
+    assert [event.arg for event in calls] == [0, 1, 2]
+
+
+def test_stats_finished_threads(tracer_impl):
+    calls = []
+
+    def foo(i):
+        return i
+
+    t = tracer_impl(threading_support=True)
+    with t.trace(Q(function='foo', kind='call', action=calls.append)):
+        for i in range(20):
+            thread = threading.Thread(target=foo, args=(i,))
+            thread.start()
+            thread.join()
+        foo(20)
+    gc.collect()
+    # at most the last finished thread is kept until the stats are read, the others were pruned when new threads started
+    assert len(t._registry.counters) <= 2
+    # the events from the finished threads are still counted
+    assert t.stats()['handled'] >= len(calls) == 21
+    assert len(t._registry.counters) == 1
+
+    with t.trace(Q(function='foo', kind='call', action=lambda event: None)):
+        pass
+    assert t.stats()['handled'] == 0
+
+
+@pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason='requires sys.monitoring')
+def test_monitoring_stats_finished_threads():
+    from hunter.monitoring import Tracer
+
+    calls = []
+
+    def foo(i):
+        return i
+
+    t = Tracer(threading_support=True)
+    with t.trace(Q(function='foo', kind='call', action=calls.append)):
+        for i in range(20):
+            thread = threading.Thread(target=foo, args=(i,))
+            thread.start()
+            thread.join()
+        foo(20)
+    gc.collect()
+    assert len(t._registry.counters) <= 2
+    assert t.stats()['handled'] >= len(calls) == 21
+    assert len(t._registry.counters) == 1
+
+
+def test_sample(tracer_impl):
+    calls = []
+
+    def foo(i):
+        return bar(i)
+
+    def bar(i):
+        return i
+
+    t = tracer_impl(sample=3)
+    t.trace(Q(function_in=['foo', 'bar'], kind='call', action=lambda event: calls.append((event.function, event.depth))))
+    try:
+        for i in range(7):
+            foo(i)
+    finally:
+        t.stop()
+
+    assert calls == [('foo', 0), ('bar', 1)] * 3
+
+
+def test_sample_rate(tracer_impl):
+    calls = []
+
+    def foo():
+        pass
+
+    t = tracer_impl(sample_rate=1)
+    with t.trace(Q(function='foo', kind='call', action=calls.append)):
+        for _ in range(3):
+            foo()
+
+    assert len(calls) == 3
+
+
+def test_sample_invalid(tracer_impl):
+    pytest.raises(ValueError, tracer_impl, sample=0)
+    pytest.raises(ValueError, tracer_impl, sample_rate=0)
+    pytest.raises(ValueError, tracer_impl, sample_rate=1.5)
+    pytest.raises(ValueError, tracer_impl, sample=2, sample_rate=0.5)
+
+
+def test_budget_max_events(tracer_impl, monkeypatch):
+    output = StringIO()
+    monkeypatch.setattr(hunter, '_default_stream', output)
+    kinds = []
+
+    def foo():
+        return 1
+
+    t = tracer_impl(budget=hunter.Budget(max_events=5))
+    t.trace(Q(function='foo', action=lambda event: kinds.append(event.kind)))
+    try:
+        for _ in range(10):
+            foo()
+    finally:
+        t.stop()
+
+    assert kinds == ['call', 'line', 'return', 'call', 'line']
+    assert output.getvalue() == 'Disabling tracer because it is over budget (more than 5 events).\n'
+
+
+def test_budget_calls_only(tracer_impl, monkeypatch):
+    output = StringIO()
+    monkeypatch.setattr(hunter, '_default_stream', output)
+    kinds = []
+
+    def foo():
+        return 1
+
+    t = tracer_impl(budget=hunter.Budget(max_events=3, over_budget='calls'))
+    t.trace(Q(function='foo', action=lambda event: kinds.append(event.kind)))
+    try:
+        for _ in range(10):
+            foo()
+    finally:
+        t.stop()
+
+    assert kinds == ['call', 'line', 'return', 'call', 'call', 'call']
+    assert output.getvalue() == (
+        'Only tracing calls from now on because the tracer is over budget (more than 3 events).\n'
+        'Disabling tracer because it is over budget (more than 3 events).\n'
+    )
+
+
+def test_budget_max_events_per_second(tracer_impl, monkeypatch):
+    output = StringIO()
+    monkeypatch.setattr(hunter, '_default_stream', output)
+    kinds = []
+
+    def foo():
+        return 1
+
+    t = tracer_impl(budget=hunter.Budget(max_events_per_second=4))
+    t.trace(Q(function='foo', action=lambda event: kinds.append(event.kind)))
+    try:
+        for _ in range(10):
+            foo()
+    finally:
+        t.stop()
+
+    assert len(kinds) == 4
+    assert output.getvalue() == 'Disabling tracer because it is over budget (more than 4 events per second).\n'
+
+
+def test_budget_max_cpu_fraction(tracer_impl, monkeypatch):
+    output = StringIO()
+    monkeypatch.setattr(hunter, '_default_stream', output)
+    events = []
+
+    def foo():
+        return 1
+
+    def slow_action(event):
+        events.append(event.kind)
+        time.sleep(0.0001)
+
+    t = tracer_impl(budget=hunter.Budget(max_cpu_fraction=0.5))
+    t.trace(Q(function='foo', action=slow_action))
+    try:
+        for _ in range(1000):
+            foo()
+    finally:
+        t.stop()
+
+    assert len(events) == 1023
+    assert output.getvalue() == 'Disabling tracer because it is over budget (more than 50% of the time spent in the handler).\n'
+
+
+def test_budget_invalid():
+    pytest.raises(ValueError, hunter.Budget, max_events=0)
+    pytest.raises(ValueError, hunter.Budget, max_cpu_fraction=2)
+    pytest.raises(ValueError, hunter.Budget, over_budget='foo')
+
+
 def _bulky_func_that_use_stdlib():
     import difflib
 
@@ -1021,6 +1437,27 @@ def test_perf_actions(tracer_impl, benchmark):
             _bulky_func_that_use_stdlib()
 
 
+@pytest.mark.parametrize('operation', ['create', 'access', 'clone', 'detach'])
+def test_perf_pure_event(benchmark, operation):
+    from hunter.event import Event
+
+    frame = sys._getframe()
+    event = Event(frame, 'line', None, 0, 0, False)
+
+    if operation == 'create':
+        benchmark(Event, frame, 'line', None, 0, 0, False)
+    elif operation == 'access':
+
+        @benchmark
+        def run():
+            event = Event(frame, 'line', None, 0, 0, False)
+            return event.module, event.function, event.filename, event.lineno, event.stdlib, event.module, event.filename
+    elif operation == 'clone':
+        benchmark(event.clone)
+    elif operation == 'detach':
+        benchmark(event.detach)
+
+
 def test_clear_env_var(monkeypatch):
     monkeypatch.setitem(os.environ, 'PYTHONHUNTER', '123')
     assert os.environ.get('PYTHONHUNTER') == '123'
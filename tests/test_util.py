@@ -1,4 +1,8 @@
+import linecache
+import os
 import re
+import sys
+import threading
 from array import array
 from collections import OrderedDict
 from collections import deque
@@ -9,6 +13,7 @@ from datetime import time
 from datetime import timedelta
 from datetime import tzinfo
 from decimal import Decimal
+from io import StringIO
 from socket import _socket
 from socket import socket
 
@@ -16,6 +21,15 @@ import py
 import pytest
 import six
 
+from hunter.util import CODE_FIELDS_CACHE
+from hunter.util import BackgroundStream
+from hunter.util import BufferedStream
+from hunter.util import SourceCache
+from hunter.util import _sweep_code_fields
+from hunter.util import classify_filename
+from hunter.util import get_buffered_stream
+from hunter.util import get_code_fields
+from hunter.util import get_stdlib
 from hunter.util import safe_repr
 
 try:
@@ -327,3 +341,165 @@ def test_reliable_primitives():
     safe_repr(Foobar())
     safe_repr(Foobar)
     assert not side_effects
+
+
+def test_get_code_fields():
+    code = compile('pass', '/some/where/foobar.pyc', 'exec')
+    key = id(code)
+    assert get_code_fields(code, 'foobar', {}) == ('/some/where/foobar.py', False)
+    assert CODE_FIELDS_CACHE[key][1:] == ('/some/where/foobar.py', 'foobar', False)
+    assert get_code_fields(code, 'foobar', {}) == ('/some/where/foobar.py', False)
+    assert get_code_fields(code, 'pkg_resources.foo', {}) == ('/some/where/foobar.py', True)
+    assert CODE_FIELDS_CACHE[key][2] == 'foobar'
+    del code
+    assert CODE_FIELDS_CACHE[key][0]() is None
+    _sweep_code_fields()
+    assert key not in CODE_FIELDS_CACHE
+
+    code = compile('pass', '', 'exec')
+    assert get_code_fields(code, 'foobar', {'__file__': 'foobar.pyo'}) == ('foobar.py', False)
+
+
+def test_classify_filename(tmp_path):
+    assert classify_filename(os.__file__) is True
+    assert classify_filename(pytest.__file__) is False
+    assert classify_filename('<frozen importlib._bootstrap>') is True
+    assert classify_filename('foobar.py') is None
+    # only whole directory names are matched
+    assert classify_filename(os.path.join(sys.prefix + 'foo', 'bar.py')) is None
+    link = tmp_path / 'lib'
+    try:
+        link.symlink_to(os.path.dirname(os.__file__), target_is_directory=True)
+    except OSError:
+        pytest.skip('symlinks are not available')
+    assert classify_filename(str(link / 'os.py')) is True
+
+
+def test_get_stdlib():
+    assert get_stdlib('os', os.__file__) is True
+    assert get_stdlib('pytest', pytest.__file__) is False
+    assert get_stdlib('foo.pkg_resources.bar', 'foobar.py') is True
+    assert get_stdlib('foo.pkg_resources_bar', 'foobar.py') is False
+    assert get_stdlib('namedtuple_foo', '<string>') is True
+
+
+def test_source_cache(tmp_path):
+    path = tmp_path / 'sample.py'
+    path.write_text('@decorator\ndef foo(\n    a,\n):\n    pass\n')
+    filename = str(path)
+    # the 39 characters of the file are kept too
+    cache = SourceCache(maxsize=69)
+    assert cache.get(filename, 1, None) == '@decorator\ndef foo(\n'
+    assert cache.get(filename, 5, None) == '    pass\n'
+    assert cache.get(filename, 6, None) == ''
+    assert cache.size == 68
+    assert list(cache.entries) == [(filename, 1), (filename, 5), (filename, 6)]
+    assert cache.get(filename, 2, None) == 'def foo(\n'
+    assert list(cache.entries) == [(filename, 5), (filename, 6), (filename, 2)]
+    assert cache.size == 57
+
+    path.write_text('class Foo:\n    pass\n')
+    os.utime(filename, (0, 0))
+    assert cache.get(filename, 2, None) == 'def foo(\n'
+    linecache.checkcache(filename)
+    assert cache.get(filename, 2, None) == '    pass\n'
+    # the entries of the previous lines are dropped together with the lines
+    assert list(cache.entries) == [(filename, 2)]
+    assert cache.size == 29
+    assert cache.get(filename, 1, None) == 'class Foo:\n'
+
+    other = tmp_path / 'other.py'
+    other.write_text('x = 1\n' * 10)
+    assert cache.get(str(other), 1, None) == 'x = 1\n'
+    # the last entry of the first file was evicted, thus its lines are not kept anymore
+    assert list(cache.entries) == [(str(other), 1)]
+    assert list(cache.files) == [str(other)]
+    assert cache.size == 66
+    linecache.clearcache()
+
+
+@pytest.mark.parametrize('module', ['hunter.event', 'hunter._event'])
+def test_yield_lines(tmp_path, module):
+    yield_lines = pytest.importorskip(module).yield_lines
+    path = tmp_path / 'sample.py'
+    path.write_text('    def foo():\n        pass\nbar = 1\n')
+    collected = []
+    lines = yield_lines(str(path), {}, 0, collected if module == 'hunter._event' else collected.append)
+    assert list(lines) == ['def foo():\n', '    pass\n']
+    assert collected == ['    def foo():\n', '        pass\n']
+    linecache.clearcache()
+
+
+def test_buffered_stream():
+    out = StringIO()
+    stream = BufferedStream(out, buffer_size=10, flush_interval=60)
+    stream.write('12345')
+    stream.write('6789')
+    assert out.getvalue() == ''
+    stream.write('0')
+    assert out.getvalue() == '1234567890'
+    stream.write('abc')
+    stream.flush()
+    assert out.getvalue() == '1234567890abc'
+
+    stream = BufferedStream(out, buffer_size=10, flush_interval=0)
+    stream.write('d')
+    assert out.getvalue() == '1234567890abcd'
+
+    assert get_buffered_stream(out, out, 10) is get_buffered_stream(out, out, 10)
+    assert get_buffered_stream(out, out, 10) is not get_buffered_stream(out, out, 20)
+
+
+@pytest.mark.skipif('not hasattr(os, "fork")')
+def test_buffered_stream_fork():
+    out = StringIO()
+    stream = BufferedStream(out, buffer_size=10, flush_interval=60)
+    stream.write('foo')
+    pid = os.fork()
+    if not pid:
+        stream.write('bar')
+        os._exit(0 if out.getvalue() == 'foo' and stream.pending == ['bar'] else 1)
+    assert out.getvalue() == 'foo'
+    assert os.waitpid(pid, 0)[1] == 0
+
+
+def test_background_stream():
+    out = StringIO()
+    stream = BackgroundStream(out)
+    for i in range(100):
+        stream.write(f'{i}\n')
+    stream.flush()
+    assert out.getvalue() == ''.join(f'{i}\n' for i in range(100))
+    assert stream.dropped == 0
+
+    with pytest.raises(ValueError, match='Expected overflow to be either "block" or "drop", not \'foo\'.'):
+        BackgroundStream(out, overflow='foo')
+
+
+def test_background_stream_drop():
+    unblocked = threading.Event()
+
+    class SlowStream(StringIO):
+        def write(self, data):
+            unblocked.wait()
+            return super().write(data)
+
+    out = SlowStream()
+    stream = BackgroundStream(out, queue_size=2, overflow='drop')
+    for i in range(10):
+        stream.write(f'{i}\n')
+    assert stream.dropped >= 7
+    unblocked.set()
+    stream.flush()
+    assert len(out.getvalue().splitlines()) == 10 - stream.dropped
+
+
+def test_background_stream_error():
+    class BrokenStream:
+        def write(self, data):
+            raise OSError('broken')
+
+    stream = BackgroundStream(BrokenStream())
+    stream.write('foo')
+    stream.flush()
+    assert repr(stream.error) == "OSError('broken')"